@@ -0,0 +1,69 @@
+"""tasks_hot_path_indexes — index tasks.uuid, (user_id, created_at DESC), (user_id, status).
+
+Revision ID: 0004_tasks_hot_path_indexes
+Revises: 0003_tasks_user_id_not_null
+Create Date: 2026-10-19
+
+Every ``SQLAlchemyTaskRepository.get_by_id`` / ``update`` / ``delete`` filters
+on ``tasks.uuid`` and every scoped ``list_paginated`` / ``count`` filters on
+``user_id`` ordered by ``created_at DESC``. Without indexes each of those is a
+full table scan whose cost grows with the table.
+
+Pre-condition: ``tasks.uuid`` values are unique. ``upgrade()`` performs a
+pre-flight duplicate count and raises RuntimeError with an operator message
+if any uuid appears more than once — refuses to build the UNIQUE index
+rather than fail mid-migration (tiger-style fail-loud, mirrors 0003).
+
+Operations (in order):
+  1. Pre-flight: count uuids appearing more than once — raise if > 0.
+  2. create_index idx_tasks_uuid UNIQUE (uuid).
+  3. create_index idx_tasks_user_id_created_at (user_id, created_at DESC).
+  4. create_index idx_tasks_user_id_status (user_id, status).
+
+``idx_tasks_user_id`` from 0003 is left in place; the composite indexes
+cover it as a prefix but existing operator tooling asserts its presence.
+
+Downgrade drops the three indexes in reverse order.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0004_tasks_hot_path_indexes"
+down_revision: Union[str, None] = "0003_tasks_user_id_not_null"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNT_DUPLICATE_UUIDS_SQL = (
+    "SELECT COUNT(*) FROM "
+    "(SELECT uuid FROM tasks GROUP BY uuid HAVING COUNT(*) > 1) AS duplicate_uuids"
+)
+
+
+def upgrade() -> None:
+    """Create the tasks hot-path indexes."""
+    bind = op.get_bind()
+    duplicate_count = bind.execute(sa.text(_COUNT_DUPLICATE_UUIDS_SQL)).scalar_one()
+    if duplicate_count > 0:
+        raise RuntimeError(
+            f"Refusing to apply 0004_tasks_hot_path_indexes: "
+            f"{duplicate_count} tasks.uuid values are duplicated. "
+            f"Deduplicate the tasks table before upgrading."
+        )
+
+    op.create_index("idx_tasks_uuid", "tasks", ["uuid"], unique=True)
+    op.create_index(
+        "idx_tasks_user_id_created_at",
+        "tasks",
+        ["user_id", sa.text("created_at DESC")],
+    )
+    op.create_index("idx_tasks_user_id_status", "tasks", ["user_id", "status"])
+
+
+def downgrade() -> None:
+    """Reverse: drop the hot-path indexes."""
+    op.drop_index("idx_tasks_user_id_status", table_name="tasks")
+    op.drop_index("idx_tasks_user_id_created_at", table_name="tasks")
+    op.drop_index("idx_tasks_uuid", table_name="tasks")
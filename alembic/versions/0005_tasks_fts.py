@@ -0,0 +1,80 @@
+"""tasks_fts — FTS5 full-text index over task file names and transcripts.
+
+Revision ID: 0005_tasks_fts
+Revises: 0004_tasks_hot_path_indexes
+Create Date: 2026-10-19
+
+Creates the ``tasks_fts`` FTS5 virtual table (one row per file name /
+transcript segment, rowid packed as ``task_id << 20 | segment``) and an
+AFTER DELETE trigger on ``tasks`` that drops a task's rowid range.
+Inserts are repository-maintained (see
+``app/infrastructure/database/task_search_index.py``), so existing
+completed tasks are NOT indexed here — run
+``python -m app.cli backfill-search-index`` after upgrading.
+
+SQLite only: FTS5 is a SQLite extension and the application skips the
+index on other backends, so on any other dialect both directions are
+no-ops.
+
+Pre-condition: the SQLite build ships FTS5. ``upgrade()`` probes
+``sqlite_compileoption_used('ENABLE_FTS5')`` and raises RuntimeError with
+an operator message rather than fail mid-migration (tiger-style, mirrors
+0003 / 0004).
+
+Operations (in order):
+  1. Pre-flight: FTS5 available — raise if not.
+  2. CREATE VIRTUAL TABLE tasks_fts USING fts5(file_name, text,
+     seg_start UNINDEXED, seg_end UNINDEXED, unicode61 remove_diacritics 2).
+  3. CREATE TRIGGER tasks_fts_after_delete.
+
+The DDL is duplicated from task_search_index on purpose — migrations are
+frozen snapshots and must not import application code.
+
+Downgrade drops the trigger, then the virtual table (and its shadow tables).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005_tasks_fts"
+down_revision: Union[str, None] = "0004_tasks_hot_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FTS5_AVAILABLE_SQL = "SELECT sqlite_compileoption_used('ENABLE_FTS5')"
+_CREATE_FTS_SQL = (
+    "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+    "file_name, text, seg_start UNINDEXED, seg_end UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+_CREATE_DELETE_TRIGGER_SQL = (
+    "CREATE TRIGGER tasks_fts_after_delete AFTER DELETE ON tasks BEGIN "
+    "DELETE FROM tasks_fts WHERE rowid BETWEEN "
+    "OLD.id << 20 AND (OLD.id << 20) + 1048575; "
+    "END"
+)
+
+
+def upgrade() -> None:
+    """Create the tasks_fts index and its delete trigger (SQLite only)."""
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite":
+        return
+    if not bind.execute(sa.text(_FTS5_AVAILABLE_SQL)).scalar_one():
+        raise RuntimeError(
+            "Refusing to apply 0005_tasks_fts: this SQLite build lacks FTS5. "
+            "Upgrade SQLite (or the Python build linking it) before upgrading."
+        )
+
+    op.execute(_CREATE_FTS_SQL)
+    op.execute(_CREATE_DELETE_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    """Reverse: drop the trigger and the FTS5 table (SQLite only)."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.execute("DROP TRIGGER IF EXISTS tasks_fts_after_delete")
+    op.execute("DROP TABLE IF EXISTS tasks_fts")
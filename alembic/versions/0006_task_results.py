@@ -0,0 +1,149 @@
+"""task_results — move task results out of row into zstd-compressed blobs.
+
+Revision ID: 0006_task_results
+Revises: 0005_tasks_fts
+Create Date: 2026-10-19
+
+Results were stored inline as JSON in ``tasks.result``; every full-row
+read decoded them and every scan of ``tasks`` paged through them. They now
+live in ``task_results`` (one row per task, zstd-compressed compact JSON)
+and the task row keeps only ``result_size`` — see
+``app/infrastructure/database/result_store.py``.
+
+Pre-condition: every non-NULL ``tasks.result`` is valid JSON. ``upgrade()``
+counts ``json_valid(result) = 0`` rows first and raises RuntimeError with
+an operator message rather than fail half-way through the copy
+(tiger-style, mirrors 0003 / 0004 / 0005).
+
+Operations (in order):
+  1. Pre-flight: no invalid inline JSON — raise if any.
+  2. CREATE TABLE task_results (task_id PK FK → tasks.id ON DELETE
+     CASCADE, codec, raw_size, data).
+  3. ADD COLUMN tasks.result_size.
+  4. Copy in id-ordered batches: compress each inline result into
+     task_results, set result_size, NULL the inline column.
+
+The serialisation / codec is duplicated from result_store on purpose —
+migrations are frozen snapshots and must not import application code.
+
+Downgrade decompresses every blob back into ``tasks.result``, then drops
+``task_results`` and ``tasks.result_size`` (via batch_alter_table for
+SQLite safety, re-creating the ``tasks`` triggers the table rebuild drops).
+"""
+
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+import zstandard
+from alembic import op
+
+revision: str = "0006_task_results"
+down_revision: Union[str, None] = "0005_tasks_fts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BATCH_SIZE = 200
+_ZSTD_LEVEL = 3
+
+_COUNT_INVALID_JSON_SQL = (
+    "SELECT COUNT(*) FROM tasks WHERE result IS NOT NULL AND json_valid(result) = 0"
+)
+_SELECT_INLINE_BATCH_SQL = (
+    "SELECT id, result FROM tasks WHERE result IS NOT NULL AND id > :last_id "
+    "ORDER BY id LIMIT :limit"
+)
+_INSERT_RESULT_SQL = (
+    "INSERT INTO task_results (task_id, codec, raw_size, data) "
+    "VALUES (:task_id, 'zstd', :raw_size, :data)"
+)
+_MARK_MOVED_SQL = (
+    "UPDATE tasks SET result = NULL, result_size = :raw_size WHERE id = :task_id"
+)
+_SELECT_STORED_BATCH_SQL = (
+    "SELECT task_id, data FROM task_results WHERE task_id > :last_id "
+    "ORDER BY task_id LIMIT :limit"
+)
+_RESTORE_INLINE_SQL = "UPDATE tasks SET result = :result WHERE id = :task_id"
+_SELECT_TASKS_TRIGGERS_SQL = (
+    "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'tasks'"
+)
+
+
+def upgrade() -> None:
+    """Create task_results and move inline results into it."""
+    bind = op.get_bind()
+    invalid_count = bind.execute(sa.text(_COUNT_INVALID_JSON_SQL)).scalar_one()
+    if invalid_count > 0:
+        raise RuntimeError(
+            f"Refusing to apply 0006_task_results: {invalid_count} tasks.result "
+            f"values are not valid JSON. Repair or NULL them before upgrading."
+        )
+
+    op.create_table(
+        "task_results",
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE", name="fk_task_results_task_id"),
+            primary_key=True,
+        ),
+        sa.Column("codec", sa.String(), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+    )
+    op.add_column("tasks", sa.Column("result_size", sa.Integer(), nullable=True))
+
+    compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(_SELECT_INLINE_BATCH_SQL),
+            {"last_id": last_id, "limit": _BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        moved = []
+        for task_id, inline in rows:
+            raw = json.dumps(
+                json.loads(inline), ensure_ascii=False, separators=(",", ":")
+            ).encode()
+            moved.append(
+                {"task_id": task_id, "raw_size": len(raw), "data": compressor.compress(raw)}
+            )
+        bind.execute(sa.text(_INSERT_RESULT_SQL), moved)
+        bind.execute(sa.text(_MARK_MOVED_SQL), moved)
+        last_id = rows[-1][0]
+
+
+def downgrade() -> None:
+    """Reverse: restore inline results, drop task_results and result_size."""
+    bind = op.get_bind()
+    decompressor = zstandard.ZstdDecompressor()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(_SELECT_STORED_BATCH_SQL),
+            {"last_id": last_id, "limit": _BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            sa.text(_RESTORE_INLINE_SQL),
+            [
+                {"task_id": task_id, "result": decompressor.decompress(data).decode()}
+                for task_id, data in rows
+            ],
+        )
+        last_id = rows[-1][0]
+
+    op.drop_table("task_results")
+    # SQLite batch mode rebuilds ``tasks``, which drops its triggers (0005's
+    # tasks_fts_after_delete); capture and replay them around the rebuild.
+    triggers: Sequence[str] = []
+    if bind.dialect.name == "sqlite":
+        triggers = bind.execute(sa.text(_SELECT_TASKS_TRIGGERS_SQL)).scalars().all()
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("result_size")
+    for trigger_sql in triggers:
+        op.execute(trigger_sql)
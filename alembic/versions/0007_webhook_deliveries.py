@@ -0,0 +1,77 @@
+"""webhook_deliveries — durable outbox for task-completion callbacks.
+
+Revision ID: 0007_webhook_deliveries
+Revises: 0006_task_results
+Create Date: 2026-10-19
+
+Callbacks were POSTed from the transcription worker with blocking retries,
+holding the worker (and the user's concurrency slot) while an endpoint was
+slow or down. The worker now only inserts a ``webhook_deliveries`` row; the
+asyncio dispatcher in ``app/infrastructure/webhooks`` delivers it, and
+``tasks.callback_status`` mirrors the outcome for the task APIs.
+
+Operations (in order):
+  1. CREATE TABLE webhook_deliveries (task_id FK → tasks.id ON DELETE
+     CASCADE, url, payload, status CHECK, attempts, next_attempt_at,
+     last_status_code, last_error, delivered_at, created_at).
+  2. CREATE INDEX idx_webhook_deliveries_due (status, next_attempt_at).
+  3. ADD COLUMN tasks.callback_status.
+
+No backfill: callbacks of tasks finished before the upgrade were already
+attempted inline.
+
+Downgrade drops ``tasks.callback_status`` and ``webhook_deliveries``;
+undelivered callbacks are lost.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007_webhook_deliveries"
+down_revision: Union[str, None] = "0006_task_results"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create webhook_deliveries and tasks.callback_status."""
+    op.create_table(
+        "webhook_deliveries",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "task_id",
+            sa.Integer(),
+            sa.ForeignKey(
+                "tasks.id", ondelete="CASCADE", name="fk_webhook_deliveries_task_id"
+            ),
+            nullable=False,
+        ),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint(
+            "status IN ('pending','delivered','failed')",
+            name="ck_webhook_deliveries_status",
+        ),
+    )
+    op.create_index(
+        "idx_webhook_deliveries_due",
+        "webhook_deliveries",
+        ["status", "next_attempt_at"],
+    )
+    op.add_column("tasks", sa.Column("callback_status", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Reverse: drop tasks.callback_status and webhook_deliveries."""
+    op.execute("ALTER TABLE tasks DROP COLUMN callback_status")
+    op.drop_index("idx_webhook_deliveries_due", table_name="webhook_deliveries")
+    op.drop_table("webhook_deliveries")
@@ -2,7 +2,7 @@
 
 from app.api.audio_api import stt_router
 from app.api.audio_services_api import service_router
-from app.api.task_api import task_router
+from app.api.task_api import task_result_link_router, task_router
 from app.api.websocket_api import websocket_router
 
 # Phase 13 routers — registered unconditionally in app/main.py post Phase 19.
@@ -18,6 +18,7 @@ __all__ = [
     "stt_router",
     "service_router",
     "task_router",
+    "task_result_link_router",
     "websocket_router",
     "auth_router",
     "key_router",
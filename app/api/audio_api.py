@@ -14,12 +14,13 @@ from fastapi import (
     Depends,
     File,
     Form,
+    Query,
     UploadFile,
 )
 
 from app.api.dependencies import (
     authenticated_user,
-    get_free_tier_gate,
+    get_async_free_tier_gate,
     get_scoped_task_repository,
 )
 from app.core.services import get_file_service
@@ -29,11 +30,12 @@ from app.core.logging import logger
 from app.domain.entities.task import Task as DomainTask
 from app.domain.entities.user import User
 from app.domain.repositories.task_repository import ITaskRepository
-from app.services.free_tier_gate import FreeTierGate
+from app.services.free_tier_gate import AsyncFreeTierGate
 from app.files import ALLOWED_EXTENSIONS
 from app.schemas import (
     AlignmentParams,
     ASROptions,
+    CallbackMode,
     DiarizationParams,
     Response,
     SpeechToTextProcessingParams,
@@ -65,10 +67,14 @@ async def speech_to_text(
     vad_options_params: VADOptions = Depends(),
     file: UploadFile = File(...),
     callback_url: str | None = Depends(validate_callback_url_dependency),
+    callback_mode: CallbackMode = Query(
+        CallbackMode.full,
+        description="full: POST the whole result; reference: POST a signed link to it",
+    ),
     repository: ITaskRepository = Depends(get_scoped_task_repository),
     file_service: FileService = Depends(get_file_service),
     user: User = Depends(authenticated_user),
-    free_tier_gate: FreeTierGate = Depends(get_free_tier_gate),
+    free_tier_gate: AsyncFreeTierGate = Depends(get_async_free_tier_gate),
 ) -> Response:
     """
     Process an uploaded audio file for speech-to-text conversion.
@@ -82,6 +88,7 @@ async def speech_to_text(
         vad_options_params (VADOptions): VAD options parameters.
         file (UploadFile): Uploaded audio file.
         callback_url (str | None): Optional URL to call back when processing is complete.
+        callback_mode (CallbackMode): What the callback carries (full result or link).
         repository (ITaskRepository): Task repository dependency.
         file_service (FileService): File service dependency.
 
@@ -114,7 +121,7 @@ async def speech_to_text(
         diarize_params.min_speakers is not None
         or diarize_params.max_speakers is not None
     )
-    free_tier_gate.check(
+    await free_tier_gate.check(
         user=user,
         file_seconds=audio_duration,
         model=model_params.model.value,
@@ -153,6 +160,7 @@ async def speech_to_text(
         alignment_params=align_params,
         diarization_params=diarize_params,
         callback_url=callback_url,
+        callback_mode=callback_mode,
     )
 
     background_tasks.add_task(process_audio_common, audio_params)
@@ -173,10 +181,14 @@ async def speech_to_text_url(
     vad_options_params: VADOptions = Depends(),
     url: str = Form(...),
     callback_url: str | None = Depends(validate_callback_url_dependency),
+    callback_mode: CallbackMode = Query(
+        CallbackMode.full,
+        description="full: POST the whole result; reference: POST a signed link to it",
+    ),
     repository: ITaskRepository = Depends(get_scoped_task_repository),
     file_service: FileService = Depends(get_file_service),
     user: User = Depends(authenticated_user),
-    free_tier_gate: FreeTierGate = Depends(get_free_tier_gate),
+    free_tier_gate: AsyncFreeTierGate = Depends(get_async_free_tier_gate),
 ) -> Response:
     """
     Process an audio file from a URL for speech-to-text conversion.
@@ -190,6 +202,7 @@ async def speech_to_text_url(
         vad_options_params (VADOptions): VAD options parameters.
         url (str): URL of the audio file.
         callback_url (str | None): Optional URL to call back when processing is complete.
+        callback_mode (CallbackMode): What the callback carries (full result or link).
         repository (ITaskRepository): Task repository dependency.
         file_service (FileService): File service dependency.
 
@@ -199,7 +212,7 @@ async def speech_to_text_url(
     logger.info("Received URL for processing: %s", url)
 
     # Download file using file service
-    temp_audio_file, filename = file_service.download_from_url(url)
+    temp_audio_file, filename = await file_service.download_from_url(url)
     logger.info("File downloaded and saved temporarily: %s", temp_audio_file)
 
     # Validate extension
@@ -216,7 +229,7 @@ async def speech_to_text_url(
         diarize_params.min_speakers is not None
         or diarize_params.max_speakers is not None
     )
-    free_tier_gate.check(
+    await free_tier_gate.check(
         user=user,
         file_seconds=audio_duration,
         model=model_params.model.value,
@@ -256,6 +269,7 @@ async def speech_to_text_url(
         alignment_params=align_params,
         diarization_params=diarize_params,
         callback_url=callback_url,
+        callback_mode=callback_mode,
     )
 
     background_tasks.add_task(process_audio_common, audio_params)
@@ -26,7 +26,7 @@ from app.api.constants import (
 )
 from app.api.dependencies import (
     authenticated_user,
-    get_free_tier_gate,
+    get_async_free_tier_gate,
     get_scoped_task_repository,
 )
 from app.core.services import (
@@ -43,7 +43,7 @@ from app.core.logging import logger
 from app.domain.entities.task import Task as DomainTask
 from app.domain.entities.user import User
 from app.domain.repositories.task_repository import ITaskRepository
-from app.services.free_tier_gate import FreeTierGate
+from app.services.free_tier_gate import AsyncFreeTierGate
 from app.domain.services.alignment_service import IAlignmentService
 from app.domain.services.diarization_service import IDiarizationService
 from app.domain.services.speaker_assignment_service import ISpeakerAssignmentService
@@ -90,7 +90,7 @@ async def transcribe(
     file_service: FileService = Depends(get_file_service),
     transcription_service: ITranscriptionService = Depends(get_transcription_service),
     user: User = Depends(authenticated_user),
-    free_tier_gate: FreeTierGate = Depends(get_free_tier_gate),
+    free_tier_gate: AsyncFreeTierGate = Depends(get_async_free_tier_gate),
 ) -> Response:
     """
     Transcribe an uploaded audio file.
@@ -122,7 +122,7 @@ async def transcribe(
 
     # Phase 13-08 free-tier gate (RATE-01..10) — diarize=False on this
     # transcribe-only route. Slot held until process_transcribe completion.
-    free_tier_gate.check(
+    await free_tier_gate.check(
         user=user,
         file_seconds=audio_duration,
         model=model_params.model.value,
@@ -285,7 +285,7 @@ async def diarize(
     file_service: FileService = Depends(get_file_service),
     diarization_service: IDiarizationService = Depends(get_diarization_service),
     user: User = Depends(authenticated_user),
-    free_tier_gate: FreeTierGate = Depends(get_free_tier_gate),
+    free_tier_gate: AsyncFreeTierGate = Depends(get_async_free_tier_gate),
 ) -> Response:
     """
     Perform diarization on an uploaded audio file.
@@ -27,6 +27,7 @@ Constraints honoured:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Depends, Request, Response, status
@@ -139,7 +140,9 @@ async def register(
         logger.info("Registration rejected disposable_domain")
         raise _registration_failed()
     try:
-        user = auth_service.register(body.email, body.password)
+        # Argon2 + DB work off the event loop; the hash itself runs on the
+        # bounded pool and may shed with PasswordHasherBusyError (503).
+        user = await asyncio.to_thread(auth_service.register, body.email, body.password)
     except UserAlreadyExistsError as exc:
         # Anti-enumeration: identical body + code as disposable rejection
         # (T-13-09 mitigation).
@@ -172,7 +175,9 @@ async def login(
     wrong-password (T-13-10). Rate-limited 10/hr per /24 (ANTI-02).
     """
     try:
-        user, session_token = auth_service.login(body.email, body.password)
+        user, session_token = await asyncio.to_thread(
+            auth_service.login, body.email, body.password
+        )
     except InvalidCredentialsError:
         logger.info("Login rejected invalid_credentials")
         raise
@@ -21,6 +21,9 @@ def task_notification(body: Result) -> TaskEventReceived:
     Receive task completion notifications.
 
     This endpoint is called automatically when a task completes or fails if a valid callback url was provided.
+    Bodies of ``CALLBACK_GZIP_MIN_BYTES`` or more arrive with ``Content-Encoding: gzip``.
+    With ``callback_mode=reference`` the body is a ``CallbackReference`` instead: fetch
+    the ``Result`` from its signed ``result_url`` before ``result_expires_at``.
 
     Args:
         body (Result): The task result containing status, result data, metadata, and optional error
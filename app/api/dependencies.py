@@ -1,8 +1,9 @@
 """Dependency injection providers for FastAPI endpoints (Phase 19 final)."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core import jwt_codec
@@ -23,16 +24,23 @@ from app.domain.repositories.device_fingerprint_repository import (
 from app.domain.repositories.rate_limit_repository import IRateLimitRepository
 from app.domain.repositories.task_repository import ITaskRepository
 from app.domain.repositories.user_repository import IUserRepository
+from app.infrastructure.database.async_connection import async_session_factory
 from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.repositories.async_sqlalchemy_api_key_repository import (
+    AsyncSQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_task_repository import (
+    AsyncSQLAlchemyTaskRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
 from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
     SQLAlchemyApiKeyRepository,
 )
 from app.infrastructure.database.repositories.sqlalchemy_device_fingerprint_repository import (
     SQLAlchemyDeviceFingerprintRepository,
 )
-from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
-    SQLAlchemyRateLimitRepository,
-)
 from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
 )
@@ -41,11 +49,13 @@ from app.infrastructure.database.repositories.sqlalchemy_user_repository import
 )
 from app.services.account_service import AccountService
 from app.services.auth import (
+    AsyncKeyService,
+    AsyncRateLimitService,
     AuthService,
     KeyService,
     RateLimitService,
 )
-from app.services.free_tier_gate import FreeTierGate
+from app.services.free_tier_gate import AsyncFreeTierGate, FreeTierGate
 from app.services.task_management_service import TaskManagementService
 from app.services.usage_event_writer import UsageEventWriter
 from app.services.usage_query_service import UsageQueryService
@@ -82,6 +92,24 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
+async def get_async_db(
+    db: Session = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Yield an AsyncSession on the same database as the request Session.
+
+    Request-path reads/writes that run on the event loop (auth resolution,
+    free-tier buckets, progress polling) use this instead of the blocking
+    Session. Derived from ``get_db``'s bind — not from settings — so
+    ``dependency_overrides[get_db]`` stays the sole DB-binding seam and
+    both sessions always hit the same database.
+    """
+    session = async_session_factory(db.get_bind())()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 # ---------------------------------------------------------------------------
 # Repository providers — chain off Depends(get_db)
 # ---------------------------------------------------------------------------
@@ -90,22 +118,33 @@ def get_db() -> Generator[Session, None, None]:
 def get_user_repository(
     db: Session = Depends(get_db),
 ) -> IUserRepository:
-    """Return a SQLAlchemyUserRepository bound to the request-scoped Session."""
-    return SQLAlchemyUserRepository(db)
+    """Return a SQLAlchemyUserRepository bound to the request-scoped Session.
+
+    Wired with the bearer-key and cookie snapshot caches so user writes
+    (logout-all, plan change, delete) drop that user's cached snapshots.
+    """
+    return SQLAlchemyUserRepository(
+        db,
+        key_cache=core_services.get_api_key_cache(),
+        snapshot_cache=core_services.get_user_snapshot_cache(),
+    )
 
 
 def get_api_key_repository(
     db: Session = Depends(get_db),
 ) -> IApiKeyRepository:
-    """Return a SQLAlchemyApiKeyRepository bound to the request-scoped Session."""
-    return SQLAlchemyApiKeyRepository(db)
+    """Return a SQLAlchemyApiKeyRepository bound to the request-scoped Session.
+
+    Wired with the bearer-key cache so ``revoke`` takes effect immediately.
+    """
+    return SQLAlchemyApiKeyRepository(db, key_cache=core_services.get_api_key_cache())
 
 
 def get_rate_limit_repository(
     db: Session = Depends(get_db),
 ) -> IRateLimitRepository:
-    """Return a SQLAlchemyRateLimitRepository bound to the request-scoped Session."""
-    return SQLAlchemyRateLimitRepository(db)
+    """Return the configured rate-limit repository (table or in-memory store)."""
+    return core_services.rate_limit_repository(db)
 
 
 def get_task_repository(
@@ -163,6 +202,17 @@ def get_free_tier_gate(
     return FreeTierGate(rate_limit_service=rate_limit_service)
 
 
+def get_async_free_tier_gate(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncFreeTierGate:
+    """Return an AsyncFreeTierGate on the request-scoped AsyncSession."""
+    return AsyncFreeTierGate(
+        rate_limit_service=AsyncRateLimitService(
+            repository=core_services.async_rate_limit_repository(db)
+        )
+    )
+
+
 def get_usage_event_writer(
     db: Session = Depends(get_db),
 ) -> UsageEventWriter:
@@ -179,9 +229,17 @@ def get_account_service(
     Plan 15-03 deviation lock: AccountService accepts both ``session`` and
     an optional pre-built ``user_repository``; passing both keeps a single
     repo instance shared across methods (DRY) instead of lazy-constructing
-    one.
+    one. With the ``memory`` rate-limit backend the in-process bucket store
+    is passed too, so account deletion clears the user's buckets there.
     """
-    return AccountService(session=db, user_repository=user_repository)
+    bucket_store = (
+        core_services.get_bucket_store()
+        if get_settings().auth.RATE_LIMIT_BACKEND == "memory"
+        else None
+    )
+    return AccountService(
+        session=db, user_repository=user_repository, bucket_store=bucket_store
+    )
 
 
 def get_usage_query_service(
@@ -234,31 +292,58 @@ _COOKIE_REFRESH_FAILURES = (JwtExpiredError, JwtAlgorithmError, JwtTamperedError
 STATE_MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
 
-def _resolve_bearer(plaintext: str, db: Session) -> User | None:
+async def _resolve_bearer(plaintext: str, db: AsyncSession) -> User | None:
     """Resolve a presented bearer plaintext to a User, or None on failure.
 
-    Two-query semantics carried forward verbatim from the legacy resolver
-    (Phase 20 collapses to a single JOIN; preserved here so structural
-    refactor and perf optimisation revert independently). Subtype-first
-    try/except over _BEARER_FAILURES; any other exception bubbles (caller
-    treats as 500).
+    Repeat callers are served from the process-wide verified-key cache (no
+    query); a miss costs one key+user JOIN on the AsyncSession. The
+    ``last_used_at`` stamp is buffered and flushed in batches by the
+    scheduler — no write per request. Subtype-first try/except over
+    _BEARER_FAILURES; any other exception bubbles (caller treats as 500).
     """
-    key_service = KeyService(repository=SQLAlchemyApiKeyRepository(db))
+    key_service = AsyncKeyService(
+        repository=AsyncSQLAlchemyApiKeyRepository(db),
+        cache=core_services.get_api_key_cache(),
+        last_used=core_services.get_last_used_buffer(),
+    )
     try:
-        api_key = key_service.verify_plaintext(plaintext)
+        return await key_service.authenticate(plaintext)
     except _BEARER_FAILURES:
         return None
-    return SQLAlchemyUserRepository(db).get_by_id(api_key.user_id)
 
 
-def _resolve_cookie(token: str, db: Session, response: Response) -> User | None:
-    """Resolve a session-cookie JWT to a User and stamp a sliding-refresh cookie.
+async def _cookie_user(
+    user_id: int, token_version: int | None, db: AsyncSession
+) -> User | None:
+    """Snapshot for ``(user_id, token_version)``; a miss loads the row.
+
+    Only a row whose ``token_version`` matches the token's is cached, and
+    hits never extend an entry's TTL — staleness stays bounded by one window.
+    """
+    snapshots = core_services.get_user_snapshot_cache()
+    cached = snapshots.get(user_id, token_version) if token_version is not None else None
+    if cached is not None:
+        return cached
+    user = await AsyncSQLAlchemyUserRepository(db).get_by_id(user_id)
+    if user is not None and user.token_version == token_version:
+        snapshots.put(user)
+    return user
+
+
+async def _resolve_cookie(
+    token: str, db: AsyncSession, response: Response
+) -> User | None:
+    """Resolve a session-cookie JWT to a User; stamp a sliding refresh when due.
 
     Semantics carried forward from the deleted legacy auth resolver:
-      - jwt_codec.decode_session validates HS256 + extracts ``sub``.
-      - SQLAlchemyUserRepository.get_by_id loads the user (None → 401 leg).
-      - TokenService.verify_and_refresh re-validates the token_version and
-        issues a fresh JWT (sliding 7d expiry).
+      - jwt_codec.decode_session validates HS256 + extracts ``sub`` / ``ver``.
+      - The user comes from the process-wide snapshot cache keyed by
+        ``(sub, ver)``; a miss loads it via
+        AsyncSQLAlchemyUserRepository.get_by_id (None → 401 leg).
+      - TokenService.refresh_if_due re-validates the token_version and
+        issues a fresh JWT only once the presented one is within
+        ``AUTH__JWT_REFRESH_THRESHOLD_HOURS`` of expiry — steady-state
+        requests (progress polls) cost no query, no signing, no Set-Cookie.
       - response.set_cookie stamps the fresh JWT BEFORE the dep returns so
         FastAPI flushes it on the response (Pitfall 1 in 19-RESEARCH).
       - Cookie attrs byte-identical to the prior implementation
@@ -273,15 +358,17 @@ def _resolve_cookie(token: str, db: Session, response: Response) -> User | None:
         user_id = int(payload["sub"])
     except _COOKIE_DECODE_FAILURES:
         return None
-    user = SQLAlchemyUserRepository(db).get_by_id(user_id)
+    user = await _cookie_user(user_id, payload.get("ver"), db)
     if user is None:
         return None
     try:
-        _payload, refreshed = core_services.get_token_service().verify_and_refresh(
-            token, user.token_version
+        refreshed = core_services.get_token_service().refresh_if_due(
+            payload, user.token_version
         )
     except _COOKIE_REFRESH_FAILURES:
         return None
+    if refreshed is None:
+        return user
     response.set_cookie(
         key=SESSION_COOKIE,
         value=refreshed,
@@ -295,8 +382,8 @@ def _resolve_cookie(token: str, db: Session, response: Response) -> User | None:
     return user
 
 
-def _try_resolve(
-    request: Request, response: Response, db: Session
+async def _try_resolve(
+    request: Request, response: Response, db: AsyncSession
 ) -> User | None:
     """Bearer wins. Then cookie. Then None. Three flat early-returns.
 
@@ -308,17 +395,17 @@ def _try_resolve(
     auth_header = request.headers.get("authorization", "")
     if auth_header.startswith(BEARER_PREFIX):
         plaintext = auth_header[len(BEARER_PREFIX):].strip()
-        return _resolve_bearer(plaintext, db)
+        return await _resolve_bearer(plaintext, db)
     cookie = request.cookies.get(SESSION_COOKIE)
     if cookie:
-        return _resolve_cookie(cookie, db, response)
+        return await _resolve_cookie(cookie, db, response)
     return None
 
 
 async def authenticated_user(
     request: Request,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Resolve the authenticated user via Depends — raise 401 on failure.
 
@@ -327,7 +414,7 @@ async def authenticated_user(
     response shape (T-13-05 anti-leak: callers cannot distinguish which
     auth leg failed).
     """
-    user = _try_resolve(request, response, db)
+    user = await _try_resolve(request, response, db)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -340,7 +427,7 @@ async def authenticated_user(
 async def authenticated_user_optional(
     request: Request,
     response: Response,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User | None:
     """Same as authenticated_user but returns None instead of raising.
 
@@ -349,7 +436,7 @@ async def authenticated_user_optional(
     public routes that want to surface user.id when present opt in via
     this dep instead).
     """
-    return _try_resolve(request, response, db)
+    return await _try_resolve(request, response, db)
 
 
 def get_scoped_task_repository(
@@ -362,7 +449,23 @@ def get_scoped_task_repository(
     repo is built). No try/finally for session.close — get_db owns the
     request-scoped Session lifecycle (single close site invariant).
     """
-    repository = SQLAlchemyTaskRepository(db)
+    repository = SQLAlchemyTaskRepository(
+        db, count_cache=core_services.get_task_count_cache()
+    )
+    repository.set_user_scope(int(user.id) if user.id is not None else 0)
+    return repository
+
+
+def get_async_scoped_task_repository(
+    user: User = Depends(authenticated_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncSQLAlchemyTaskRepository:
+    """Return a per-user-scoped AsyncSQLAlchemyTaskRepository (read path).
+
+    Same scoping contract as ``get_scoped_task_repository``; shares the
+    request's AsyncSession with authenticated_user via the dep cache.
+    """
+    repository = AsyncSQLAlchemyTaskRepository(db)
     repository.set_user_scope(int(user.id) if user.id is not None else 0)
     return repository
 
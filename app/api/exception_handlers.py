@@ -16,6 +16,7 @@ from app.core.exceptions import (
     FreeTierViolationError,
     InfrastructureError,
     InvalidCredentialsError,
+    PasswordHasherBusyError,
     RateLimitExceededError,
     TaskNotFoundError,
     TrialExpiredError,
@@ -284,6 +285,23 @@ async def rate_limit_exceeded_handler(
     )
 
 
+async def password_hasher_busy_handler(
+    request: Request, exc: PasswordHasherBusyError | Exception
+) -> JSONResponse:
+    """Map PasswordHasherBusyError -> HTTP 503 + Retry-After header."""
+    busy_exc = exc if isinstance(exc, PasswordHasherBusyError) else PasswordHasherBusyError(0)
+    retry_after = int(busy_exc.details.get("retry_after_seconds", 1))
+    logger.warning(
+        "Password hashing saturated; request shed",
+        extra={"correlation_id": busy_exc.correlation_id, "path": request.url.path},
+    )
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content=busy_exc.to_dict(),
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
 async def concurrency_limit_handler(
     request: Request, exc: ConcurrencyLimitError | Exception
 ) -> JSONResponse:
@@ -9,10 +9,13 @@ from uuid import uuid4
 
 from app.api.schemas.task_schemas import (
     CreateTaskRequest,
+    SegmentMatchResponse,
     TaskResponse,
+    TaskSearchResultResponse,
     TaskSummaryResponse,
 )
 from app.domain.entities.task import Task
+from app.domain.entities.task_search_hit import TaskSearchHit
 
 
 class TaskMapper:
@@ -95,3 +98,26 @@ class TaskMapper:
             start_time=entity.start_time,
             end_time=entity.end_time,
         )
+
+    @staticmethod
+    def to_search_result(hit: TaskSearchHit) -> TaskSearchResultResponse:
+        """Convert a domain TaskSearchHit to the API search result DTO.
+
+        Args:
+            hit: The domain search hit
+
+        Returns:
+            TaskSearchResultResponse: The API search result DTO
+        """
+        return TaskSearchResultResponse(
+            identifier=hit.uuid,
+            file_name=hit.file_name,
+            rank=hit.rank,
+            file_name_snippet=hit.file_name_snippet,
+            segments=[
+                SegmentMatchResponse(
+                    start=segment.start, end=segment.end, snippet=segment.snippet
+                )
+                for segment in hit.segments
+            ],
+        )
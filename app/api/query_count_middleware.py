@@ -0,0 +1,60 @@
+"""ASGI middleware reporting the SQL statements each HTTP request ran.
+
+Pure ASGI (no ``BaseHTTPMiddleware``): the request runs in this
+middleware's context, so the counter bound here is the one the
+``before_cursor_execute`` listener in ``query_counter`` increments. The
+count is debug-logged when the response completes; with
+``DB_QUERY_COUNT_HEADER`` enabled it is also sent as ``X-DB-Query-Count``
+(statements run before the response started — background tasks excluded).
+"""
+
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.infrastructure.database.query_counter import start_counting, stop_counting
+
+QUERY_COUNT_HEADER = b"x-db-query-count"
+
+
+class QueryCountMiddleware:
+    """Count DB statements per HTTP request; log and optionally expose them."""
+
+    def __init__(self, app: ASGIApp, expose_header: bool | None = None) -> None:
+        """Wrap ``app``.
+
+        Args:
+            app: Downstream ASGI application.
+            expose_header: Send ``X-DB-Query-Count``; ``None`` reads
+                ``DatabaseSettings.DB_QUERY_COUNT_HEADER``.
+        """
+        self.app = app
+        if expose_header is None:
+            expose_header = get_settings().database.DB_QUERY_COUNT_HEADER
+        self.expose_header = expose_header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request inside a fresh counted scope."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        counter, token = start_counting()
+
+        async def send_with_count(message: Message) -> None:
+            if self.expose_header and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER, str(counter.statements).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            stop_counting(token)
+            logger.debug(
+                "%s %s ran %d DB statements",
+                scope["method"], scope["path"], counter.statements,
+            )
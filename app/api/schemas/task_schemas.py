@@ -83,7 +83,8 @@ class TaskListResponse(BaseModel):
     Plan 15-ux pagination: ``tasks`` is the current page slice; ``total``
     is the un-paginated count after q/status filters apply (for
     "Page N of M" UI). Backwards-compatible — existing clients that only
-    read ``tasks`` keep working.
+    read ``tasks`` keep working. In cursor mode ``page`` stays 1 and
+    ``next_cursor`` carries the position of the following page.
     """
 
     tasks: list[TaskSummaryResponse] = Field(
@@ -98,3 +99,43 @@ class TaskListResponse(BaseModel):
     page_size: int = Field(
         50, ge=1, le=200, description="Items per page (1..200)"
     )
+    next_cursor: str | None = Field(
+        None,
+        description=(
+            "Cursor mode only: opaque token for the next page; "
+            "null on the last page"
+        ),
+    )
+
+
+class SegmentMatchResponse(BaseModel):
+    """DTO for one transcript segment matching a search query."""
+
+    start: float | None = Field(None, description="Segment start (seconds)")
+    end: float | None = Field(None, description="Segment end (seconds)")
+    snippet: str = Field(
+        ..., description="Excerpt with matched terms wrapped in [brackets]"
+    )
+
+
+class TaskSearchResultResponse(BaseModel):
+    """DTO for one task matching a search query."""
+
+    identifier: str = Field(..., description="Unique identifier for the task")
+    file_name: str | None = Field(None, description="Name of the file")
+    rank: float = Field(..., description="bm25 relevance; lower is better")
+    file_name_snippet: str | None = Field(
+        None, description="Highlighted file name when the name matched"
+    )
+    segments: list[SegmentMatchResponse] = Field(
+        default_factory=list, description="Matching segments, best first"
+    )
+
+
+class TaskSearchResponse(BaseModel):
+    """DTO for GET /task/search — ranked full-text matches."""
+
+    query: str = Field(..., description="The query as received")
+    results: list[TaskSearchResultResponse] = Field(
+        ..., description="Matching tasks, most relevant first"
+    )
@@ -1,19 +1,70 @@
 """This module contains the task management routes for the FastAPI application."""
 
+import time
+from typing import Literal
+
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response as HTTPResponse
+from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import (
     csrf_protected,
+    get_async_scoped_task_repository,
     get_task_management_service,
+    get_task_repository,
 )
 from app.api.mappers.task_mapper import TaskMapper
-from app.api.schemas.task_schemas import TaskListResponse
+from app.api.schemas.task_schemas import TaskListResponse, TaskSearchResponse
+from app.core import result_link
+from app.core.config import get_settings
 from app.core.exceptions import TaskNotFoundError
 from app.core.logging import logger
-from app.schemas import Metadata, Response, Result, TaskProgress
+from app.domain.repositories.task_repository import ITaskRepository
+from app.infrastructure.database.repositories.async_sqlalchemy_task_repository import (
+    AsyncSQLAlchemyTaskRepository,
+)
+from app.result_document import iter_result_json, task_metadata
+from app.schemas import Response, Result, TaskProgress
 from app.services.task_management_service import TaskManagementService
+from app.transcript_columnar import ColumnarTranscript
 
 task_router = APIRouter(dependencies=[Depends(csrf_protected)])
+# Authenticated by the link signature, not by a session or API key.
+task_result_link_router = APIRouter()
+
+
+def _columnar_result(
+    service: TaskManagementService, identifier: str, *, binary: bool
+) -> HTTPResponse:
+    """Render ``GET /task/{id}`` in the columnar (JSON) or npz format."""
+    task = service.get_task(identifier)
+    if task is None:
+        logger.error("Task ID not found: %s", identifier)
+        raise TaskNotFoundError(identifier)
+
+    columnar = (
+        ColumnarTranscript.from_result(task.result) if task.result is not None else None
+    )
+    if binary:
+        # No result yet → nothing to serialise; same opaque 404 as a miss.
+        if columnar is None:
+            raise TaskNotFoundError(identifier)
+        return HTTPResponse(
+            content=columnar.to_npz(),
+            media_type="application/octet-stream",
+            headers={
+                "Content-Disposition": f'attachment; filename="{task.uuid}.npz"'
+            },
+        )
+    result = Result(
+        status=task.status,
+        result=columnar.to_json() if columnar is not None else None,
+        metadata=task_metadata(task),
+        error=task.error,
+    )
+    return HTTPResponse(
+        content=result.model_dump_json(), media_type="application/json"
+    )
 
 
 @task_router.get("/task/all", tags=["Tasks Management"])
@@ -32,6 +83,15 @@ async def get_all_tasks_status(
     page_size: int = Query(
         50, ge=1, le=200, description="Items per page (1..200)"
     ),
+    pagination: Literal["offset", "cursor"] = Query(
+        "offset",
+        description="offset: page/page_size; cursor: keyset via next_cursor",
+    ),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from the previous page (implies cursor mode)",
+        max_length=200,
+    ),
     service: TaskManagementService = Depends(get_task_management_service),
 ) -> TaskListResponse:
     """
@@ -42,16 +102,44 @@ async def get_all_tasks_status(
     user-scope filter (Phase 13-07) still applies — callers see only their
     own tasks.
 
+    Cursor mode (``pagination=cursor`` or any ``cursor``) pages by the
+    ``(created_at, id)`` keyset instead of OFFSET, so deep pages stay as
+    cheap as the first; ``page`` is ignored and ``next_cursor`` links the
+    following page.
+
     Args:
         q: Case-insensitive substring match against file_name.
         status: Exact-match status filter (processing|completed|failed).
         page: 1-indexed page number; Pydantic ``ge=1`` rejects 0/negatives.
         page_size: Items per page, 1..200; out-of-range -> 422.
+        pagination: ``offset`` (default) or ``cursor``.
+        cursor: Opaque ``next_cursor`` from the previous cursor-mode page.
         service: Task management service dependency (scoped to caller).
 
     Returns:
-        TaskListResponse: ``{tasks, total, page, page_size}``.
+        TaskListResponse: ``{tasks, total, page, page_size, next_cursor}``.
+
+    Raises:
+        ValidationError: If ``cursor`` is malformed (422).
     """
+    if pagination == "cursor" or cursor:
+        logger.info(
+            "Retrieving tasks by cursor: q=%s status=%s page_size=%d",
+            q,
+            status,
+            page_size,
+        )
+        tasks, next_cursor, total = service.list_tasks_by_cursor(
+            q=q, status=status, cursor=cursor, page_size=page_size
+        )
+        return TaskListResponse(
+            tasks=[TaskMapper.to_summary(task) for task in tasks],
+            total=total,
+            page=1,
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
+
     logger.info(
         "Retrieving tasks: q=%s status=%s page=%d page_size=%d",
         q,
@@ -64,52 +152,148 @@ async def get_all_tasks_status(
     )
     task_summaries = [TaskMapper.to_summary(task) for task in tasks]
     return TaskListResponse(
-        tasks=task_summaries, total=total, page=page, page_size=page_size
+        tasks=task_summaries,
+        total=total,
+        page=page,
+        page_size=page_size,
+        next_cursor=None,
+    )
+
+
+@task_router.get("/task/search", tags=["Tasks Management"])
+async def search_tasks(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Words to find in file names and transcripts (all must match)",
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum tasks (1..100)"),
+    service: TaskManagementService = Depends(get_task_management_service),
+) -> TaskSearchResponse:
+    """
+    Full-text search over the caller's completed tasks.
+
+    Matches file names and transcript text via the SQLite FTS5 index.
+    Each result carries ranked snippets and the start/end seconds of the
+    matching segments. Declared before ``/task/{identifier}`` so "search"
+    is not captured as a task id.
+
+    Args:
+        q: Free-text query; every term must appear.
+        limit: Maximum number of tasks to return.
+        service: Task management service dependency (scoped to caller).
+
+    Returns:
+        TaskSearchResponse: ``{query, results}`` — most relevant first.
+    """
+    logger.info("Searching tasks: limit=%d", limit)
+    hits = service.search_tasks(q, limit=limit)
+    return TaskSearchResponse(
+        query=q, results=[TaskMapper.to_search_result(hit) for hit in hits]
     )
 
 
-@task_router.get("/task/{identifier}", tags=["Tasks Management"])
+@task_router.get(
+    "/task/{identifier}", response_model=Result, tags=["Tasks Management"]
+)
 async def get_transcription_status(
     identifier: str,
+    result_format: Literal["verbose", "columnar", "npz"] = Query(
+        "verbose",
+        alias="format",
+        description=(
+            "verbose: per-word JSON objects; columnar: parallel arrays "
+            "(ColumnarTranscript JSON); npz: the result alone as a NumPy archive"
+        ),
+    ),
     service: TaskManagementService = Depends(get_task_management_service),
-) -> Result:
+) -> HTTPResponse:
     """
     Retrieve the status of a specific task by its identifier.
 
+    The body has the ``Result`` shape. In ``verbose`` mode (default) the
+    transcript is streamed as it is decompressed from storage — it is never
+    parsed into Python objects, so large results cost neither the memory
+    nor the time of a dict round-trip. ``columnar`` replaces the per-word
+    objects with parallel arrays and a string table (see
+    ``app.transcript_columnar``); ``npz`` returns only the result, as a
+    compressed NumPy archive, and 404s when the task has no result yet.
+
     Args:
         identifier (str): The identifier of the task.
+        result_format: ``format`` query param — verbose|columnar|npz.
         service: Task management service dependency.
 
     Returns:
-        Result: The status of the task.
+        StreamingResponse | Response: The status of the task (``Result``
+        JSON) or, for ``npz``, the archive bytes.
 
     Raises:
         TaskNotFoundError: If the identifier is not found.
     """
-    logger.info("Retrieving status for task ID: %s", identifier)
-    task = service.get_task(identifier)
+    logger.info(
+        "Retrieving status for task ID: %s (format=%s)", identifier, result_format
+    )
+    if result_format != "verbose":
+        return _columnar_result(service, identifier, binary=result_format == "npz")
 
-    if task is None:
+    found = service.get_task_result_stream(identifier)
+
+    if found is None:
         logger.error("Task ID not found: %s", identifier)
         raise TaskNotFoundError(identifier)
 
+    task, result_chunks = found
     logger.info("Status retrieved for task ID: %s", identifier)
-    return Result(
-        status=task.status,
-        result=task.result,
-        metadata=Metadata(
-            task_type=task.task_type,
-            task_params=task.task_params,
-            language=task.language,
-            file_name=task.file_name,
-            url=task.url,
-            callback_url=task.callback_url,
-            duration=task.duration,
-            audio_duration=task.audio_duration,
-            start_time=task.start_time,
-            end_time=task.end_time,
-        ),
-        error=task.error,
+    return StreamingResponse(
+        iter_result_json(task, result_chunks),
+        media_type="application/json",
+    )
+
+
+@task_result_link_router.get(
+    "/task/{identifier}/callback-result",
+    response_model=Result,
+    tags=["Tasks Management"],
+    summary="Fetch a task result from a callback link",
+)
+async def get_callback_result(
+    identifier: str,
+    expires: int = Query(..., description="Link expiry (unix seconds)"),
+    signature: str = Query(..., max_length=64, description="Link signature"),
+    repository: ITaskRepository = Depends(get_task_repository),
+) -> StreamingResponse:
+    """
+    Retrieve a task result through the signed link of a reference-mode callback.
+
+    Same body as ``GET /task/{identifier}`` (verbose). A forged, altered or
+    expired link is answered like an unknown task.
+
+    Args:
+        identifier: The identifier of the task.
+        expires: Expiry from the link.
+        signature: Signature from the link.
+        repository: Unscoped task repository (the signature is the scope).
+
+    Returns:
+        StreamingResponse: The task's ``Result`` JSON.
+
+    Raises:
+        TaskNotFoundError: If the link is invalid or the task is gone.
+    """
+    secret = get_settings().auth.JWT_SECRET.get_secret_value()
+    if not result_link.verify(identifier, expires, signature, secret, now=time.time()):
+        logger.warning("Rejected callback result link for task ID: %s", identifier)
+        raise TaskNotFoundError(identifier)
+
+    found = repository.get_result_stream(identifier)
+    if found is None:
+        raise TaskNotFoundError(identifier)
+
+    task, result_chunks = found
+    return StreamingResponse(
+        iter_result_json(task, result_chunks), media_type="application/json"
     )
 
 
@@ -149,17 +333,21 @@ async def delete_task(
 )
 async def get_task_progress(
     identifier: str,
-    service: TaskManagementService = Depends(get_task_management_service),
+    repository: AsyncSQLAlchemyTaskRepository = Depends(
+        get_async_scoped_task_repository
+    ),
 ) -> TaskProgress:
     """
     Get current progress for a task.
 
     Returns progress percentage, current stage, and status.
     Use this endpoint as fallback when WebSocket connection fails.
+    Polled by every client without a WebSocket, so it reads through the
+    async repository instead of blocking the event loop.
 
     Args:
         identifier: The task identifier (UUID)
-        service: Task management service (injected)
+        repository: User-scoped async task repository (injected)
 
     Returns:
         TaskProgress with current progress information
@@ -168,7 +356,7 @@ async def get_task_progress(
         TaskNotFoundError: If task with identifier doesn't exist
     """
     logger.info("Retrieving progress for task ID: %s", identifier)
-    task = service.get_task(identifier)
+    task = await repository.get_summary_by_id(identifier)
 
     if task is None:
         logger.error("Task ID not found: %s", identifier)
@@ -3,22 +3,84 @@
 Provides a TUS-compliant upload endpoint at /uploads/files/ using tuspyserver.
 Supports resumable uploads up to 5GB with automatic expiry cleanup.
 On upload completion, triggers transcription via UploadSessionService.
+
+Parallel uploads use the TUS ``concatenation`` extension: the client creates
+several ``Upload-Concat: partial`` uploads, PATCHes them concurrently, then
+POSTs ``Upload-Concat: final;<urls>``. Final-concat requests are served by a
+dedicated route that assembles the parts with ``copy_file_range``/``sendfile``
+off the event loop; the completion hook fires only for the assembled upload,
+never for the individual partials.
 """
 
+import asyncio
+import base64
+import binascii
+import json
+import re
+from datetime import datetime, timedelta
+from email.utils import formatdate
 from pathlib import Path
+from typing import Awaitable, Callable
+from urllib.parse import urlparse
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.routing import APIRoute
+from starlette.routing import Match
+from starlette.types import Scope
 from tuspyserver import create_tus_router
+from tuspyserver.file import TusUploadFile
+from tuspyserver.params import TusUploadParams
+from tuspyserver.request import get_request_headers
+from tuspyserver.router import TusRouterOptions
 
 from app.api.dependencies import get_scoped_task_repository
 from app.core.logging import logger
-from app.core.upload_config import UPLOAD_DIR
+from app.core.upload_config import MAX_FILE_SIZE, UPLOAD_DIR
 from app.domain.repositories.task_repository import ITaskRepository
+from app.infrastructure.storage.file_concat import concatenate_files
 from app.services.upload_session_service import UploadSessionService
 
 # TUS-specific storage directory (separate from streaming uploads)
 TUS_UPLOAD_DIR: Path = UPLOAD_DIR / "tus"
 
+TUS_VERSION: str = "1.0.0"
+TUS_DAYS_TO_KEEP: int = 1
+
+# tuspyserver upload ids are uuid4().hex -- anything else in an
+# Upload-Concat list is rejected before it touches the filesystem.
+_UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _is_partial_upload(file_path: str) -> bool:
+    """Return True if the upload at file_path is a concatenation partial.
+
+    tuspyserver invokes the completion hook whenever an upload reaches its
+    declared length, including each ``Upload-Concat: partial`` part. Those
+    parts are only fragments of the real media file and must not start a
+    transcription.
+
+    Args:
+        file_path: Path to the upload data file (its ``.info`` sits alongside).
+
+    Returns:
+        True if the upload's info marks it as partial.
+    """
+    try:
+        with open(f"{file_path}.info", "r") as f:
+            info = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return False
+    return bool(isinstance(info, dict) and info.get("is_partial"))
+
 
 async def create_upload_complete_hook(
     background_tasks: BackgroundTasks,
@@ -45,18 +107,258 @@ async def create_upload_complete_hook(
             file_path: Path to the assembled file on disk.
             metadata: TUS client metadata dict.
         """
+        if _is_partial_upload(file_path):
+            logger.debug("TUS partial upload complete: %s, awaiting final concat", file_path)
+            return
         logger.info("TUS upload complete: %s, triggering transcription", file_path)
         await service.start_transcription(file_path, metadata, background_tasks)
 
     return handler
 
 
+class FinalConcatRoute(APIRoute):
+    """APIRoute that only matches requests carrying ``Upload-Concat: final;``.
+
+    Plain creation and ``partial`` requests fall through to tuspyserver's own
+    creation route, which is registered after this one on the same path.
+    """
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        """Match on path/method as usual, then require a final-concat header."""
+        match, child_scope = super().matches(scope)
+        if match is not Match.FULL:
+            return match, child_scope
+        for name, value in scope.get("headers", []):
+            if name == b"upload-concat" and value.strip().startswith(b"final;"):
+                return match, child_scope
+        return Match.NONE, {}
+
+
+def _build_tus_options() -> TusRouterOptions:
+    """Build TusRouterOptions for loading upload files outside tuspyserver routes.
+
+    Returns:
+        TusRouterOptions pointing at the TUS upload directory.
+    """
+    return TusRouterOptions(
+        prefix="files",
+        files_dir=str(TUS_UPLOAD_DIR),
+        max_size=MAX_FILE_SIZE,
+        auth=None,
+        days_to_keep=TUS_DAYS_TO_KEEP,
+        on_upload_complete=None,
+        upload_complete_dep=None,
+        pre_create_hook=None,
+        pre_create_dep=None,
+        file_dep=None,
+        tags=None,
+        tus_version=TUS_VERSION,
+        tus_extension="",
+        strict_offset_validation=False,
+    )
+
+
+def _decode_metadata(upload_metadata: str | None) -> dict[str, str]:
+    """Decode a TUS ``Upload-Metadata`` header into a dict.
+
+    Args:
+        upload_metadata: Comma-separated ``key base64value`` pairs.
+
+    Returns:
+        Decoded metadata; malformed values are skipped, bare keys map to "".
+    """
+    metadata: dict[str, str] = {}
+    for pair in (upload_metadata or "").split(","):
+        parts = pair.strip().split(" ", 1)
+        key = parts[0].strip()
+        if not key:
+            continue
+        if len(parts) == 1:
+            metadata[key] = ""
+            continue
+        try:
+            metadata[key] = base64.b64decode(parts[1].strip(), validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            continue
+    return metadata
+
+
+def _parse_partial_ids(upload_concat: str) -> list[str]:
+    """Extract upload ids from an ``Upload-Concat: final;<url> <url>`` header.
+
+    Args:
+        upload_concat: Raw Upload-Concat header value.
+
+    Returns:
+        Ordered list of partial upload ids.
+
+    Raises:
+        HTTPException: 400 if the list is empty or contains an invalid id.
+    """
+    spec = upload_concat.strip()[len("final;"):]
+    ids: list[str] = []
+    for url in spec.split():
+        upload_id = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+        if not _UPLOAD_ID_PATTERN.match(upload_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid partial upload in Upload-Concat: {url}",
+            )
+        ids.append(upload_id)
+    if not ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload-Concat final header must list at least one partial upload",
+        )
+    return ids
+
+
+def _load_completed_partial(options: TusRouterOptions, upload_id: str) -> TusUploadFile:
+    """Load a partial upload and verify it is complete.
+
+    Args:
+        options: TUS options pointing at the upload directory.
+        upload_id: Partial upload id.
+
+    Returns:
+        The partial upload file handle.
+
+    Raises:
+        HTTPException: 404 if missing, 400 if not partial or not complete.
+    """
+    partial = TusUploadFile(options=options, uid=upload_id)
+    if not partial.exists or partial.info is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Partial upload not found: {upload_id}",
+        )
+    if not partial.info.is_partial:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Upload {upload_id} is not a partial upload",
+        )
+    if partial.info.size is None or partial.info.offset != partial.info.size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Partial upload {upload_id} is not complete",
+        )
+    return partial
+
+
+async def create_final_concat_upload(
+    request: Request,
+    upload_concat: str = Header(...),
+    upload_metadata: str | None = Header(None),
+    upload_length: int | None = Header(None),
+    upload_defer_length: int | None = Header(None),
+    tus_resumable: str | None = Header(None),
+    on_complete: Callable[[str, dict], Awaitable[None]] = Depends(
+        create_upload_complete_hook
+    ),
+) -> Response:
+    """Create a final upload by concatenating completed partial uploads.
+
+    Partials are appended in header order using kernel-side copies in a
+    worker thread, then deleted. The completion hook runs once, on the
+    assembled file.
+
+    Args:
+        request: Incoming request (used to build the Location header).
+        upload_concat: ``final;`` followed by space-separated partial URLs.
+        upload_metadata: Optional TUS metadata for the assembled upload.
+        upload_length: Must be absent for final uploads.
+        upload_defer_length: Must be absent for final uploads.
+        tus_resumable: TUS protocol version sent by the client.
+        on_complete: Upload completion handler from create_upload_complete_hook.
+
+    Returns:
+        201 response with the Location of the assembled upload.
+
+    Raises:
+        HTTPException: 412 on version mismatch, 400 on malformed concat
+            requests, 404 for unknown partials, 413 when the assembled size
+            exceeds MAX_FILE_SIZE, 500 if concatenation fails.
+    """
+    if tus_resumable != TUS_VERSION:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Unsupported version. Expected {TUS_VERSION}",
+            headers={"Tus-Version": TUS_VERSION},
+        )
+    if upload_length is not None or upload_defer_length is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload-Length must not be sent for final concatenated uploads",
+        )
+
+    options = _build_tus_options()
+    partial_ids = _parse_partial_ids(upload_concat)
+    partials = [_load_completed_partial(options, upload_id) for upload_id in partial_ids]
+    total_size = sum(len(partial) for partial in partials)
+    if total_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Concatenated upload exceeds maximum size of {MAX_FILE_SIZE} bytes",
+        )
+
+    final = TusUploadFile(options=options)
+    try:
+        written = await asyncio.to_thread(
+            concatenate_files,
+            Path(final.path),
+            [Path(partial.path) for partial in partials],
+        )
+    except OSError as e:
+        final.delete(final.uid)
+        logger.error("TUS concatenation failed for %s", partial_ids, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to concatenate uploads",
+        ) from e
+
+    expires = formatdate(
+        (datetime.now() + timedelta(days=TUS_DAYS_TO_KEEP)).timestamp(), usegmt=True
+    )
+    metadata = _decode_metadata(upload_metadata)
+    final.info = TusUploadParams(
+        metadata=metadata,
+        size=written,
+        offset=written,
+        created_at=str(datetime.now()),
+        expires=expires,
+        is_final=True,
+        partial_uploads=partial_ids,
+    )
+    for partial in partials:
+        partial.delete(partial.uid)
+    logger.info(
+        "TUS final upload %s assembled from %d partials (%d bytes)",
+        final.uid,
+        len(partials),
+        written,
+    )
+
+    await on_complete(final.path, metadata)
+
+    return Response(
+        status_code=status.HTTP_201_CREATED,
+        headers={
+            "Location": get_request_headers(
+                request=request, uuid=final.uid, prefix="files"
+            )["location"],
+            "Tus-Resumable": TUS_VERSION,
+            "Upload-Expires": expires,
+            "Content-Length": "0",
+        },
+    )
+
+
 # Create TUS protocol router via tuspyserver
 tus_router: APIRouter = create_tus_router(
     prefix="files",
     files_dir=str(TUS_UPLOAD_DIR),
-    max_size=5 * 1024 * 1024 * 1024,  # 5GB max (matches MAX_FILE_SIZE)
-    days_to_keep=1,
+    max_size=MAX_FILE_SIZE,  # 5GB max
+    days_to_keep=TUS_DAYS_TO_KEEP,
     upload_complete_dep=create_upload_complete_hook,
 )
 
@@ -65,4 +367,14 @@ tus_upload_router: APIRouter = APIRouter(
     prefix="/uploads",
     tags=["TUS Upload"],
 )
+# Final-concat routes must precede tuspyserver's creation route on the same path
+for _path in ("/files", "/files/"):
+    tus_upload_router.add_api_route(
+        _path,
+        create_final_concat_upload,
+        methods=["POST"],
+        status_code=status.HTTP_201_CREATED,
+        include_in_schema=False,
+        route_class_override=FinalConcatRoute,
+    )
 tus_upload_router.include_router(tus_router)
@@ -39,9 +39,10 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
 from app.core.services import get_ws_ticket_service
+from app.infrastructure.database.async_connection import async_session_factory
 from app.infrastructure.database.connection import SessionLocal
-from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
-    SQLAlchemyTaskRepository,
+from app.infrastructure.database.repositories.async_sqlalchemy_task_repository import (
+    AsyncSQLAlchemyTaskRepository,
 )
 from app.infrastructure.websocket import connection_manager
 from app.schemas.websocket_schemas import HeartbeatMessage
@@ -73,15 +74,15 @@ async def websocket_task_progress(
     """
     # WS scope has no FastAPI Depends, so we use the lru-cached singleton
     # for ws_ticket_service (HTTP issue and WS consume agree on the same
-    # in-memory dict) and an explicit ``with SessionLocal() as db:`` block
-    # for the per-request session. The context manager owns close().
+    # in-memory dict) and an explicit ``async with`` AsyncSession block on
+    # the database SessionLocal is bound to. The context manager owns close().
     if not ticket:
         await websocket.close(code=WS_POLICY_VIOLATION)
         return
 
     ticket_service = get_ws_ticket_service()
-    with SessionLocal() as db:
-        task = SQLAlchemyTaskRepository(db).get_by_id(task_id)
+    async with async_session_factory(SessionLocal.kw["bind"])() as db:
+        task = await AsyncSQLAlchemyTaskRepository(db).get_summary_by_id(task_id)
     if task is None:
         await websocket.close(code=WS_POLICY_VIOLATION)
         return
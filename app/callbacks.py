@@ -1,32 +1,64 @@
-"""Callback functionality."""
-
+"""Callback URL validation and callback payloads.
+
+Submissions with a ``callback_url`` are rejected up front when the callback
+host does not answer. Probing used to be a blocking ``HEAD`` with a 10 s
+timeout per submission; ``CallbackUrlValidator`` probes asynchronously,
+caches the verdict per origin (scheme, host, port) — positive results for
+``CALLBACK_PROBE_TTL_SECONDS``, negative ones for the shorter
+``CALLBACK_PROBE_NEGATIVE_TTL_SECONDS`` — and coalesces concurrent probes
+of one origin, so a client submitting 1000 tasks triggers one probe.
+Hosts listed in ``CALLBACK_TRUSTED_HOSTS`` are never probed.
+
+A callback body is either the full ``Result`` — built by splicing the
+stored result JSON, never parsed — or, in reference mode, a small
+``CallbackReference`` whose signed ``result_url`` lets the receiver fetch
+the result once (see ``app.core.result_link``). Delivery lives in
+``app.infrastructure.webhooks`` (durable outbox + async dispatcher).
+"""
+
+from __future__ import annotations
+
+import asyncio
 import time
-from datetime import datetime
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timezone
+from urllib.parse import quote, urlencode
 
 import httpx
 from fastapi import HTTPException, status
 from pydantic import HttpUrl
 
-from app.core.config import get_settings
+from app.core import result_link
 from app.core.logging import logger
+from app.core.ttl_cache import TTLCache
+from app.domain.entities.task import Task
+from app.result_document import iter_result_json
+from app.schemas import CallbackMode, CallbackReference
+
+DEFAULT_MAX_ORIGINS = 10_000
 
 
-def validate_callback_url(callback_url: str) -> bool:
+async def validate_callback_url(
+    callback_url: str,
+    timeout_seconds: float,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> bool:
     """
     Validate that a callback URL is reachable.
 
     Args:
         callback_url: The callback URL to validate
+        timeout_seconds: Probe timeout
+        transport: Optional transport (tests)
 
     Returns:
         bool: True if the URL is reachable, False otherwise
     """
     try:
-        with httpx.Client(
-            timeout=float(get_settings().callback.CALLBACK_TIMEOUT)
+        async with httpx.AsyncClient(
+            timeout=timeout_seconds, transport=transport
         ) as client:
-            response = client.head(callback_url)
+            response = await client.head(callback_url)
             if response.status_code < 400 or response.status_code == 405:
                 return True
             else:
@@ -49,7 +81,85 @@ def validate_callback_url(callback_url: str) -> bool:
         return False
 
 
-def validate_callback_url_dependency(
+def parse_trusted_hosts(raw: str) -> frozenset[str]:
+    """Split the comma-separated ``CALLBACK_TRUSTED_HOSTS`` setting."""
+    return frozenset(host.strip().lower() for host in raw.split(",") if host.strip())
+
+
+class CallbackUrlValidator:
+    """Per-origin cached, coalesced reachability probe.
+
+    Trusted hosts match exactly, or by suffix when written ``*.example.com``.
+    Verdicts live in a bounded ``TTLCache`` (failures for the shorter
+    negative TTL); in-flight probes are shared per event loop, so
+    concurrent submissions for one origin await the same ``HEAD``.
+    """
+
+    def __init__(
+        self,
+        timeout_seconds: float,
+        ttl_seconds: float = 300.0,
+        negative_ttl_seconds: float = 30.0,
+        trusted_hosts: Iterable[str] = (),
+        max_origins: int = DEFAULT_MAX_ORIGINS,
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._timeout_seconds = timeout_seconds
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._trusted_exact = frozenset(h for h in trusted_hosts if not h.startswith("*."))
+        self._trusted_suffixes = tuple(h[1:] for h in trusted_hosts if h.startswith("*."))
+        self._transport = transport
+        self._verdicts: TTLCache[str, bool] = TTLCache(max_origins, clock)
+        self._inflight: dict[tuple[int, str], asyncio.Future[bool]] = {}
+
+    async def is_reachable(self, callback_url: str) -> bool:
+        """Return the (cached) reachability verdict for ``callback_url``'s origin."""
+        url = httpx.URL(callback_url)
+        if self._is_trusted(url.host):
+            return True
+        origin = f"{url.scheme}://{url.host}:{url.port or ''}"
+        cached = self._verdicts.get(origin)
+        if cached is not None:
+            return cached
+
+        key = (id(asyncio.get_running_loop()), origin)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            await asyncio.wait([pending])
+            if not pending.cancelled():
+                return pending.result()
+            # The probing request went away; probe for this one instead.
+            return await validate_callback_url(
+                callback_url, self._timeout_seconds, self._transport
+            )
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        try:
+            verdict = await validate_callback_url(
+                callback_url, self._timeout_seconds, self._transport
+            )
+            ttl = self._ttl_seconds if verdict else self._negative_ttl_seconds
+            self._verdicts.put(origin, verdict, ttl)
+            pending.set_result(verdict)
+            return verdict
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        finally:
+            del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop every cached verdict."""
+        self._verdicts.clear()
+
+    def _is_trusted(self, host: str) -> bool:
+        host = host.lower()
+        return host in self._trusted_exact or host.endswith(self._trusted_suffixes)
+
+
+async def validate_callback_url_dependency(
     callback_url: HttpUrl | None = None,
 ) -> str | None:
     """
@@ -69,7 +179,10 @@ def validate_callback_url_dependency(
 
     callback_url_str = str(callback_url)
 
-    if not validate_callback_url(callback_url_str):
+    # Deferred: app.core.services imports this module.
+    from app.core.services import get_callback_url_validator
+
+    if not await get_callback_url_validator().is_reachable(callback_url_str):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Callback URL is not reachable: {callback_url_str}",
@@ -78,77 +191,50 @@ def validate_callback_url_dependency(
     return callback_url_str
 
 
-def _serialize_datetime(obj: Any) -> Any:
-    """Recursively serialize datetime objects to ISO format strings."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {key: _serialize_datetime(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [_serialize_datetime(item) for item in obj]
-    else:
-        return obj
-
-
-def post_task_callback(callback_url: str, payload: dict[str, Any]) -> None:
+def signed_result_url(
+    task_uuid: str, expires_at: int, *, public_base_url: str, secret: str
+) -> str:
+    """Absolute ``GET /task/{id}/callback-result`` link, valid until ``expires_at``."""
+    query = urlencode(
+        {"expires": expires_at, "signature": result_link.sign(task_uuid, expires_at, secret)}
+    )
+    return f"{public_base_url.rstrip('/')}/task/{quote(task_uuid, safe='')}/callback-result?{query}"
+
+
+def build_callback_payload(
+    task: Task,
+    result_chunks: Iterator[bytes] | None,
+    mode: CallbackMode,
+    *,
+    public_base_url: str,
+    secret: str,
+    link_ttl_seconds: int,
+    now: datetime,
+) -> str:
     """
-    POST task callback with serialized datetime objects and retry logic.
+    Serialise the callback body for a finished ``task``.
 
     Args:
-        callback_url: The URL to send the callback to
-        payload: The payload to send
-    """
-    max_retries = get_settings().callback.CALLBACK_MAX_RETRIES
+        task: The finished task (its ``result`` attribute is not used)
+        result_chunks: The stored result JSON, or None when there is none
+        mode: ``full`` for the whole ``Result``; ``reference`` for a link
+        public_base_url: API base URL the receiver can reach
+        secret: Result-link signing secret
+        link_ttl_seconds: Validity of the result link
+        now: Current time (UTC)
 
-    serialized_payload = _serialize_datetime(payload)
-
-    for attempt in range(max_retries):
-        try:
-            with httpx.Client(
-                timeout=float(get_settings().callback.CALLBACK_TIMEOUT)
-            ) as client:
-                response = client.post(callback_url, json=serialized_payload)
-                response.raise_for_status()
-
-            logger.info(
-                "Successfully posted callback to %s",
-                callback_url,
-            )
-            return
-
-        except httpx.TimeoutException as e:
-            logger.warning(
-                "Timeout posting callback to %s (attempt %d/%d): %s",
-                callback_url,
-                attempt + 1,
-                max_retries,
-                str(e),
-            )
-        except httpx.HTTPStatusError as e:
-            logger.warning(
-                "HTTP error posting callback to %s (attempt %d/%d): %s - %s",
-                callback_url,
-                attempt + 1,
-                max_retries,
-                e.response.status_code,
-                e.response.text[:200],
-            )
-        except Exception as e:
-            logger.warning(
-                "Failed to POST callback to %s (attempt %d/%d): %s",
-                callback_url,
-                attempt + 1,
-                max_retries,
-                str(e),
-            )
-
-        if attempt < max_retries - 1:
-            wait_time = 2**attempt
-            logger.debug("Waiting %ss before retry...", wait_time)
-            time.sleep(wait_time)
-
-    logger.error(
-        "All callback attempts failed for %s, after %d attempts",
-        callback_url,
-        max_retries,
-    )
+    Returns:
+        str: The JSON body
+    """
+    if mode is CallbackMode.full:
+        return b"".join(iter_result_json(task, result_chunks)).decode()
+    expires_at = int(now.timestamp()) + link_ttl_seconds
+    return CallbackReference(
+        identifier=task.uuid,
+        status=task.status,
+        error=task.error,
+        result_url=signed_result_url(
+            task.uuid, expires_at, public_base_url=public_base_url, secret=secret
+        ),
+        result_expires_at=datetime.fromtimestamp(expires_at, tz=timezone.utc),
+    ).model_dump_json()
@@ -17,5 +17,8 @@ app = typer.Typer(
 # in those modules find the singleton.
 from app.cli.commands import create_admin as _create_admin  # noqa: E402, F401
 from app.cli.commands import backfill_tasks as _backfill_tasks  # noqa: E402, F401
+from app.cli.commands import (  # noqa: E402, F401
+    backfill_search_index as _backfill_search_index,
+)
 
 __all__ = ["app"]
@@ -20,6 +20,7 @@ from dataclasses import dataclass
 from typing import Callable
 
 import typer
+from sqlalchemy.engine import Engine
 
 from app.core import services as core_services
 from app.core.logging import logger
@@ -29,7 +30,7 @@ from app.infrastructure.database.connection import SessionLocal, engine
 from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
-from app.services.auth import AuthService
+from app.services.auth import AuthService, PasswordService
 
 
 @dataclass
@@ -44,7 +45,7 @@ class _CliContainer:
 
     auth_service: Callable[[], AuthService]
     user_repository: Callable[[], IUserRepository]
-    db_engine: Callable[[], object]
+    db_engine: Callable[[], Engine]
 
 
 def _build_auth_service() -> AuthService:
@@ -54,11 +55,13 @@ def _build_auth_service() -> AuthService:
     session to the service for the whole invocation matches the legacy
     Container.auth_service() lifecycle (the per-command session lives
     until the process exits — no pool exhaustion concern at this scale).
+    Hashing runs inline on an unpooled ``PasswordService``: the request
+    path's bounded pool could reject a CLI hash as busy.
     """
     session = SessionLocal()
     return AuthService(
         user_repository=SQLAlchemyUserRepository(session),
-        password_service=core_services.get_password_service(),
+        password_service=PasswordService(),
         token_service=core_services.get_token_service(),
     )
 
@@ -3,4 +3,5 @@
 Individual commands live in sibling modules:
     - create_admin.py — populated in plan 12-02
     - backfill_tasks.py — populated in plan 12-03
+    - backfill_search_index.py — builds tasks_fts for pre-0005 rows
 """
@@ -0,0 +1,164 @@
+"""`python -m app.cli backfill-search-index` — build tasks_fts for existing rows.
+
+New results are indexed as they are written (``SQLAlchemyTaskRepository
+.update``); tasks completed before migration ``0005_tasks_fts`` have no
+search rows until this command runs. Results are read from
+``task_results`` (decompressed), falling back to a legacy inline
+``tasks.result``.
+
+Inputs:
+  --batch-size <n>   Tasks indexed per transaction (default 200).
+  --dry-run          Report how many tasks would be indexed; write nothing.
+
+Pre-conditions:
+  - The database is SQLite (the index is SQLite-only) — else exit 1.
+  - ``tasks_fts`` exists (migration 0005 applied) — else exit 1.
+
+Post-conditions:
+  - Every completed task with a result has a file-name row in
+    ``tasks_fts``; verified by re-counting after the run. Mismatch → exit 1
+    (fail loud — tiger-style, mirrors ``backfill-tasks``).
+
+Idempotency:
+  - ``index_task`` replaces a task's rows, so re-running is safe; 0
+    candidates → exit 0.
+"""
+
+from __future__ import annotations
+
+import typer
+from sqlalchemy import or_, select, text
+from sqlalchemy.orm import Session
+
+from app.cli import app
+from app.cli._helpers import _get_container
+from app.core.logging import logger
+from app.infrastructure.database import task_search_index
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import TaskResult
+from app.infrastructure.database.result_store import StoredResult
+
+_FTS_EXISTS_SQL = (
+    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = :name"
+)
+_COUNT_CANDIDATES_SQL = (
+    "SELECT COUNT(*) FROM tasks WHERE status = 'completed' "
+    "AND (result_size IS NOT NULL OR result IS NOT NULL)"
+)
+_COUNT_INDEXED_SQL = (
+    f"SELECT COUNT(*) FROM {task_search_index.FTS_TABLE} "
+    f"WHERE (rowid & {task_search_index.MAX_SEGMENTS}) = 0"
+)
+
+
+@app.command(name="backfill-search-index")
+def backfill_search_index(
+    batch_size: int = typer.Option(
+        200,
+        "--batch-size",
+        min=1,
+        help="Tasks indexed per transaction.",
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Report the number of tasks to index and exit without writing.",
+    ),
+) -> None:
+    """Index every completed task's file name and transcript into tasks_fts."""
+    engine = _get_container().db_engine()
+
+    # Guard 0: FTS5 is SQLite-only; other backends have no tasks_fts.
+    if engine.dialect.name != "sqlite":
+        typer.echo(
+            f"{task_search_index.FTS_TABLE} is only maintained on SQLite "
+            f"(database is {engine.dialect.name}).",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    with engine.connect() as conn:
+        has_fts = conn.execute(
+            text(_FTS_EXISTS_SQL), {"name": task_search_index.FTS_TABLE}
+        ).scalar_one()
+        candidates = conn.execute(text(_COUNT_CANDIDATES_SQL)).scalar_one()
+
+    # Guard 1: schema not migrated — nothing sensible to do.
+    if not has_fts:
+        typer.echo(
+            f"{task_search_index.FTS_TABLE} does not exist — run "
+            f"`alembic upgrade head` first.",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    # Guard 2: nothing to do — exit cleanly (idempotency).
+    if candidates == 0:
+        typer.echo("No completed tasks to index.")
+        return
+
+    # Guard 3: dry-run — report and exit before touching data.
+    if dry_run:
+        typer.echo(f"Would index {candidates} completed tasks. [dry-run]")
+        return
+
+    indexed = 0
+    segments = 0
+    last_id = 0
+    with Session(engine) as session:
+        while True:
+            rows = session.execute(
+                select(
+                    ORMTask.id,
+                    ORMTask.file_name,
+                    ORMTask.result,
+                    TaskResult.codec,
+                    TaskResult.raw_size,
+                    TaskResult.data,
+                )
+                .outerjoin(TaskResult, TaskResult.task_id == ORMTask.id)
+                .where(
+                    ORMTask.status == "completed",
+                    or_(ORMTask.result_size.is_not(None), ORMTask.result.is_not(None)),
+                    ORMTask.id > last_id,
+                )
+                .order_by(ORMTask.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            for row in rows:
+                result = row.result
+                if row.data is not None:
+                    result = StoredResult(
+                        codec=row.codec, raw_size=row.raw_size, data=row.data
+                    ).decode()
+                segments += task_search_index.index_task(
+                    session, task_id=row.id, file_name=row.file_name, result=result
+                )
+            session.commit()
+            indexed += len(rows)
+            last_id = rows[-1].id
+            typer.echo(f"Indexed {indexed}/{candidates} tasks...")
+
+    # Post-condition: one file-name row per indexed task (tiger-style fail-loud).
+    with engine.connect() as conn:
+        indexed_rows = conn.execute(text(_COUNT_INDEXED_SQL)).scalar_one()
+    if indexed_rows < indexed:
+        typer.echo(
+            f"verification failed: {indexed_rows} tasks present in "
+            f"{task_search_index.FTS_TABLE} after indexing {indexed}. "
+            f"Investigate before relying on search.",
+            err=True,
+        )
+        logger.error(
+            "backfill-search-index post-condition fail indexed=%s present=%s",
+            indexed,
+            indexed_rows,
+        )
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Indexed {indexed} tasks ({segments} transcript segments).")
+    logger.info(
+        "CLI backfill-search-index success tasks=%s segments=%s", indexed, segments
+    )
@@ -39,6 +39,11 @@ def generate() -> tuple[str, str, str]:
     return plaintext, prefix, _sha256_hex(plaintext)
 
 
+def digest(plaintext: str) -> str:
+    """SHA-256 hex of ``plaintext`` — the value stored in ``api_keys.hash``."""
+    return _sha256_hex(plaintext)
+
+
 def verify(plaintext: str, stored_hash: str) -> bool:
     """Constant-time SHA-256 hash compare."""
     return secrets.compare_digest(_sha256_hex(plaintext), stored_hash)
@@ -1,7 +1,9 @@
 """Configuration module for the WhisperX FastAPI application."""
 
 from functools import lru_cache
-from typing import Optional
+from pathlib import Path
+from tempfile import gettempdir
+from typing import Literal, Optional
 
 import torch
 from pydantic import Field, SecretStr, computed_field, field_validator, model_validator
@@ -21,6 +23,59 @@ class DatabaseSettings(BaseSettings):
         default=False,
         description="Echo SQL queries for debugging",
     )
+    DB_ASYNC_POOL_SIZE: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open by the request-path async engine",
+    )
+    DB_ASYNC_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        description="Extra async connections opened under load and closed when returned",
+    )
+
+    # SQLite performance profile — applied by the connect listener in
+    # app/infrastructure/database/connection.py on every new connection.
+    # Enum-typed so only known PRAGMA values can reach the SQL string.
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL",
+        description="SQLite journal_mode (WAL lets readers run alongside the writer)",
+    )
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="SQLite synchronous level (NORMAL is durable under WAL except on power loss)",
+    )
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5000,
+        ge=0,
+        description="Milliseconds a connection waits on a lock before 'database is locked'",
+    )
+    SQLITE_CACHE_SIZE_KIB: int = Field(
+        default=65536,
+        ge=0,
+        description="Per-connection page cache size in KiB (0 keeps the SQLite default)",
+    )
+    SQLITE_MMAP_SIZE: int = Field(
+        default=256 * 1024 * 1024,
+        ge=0,
+        description="Bytes of the database file to memory-map for reads (0 disables)",
+    )
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="Where SQLite keeps temporary tables and sort indices",
+    )
+    PROGRESS_WRITE_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "Minimum seconds between task-progress DB writes within one stage "
+            "(stage transitions always write; WebSocket updates are not throttled)"
+        ),
+    )
+    DB_QUERY_COUNT_HEADER: bool = Field(
+        default=False,
+        description="Send X-DB-Query-Count (SQL statements run per request) on HTTP responses",
+    )
 
 
 class WhisperSettings(BaseSettings):
@@ -129,7 +184,108 @@ class CallbackSettings(BaseSettings):
     )
     CALLBACK_MAX_RETRIES: int = Field(
         default=3,
-        description="Maximum number of retries for failed callback requests",
+        ge=1,
+        description="Delivery attempts per callback before it is marked failed",
+    )
+    CALLBACK_RETRY_BASE_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="Backoff before the 2nd attempt; doubles per attempt after that",
+    )
+    CALLBACK_RETRY_MAX_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Upper bound on the backoff between two attempts",
+    )
+    CALLBACK_MAX_CONNECTIONS: int = Field(
+        default=50,
+        ge=1,
+        description="Pooled connections of the shared callback HTTP client",
+    )
+    CALLBACK_MAX_CONNECTIONS_PER_HOST: int = Field(
+        default=4,
+        ge=1,
+        description="Concurrent deliveries to one callback host",
+    )
+    CALLBACK_POLL_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds between outbox polls when no delivery was signalled",
+    )
+    CALLBACK_BATCH_SIZE: int = Field(
+        default=20,
+        ge=1,
+        description="Most due deliveries claimed per dispatcher pass",
+    )
+    CALLBACK_PROBE_TTL_SECONDS: float = Field(
+        default=300.0,
+        ge=0,
+        description="Seconds a reachable callback origin is not probed again; 0 disables",
+    )
+    CALLBACK_PROBE_NEGATIVE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds an unreachable callback origin stays rejected; 0 disables",
+    )
+    CALLBACK_TRUSTED_HOSTS: str = Field(
+        default="",
+        description=(
+            "Comma-separated callback hosts accepted without a probe "
+            "(exact, or '*.example.com' for subdomains)"
+        ),
+    )
+    CALLBACK_GZIP_MIN_BYTES: int = Field(
+        default=1024,
+        ge=0,
+        description="Callback bodies of at least this size are sent gzip-encoded; 0 disables",
+    )
+    CALLBACK_PUBLIC_BASE_URL: str = Field(
+        default="http://localhost:8000",
+        description="Externally reachable API base URL used in reference-mode result links",
+    )
+    CALLBACK_RESULT_LINK_TTL_SECONDS: int = Field(
+        default=86400,
+        ge=60,
+        description="Validity of the signed result link in reference-mode callbacks",
+    )
+
+
+class UrlDownloadSettings(BaseSettings):
+    """``/speech-to-text-url`` download and cache settings."""
+
+    URL_DOWNLOAD_MAX_BYTES: int = Field(
+        default=5 * 1024 * 1024 * 1024,
+        ge=1,
+        description="Largest URL source accepted; enforced while streaming",
+    )
+    URL_DOWNLOAD_CHUNK_BYTES: int = Field(
+        default=1024 * 1024,
+        ge=64 * 1024,
+        description="Read/write chunk size of URL downloads",
+    )
+    URL_DOWNLOAD_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Connect/read timeout of URL downloads (per operation, not total)",
+    )
+    URL_DOWNLOAD_RANGE_SEGMENTS: int = Field(
+        default=4,
+        ge=1,
+        description="Parallel Range requests for large sources; 1 disables",
+    )
+    URL_DOWNLOAD_RANGE_MIN_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1,
+        description="Sources at least this large are fetched in Range segments",
+    )
+    URL_DOWNLOAD_CACHE_DIR: str = Field(
+        default=str(Path(gettempdir()) / "whisperx_url_cache"),
+        description="Directory of the URL download cache",
+    )
+    URL_DOWNLOAD_CACHE_MAX_BYTES: int = Field(
+        default=10 * 1024 * 1024 * 1024,
+        ge=0,
+        description="Size budget of the URL download cache (LRU); 0 disables the cache",
     )
 
 
@@ -155,9 +311,43 @@ class AuthSettings(BaseSettings):
         description="HS256 secret for session tokens (override in production)",
     )
     JWT_TTL_DAYS: int = Field(default=7, description="JWT validity period (days)")
+    JWT_REFRESH_THRESHOLD_HOURS: float = Field(
+        default=144.0,
+        ge=0,
+        description=(
+            "Sliding refresh re-issues the session cookie only once the JWT has "
+            "less than this many hours left (>= JWT_TTL_DAYS*24 refreshes always)"
+        ),
+    )
+    SESSION_USER_CACHE_TTL_SECONDS: float = Field(
+        default=15.0,
+        ge=0,
+        description=(
+            "Seconds a cookie-auth user snapshot, keyed by (user_id, token_version), "
+            "is served from the per-process cache; 0 disables the cache"
+        ),
+    )
     ARGON2_M_COST: int = Field(default=19456, description="Argon2 memory cost (KiB)")
     ARGON2_T_COST: int = Field(default=2, description="Argon2 time cost (iterations)")
     ARGON2_PARALLELISM: int = Field(default=1, description="Argon2 parallelism")
+    ARGON2_MAX_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        description="Argon2 hash/verify calls run at once per process (pool workers)",
+    )
+    ARGON2_MAX_PENDING: int = Field(
+        default=16,
+        ge=1,
+        description=(
+            "Argon2 calls admitted per process (running + queued); past this "
+            "register/login answer 503 + Retry-After"
+        ),
+    )
+    ARGON2_BUSY_RETRY_AFTER_SECONDS: int = Field(
+        default=1,
+        ge=1,
+        description="Retry-After sent when the Argon2 pool is saturated",
+    )
     CSRF_SECRET: SecretStr = Field(
         default=SecretStr("change-me-dev-only"),
         description="CSRF double-submit token signing secret",
@@ -184,6 +374,52 @@ class AuthSettings(BaseSettings):
         default=False,
         description="Trust CF-Connecting-IP for slowapi key_func (RATE-01)",
     )
+    RATE_LIMIT_BACKEND: Literal["database", "memory"] = Field(
+        default="database",
+        description=(
+            "Token-bucket store: 'database' (rate_limit_buckets, shared by all "
+            "workers) or 'memory' (per-process, write-behind to the table). "
+            "With 'memory' each worker enforces its own buckets, so N workers "
+            "allow N times every quota; use it with a single worker only"
+        ),
+    )
+    RATE_LIMIT_FLUSH_INTERVAL_SECONDS: float = Field(
+        default=5.0,
+        gt=0,
+        description="Seconds between write-behind flushes of the in-memory bucket store",
+    )
+    API_KEY_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        ge=0,
+        description=(
+            "Seconds a verified bearer key (and its user snapshot) is served from "
+            "the per-process cache; 0 disables the cache"
+        ),
+    )
+    API_KEY_CACHE_MAX_ENTRIES: int = Field(
+        default=10_000,
+        ge=1,
+        description="Most verified bearer keys cached per process (LRU eviction)",
+    )
+    API_KEY_LAST_USED_FLUSH_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds between batched writes of buffered api_keys.last_used_at",
+    )
+    RATE_LIMIT_STORAGE_URI: str = Field(
+        default="memory://",
+        description=(
+            "slowapi limiter storage: 'memory://' (per process), "
+            "'sqlite:///<path>' (one file shared by every worker on the host; "
+            "a check that waits more than a few ms for the file lock is denied "
+            "with 429 instead of blocking the event loop) "
+            "or 'redis://host:port/db' (needs the redis package)"
+        ),
+    )
+    RATE_LIMIT_STRATEGY: Literal["fixed-window", "moving-window"] = Field(
+        default="moving-window",
+        description="slowapi window strategy for the per-subnet route limits",
+    )
     HCAPTCHA_ENABLED: bool = Field(
         default=False,
         description="Enable hCaptcha verify on register/login (ANTI-05; default off)",
@@ -250,6 +486,7 @@ class Settings(BaseSettings):
     whisper: WhisperSettings = Field(default_factory=WhisperSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     callback: CallbackSettings = Field(default_factory=CallbackSettings)
+    url_download: UrlDownloadSettings = Field(default_factory=UrlDownloadSettings)
     auth: AuthSettings = Field(default_factory=AuthSettings)
 
     @field_validator("ENVIRONMENT", mode="before")
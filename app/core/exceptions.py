@@ -691,6 +691,18 @@ class JwtTamperedError(DomainError):
         )
 
 
+class PasswordHasherBusyError(InfrastructureError):
+    """Argon2 pool queue is full — shed the request (503 + Retry-After)."""
+
+    def __init__(self, pending: int, retry_after_seconds: int = 1) -> None:
+        super().__init__(
+            message=f"Password hashing saturated: {pending} calls pending",
+            code="PASSWORD_HASHER_BUSY",
+            user_message="The service is busy. Please try again shortly.",
+            retry_after_seconds=retry_after_seconds,
+        )
+
+
 class WeakPasswordError(ValidationError):
     """Password rejected by complexity rules (Phase 13 wires the policy)."""
 
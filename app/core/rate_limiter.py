@@ -9,10 +9,13 @@ Per RATE-01 + Phase-13 CONTEXT §107:
 * IPv4 clients are grouped by ``/24`` subnet; IPv6 clients by ``/64``. This
   matches the anti-DDOS policy from CONTEXT §118 (register 3/hr/ip:/24,
   login 10/hr/ip:/24).
-* Slowapi storage backend: in-memory leaky bucket (process-local). Acceptable
-  for v1.2 single-worker deploys — the bot-scale attacks the threat model
-  (T-13-11 / T-13-12) targets are foiled even by a per-process bucket. Multi-
-  worker deployments must swap storage to redis/limits before Phase 18.
+* Slowapi storage backend: ``AUTH__RATE_LIMIT_STORAGE_URI``. The default
+  ``memory://`` is process-local — fine for single-worker deploys, but with
+  N workers every limit is effectively N times higher. Multi-worker hosts
+  point it at ``sqlite:///<file>`` (``SQLiteLimitsStorage``, atomic across
+  processes); multi-host deploys at ``redis://`` (needs the redis package).
+* Strategy: ``AUTH__RATE_LIMIT_STRATEGY`` (default ``moving-window``), so a
+  burst straddling a fixed-window boundary cannot double the budget.
 
 Single source of truth: every Phase 13 route that wants slowapi enforcement
 imports ``limiter`` from this module. Never instantiate a second Limiter.
@@ -32,6 +35,10 @@ from starlette.responses import JSONResponse
 
 from app.core.config import get_settings
 
+# Imported for its side effect: registers the ``sqlite://`` storage scheme
+# with ``limits`` before the Limiter parses the storage URI.
+from app.infrastructure.rate_limit import sqlite_limits_storage  # noqa: F401
+
 logger = logging.getLogger(__name__)
 
 _DEFAULT_RETRY_AFTER_SECONDS = 60
@@ -75,8 +82,13 @@ def _client_subnet_key(request: Request) -> str:
 # Module-level singleton — used by `@limiter.limit("3/hour")` decorators on
 # /auth/register, /auth/login, etc. App wiring (mounting limiter onto
 # `app.state.limiter`) lives in plan 13-09.
+_auth_settings = get_settings().auth
 limiter = Limiter(
-    key_func=_client_subnet_key, default_limits=[], enabled=_RATE_LIMIT_ENABLED
+    key_func=_client_subnet_key,
+    default_limits=[],
+    enabled=_RATE_LIMIT_ENABLED,
+    storage_uri=_auth_settings.RATE_LIMIT_STORAGE_URI,
+    strategy=_auth_settings.RATE_LIMIT_STRATEGY,
 )
 if not _RATE_LIMIT_ENABLED:
     logger.warning("rate limiter DISABLED via RATE_LIMIT_ENABLED=false (test/dev only)")
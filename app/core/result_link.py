@@ -0,0 +1,42 @@
+"""Signed, expiring links to a task result (callback reference mode).
+
+A reference-mode callback carries a URL instead of the transcript. The URL
+names the task and an expiry (unix seconds) and is authenticated by an
+HMAC-SHA256 over both, so the receiver can fetch the result without an API
+key until the link expires.
+
+- Signature: urlsafe-base64 (unpadded) HMAC-SHA256 of ``"<uuid>.<expires>"``
+  keyed with ``_PURPOSE`` + the server secret — a link signature is never
+  valid as any other token signed with the same secret.
+- Verify: constant-time compare; an expired link fails like a forged one.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import secrets
+
+_PURPOSE = b"task-result-link:"
+_SIGNATURE_LENGTH = 43  # unpadded urlsafe-base64 of a 32-byte digest
+assert _SIGNATURE_LENGTH == 43, "result-link signature length drift"
+
+
+def sign(task_uuid: str, expires_at: int, secret: str) -> str:
+    """Return the link signature for ``task_uuid`` valid until ``expires_at``."""
+    digest = hmac.new(
+        _PURPOSE + secret.encode("utf-8"),
+        f"{task_uuid}.{expires_at}".encode("utf-8"),
+        hashlib.sha256,
+    ).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
+
+
+def verify(
+    task_uuid: str, expires_at: int, signature: str, secret: str, *, now: float
+) -> bool:
+    """True when ``signature`` is valid for the link and it has not expired."""
+    if expires_at <= now or len(signature) != _SIGNATURE_LENGTH:
+        return False
+    return secrets.compare_digest(sign(task_uuid, expires_at, secret), signature)
@@ -24,8 +24,34 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.callbacks import CallbackUrlValidator, parse_trusted_hosts
 from app.core.config import get_settings
+from app.domain.repositories.rate_limit_repository import (
+    IAsyncRateLimitRepository,
+    IRateLimitRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_rate_limit_repository import (
+    AsyncSQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
+    SQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.database.api_key_cache import ApiKeyCache, LastUsedBuffer
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.task_count_cache import TaskCountCache
+from app.infrastructure.database.user_snapshot_cache import UserSnapshotCache
+from app.infrastructure.rate_limit.bucket_store import ShardedBucketStore
+from app.infrastructure.rate_limit.in_memory_rate_limit_repository import (
+    AsyncInMemoryRateLimitRepository,
+    InMemoryRateLimitRepository,
+)
+from app.infrastructure.storage.url_downloader import UrlDownloader
+from app.infrastructure.webhooks import WebhookDispatcher
 from app.services.auth.csrf_service import CsrfService
+from app.services.auth.password_pool import PasswordHashPool
 from app.services.auth.password_service import PasswordService
 from app.services.auth.token_service import TokenService
 from app.services.file_service import FileService
@@ -37,10 +63,21 @@ from app.services.ws_ticket_service import WsTicketService
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=1)
+def get_password_hash_pool() -> PasswordHashPool:
+    """Return the process-wide bounded Argon2 pool (size + admission from settings)."""
+    auth = get_settings().auth
+    return PasswordHashPool(
+        workers=auth.ARGON2_MAX_CONCURRENCY,
+        max_pending=max(auth.ARGON2_MAX_PENDING, auth.ARGON2_MAX_CONCURRENCY),
+        retry_after_seconds=auth.ARGON2_BUSY_RETRY_AFTER_SECONDS,
+    )
+
+
 @lru_cache(maxsize=1)
 def get_password_service() -> PasswordService:
-    """Return the process-wide PasswordService singleton."""
-    return PasswordService()
+    """Return the process-wide PasswordService singleton (hashes on the pool)."""
+    return PasswordService(pool=get_password_hash_pool())
 
 
 @lru_cache(maxsize=1)
@@ -52,8 +89,11 @@ def get_csrf_service() -> CsrfService:
 @lru_cache(maxsize=1)
 def get_token_service() -> TokenService:
     """Return the process-wide TokenService singleton (JWT secret bound at first call)."""
+    auth = get_settings().auth
     return TokenService(
-        secret=get_settings().auth.JWT_SECRET.get_secret_value(),
+        secret=auth.JWT_SECRET.get_secret_value(),
+        ttl_days=auth.JWT_TTL_DAYS,
+        refresh_threshold_seconds=auth.JWT_REFRESH_THRESHOLD_HOURS * 3600,
     )
 
 
@@ -68,10 +108,103 @@ def get_ws_ticket_service() -> WsTicketService:
     return WsTicketService()
 
 
+@lru_cache(maxsize=1)
+def get_task_count_cache() -> TaskCountCache:
+    """Return the process-wide TaskCountCache singleton (short-TTL task totals)."""
+    return TaskCountCache()
+
+
+@lru_cache(maxsize=1)
+def get_api_key_cache() -> ApiKeyCache:
+    """Return the process-wide verified bearer-key cache (TTL + size from settings)."""
+    auth = get_settings().auth
+    return ApiKeyCache(
+        ttl_seconds=auth.API_KEY_CACHE_TTL_SECONDS,
+        max_entries=auth.API_KEY_CACHE_MAX_ENTRIES,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_user_snapshot_cache() -> UserSnapshotCache:
+    """Return the process-wide cookie-auth user snapshot cache."""
+    return UserSnapshotCache(ttl_seconds=get_settings().auth.SESSION_USER_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def get_last_used_buffer() -> LastUsedBuffer:
+    """Return the process-wide buffer of pending ``api_keys.last_used_at`` stamps."""
+    return LastUsedBuffer()
+
+
+@lru_cache(maxsize=1)
+def get_bucket_store() -> ShardedBucketStore:
+    """Return the process-wide in-memory token-bucket store (``RATE_LIMIT_BACKEND=memory``)."""
+    return ShardedBucketStore()
+
+
+def rate_limit_repository(db: Session) -> IRateLimitRepository:
+    """Bucket repository for the configured ``AUTH__RATE_LIMIT_BACKEND``."""
+    if get_settings().auth.RATE_LIMIT_BACKEND == "memory":
+        return InMemoryRateLimitRepository(get_bucket_store())
+    return SQLAlchemyRateLimitRepository(db)
+
+
+def async_rate_limit_repository(db: AsyncSession) -> IAsyncRateLimitRepository:
+    """Async bucket repository for the configured ``AUTH__RATE_LIMIT_BACKEND``."""
+    if get_settings().auth.RATE_LIMIT_BACKEND == "memory":
+        return AsyncInMemoryRateLimitRepository(get_bucket_store())
+    return AsyncSQLAlchemyRateLimitRepository(db)
+
+
+@lru_cache(maxsize=1)
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Return the process-wide task-callback dispatcher (started in the lifespan)."""
+    callback = get_settings().callback
+    return WebhookDispatcher(
+        SessionLocal,
+        timeout_seconds=float(callback.CALLBACK_TIMEOUT),
+        max_attempts=callback.CALLBACK_MAX_RETRIES,
+        retry_base_seconds=callback.CALLBACK_RETRY_BASE_SECONDS,
+        retry_max_seconds=callback.CALLBACK_RETRY_MAX_SECONDS,
+        max_connections=callback.CALLBACK_MAX_CONNECTIONS,
+        max_per_host=callback.CALLBACK_MAX_CONNECTIONS_PER_HOST,
+        poll_seconds=callback.CALLBACK_POLL_SECONDS,
+        batch_size=callback.CALLBACK_BATCH_SIZE,
+        gzip_min_bytes=callback.CALLBACK_GZIP_MIN_BYTES,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_callback_url_validator() -> CallbackUrlValidator:
+    """Return the process-wide callback URL probe cache."""
+    callback = get_settings().callback
+    return CallbackUrlValidator(
+        timeout_seconds=float(callback.CALLBACK_TIMEOUT),
+        ttl_seconds=callback.CALLBACK_PROBE_TTL_SECONDS,
+        negative_ttl_seconds=callback.CALLBACK_PROBE_NEGATIVE_TTL_SECONDS,
+        trusted_hosts=parse_trusted_hosts(callback.CALLBACK_TRUSTED_HOSTS),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_url_downloader() -> UrlDownloader:
+    """Return the process-wide URL source downloader (with its disk cache)."""
+    download = get_settings().url_download
+    return UrlDownloader(
+        max_bytes=download.URL_DOWNLOAD_MAX_BYTES,
+        chunk_bytes=download.URL_DOWNLOAD_CHUNK_BYTES,
+        timeout_seconds=download.URL_DOWNLOAD_TIMEOUT_SECONDS,
+        range_segments=download.URL_DOWNLOAD_RANGE_SEGMENTS,
+        range_min_bytes=download.URL_DOWNLOAD_RANGE_MIN_BYTES,
+        cache_dir=download.URL_DOWNLOAD_CACHE_DIR,
+        cache_max_bytes=download.URL_DOWNLOAD_CACHE_MAX_BYTES,
+    )
+
+
 @lru_cache(maxsize=1)
 def get_file_service() -> FileService:
     """Return the process-wide FileService singleton."""
-    return FileService()
+    return FileService(downloader=get_url_downloader())
 
 
 # ---------------------------------------------------------------------------
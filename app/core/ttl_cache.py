@@ -0,0 +1,77 @@
+"""Bounded, thread-safe TTL + LRU map shared by the in-process caches.
+
+``TTLCache`` stores each value with its own expiry: ``get`` drops an
+expired entry and refreshes the recency of a live one; ``put`` evicts the
+least recently used entry once ``max_entries`` is exceeded. One
+``threading.Lock`` guards the map, so event-loop readers and threadpool
+writers can share an instance. Values are stored as given — callers that
+hand out mutable values copy them on the way in and out.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """``K -> V`` with per-entry TTL expiry and LRU eviction."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for ``key``, or None when absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V, ttl_seconds: float) -> None:
+        """Store ``value`` for ``ttl_seconds``; a TTL <= 0 stores nothing."""
+        if ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, stale: Callable[[K, V], bool]) -> None:
+        """Drop every entry for which ``stale(key, value)`` is true."""
+        with self._lock:
+            stale_keys = [
+                key for key, (_, value) in self._entries.items() if stale(key, value)
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -4,6 +4,17 @@ from app.domain.entities.api_key import ApiKey
 from app.domain.entities.device_fingerprint import DeviceFingerprint
 from app.domain.entities.rate_limit_bucket import RateLimitBucket
 from app.domain.entities.task import Task
+from app.domain.entities.task_search_hit import SegmentMatch, TaskSearchHit
 from app.domain.entities.user import User
+from app.domain.entities.webhook_delivery import WebhookDelivery
 
-__all__ = ["ApiKey", "DeviceFingerprint", "RateLimitBucket", "Task", "User"]
+__all__ = [
+    "ApiKey",
+    "DeviceFingerprint",
+    "RateLimitBucket",
+    "SegmentMatch",
+    "Task",
+    "TaskSearchHit",
+    "User",
+    "WebhookDelivery",
+]
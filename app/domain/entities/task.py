@@ -21,6 +21,8 @@ class Task:
         file_name: Name of the file associated with the task
         url: URL of the file associated with the task
         callback_url: Callback URL to POST results to
+        callback_status: Callback delivery status (pending, delivered,
+                 failed); ``None`` when no callback was requested
         audio_duration: Duration of the audio in seconds
         language: Language of the file associated with the task
         task_params: Parameters of the task
@@ -45,6 +47,7 @@ class Task:
     file_name: str | None = None
     url: str | None = None
     callback_url: str | None = None
+    callback_status: str | None = None
     audio_duration: float | None = None
     language: str | None = None
     task_params: dict[str, Any] | None = None
@@ -0,0 +1,39 @@
+"""Domain entities for full-text task search results."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class SegmentMatch:
+    """One matching transcript segment.
+
+    Attributes:
+        start: Segment start in seconds (None if the transcript had none).
+        end: Segment end in seconds (None if the transcript had none).
+        snippet: Excerpt around the matched terms, terms wrapped in ``[]``.
+    """
+
+    start: float | None
+    end: float | None
+    snippet: str
+
+
+@dataclass
+class TaskSearchHit:
+    """A task matching a full-text query, with its best-ranked matches.
+
+    Attributes:
+        uuid: Task UUID.
+        file_name: Task file name.
+        rank: bm25 rank of the best match — lower is more relevant.
+        file_name_snippet: Highlighted file name when the name matched.
+        segments: Matching transcript segments, most relevant first.
+    """
+
+    uuid: str
+    file_name: str | None
+    rank: float
+    file_name_snippet: str | None = None
+    segments: list[SegmentMatch] = field(default_factory=list)
@@ -0,0 +1,24 @@
+"""Domain entity for WebhookDelivery — pure Python, framework-free."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WebhookDelivery:
+    """A claimed task-completion callback, ready to be POSTed.
+
+    Attributes:
+        id: Outbox row id.
+        task_id: Owning task's primary-key id.
+        url: Callback URL.
+        payload: JSON request body (already serialised).
+        attempt: 1-based number of the attempt this claim represents.
+    """
+
+    id: int
+    task_id: int
+    url: str
+    payload: str
+    attempt: int
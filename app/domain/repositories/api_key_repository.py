@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Protocol
 
 from app.domain.entities.api_key import ApiKey
+from app.domain.entities.user import User
 
 
 class IApiKeyRepository(Protocol):
@@ -76,6 +78,22 @@ class IApiKeyRepository(Protocol):
         """
         ...
 
+    def mark_used_many(self, stamps: Mapping[int, datetime]) -> int:
+        """Write buffered ``last_used_at`` stamps in one batch.
+
+        Missing keys are skipped; a stamp never overwrites a newer one.
+
+        Args:
+            stamps: ``api_key id -> last_used_at``.
+
+        Returns:
+            int: Number of rows updated.
+
+        Raises:
+            DatabaseOperationError: If the update fails.
+        """
+        ...
+
     def revoke(self, identifier: int) -> None:
         """Soft-delete (set ``revoked_at = now``). Idempotent.
 
@@ -86,3 +104,48 @@ class IApiKeyRepository(Protocol):
             DatabaseOperationError: If the key is not found or update fails.
         """
         ...
+
+
+class IAsyncApiKeyRepository(Protocol):
+    """Async subset of ``IApiKeyRepository`` used for request-path bearer auth.
+
+    Same contracts as the sync methods of the same names.
+    """
+
+    async def get_by_prefix(self, prefix: str) -> list[ApiKey]:
+        """Indexed lookup of ACTIVE keys (``revoked_at IS NULL``) matching prefix.
+
+        Args:
+            prefix: 8-char prefix string.
+
+        Returns:
+            list[ApiKey]: All active keys whose ``prefix`` column equals ``prefix``.
+        """
+        ...
+
+    async def get_active_with_user_by_prefix(
+        self, prefix: str
+    ) -> list[tuple[ApiKey, User]]:
+        """ACTIVE keys matching ``prefix`` paired with their owning users.
+
+        One JOIN instead of ``get_by_prefix`` + a user lookup.
+
+        Args:
+            prefix: 8-char prefix string.
+
+        Returns:
+            list[tuple[ApiKey, User]]: ``(key, owner)`` per active candidate.
+        """
+        ...
+
+    async def mark_used(self, identifier: int, when: datetime) -> None:
+        """Update ``last_used_at`` on a single ``api_key`` row.
+
+        Args:
+            identifier: Primary-key id of the key.
+            when: Timestamp to record.
+
+        Raises:
+            DatabaseOperationError: If the key is not found or update fails.
+        """
+        ...
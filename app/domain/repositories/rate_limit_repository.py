@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any, Protocol
 
 from app.domain.entities.rate_limit_bucket import RateLimitBucket
@@ -36,3 +37,72 @@ class IRateLimitRepository(Protocol):
             DatabaseOperationError: If the upsert fails.
         """
         ...
+
+    def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, RateLimitBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read-modify-write several buckets in one ``BEGIN IMMEDIATE`` transaction.
+
+        Args:
+            bucket_keys: Keys to load; missing buckets are absent from the
+                mapping passed to ``decide``.
+            decide: Computes the new state of each bucket to write from the
+                current buckets (``{}`` writes nothing). An exception it
+                raises rolls back the transaction and propagates unchanged.
+
+        Raises:
+            DatabaseOperationError: If the read or the writes fail.
+        """
+        ...
+
+
+class IAsyncRateLimitRepository(Protocol):
+    """Async counterpart of ``IRateLimitRepository`` (request-path checks).
+
+    Same contracts as the sync methods of the same names.
+    """
+
+    async def get_by_key(self, bucket_key: str) -> RateLimitBucket | None:
+        """Get a bucket by its unique key.
+
+        Args:
+            bucket_key: Unique bucket identifier.
+
+        Returns:
+            RateLimitBucket | None: Bucket if found, ``None`` if not yet created.
+        """
+        ...
+
+    async def upsert_atomic(self, bucket_key: str, new_state: dict[str, Any]) -> None:
+        """Read-modify-write a bucket atomically (``BEGIN IMMEDIATE``).
+
+        Args:
+            bucket_key: Unique bucket identifier.
+            new_state: Mapping with at least ``tokens`` (int) and ``last_refill``
+                (datetime) keys.
+
+        Raises:
+            DatabaseOperationError: If the upsert fails.
+        """
+        ...
+
+    async def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, RateLimitBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read-modify-write several buckets in one ``BEGIN IMMEDIATE`` transaction.
+
+        Args:
+            bucket_keys: Keys to load; missing buckets are absent from the
+                mapping passed to ``decide``.
+            decide: Computes the new state of each bucket to write from the
+                current buckets (``{}`` writes nothing). An exception it
+                raises rolls back the transaction and propagates unchanged.
+
+        Raises:
+            DatabaseOperationError: If the read or the writes fail.
+        """
+        ...
@@ -1,8 +1,11 @@
 """Repository interface for Task entity using Protocol for structural typing."""
 
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any, Protocol
 
 from app.domain.entities.task import Task
+from app.domain.entities.task_search_hit import TaskSearchHit
 
 
 class ITaskRepository(Protocol):
@@ -44,10 +47,49 @@ class ITaskRepository(Protocol):
         """
         ...
 
+    def get_summary_by_id(self, identifier: str) -> Task | None:
+        """
+        Get a task by its UUID without its heavy JSON payloads.
+
+        Same lookup and scoping as ``get_by_id`` but ``result`` and
+        ``task_params`` are not loaded (returned as None). For status /
+        progress reads that must not pay to deserialise the transcript.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            Task | None: The Task entity if found, None otherwise
+        """
+        ...
+
+    def get_result_stream(
+        self, identifier: str
+    ) -> tuple[Task, Iterator[bytes] | None] | None:
+        """
+        Get a task together with its result as serialised JSON chunks.
+
+        Same lookup and scoping as ``get_by_id``. The result is not parsed:
+        concatenating the chunks yields its JSON document, so callers can
+        stream it straight into a response. The returned entity's
+        ``result`` is None.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            ``(task, chunks)`` — ``chunks`` is None when the task has no
+            result — or None if the task is not found.
+        """
+        ...
+
     def get_all(self) -> list[Task]:
         """
         Get all tasks from the repository.
 
+        Summary projection: ``result`` and ``task_params`` are None on the
+        returned entities — use ``get_by_id`` for the full task.
+
         Returns:
             list[Task]: List of all Task entities
         """
@@ -67,6 +109,8 @@ class ITaskRepository(Protocol):
         ``set_user_scope``) AND the q/status predicates into SQL — never
         load every row into memory and slice in Python. ``q`` is matched
         case-insensitively against file_name; ``status`` is exact-match.
+        Summary projection: ``result`` and ``task_params`` are never loaded
+        and are None on the returned entities.
 
         Args:
             q: Case-insensitive substring filter on file_name (or None).
@@ -80,6 +124,32 @@ class ITaskRepository(Protocol):
         """
         ...
 
+    def list_keyset(
+        self,
+        *,
+        q: str | None,
+        status: str | None,
+        after: tuple[datetime, int] | None,
+        limit: int,
+    ) -> tuple[list[Task], tuple[datetime, int] | None]:
+        """Return the page following the ``(created_at, id)`` key ``after``.
+
+        Keyset alternative to ``list_paginated``: cost does not grow with
+        page depth. Same scope, q/status filters and summary projection.
+        Ordered ``created_at DESC`` with ``id`` ascending as tie-break.
+
+        Args:
+            q: Case-insensitive substring filter on file_name (or None).
+            status: Exact-match status filter (or None).
+            after: Key of the previous page's last row; None for page one.
+            limit: Maximum rows to return (>= 1).
+
+        Returns:
+            (tasks, next_after): the page slice and the key to pass as
+            ``after`` for the next page, or None when this is the last page.
+        """
+        ...
+
     def count(self, *, q: str | None, status: str | None) -> int:
         """Return the count of tasks matching q/status under the active scope.
 
@@ -95,6 +165,22 @@ class ITaskRepository(Protocol):
         """
         ...
 
+    def search(self, query: str, *, limit: int) -> list[TaskSearchHit]:
+        """Full-text search over file names and transcripts of completed tasks.
+
+        Implementations MUST apply the user scope in the query itself.
+        Every term in ``query`` must match; results are ordered by
+        relevance and carry snippets plus the matching segments' timestamps.
+
+        Args:
+            query: Free-text query.
+            limit: Maximum number of tasks to return.
+
+        Returns:
+            list[TaskSearchHit]: Matching tasks, most relevant first.
+        """
+        ...
+
     def update(self, identifier: str, update_data: dict[str, Any]) -> None:
         """
         Update a task by its UUID.
@@ -0,0 +1,62 @@
+"""Repository interface for the task-callback outbox (WebhookDelivery)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Protocol
+
+from app.domain.entities.webhook_delivery import WebhookDelivery
+
+
+class IWebhookDeliveryRepository(Protocol):
+    """Outbox of task-completion callbacks.
+
+    Every state change also sets ``tasks.callback_status`` in the same
+    transaction, so the task APIs report the delivery outcome.
+    """
+
+    def enqueue(self, task_uuid: str, url: str, payload: str, due_at: datetime) -> int | None:
+        """Insert a pending delivery for the task; return its id.
+
+        Returns:
+            int | None: New row id, or ``None`` if the task no longer exists.
+
+        Raises:
+            DatabaseOperationError: If persistence fails.
+        """
+        ...
+
+    def claim_due(
+        self, now: datetime, lease_until: datetime, limit: int
+    ) -> list[WebhookDelivery]:
+        """Atomically claim up to ``limit`` pending rows due at ``now``.
+
+        Each claimed row counts one more attempt and is not due again until
+        ``lease_until``, so a dispatcher that dies mid-delivery only delays it.
+
+        Raises:
+            DatabaseOperationError: If the claim fails.
+        """
+        ...
+
+    def mark_delivered(
+        self, delivery: WebhookDelivery, status_code: int, delivered_at: datetime
+    ) -> None:
+        """Record a successful attempt."""
+        ...
+
+    def mark_retry(
+        self,
+        delivery: WebhookDelivery,
+        status_code: int | None,
+        error: str,
+        next_attempt_at: datetime,
+    ) -> None:
+        """Record a failed attempt; the row is due again at ``next_attempt_at``."""
+        ...
+
+    def mark_failed(
+        self, delivery: WebhookDelivery, status_code: int | None, error: str
+    ) -> None:
+        """Record the final failed attempt; the row is never retried."""
+        ...
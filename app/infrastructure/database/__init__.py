@@ -1,5 +1,8 @@
 """Database infrastructure - Database connection and repositories."""
 
+# Imported for its side effect: attaches the tasks_fts DDL to tasks
+# after_create so Base.metadata.create_all builds the search index too.
+from app.infrastructure.database import task_search_index  # noqa: F401
 from app.infrastructure.database.connection import (
     engine,
     get_db_session,
@@ -12,8 +15,10 @@ from app.infrastructure.database.models import (
     RateLimitBucket,
     Subscription,
     Task,
+    TaskResult,
     UsageEvent,
     User,
+    WebhookDelivery,
 )
 from app.infrastructure.database.task_repository import (
     add_task_to_db,
@@ -29,12 +34,14 @@ __all__ = [
     "handle_database_errors",
     "Base",
     "Task",
+    "TaskResult",
     "User",
     "ApiKey",
     "Subscription",
     "UsageEvent",
     "RateLimitBucket",
     "DeviceFingerprint",
+    "WebhookDelivery",
     "add_task_to_db",
     "delete_task_from_db",
     "get_all_tasks_status_from_db",
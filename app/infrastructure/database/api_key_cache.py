@@ -0,0 +1,107 @@
+"""In-process cache of verified bearer keys + buffered ``last_used_at`` stamps.
+
+Every bearer request used to cost a prefix lookup, a user lookup and a
+``last_used_at`` UPDATE + commit — a write lock on the SQLite file per API
+call. ``ApiKeyCache`` maps the SHA-256 of a presented plaintext to the
+verified ``(key id, user snapshot)`` for ``ttl_seconds`` (bounded LRU), so a
+repeat caller resolves without touching the database. ``LastUsedBuffer``
+aggregates the ``last_used_at`` stamps in memory; a scheduler job writes
+them in one batched UPDATE per interval.
+
+Invalidation: ``SQLAlchemyApiKeyRepository.revoke`` drops the key and
+``SQLAlchemyUserRepository`` writes (token_version bump, plan/profile
+update, delete) drop every key of that user. Both are per process, like
+``TaskCountCache``: in a multi-worker deploy another worker keeps serving
+a revoked key or stale snapshot for at most one TTL window.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+from app.core.ttl_cache import TTLCache
+from app.domain.entities.user import User
+
+DEFAULT_TTL_SECONDS = 30.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass(frozen=True)
+class VerifiedKey:
+    """A bearer key that passed the hash compare, with its owner's snapshot."""
+
+    key_id: int
+    user: User
+
+
+class ApiKeyCache:
+    """``sha256(plaintext) -> VerifiedKey`` with TTL expiry and LRU eviction.
+
+    Built on the thread-safe ``TTLCache``; the bearer path runs on the
+    event loop while revokes and user updates run in the threadpool. Keyed
+    by the plaintext's hash — the plaintext itself is never stored.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: TTLCache[str, VerifiedKey] = TTLCache(max_entries, clock)
+
+    def get(self, key_hash: str) -> VerifiedKey | None:
+        """Return the cached key (with a private copy of the user), or None."""
+        verified = self._entries.get(key_hash)
+        if verified is None:
+            return None
+        return VerifiedKey(key_id=verified.key_id, user=replace(verified.user))
+
+    def put(self, key_hash: str, key_id: int, user: User) -> None:
+        """Cache a verified key for one TTL window; evicts the least recent entry."""
+        self._entries.put(
+            key_hash, VerifiedKey(key_id=key_id, user=replace(user)), self._ttl_seconds
+        )
+
+    def invalidate_key(self, key_id: int) -> None:
+        """Drop the entry for ``key_id`` (revocation)."""
+        self._entries.discard_where(lambda _, verified: verified.key_id == key_id)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every entry owned by ``user_id`` (token_version / profile change)."""
+        self._entries.discard_where(lambda _, verified: verified.user.id == user_id)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+class LastUsedBuffer:
+    """Pending ``api_key id -> latest last_used_at`` stamps awaiting a flush."""
+
+    def __init__(self) -> None:
+        self._pending: dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key_id: int, when: datetime) -> None:
+        """Remember ``when`` for ``key_id``; keeps the latest stamp per key."""
+        with self._lock:
+            current = self._pending.get(key_id)
+            if current is None or when > current:
+                self._pending[key_id] = when
+
+    def drain(self) -> dict[int, datetime]:
+        """Return and clear every pending stamp."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def restore(self, stamps: Mapping[int, datetime]) -> None:
+        """Re-queue stamps whose flush failed (newer stamps recorded since win)."""
+        for key_id, when in stamps.items():
+            self.record(key_id, when)
@@ -0,0 +1,181 @@
+"""Async engine and session management for request-path database access.
+
+Routes are ``async def``; running blocking SQLAlchemy sessions inside them
+stalls the event loop for the duration of every query. Request-path reads
+(auth resolution, task progress, rate-limit checks) go through an
+``AsyncSession`` instead — aiosqlite for SQLite, asyncpg for PostgreSQL.
+
+The async engine is derived from a *sync* engine's URL rather than from
+settings, so ``get_db`` stays the single DB-binding seam: whatever sync
+engine a request (or a test override) is bound to, ``async_session_factory``
+returns sessions on the same database. Engines are cached per URL.
+
+SQLite connections get the same foreign-key enforcement and performance
+profile as the sync engine (see ``connection.py``). Connections are pooled
+(``DB_ASYNC_POOL_SIZE`` + ``DB_ASYNC_MAX_OVERFLOW``): a fresh aiosqlite
+connection costs a thread start, a file open and the PRAGMA script, which
+would otherwise be paid on every authenticated request. Each pooled
+aiosqlite connection owns a non-daemon thread, so ``dispose_async_engines``
+must run at shutdown (the app lifespan does) or the idle threads keep the
+process alive. Async writes to one SQLite file are queued per process
+(``write_lock``) instead of racing in SQLite's sleeping busy handler.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import weakref
+from contextlib import AbstractAsyncContextManager
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Connection, Engine, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import get_settings
+from app.core.logging import logger
+from app.infrastructure.database.connection import build_sqlite_pragmas
+
+# Sync driver -> async driver. Anything else must already be async.
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+_ALREADY_ASYNC = frozenset({"sqlite+aiosqlite", "postgresql+asyncpg"})
+
+# Every engine get_async_engine has built, for dispose_async_engines.
+_ENGINES: weakref.WeakSet[AsyncEngine] = weakref.WeakSet()
+
+
+def to_async_url(url: str | URL) -> URL:
+    """Map a sync database URL onto its async driver.
+
+    Args:
+        url: Database URL, e.g. ``sqlite:///records.db``.
+
+    Returns:
+        The same URL with an async driver (``sqlite+aiosqlite``, ...).
+
+    Raises:
+        ValueError: If the URL is an in-memory SQLite database (a second
+            engine would see a different, empty database) or its driver
+            has no known async counterpart.
+    """
+    parsed = make_url(url)
+    if parsed.drivername in _ALREADY_ASYNC:
+        return parsed
+    if parsed.drivername not in _ASYNC_DRIVERS:
+        raise ValueError(f"No async driver for database URL scheme: {parsed.drivername}")
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        raise ValueError("In-memory SQLite databases cannot be shared with an async engine")
+    return parsed.set(drivername=_ASYNC_DRIVERS[parsed.drivername])
+
+
+def _apply_sqlite_profile(dbapi_connection: Any, connection_record: Any) -> None:
+    """FK enforcement + performance profile for a new aiosqlite connection.
+
+    Sent as one script on the driver connection: every statement through
+    the adapted cursor is a round trip to aiosqlite's thread, and nine of
+    them would cost more than the connect itself.
+    """
+    script = ";\n".join(
+        ["PRAGMA foreign_keys = ON", *build_sqlite_pragmas(get_settings().database)]
+    )
+    dbapi_connection.run_async(lambda conn: conn.executescript(script))
+
+
+@lru_cache(maxsize=16)
+def get_async_engine(url: str) -> AsyncEngine:
+    """Return the (cached) async engine for a sync database URL.
+
+    Args:
+        url: Sync or async database URL rendered with its password.
+
+    Returns:
+        AsyncEngine bound to the same database.
+    """
+    settings = get_settings().database
+    async_url = to_async_url(url)
+    async_engine = create_async_engine(
+        async_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.DB_ASYNC_POOL_SIZE,
+        max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    )
+    _ENGINES.add(async_engine)
+    if async_url.get_backend_name() == "sqlite":
+        event.listen(async_engine.sync_engine, "connect", _apply_sqlite_profile)
+        logger.debug("Async SQLite engine created for %s", async_url.database)
+    return async_engine
+
+
+async def dispose_async_engines() -> None:
+    """Close the pooled connections of every async engine.
+
+    The engines stay usable and reconnect on demand. Call at shutdown:
+    pooled aiosqlite connections each keep a non-daemon thread alive.
+    """
+    for async_engine in list(_ENGINES):
+        await async_engine.dispose()
+
+
+def async_session_factory(bind: Engine | Connection) -> async_sessionmaker[AsyncSession]:
+    """Return an ``AsyncSession`` factory on the database ``bind`` uses.
+
+    Args:
+        bind: The sync engine (or connection) of the request's ``Session``.
+
+    Returns:
+        Sessionmaker producing ``AsyncSession`` objects; attributes stay
+        loaded after commit so domain mapping never triggers async IO.
+    """
+    engine = bind.engine if isinstance(bind, Connection) else bind
+    rendered = engine.url.render_as_string(hide_password=False)
+    return _session_factory(rendered)
+
+
+@lru_cache(maxsize=16)
+def _session_factory(url: str) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        get_async_engine(url), expire_on_commit=False, autoflush=False
+    )
+
+
+# Per event loop, per SQLite database file: one asyncio.Lock.
+_SQLITE_WRITE_LOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+def write_lock(session: AsyncSession) -> AbstractAsyncContextManager[Any]:
+    """Serialise this process's async write transactions on one SQLite file.
+
+    SQLite admits one writer at a time and makes the others retry with a
+    sleeping back-off (``busy_timeout``). Concurrent requests on one event
+    loop would all take part in that back-off — each waiting far longer
+    than the write itself takes. Queueing them on an ``asyncio.Lock``
+    first leaves at most one request per process contending for the file
+    lock. Other backends get a no-op context manager.
+
+    Args:
+        session: AsyncSession about to open a write transaction.
+
+    Returns:
+        Async context manager to hold around the transaction.
+    """
+    bind = session.get_bind()
+    if bind.dialect.name != "sqlite":
+        return contextlib.nullcontext()
+    engine = bind.engine if isinstance(bind, Connection) else bind
+    locks = _SQLITE_WRITE_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(str(engine.url.database), asyncio.Lock())
@@ -1,9 +1,11 @@
 """This module provides database connection and session management.
 
-On import, registers a SQLAlchemy event listener that enforces
-SQLite foreign-key constraints on every new connection (SCHEMA-05),
-and asserts at module load that the pragma actually took effect — fail
-loudly per tiger-style (CONTEXT §69).
+On import, registers SQLAlchemy event listeners that enforce SQLite
+foreign-key constraints (SCHEMA-05) and apply the configurable SQLite
+performance profile (WAL journal, synchronous level, busy_timeout, page
+cache, mmap, temp_store — see ``DatabaseSettings.SQLITE_*``) on every new
+connection, then asserts at module load that the pragmas actually took
+effect — fail loudly per tiger-style (CONTEXT §69).
 """
 
 from collections.abc import Callable, Generator
@@ -18,7 +20,7 @@ from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.core.config import Config
+from app.core.config import Config, DatabaseSettings, get_settings
 from app.core.logging import logger
 
 # Load environment variables from .env
@@ -56,15 +58,83 @@ def _enforce_sqlite_foreign_keys(
     logger.debug("PRAGMA foreign_keys=ON applied to new SQLite connection")
 
 
+def build_sqlite_pragmas(settings: DatabaseSettings) -> list[str]:
+    """Render the SQLite performance profile as PRAGMA statements.
+
+    Values are enum/int validated by ``DatabaseSettings``, so interpolating
+    them is safe. ``cache_size`` is negative to express KiB rather than
+    pages; 0 keeps the SQLite default and is omitted.
+
+    Args:
+        settings: Database settings carrying the ``SQLITE_*`` profile.
+
+    Returns:
+        Ordered PRAGMA statements. journal_mode comes first: it needs no
+        open transaction and every later pragma is per-connection.
+    """
+    pragmas = [
+        f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}",
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE}",
+    ]
+    if settings.SQLITE_CACHE_SIZE_KIB > 0:
+        pragmas.append(f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KIB}")
+    return pragmas
+
+
+_SQLITE_PRAGMAS = build_sqlite_pragmas(get_settings().database)
+
+
+@event.listens_for(Engine, "connect")
+def _apply_sqlite_performance_profile(
+    dbapi_connection: Any,
+    connection_record: Any,
+) -> None:
+    """Apply the configured SQLite performance profile to a new connection.
+
+    WAL lets API reads proceed while the worker commits progress, and
+    busy_timeout turns short lock waits into retries instead of
+    "database is locked" errors. Non-SQLite drivers are skipped early.
+
+    Args:
+        dbapi_connection: Raw DB-API connection object.
+        connection_record: SQLAlchemy connection pool record.
+    """
+    if not isinstance(dbapi_connection, SQLite3Connection):
+        return
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+    logger.debug("SQLite performance profile applied to new connection")
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Tiger-style: fail loudly at module load if FK enforcement isn't actually on.
-# Per CONTEXT §69 (locked code quality bar).
+# Tiger-style: fail loudly at module load if FK enforcement isn't actually on,
+# or if the performance profile did not stick. Per CONTEXT §69 (locked code
+# quality bar). In-memory databases cannot use WAL — SQLite reports "memory".
 with engine.connect() as _verify_conn:
     _fk_on = _verify_conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
     assert _fk_on == 1, (
         f"PRAGMA foreign_keys MUST be ON, got {_fk_on}; check listener registration"
     )
+    _db_settings = get_settings().database
+    _journal_mode = str(_verify_conn.exec_driver_sql("PRAGMA journal_mode").scalar())
+    assert _journal_mode.upper() in (_db_settings.SQLITE_JOURNAL_MODE, "MEMORY"), (
+        f"PRAGMA journal_mode MUST be {_db_settings.SQLITE_JOURNAL_MODE}, "
+        f"got {_journal_mode}; check listener registration"
+    )
+    _busy_timeout = _verify_conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+    assert _busy_timeout == _db_settings.SQLITE_BUSY_TIMEOUT_MS, (
+        f"PRAGMA busy_timeout MUST be {_db_settings.SQLITE_BUSY_TIMEOUT_MS}, "
+        f"got {_busy_timeout}; check listener registration"
+    )
 
 
 def get_db_session() -> Generator[Session, None, None]:
@@ -7,7 +7,11 @@ from app.infrastructure.database.mappers import (
     task_mapper,
     user_mapper,
 )
-from app.infrastructure.database.mappers.task_mapper import to_domain, to_orm
+from app.infrastructure.database.mappers.task_mapper import (
+    to_domain,
+    to_domain_summary,
+    to_orm,
+)
 
 __all__ = [
     "api_key_mapper",
@@ -15,6 +19,7 @@ __all__ = [
     "rate_limit_bucket_mapper",
     "task_mapper",
     "to_domain",
+    "to_domain_summary",
     "to_orm",
     "user_mapper",
 ]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import Row
+
 from app.domain.entities.api_key import ApiKey as DomainApiKey
 from app.infrastructure.database.models import ApiKey as ORMApiKey
 
 
-def to_domain(orm_key: ORMApiKey) -> DomainApiKey:
-    """Convert ORM ApiKey to domain ApiKey entity."""
+def to_domain(orm_key: ORMApiKey | Row[Any]) -> DomainApiKey:
+    """Convert ORM ApiKey (or an api_keys column row) to domain ApiKey entity."""
     return DomainApiKey(
         id=orm_key.id,
         user_id=orm_key.user_id,
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import Row
 
 from app.domain.entities.rate_limit_bucket import RateLimitBucket as DomainBucket
 from app.infrastructure.database.models import RateLimitBucket as ORMBucket
@@ -19,8 +22,8 @@ def _ensure_tz_aware(value: datetime) -> datetime:
     return value
 
 
-def to_domain(orm_bucket: ORMBucket) -> DomainBucket:
-    """Convert ORM RateLimitBucket to domain RateLimitBucket entity."""
+def to_domain(orm_bucket: ORMBucket | Row[Any]) -> DomainBucket:
+    """Convert ORM RateLimitBucket (or a bucket column row) to domain entity."""
     return DomainBucket(
         id=orm_bucket.id,
         bucket_key=orm_bucket.bucket_key,
@@ -1,5 +1,9 @@
 """Mapper functions for converting between domain and ORM models."""
 
+from typing import Any
+
+from sqlalchemy import Row
+
 from app.domain.entities.task import Task as DomainTask
 from app.infrastructure.database.models import Task as ORMTask
 
@@ -22,6 +26,7 @@ def to_domain(orm_task: ORMTask) -> DomainTask:
         file_name=orm_task.file_name,
         url=orm_task.url,
         callback_url=orm_task.callback_url,
+        callback_status=orm_task.callback_status,
         audio_duration=orm_task.audio_duration,
         language=orm_task.language,
         task_params=orm_task.task_params,
@@ -37,6 +42,43 @@ def to_domain(orm_task: ORMTask) -> DomainTask:
     )
 
 
+def to_domain_summary(orm_task: ORMTask | Row[Any]) -> DomainTask:
+    """
+    Convert a summary-projected ORM Task to a domain Task entity.
+
+    Used with rows loaded with ``result`` and ``task_params`` deferred
+    (list / progress paths). Those attributes are never touched, so no
+    lazy load fires, and the entity carries ``None`` for both.
+
+    Args:
+        orm_task: The SQLAlchemy ORM Task model (heavy columns deferred),
+            or a summary column row from ``repositories.statements``
+
+    Returns:
+        DomainTask: The domain Task entity without result/task_params
+    """
+    return DomainTask(
+        uuid=orm_task.uuid,
+        status=orm_task.status,
+        task_type=orm_task.task_type,
+        file_name=orm_task.file_name,
+        url=orm_task.url,
+        callback_url=orm_task.callback_url,
+        callback_status=orm_task.callback_status,
+        audio_duration=orm_task.audio_duration,
+        language=orm_task.language,
+        duration=orm_task.duration,
+        start_time=orm_task.start_time,
+        end_time=orm_task.end_time,
+        error=orm_task.error,
+        created_at=orm_task.created_at,
+        updated_at=orm_task.updated_at,
+        progress_percentage=orm_task.progress_percentage,
+        progress_stage=orm_task.progress_stage,
+        user_id=orm_task.user_id,
+    )
+
+
 def to_orm(domain_task: DomainTask) -> ORMTask:
     """
     Convert a domain Task entity to an ORM Task model.
@@ -55,6 +97,7 @@ def to_orm(domain_task: DomainTask) -> ORMTask:
         file_name=domain_task.file_name,
         url=domain_task.url,
         callback_url=domain_task.callback_url,
+        callback_status=domain_task.callback_status,
         audio_duration=domain_task.audio_duration,
         language=domain_task.language,
         task_params=domain_task.task_params,
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import Row
+
 from app.domain.entities.user import User as DomainUser
 from app.infrastructure.database.models import User as ORMUser
 
 
-def to_domain(orm_user: ORMUser) -> DomainUser:
+def to_domain(orm_user: ORMUser | Row[Any]) -> DomainUser:
     """Convert ORM User to domain User entity.
 
     Args:
-        orm_user: SQLAlchemy ORM User row.
+        orm_user: SQLAlchemy ORM User, or a ``users`` column row.
 
     Returns:
         DomainUser: Framework-free domain entity.
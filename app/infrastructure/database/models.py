@@ -12,7 +12,9 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
+    Text,
     UniqueConstraint,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
@@ -71,13 +73,21 @@ class Task(Base):
     - id: Unique identifier for each task (Primary Key).
     - uuid: Universally unique identifier for each task.
     - status: Current status of the task.
-    - result: JSON data representing the result of the task.
+    - result: Legacy inline result JSON; NULL once the result lives in
+      task_results (every row after 0006_task_results).
+    - result_size: Uncompressed size in bytes of the stored result; NULL
+      when the task has no row in task_results.
     - file_name: Name of the file associated with the task.
     - task_type: Type/category of the task.
     - duration: Duration of the task execution.
     - error: Error message, if any, associated with the task.
     - created_at: Date and time of creation.
     - updated_at: Date and time of last update.
+
+    Indexes (hot paths — see 0004_tasks_hot_path_indexes):
+    - idx_tasks_uuid: UNIQUE (uuid) — get_by_id / update / delete lookups.
+    - idx_tasks_user_id_created_at: (user_id, created_at DESC) — scoped list.
+    - idx_tasks_user_id_status: (user_id, status) — scoped status filter/count.
     """
 
     __tablename__ = "tasks"
@@ -94,7 +104,12 @@ class Task(Base):
     )
     status: Mapped[str] = mapped_column(String, comment="Current status of the task")
     result: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, comment="JSON data representing the result of the task"
+        JSON, comment="Legacy inline result JSON (superseded by task_results)"
+    )
+    result_size: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+        comment="Uncompressed result size in bytes; set iff a task_results row exists",
     )
     file_name: Mapped[str | None] = mapped_column(
         String, nullable=True, comment="Name of the file associated with the task"
@@ -105,6 +120,11 @@ class Task(Base):
     callback_url: Mapped[str | None] = mapped_column(
         String, nullable=True, comment="Callback URL to POST results to"
     )
+    callback_status: Mapped[str | None] = mapped_column(
+        String,
+        nullable=True,
+        comment="Callback delivery status (pending, delivered, failed); NULL = none",
+    )
     audio_duration: Mapped[float | None] = mapped_column(
         Float, nullable=True, comment="Duration of the audio in seconds"
     )
@@ -144,6 +164,138 @@ class Task(Base):
         comment="Owning user (nullable until Phase 12 backfill)",
     )
 
+    __table_args__ = (
+        Index("idx_tasks_uuid", "uuid", unique=True),
+        Index("idx_tasks_user_id_status", "user_id", "status"),
+    )
+
+
+# Hot-path index for the scoped queue listing (WHERE user_id = ? ORDER BY
+# created_at DESC). Declared after the class so the DESC ordering can bind
+# to the mapped column.
+Index(
+    "idx_tasks_user_id_created_at",
+    Task.user_id,
+    Task.created_at.desc(),
+)
+
+
+class TaskResult(Base):
+    """Table to store task results out of row, compressed.
+
+    One row per task that has a result (1:1 with tasks, keyed by task id).
+    Keeping the blob out of ``tasks`` means status / list / progress reads
+    never page through transcripts, and compression shrinks the DB file.
+
+    Attributes:
+    - task_id: Owning task (Primary Key, FK → tasks.id, CASCADE on delete).
+    - codec: Compression codec of ``data`` (currently always 'zstd').
+    - raw_size: Uncompressed size of the result JSON in bytes.
+    - data: Compressed UTF-8 JSON document.
+    """
+
+    __tablename__ = "task_results"
+
+    task_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tasks.id", ondelete="CASCADE", name="fk_task_results_task_id"),
+        primary_key=True,
+        comment="Owning task (FK → tasks.id)",
+    )
+    codec: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+        comment="Compression codec of data (zstd)",
+    )
+    raw_size: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Uncompressed size of the result JSON in bytes",
+    )
+    data: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+        comment="Compressed UTF-8 JSON result document",
+    )
+
+
+class WebhookDelivery(Base):
+    """Outbox of task-completion callbacks awaiting (or done with) delivery.
+
+    The transcription worker inserts one row per finished task with a
+    callback URL; the webhook dispatcher claims due rows, POSTs them and
+    records the outcome. A claim pushes ``next_attempt_at`` out by a lease,
+    so a row whose dispatcher died mid-delivery becomes due again.
+
+    Attributes:
+    - id: Unique identifier for each delivery (Primary Key).
+    - task_id: Owning task (FK → tasks.id, CASCADE on delete).
+    - url: Callback URL the payload is POSTed to.
+    - payload: JSON request body, serialised at enqueue time.
+    - status: pending | delivered | failed.
+    - attempts: Delivery attempts started so far.
+    - next_attempt_at: When the row is next due (UTC, tz-aware).
+    - last_status_code: HTTP status of the last attempt, if any.
+    - last_error: Error of the last failed attempt, if any.
+    - delivered_at: Time of the successful attempt (UTC, tz-aware).
+    - created_at: Date and time of creation (UTC, tz-aware).
+    """
+
+    __tablename__ = "webhook_deliveries"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        comment="Unique identifier for each delivery (Primary Key)",
+    )
+    task_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tasks.id", ondelete="CASCADE", name="fk_webhook_deliveries_task_id"),
+        nullable=False,
+        comment="Owning task (FK → tasks.id)",
+    )
+    url: Mapped[str] = mapped_column(
+        String, nullable=False, comment="Callback URL the payload is POSTed to"
+    )
+    payload: Mapped[str] = mapped_column(
+        Text, nullable=False, comment="JSON request body, serialised at enqueue time"
+    )
+    status: Mapped[str] = mapped_column(
+        String,
+        nullable=False,
+        default="pending",
+        comment="pending | delivered | failed",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="Delivery attempts started so far"
+    )
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When the row is next due (UTC, tz-aware)",
+    )
+    last_status_code: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, comment="HTTP status of the last attempt"
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        String, nullable=True, comment="Error of the last failed attempt"
+    )
+    delivered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Time of the successful attempt (UTC, tz-aware)",
+    )
+    created_at: Mapped[datetime] = _created_at_column()
+
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('pending','delivered','failed')",
+            name="ck_webhook_deliveries_status",
+        ),
+        Index("idx_webhook_deliveries_due", "status", "next_attempt_at"),
+    )
+
 
 class User(Base):
     """Table to store registered user accounts.
@@ -511,6 +663,9 @@ class DeviceFingerprint(Base):
 # Tiger-style invariants — fail loudly at module load if tablenames drift.
 # Per CONTEXT §69 (locked code quality bar).
 # ---------------------------------------------------------------------------
+assert WebhookDelivery.__tablename__ == "webhook_deliveries", (
+    "WebhookDelivery.__tablename__ drift"
+)
 assert User.__tablename__ == "users", "User.__tablename__ drift"
 assert ApiKey.__tablename__ == "api_keys", "ApiKey.__tablename__ drift"
 assert Subscription.__tablename__ == "subscriptions", "Subscription.__tablename__ drift"
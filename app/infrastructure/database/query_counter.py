@@ -0,0 +1,80 @@
+"""Per-request SQL statement counter.
+
+On import, registers a ``before_cursor_execute`` listener on every
+``Engine`` (sync engines and the ``sync_engine`` behind each async engine)
+that increments the counter bound to the current context, if any. The
+counter lives in a ``ContextVar`` holding a mutable box, so increments made
+where the context was *copied* — Starlette's threadpool for sync
+dependencies, SQLAlchemy's greenlet for ``AsyncSession`` — still land on
+the request's counter.
+
+Outside a counted scope the listener is one ``ContextVar.get`` and a
+``None`` check — cheap enough to stay registered unconditionally.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCount:
+    """Mutable statement tally for one counted scope (request, test, ...)."""
+
+    __slots__ = ("statements",)
+
+    def __init__(self) -> None:
+        """Start at zero statements."""
+        self.statements = 0
+
+
+_current: ContextVar[QueryCount | None] = ContextVar("db_query_count", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_statement(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Increment the active counter; no-op outside a counted scope."""
+    counter = _current.get()
+    if counter is not None:
+        counter.statements += 1
+
+
+def start_counting() -> tuple[QueryCount, Token[QueryCount | None]]:
+    """Bind a fresh counter to the current context.
+
+    Returns:
+        ``(counter, token)`` — pass the token to ``stop_counting``.
+    """
+    counter = QueryCount()
+    return counter, _current.set(counter)
+
+
+def stop_counting(token: Token[QueryCount | None]) -> None:
+    """Restore the counter that was active before ``start_counting``."""
+    _current.reset(token)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCount]:
+    """Count the SQL statements executed inside the ``with`` block.
+
+    Yields:
+        QueryCount: Read ``.statements`` after (or during) the block.
+    """
+    counter, token = start_counting()
+    try:
+        yield counter
+    finally:
+        stop_counting(token)
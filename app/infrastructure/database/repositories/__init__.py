@@ -1,7 +1,10 @@
 """Repository implementations for data access."""
 
+from app.infrastructure.database.repositories.async_sqlalchemy_task_repository import (
+    AsyncSQLAlchemyTaskRepository,
+)
 from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
 )
 
-__all__ = ["SQLAlchemyTaskRepository"]
+__all__ = ["AsyncSQLAlchemyTaskRepository", "SQLAlchemyTaskRepository"]
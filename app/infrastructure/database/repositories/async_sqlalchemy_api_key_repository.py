@@ -0,0 +1,88 @@
+"""Async SQLAlchemy api_key repository — request-path bearer resolution."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.domain.entities.api_key import ApiKey as DomainApiKey
+from app.domain.entities.user import User as DomainUser
+from app.infrastructure.database.async_connection import write_lock
+from app.infrastructure.database.mappers.api_key_mapper import to_domain
+from app.infrastructure.database.mappers.user_mapper import to_domain as user_to_domain
+from app.infrastructure.database.models import ApiKey as ORMApiKey
+from app.infrastructure.database.repositories.statements import (
+    ACTIVE_API_KEYS_BY_PREFIX,
+    ACTIVE_API_KEYS_WITH_USER_BY_PREFIX,
+)
+
+
+class AsyncSQLAlchemyApiKeyRepository:
+    """Async counterpart of ``SQLAlchemyApiKeyRepository`` for bearer auth.
+
+    ``get_by_prefix`` uses ``idx_api_keys_prefix`` and excludes revoked
+    keys (KEY-08 / T-11-12), exactly like the sync repository. Log only
+    ``id`` and ``prefix`` — never hashes or plaintext.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialise repository with an ``AsyncSession``."""
+        self.session = session
+
+    async def get_by_prefix(self, prefix: str) -> list[DomainApiKey]:
+        """Indexed lookup of ACTIVE keys matching ``prefix``; ``[]`` on failure."""
+        try:
+            rows = await self.session.execute(
+                ACTIVE_API_KEYS_BY_PREFIX, {"prefix": prefix}
+            )
+            return [to_domain(row) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to get api_keys by prefix=%s: %s", prefix, str(e),
+            )
+            return []
+
+    async def get_active_with_user_by_prefix(
+        self, prefix: str
+    ) -> list[tuple[DomainApiKey, DomainUser]]:
+        """ACTIVE keys matching ``prefix`` with their owners, in one JOIN; ``[]`` on failure."""
+        try:
+            rows = await self.session.execute(
+                ACTIVE_API_KEYS_WITH_USER_BY_PREFIX, {"prefix": prefix}
+            )
+            return [(to_domain(row.key), user_to_domain(row.user)) for row in rows]
+        except SQLAlchemyError as e:
+            logger.error(
+                "Failed to get api_keys with users by prefix=%s: %s", prefix, str(e),
+            )
+            return []
+
+    async def mark_used(self, identifier: int, when: datetime) -> None:
+        """Set ``last_used_at`` with one UPDATE; fail loud on a missing row."""
+        try:
+            async with write_lock(self.session):
+                result = await self.session.execute(
+                    update(ORMApiKey)
+                    .where(ORMApiKey.id == identifier)
+                    .values(last_used_at=when)
+                )
+                if result.rowcount == 0:
+                    await self.session.rollback()
+                    raise DatabaseOperationError(
+                        operation="mark_used",
+                        reason=f"api_key id={identifier} not found",
+                    )
+                await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Failed to mark_used id=%s: %s", identifier, str(e))
+            raise DatabaseOperationError(
+                operation="mark_used",
+                reason=str(e),
+                original_error=e,
+            )
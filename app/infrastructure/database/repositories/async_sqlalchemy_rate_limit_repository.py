@@ -0,0 +1,125 @@
+"""Async SQLAlchemy rate-limit repository (BEGIN IMMEDIATE atomic upsert)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.domain.entities.rate_limit_bucket import RateLimitBucket as DomainBucket
+from app.infrastructure.database.async_connection import write_lock
+from app.infrastructure.database.mappers.rate_limit_bucket_mapper import to_domain
+from app.infrastructure.database.models import RateLimitBucket as ORMBucket
+from app.infrastructure.database.repositories.statements import (
+    INSERT_RATE_LIMIT_BUCKET,
+    RATE_LIMIT_BUCKET_BY_KEY,
+    RATE_LIMIT_BUCKETS_BY_KEYS,
+    UPDATE_RATE_LIMIT_BUCKET,
+    bucket_write_params,
+)
+
+
+class AsyncSQLAlchemyRateLimitRepository:
+    """Async counterpart of ``SQLAlchemyRateLimitRepository``.
+
+    ``upsert_atomic`` takes the same ``BEGIN IMMEDIATE`` RESERVED lock so
+    the read-modify-write stays lost-update free across workers (T-11-10);
+    the lock wait happens off the event loop.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialise repository with an ``AsyncSession``."""
+        self.session = session
+
+    async def get_by_key(self, bucket_key: str) -> DomainBucket | None:
+        """Read a bucket by its unique key; ``None`` on miss or read failure."""
+        try:
+            result = await self.session.execute(
+                RATE_LIMIT_BUCKET_BY_KEY, {"bucket_key": bucket_key}
+            )
+            row = result.first()
+            return to_domain(row) if row else None
+        except SQLAlchemyError as e:
+            logger.error("Failed to get bucket key=%s: %s", bucket_key, str(e))
+            return None
+
+    async def upsert_atomic(self, bucket_key: str, new_state: dict[str, Any]) -> None:
+        """Read-modify-write under ``BEGIN IMMEDIATE`` for SQLite worker-safety.
+
+        Args:
+            bucket_key: Unique bucket identifier.
+            new_state: Mapping with ``tokens`` (int) and ``last_refill``
+                (datetime) keys, computed by ``app.core.rate_limit.consume()``.
+
+        Raises:
+            DatabaseOperationError: If the upsert fails.
+        """
+        try:
+            async with write_lock(self.session):
+                await self.session.execute(text("BEGIN IMMEDIATE"))
+                orm_bucket = await self.session.scalar(
+                    select(ORMBucket).where(ORMBucket.bucket_key == bucket_key)
+                )
+                if orm_bucket is None:
+                    orm_bucket = ORMBucket(
+                        bucket_key=bucket_key,
+                        tokens=new_state["tokens"],
+                        last_refill=new_state["last_refill"],
+                    )
+                    self.session.add(orm_bucket)
+                else:
+                    orm_bucket.tokens = new_state["tokens"]
+                    orm_bucket.last_refill = new_state["last_refill"]
+                await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Failed to upsert bucket key=%s: %s", bucket_key, str(e))
+            raise DatabaseOperationError(
+                operation="upsert_rate_limit",
+                reason=str(e),
+                original_error=e,
+            )
+
+    async def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, DomainBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read, decide and write several buckets under one ``BEGIN IMMEDIATE``.
+
+        Same contract as ``SQLAlchemyRateLimitRepository.upsert_many_atomic``;
+        ``decide`` is synchronous, so no await happens between the read
+        and the writes.
+
+        Raises:
+            DatabaseOperationError: If the read or the writes fail.
+        """
+        try:
+            async with write_lock(self.session):
+                await self.session.execute(text("BEGIN IMMEDIATE"))
+                rows = await self.session.execute(
+                    RATE_LIMIT_BUCKETS_BY_KEYS, {"bucket_keys": list(bucket_keys)}
+                )
+                current = {row.bucket_key: to_domain(row) for row in rows}
+                updates, inserts = bucket_write_params(current.keys(), decide(current))
+                if updates:
+                    await self.session.execute(UPDATE_RATE_LIMIT_BUCKET, updates)
+                if inserts:
+                    await self.session.execute(INSERT_RATE_LIMIT_BUCKET, inserts)
+                await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logger.error("Failed to upsert buckets keys=%s: %s", list(bucket_keys), str(e))
+            raise DatabaseOperationError(
+                operation="upsert_rate_limit",
+                reason=str(e),
+                original_error=e,
+            )
+        except Exception:
+            await self.session.rollback()
+            raise
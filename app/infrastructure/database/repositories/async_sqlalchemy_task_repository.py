@@ -0,0 +1,49 @@
+"""Async SQLAlchemy task repository — request-path task reads.
+
+Covers the high-frequency reads that run on the event loop: progress
+polling (``GET /tasks/{id}/progress``) and the WebSocket ownership check.
+Same per-user scoping contract as ``SQLAlchemyTaskRepository``: with a
+scope set, foreign tasks read as not found. Heavy JSON columns are never
+selected.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import logger
+from app.domain.entities.task import Task as DomainTask
+from app.infrastructure.database.mappers.task_mapper import to_domain_summary
+from app.infrastructure.database.repositories.statements import task_summary_by_uuid
+
+
+class AsyncSQLAlchemyTaskRepository:
+    """Async, read-only counterpart of ``SQLAlchemyTaskRepository``."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialise repository with an ``AsyncSession`` (unscoped)."""
+        self.session = session
+        self._user_scope: int | None = None
+
+    def set_user_scope(self, user_id: int | None) -> None:
+        """Push a user_id filter into all subsequent reads (``None`` clears)."""
+        self._user_scope = user_id
+
+    async def get_summary_by_id(self, identifier: str) -> DomainTask | None:
+        """Task by UUID without ``result`` / ``task_params``; scoped.
+
+        Returns:
+            DomainTask | None: The summary entity if found within the
+            scope, else None (also on read failure).
+        """
+        try:
+            statement, params = task_summary_by_uuid(self._user_scope)
+            result = await self.session.execute(
+                statement, {"uuid": identifier, **params}
+            )
+            row = result.first()
+            return to_domain_summary(row) if row else None
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get task summary by ID {identifier}: {str(e)}")
+            return None
@@ -0,0 +1,33 @@
+"""Async SQLAlchemy user repository — request-path reads (auth resolution)."""
+
+from __future__ import annotations
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import logger
+from app.domain.entities.user import User as DomainUser
+from app.infrastructure.database.mappers.user_mapper import to_domain
+from app.infrastructure.database.repositories.statements import USER_BY_ID
+
+
+class AsyncSQLAlchemyUserRepository:
+    """Async counterpart of ``SQLAlchemyUserRepository`` for auth lookups.
+
+    Same miss / failure surface as the sync repository: ``None`` on miss
+    or read failure. Logging hygiene per CONTEXT §86-90 — ids only.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialise repository with an ``AsyncSession``."""
+        self.session = session
+
+    async def get_by_id(self, identifier: int) -> DomainUser | None:
+        """Read a user by primary-key id; ``None`` on miss or read failure."""
+        try:
+            result = await self.session.execute(USER_BY_ID, {"user_id": identifier})
+            row = result.first()
+            return to_domain(row) if row else None
+        except SQLAlchemyError as e:
+            logger.error("Failed to get user by id=%s: %s", identifier, str(e))
+            return None
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,8 +11,13 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import DatabaseOperationError
 from app.core.logging import logger
 from app.domain.entities.api_key import ApiKey as DomainApiKey
+from app.infrastructure.database.api_key_cache import ApiKeyCache
 from app.infrastructure.database.mappers.api_key_mapper import to_domain, to_orm
 from app.infrastructure.database.models import ApiKey as ORMApiKey
+from app.infrastructure.database.repositories.statements import (
+    ACTIVE_API_KEYS_BY_PREFIX,
+    UPDATE_API_KEY_LAST_USED,
+)
 
 
 class SQLAlchemyApiKeyRepository:
@@ -25,9 +31,16 @@ class SQLAlchemyApiKeyRepository:
     NEVER log the full ``hash`` or any plaintext key material.
     """
 
-    def __init__(self, session: Session) -> None:
-        """Initialise repository with a SQLAlchemy session."""
+    def __init__(self, session: Session, key_cache: ApiKeyCache | None = None) -> None:
+        """Initialise repository with a SQLAlchemy session.
+
+        Args:
+            session: The SQLAlchemy database session.
+            key_cache: Optional process-wide verified-key cache; ``revoke``
+                drops the key from it.
+        """
         self.session = session
+        self._key_cache = key_cache
 
     def add(self, api_key: DomainApiKey) -> int:
         """Persist a new api_key row; return its primary-key id."""
@@ -68,13 +81,8 @@ class SQLAlchemyApiKeyRepository:
         (mitigates T-11-12 spoofing-via-revoked-key).
         """
         try:
-            orm_keys = (
-                self.session.query(ORMApiKey)
-                .filter(ORMApiKey.prefix == prefix)
-                .filter(ORMApiKey.revoked_at.is_(None))
-                .all()
-            )
-            return [to_domain(k) for k in orm_keys]
+            rows = self.session.execute(ACTIVE_API_KEYS_BY_PREFIX, {"prefix": prefix})
+            return [to_domain(row) for row in rows]
         except SQLAlchemyError as e:
             logger.error(
                 "Failed to get api_keys by prefix=%s: %s", prefix, str(e),
@@ -120,6 +128,33 @@ class SQLAlchemyApiKeyRepository:
                 original_error=e,
             )
 
+    def mark_used_many(self, stamps: Mapping[int, datetime]) -> int:
+        """Write buffered ``last_used_at`` stamps in one executemany UPDATE.
+
+        Keys deleted since the stamp was taken are skipped silently, and a
+        stamp never overwrites a newer one.
+
+        Returns:
+            Number of rows updated.
+        """
+        if not stamps:
+            return 0
+        try:
+            result = self.session.execute(
+                UPDATE_API_KEY_LAST_USED,
+                [{"key_id": key_id, "used_at": when} for key_id, when in stamps.items()],
+            )
+            self.session.commit()
+            return int(result.rowcount)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error("Failed to flush last_used_at for %d keys: %s", len(stamps), str(e))
+            raise DatabaseOperationError(
+                operation="mark_used_many",
+                reason=str(e),
+                original_error=e,
+            )
+
     def revoke(self, identifier: int) -> None:
         """Soft-delete (set ``revoked_at = now``). Idempotent."""
         try:
@@ -136,6 +171,8 @@ class SQLAlchemyApiKeyRepository:
             if orm_key.revoked_at is None:
                 orm_key.revoked_at = datetime.now(timezone.utc)
                 self.session.commit()
+            if self._key_cache is not None:
+                self._key_cache.invalidate_key(identifier)
             logger.info("ApiKey revoked id=%s", identifier)
         except SQLAlchemyError as e:
             self.session.rollback()
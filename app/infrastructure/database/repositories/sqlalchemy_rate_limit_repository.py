@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from sqlalchemy import text
@@ -13,6 +14,13 @@ from app.core.logging import logger
 from app.domain.entities.rate_limit_bucket import RateLimitBucket as DomainBucket
 from app.infrastructure.database.mappers.rate_limit_bucket_mapper import to_domain
 from app.infrastructure.database.models import RateLimitBucket as ORMBucket
+from app.infrastructure.database.repositories.statements import (
+    INSERT_RATE_LIMIT_BUCKET,
+    RATE_LIMIT_BUCKET_BY_KEY,
+    RATE_LIMIT_BUCKETS_BY_KEYS,
+    UPDATE_RATE_LIMIT_BUCKET,
+    bucket_write_params,
+)
 
 
 class SQLAlchemyRateLimitRepository:
@@ -30,12 +38,10 @@ class SQLAlchemyRateLimitRepository:
     def get_by_key(self, bucket_key: str) -> DomainBucket | None:
         """Read a bucket by its unique key; ``None`` on miss or read failure."""
         try:
-            orm_bucket = (
-                self.session.query(ORMBucket)
-                .filter(ORMBucket.bucket_key == bucket_key)
-                .first()
-            )
-            return to_domain(orm_bucket) if orm_bucket else None
+            row = self.session.execute(
+                RATE_LIMIT_BUCKET_BY_KEY, {"bucket_key": bucket_key}
+            ).first()
+            return to_domain(row) if row else None
         except SQLAlchemyError as e:
             logger.error("Failed to get bucket key=%s: %s", bucket_key, str(e))
             return None
@@ -79,3 +85,48 @@ class SQLAlchemyRateLimitRepository:
                 reason=str(e),
                 original_error=e,
             )
+
+    def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, DomainBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read, decide and write several buckets under one ``BEGIN IMMEDIATE``.
+
+        One indexed ``IN`` read loads every bucket, ``decide`` computes the
+        new states in memory, and all writes commit together — or none do.
+
+        Args:
+            bucket_keys: Keys to load (missing buckets are absent from the
+                mapping passed to ``decide``).
+            decide: Pure function from the current buckets to the
+                ``{"tokens", "last_refill"}`` state of each bucket to
+                write; may return ``{}`` to write nothing. An exception
+                it raises rolls the transaction back and propagates as-is.
+
+        Raises:
+            DatabaseOperationError: If the read or the writes fail.
+        """
+        try:
+            self.session.execute(text("BEGIN IMMEDIATE"))
+            rows = self.session.execute(
+                RATE_LIMIT_BUCKETS_BY_KEYS, {"bucket_keys": list(bucket_keys)}
+            )
+            current = {row.bucket_key: to_domain(row) for row in rows}
+            updates, inserts = bucket_write_params(current.keys(), decide(current))
+            if updates:
+                self.session.execute(UPDATE_RATE_LIMIT_BUCKET, updates)
+            if inserts:
+                self.session.execute(INSERT_RATE_LIMIT_BUCKET, inserts)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error("Failed to upsert buckets keys=%s: %s", list(bucket_keys), str(e))
+            raise DatabaseOperationError(
+                operation="upsert_rate_limit",
+                reason=str(e),
+                original_error=e,
+            )
+        except Exception:
+            self.session.rollback()
+            raise
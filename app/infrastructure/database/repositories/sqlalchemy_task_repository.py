@@ -14,20 +14,73 @@ write via mis-wired route) per /tiger-style.
 
 Default scope is ``None`` so existing un-scoped callers (Phase 12 CLI,
 internal services) keep working unchanged.
+
+``update()`` is a single ``UPDATE tasks SET ... WHERE uuid = :id
+[AND user_id = :scope]`` statement — it never SELECTs the row first, so
+progress writes do not pay to load the (potentially multi-MB) ``result``
+JSON. ``rowcount`` drives the not-found check.
+
+List and progress reads (``get_all``, ``list_paginated``,
+``get_summary_by_id``) defer the heavy JSON columns ``result`` and
+``task_params`` with ``raiseload`` — the SELECT never fetches them and any
+accidental access raises instead of silently issuing a per-row lazy load.
+
+``list_keyset`` pages by the ``(created_at, id)`` cursor instead of OFFSET,
+so deep pages cost the same as the first. Scoped ``count()`` calls without
+a ``q`` filter go through an optional ``TaskCountCache``.
+
+Result storage: ``result`` is never written to the task row. ``update()``
+and ``add()`` compress it into ``task_results`` (see ``result_store``) in
+the same transaction and set ``tasks.result_size``; ``get_by_id``
+decompresses it back onto the entity, and ``get_result_stream`` hands the
+JSON out chunk by chunk for ``GET /task/{id}``. Rows written before
+migration 0006 that still carry inline ``tasks.result`` read through
+unchanged.
+
+Full-text search: an ``update()`` that writes a non-empty ``result``
+re-indexes the task in ``tasks_fts`` within the same transaction (see
+``task_search_index``), and clearing the result drops its rows;
+``search()`` queries it under the user scope. The index is SQLite FTS5
+only — on other dialects both are skipped and search returns no hits.
 """
 
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, defer
 
 from app.core.exceptions import DatabaseOperationError
 from app.core.logging import logger
 from app.domain.entities.task import Task as DomainTask
-from app.infrastructure.database.mappers.task_mapper import to_domain, to_orm
+from app.domain.entities.task_search_hit import SegmentMatch, TaskSearchHit
+from app.infrastructure.database import result_store, task_search_index
+from app.infrastructure.database.mappers.task_mapper import (
+    to_domain,
+    to_domain_summary,
+    to_orm,
+)
 from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.repositories.statements import task_summary_by_uuid
+from app.infrastructure.database.result_store import StoredResult
+from app.infrastructure.database.task_count_cache import TaskCountCache
+
+# Mapped column attribute names — update() silently drops unknown keys, the
+# same contract the previous hasattr/setattr loop had.
+_TASK_COLUMNS = frozenset(ORMTask.__table__.columns.keys())
+
+# search() pulls this many segment hits per requested task before grouping.
+_SEARCH_SEGMENTS_PER_TASK = 5
+
+# Loader options for summary reads: never SELECT the heavy JSON columns.
+# Shared with AsyncSQLAlchemyTaskRepository.
+SUMMARY_LOAD_OPTIONS = (
+    defer(ORMTask.result, raiseload=True),
+    defer(ORMTask.task_params, raiseload=True),
+)
 
 
 class SQLAlchemyTaskRepository:
@@ -41,17 +94,23 @@ class SQLAlchemyTaskRepository:
         session: The SQLAlchemy database session for executing queries
         _user_scope: Optional user id pushed into every read/write WHERE
             clause; ``None`` means unscoped (admin / CLI default).
+        _count_cache: Optional shared cache for scoped, q-less counts.
     """
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, count_cache: TaskCountCache | None = None
+    ):
         """
         Initialize the repository with a database session.
 
         Args:
             session: The SQLAlchemy database session
+            count_cache: Optional process-wide count cache; only consulted
+                for scoped ``count()`` calls without a ``q`` filter.
         """
         self.session = session
         self._user_scope: int | None = None
+        self._count_cache = count_cache
 
     def set_user_scope(self, user_id: int | None) -> None:
         """Push a user_id filter into all subsequent reads/writes.
@@ -74,6 +133,35 @@ class SQLAlchemyTaskRepository:
             query = query.filter(ORMTask.user_id == self._user_scope)
         return query
 
+    def _summary_query(self) -> Query:
+        """Scoped query with ``result`` / ``task_params`` deferred.
+
+        Pair with ``to_domain_summary`` — ``to_domain`` would touch the
+        deferred attributes and trip the raiseload guard.
+        """
+        return self._scoped_query().options(*SUMMARY_LOAD_OPTIONS)
+
+    def _invalidate_counts(self, user_id: int | None) -> None:
+        """Drop cached counts for ``user_id`` after a write that moves them."""
+        if self._count_cache is not None and user_id is not None:
+            self._count_cache.invalidate_user(user_id)
+
+    @staticmethod
+    def _detach_result(orm_task: ORMTask) -> StoredResult | None:
+        """Move ``orm_task.result`` out of the row into a compressed blob."""
+        if orm_task.result is None:
+            return None
+        stored = StoredResult.encode(orm_task.result)
+        orm_task.result = None
+        orm_task.result_size = stored.raw_size
+        return stored
+
+    def _load_stored_result(self, orm_task: ORMTask) -> StoredResult | None:
+        """Fetch the task's out-of-row result (None when it has none)."""
+        if orm_task.result_size is None:
+            return None
+        return result_store.load_result(self.session, task_id=orm_task.id)
+
     def add(self, task: DomainTask) -> str:
         """
         Add a new task to the database.
@@ -107,9 +195,16 @@ class SQLAlchemyTaskRepository:
                 task.uuid = str(uuid4())
 
             orm_task = to_orm(task)
+            stored = self._detach_result(orm_task)
             self.session.add(orm_task)
+            if stored is not None:
+                self.session.flush()
+                result_store.store_result(
+                    self.session, task_id=orm_task.id, stored=stored
+                )
             self.session.commit()
             self.session.refresh(orm_task)
+            self._invalidate_counts(orm_task.user_id)
 
             logger.info(
                 f"Task added successfully with UUID: {orm_task.uuid} user_id={orm_task.user_id}"
@@ -147,7 +242,11 @@ class SQLAlchemyTaskRepository:
 
             if orm_task:
                 logger.debug(f"Task found with UUID: {identifier}")
-                return to_domain(orm_task)
+                task = to_domain(orm_task)
+                stored = self._load_stored_result(orm_task)
+                if stored is not None:
+                    task.result = stored.decode()
+                return task
             else:
                 logger.debug(f"Task not found with UUID: {identifier}")
                 return None
@@ -156,19 +255,82 @@ class SQLAlchemyTaskRepository:
             logger.error(f"Failed to get task by ID {identifier}: {str(e)}")
             return None
 
+    def get_result_stream(
+        self, identifier: str
+    ) -> tuple[DomainTask, Iterator[bytes] | None] | None:
+        """
+        Get a task plus its result as a stream of JSON bytes — scoped.
+
+        The result is never parsed: stored results decompress chunk by
+        chunk, legacy inline results are re-serialised once. The entity's
+        own ``result`` attribute is left None.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            ``(task, chunks)`` where ``chunks`` yields the result JSON or is
+            None when the task has no result; None if the task is not found
+            within the scope.
+        """
+        try:
+            orm_task = (
+                self._scoped_query().filter(ORMTask.uuid == identifier).first()
+            )
+            if orm_task is None:
+                return None
+            task = to_domain(orm_task)
+            task.result = None
+            stored = self._load_stored_result(orm_task)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get task result {identifier}: {str(e)}")
+            return None
+
+        if stored is not None:
+            return task, stored.iter_json()
+        if orm_task.result is not None:
+            return task, iter((result_store.serialize_result(orm_task.result),))
+        return task, None
+
+    def get_summary_by_id(self, identifier: str) -> DomainTask | None:
+        """
+        Get a task by its UUID without loading ``result`` / ``task_params``.
+
+        Same scoping and not-found surface as ``get_by_id``; for callers
+        that only need status / progress fields.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            DomainTask | None: The Task entity (``result`` and
+            ``task_params`` are None) if found within the scope, else None.
+        """
+        try:
+            statement, params = task_summary_by_uuid(self._user_scope)
+            row = self.session.execute(
+                statement, {"uuid": identifier, **params}
+            ).first()
+            return to_domain_summary(row) if row else None
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get task summary by ID {identifier}: {str(e)}")
+            return None
+
     def get_all(self) -> list[DomainTask]:
         """
         Get all tasks from the database — scoped to ``_user_scope`` when set.
 
         Scoped callers see only their own tasks; unscoped callers (CLI,
-        admin) see every row.
+        admin) see every row. Summary projection — ``result`` and
+        ``task_params`` are not loaded; use ``get_by_id`` for the full task.
 
         Returns:
             list[DomainTask]: List of Task entities matching the scope.
         """
         try:
-            orm_tasks = self._scoped_query().all()
-            domain_tasks = [to_domain(orm_task) for orm_task in orm_tasks]
+            orm_tasks = self._summary_query().all()
+            domain_tasks = [to_domain_summary(orm_task) for orm_task in orm_tasks]
 
             logger.debug(f"Retrieved {len(domain_tasks)} tasks from database")
             return domain_tasks
@@ -208,6 +370,7 @@ class SQLAlchemyTaskRepository:
         Pushes the user-scope filter AND q/status predicates into SQL via
         ``_scoped_query`` + ``_apply_filters``. Ordered ``created_at DESC``
         so newest tasks render first in the queue. Single SELECT — no N+1.
+        Summary projection — ``result`` and ``task_params`` are not loaded.
 
         Args:
             q: Case-insensitive substring filter on file_name (or None).
@@ -220,7 +383,7 @@ class SQLAlchemyTaskRepository:
         """
         try:
             query = self._apply_filters(
-                self._scoped_query(), q=q, status=status
+                self._summary_query(), q=q, status=status
             )
             orm_tasks = (
                 query.order_by(ORMTask.created_at.desc())
@@ -228,7 +391,7 @@ class SQLAlchemyTaskRepository:
                 .limit(limit)
                 .all()
             )
-            domain_tasks = [to_domain(orm_task) for orm_task in orm_tasks]
+            domain_tasks = [to_domain_summary(orm_task) for orm_task in orm_tasks]
             logger.debug(
                 "list_paginated returned %d tasks (offset=%d limit=%d)",
                 len(domain_tasks),
@@ -240,53 +403,137 @@ class SQLAlchemyTaskRepository:
             logger.error(f"Failed to list paginated tasks: {str(e)}")
             return []
 
+    def list_keyset(
+        self,
+        *,
+        q: str | None,
+        status: str | None,
+        after: tuple[datetime, int] | None,
+        limit: int,
+    ) -> tuple[list[DomainTask], tuple[datetime, int] | None]:
+        """Return the page after the ``(created_at, id)`` cursor ``after``.
+
+        Ordered ``created_at DESC, id ASC`` — the natural order of
+        ``idx_tasks_user_id_created_at`` (the rowid is the implicit trailing
+        key), so SQLite seeks straight to the cursor and never sorts. One
+        extra row is fetched to tell whether another page exists. Same
+        scope, filters and summary projection as ``list_paginated``.
+
+        Args:
+            q: Case-insensitive substring filter on file_name (or None).
+            status: Exact-match status filter (or None).
+            after: Key of the last row of the previous page; None for the
+                first page.
+            limit: Maximum rows to return.
+
+        Returns:
+            (tasks, next_after) where ``next_after`` is the key of the last
+            returned row when more rows follow, else None.
+        """
+        try:
+            query = self._apply_filters(
+                self._summary_query(), q=q, status=status
+            )
+            if after is not None:
+                after_created_at, after_id = after
+                query = query.filter(
+                    and_(
+                        ORMTask.created_at <= after_created_at,
+                        or_(
+                            ORMTask.created_at < after_created_at,
+                            ORMTask.id > after_id,
+                        ),
+                    )
+                )
+            orm_tasks = (
+                query.order_by(ORMTask.created_at.desc(), ORMTask.id.asc())
+                .limit(limit + 1)
+                .all()
+            )
+            has_more = len(orm_tasks) > limit
+            orm_tasks = orm_tasks[:limit]
+            next_after = (
+                (orm_tasks[-1].created_at, orm_tasks[-1].id) if has_more else None
+            )
+            return [to_domain_summary(orm_task) for orm_task in orm_tasks], next_after
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to list tasks by cursor: {str(e)}")
+            return [], None
+
     def count(self, *, q: str | None, status: str | None) -> int:
         """Return scoped + filtered count (Plan 15-ux).
 
         Mirrors ``list_paginated`` predicates so totals match the slice.
-        Single SELECT COUNT(*) — no row materialisation.
+        Single SELECT COUNT(*) — no row materialisation. Scoped counts
+        without ``q`` are served from ``_count_cache`` when one is wired.
         """
+        scope = self._user_scope
+        cache = self._count_cache if scope is not None and not q else None
+        if cache is not None and scope is not None:
+            cached = cache.get(scope, status)
+            if cached is not None:
+                return cached
         try:
             query = self._apply_filters(
                 self._scoped_query(), q=q, status=status
             )
-            return int(query.count())
+            total = int(query.count())
         except SQLAlchemyError as e:
             logger.error(f"Failed to count tasks: {str(e)}")
             return 0
+        if cache is not None and scope is not None:
+            cache.put(scope, status, total)
+        return total
 
     def update(self, identifier: str, update_data: dict[str, Any]) -> None:
         """
         Update a task by its UUID — scoped to ``_user_scope`` when set.
 
-        Cross-user updates raise ``ValueError("Task not found...")`` because
-        the scoped query returns no row — identical surface to a genuine
-        miss (no enumeration).
+        Issues one UPDATE statement; the row is never loaded. A ``result``
+        key is routed to ``task_results`` (compressed) in the same
+        transaction — the UPDATE sets only ``result_size`` — and a
+        non-empty result also re-indexes the task for full-text search
+        (an empty or cleared one removes its index rows; SQLite only).
+        Cross-user updates match zero rows and raise ``ValueError("Task not found...")``
+        — identical surface to a genuine miss (no enumeration).
+        ``updated_at`` is refreshed by the column's ``onupdate`` default.
 
         Args:
             identifier: The UUID of the task to update
             update_data: Dictionary containing the attributes to update
-                        along with their new values
+                        along with their new values; keys that are not
+                        task columns are ignored.
 
         Raises:
             ValueError: If the task is not found within the current scope.
             DatabaseOperationError: If the underlying UPDATE fails.
         """
-        orm_task = (
-            self._scoped_query().filter(ORMTask.uuid == identifier).first()
-        )
-
-        if not orm_task:
-            logger.error(f"Task not found for update with UUID: {identifier}")
-            raise ValueError(f"Task not found with UUID: {identifier}")
+        values = {k: v for k, v in update_data.items() if k in _TASK_COLUMNS}
+        writes_result = "result" in values
+        new_result = values.pop("result", None)
+        stored = StoredResult.encode(new_result) if new_result is not None else None
+        if writes_result:
+            values["result"] = None
+            values["result_size"] = stored.raw_size if stored is not None else None
+
+        stmt = update(ORMTask).where(ORMTask.uuid == identifier)
+        if self._user_scope is not None:
+            stmt = stmt.where(ORMTask.user_id == self._user_scope)
+        stmt = stmt.values(**values).execution_options(synchronize_session=False)
 
         try:
-            # Update attributes
-            for key, value in update_data.items():
-                if hasattr(orm_task, key):
-                    setattr(orm_task, key, value)
+            result = self.session.execute(stmt)
+            if result.rowcount == 0:
+                self.session.rollback()
+                logger.error(f"Task not found for update with UUID: {identifier}")
+                raise ValueError(f"Task not found with UUID: {identifier}")
+
+            if writes_result:
+                self._write_result(identifier, new_result, stored)
 
             self.session.commit()
+            if "status" in values:
+                self._invalidate_counts(self._user_scope)
             logger.info(f"Task updated successfully with UUID: {identifier}")
 
         except SQLAlchemyError as e:
@@ -299,6 +546,83 @@ class SQLAlchemyTaskRepository:
                 identifier=identifier,
             )
 
+    def _write_result(
+        self,
+        identifier: str,
+        result: dict[str, Any] | None,
+        stored: StoredResult | None,
+    ) -> None:
+        """Store (or clear) the result blob and re-index search (caller commits)."""
+        row = self.session.execute(
+            select(ORMTask.id, ORMTask.file_name).where(ORMTask.uuid == identifier)
+        ).one()
+        if stored is None:
+            result_store.drop_result(self.session, task_id=row.id)
+        else:
+            result_store.store_result(self.session, task_id=row.id, stored=stored)
+        if not task_search_index.is_supported(self.session):
+            return
+        if result:
+            task_search_index.index_task(
+                self.session, task_id=row.id, file_name=row.file_name, result=result
+            )
+        else:
+            task_search_index.drop_task(self.session, task_id=row.id)
+
+    def search(self, query: str, *, limit: int) -> list[TaskSearchHit]:
+        """Full-text search over file names and transcripts — scoped.
+
+        Runs one ranked FTS5 query at segment granularity, then groups the
+        hits per task (best rank first, up to ``_SEARCH_SEGMENTS_PER_TASK``
+        segments each). Cross-user rows are excluded in SQL by joining
+        back to ``tasks.user_id``.
+
+        Args:
+            query: Free text; every term must match (implicit AND).
+            limit: Maximum number of tasks to return.
+
+        Returns:
+            list[TaskSearchHit]: Matching tasks, most relevant first; empty
+            for a blank query, on database error, or on a database without
+            the SQLite FTS5 index.
+        """
+        match = task_search_index.to_match_expression(query)
+        if not match or not task_search_index.is_supported(self.session):
+            return []
+        params: dict[str, Any] = {
+            "match": match,
+            "limit": limit * _SEARCH_SEGMENTS_PER_TASK,
+            "open": task_search_index.SNIPPET_OPEN,
+            "close": task_search_index.SNIPPET_CLOSE,
+            "ellipsis": task_search_index.SNIPPET_ELLIPSIS,
+            "tokens": task_search_index.SNIPPET_TOKENS,
+        }
+        if self._user_scope is not None:
+            params["user_id"] = self._user_scope
+        sql = task_search_index.build_search_sql(scoped=self._user_scope is not None)
+        try:
+            rows = self.session.execute(sql, params).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to search tasks: {str(e)}")
+            return []
+
+        hits: dict[str, TaskSearchHit] = {}
+        for row in rows:
+            hit = hits.get(row.uuid)
+            if hit is None:
+                if len(hits) == limit:
+                    continue
+                hit = hits[row.uuid] = TaskSearchHit(
+                    uuid=row.uuid, file_name=row.file_name, rank=row.rank
+                )
+            if row.segment == 0:
+                hit.file_name_snippet = row.snippet
+            elif len(hit.segments) < _SEARCH_SEGMENTS_PER_TASK:
+                hit.segments.append(
+                    SegmentMatch(start=row.seg_start, end=row.seg_end, snippet=row.snippet)
+                )
+        return list(hits.values())
+
     def delete(self, identifier: str) -> bool:
         """
         Delete a task by its UUID — scoped to ``_user_scope`` when set.
@@ -319,8 +643,10 @@ class SQLAlchemyTaskRepository:
             )
 
             if orm_task:
+                owner_id = orm_task.user_id
                 self.session.delete(orm_task)
                 self.session.commit()
+                self._invalidate_counts(owner_id)
                 logger.info(f"Task deleted successfully with UUID: {identifier}")
                 return True
             else:
@@ -10,8 +10,11 @@ from sqlalchemy.orm import Session
 from app.core.exceptions import DatabaseOperationError
 from app.core.logging import logger
 from app.domain.entities.user import User as DomainUser
+from app.infrastructure.database.api_key_cache import ApiKeyCache
 from app.infrastructure.database.mappers.user_mapper import to_domain, to_orm
 from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.statements import USER_BY_ID
+from app.infrastructure.database.user_snapshot_cache import UserSnapshotCache
 
 
 class SQLAlchemyUserRepository:
@@ -21,9 +24,30 @@ class SQLAlchemyUserRepository:
     email payloads. Only ``id`` is safe for info-level logs.
     """
 
-    def __init__(self, session: Session) -> None:
-        """Initialise repository with a SQLAlchemy session."""
+    def __init__(
+        self,
+        session: Session,
+        key_cache: ApiKeyCache | None = None,
+        snapshot_cache: UserSnapshotCache | None = None,
+    ) -> None:
+        """Initialise repository with a SQLAlchemy session.
+
+        Args:
+            session: The SQLAlchemy database session.
+            key_cache: Optional process-wide verified-key cache; every write
+                to a user drops that user's cached bearer snapshots.
+            snapshot_cache: Optional process-wide cookie-auth user cache;
+                invalidated on the same writes.
+        """
         self.session = session
+        self._key_cache = key_cache
+        self._snapshot_cache = snapshot_cache
+
+    def _invalidate_cached_user(self, identifier: int) -> None:
+        if self._key_cache is not None:
+            self._key_cache.invalidate_user(identifier)
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.invalidate_user(identifier)
 
     def add(self, user: DomainUser) -> int:
         """Persist a new user; return its primary-key id."""
@@ -46,10 +70,8 @@ class SQLAlchemyUserRepository:
     def get_by_id(self, identifier: int) -> DomainUser | None:
         """Read a user by primary-key id; ``None`` on miss or read failure."""
         try:
-            orm_user = (
-                self.session.query(ORMUser).filter(ORMUser.id == identifier).first()
-            )
-            return to_domain(orm_user) if orm_user else None
+            row = self.session.execute(USER_BY_ID, {"user_id": identifier}).first()
+            return to_domain(row) if row else None
         except SQLAlchemyError as e:
             logger.error("Failed to get user by id=%s: %s", identifier, str(e))
             return None
@@ -82,6 +104,7 @@ class SQLAlchemyUserRepository:
                 )
             orm_user.token_version = new_version
             self.session.commit()
+            self._invalidate_cached_user(identifier)
             logger.info("Token version bumped for user id=%s", identifier)
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -109,6 +132,7 @@ class SQLAlchemyUserRepository:
                 if hasattr(orm_user, key):
                     setattr(orm_user, key, value)
             self.session.commit()
+            self._invalidate_cached_user(identifier)
             logger.info("User updated id=%s", identifier)
         except SQLAlchemyError as e:
             self.session.rollback()
@@ -129,6 +153,7 @@ class SQLAlchemyUserRepository:
                 return False
             self.session.delete(orm_user)
             self.session.commit()
+            self._invalidate_cached_user(identifier)
             logger.info("User deleted id=%s", identifier)
             return True
         except SQLAlchemyError as e:
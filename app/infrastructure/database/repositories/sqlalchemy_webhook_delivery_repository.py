@@ -0,0 +1,203 @@
+"""SQLAlchemy implementation of IWebhookDeliveryRepository (callback outbox)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import Table, bindparam, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.domain.entities.webhook_delivery import WebhookDelivery
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import WebhookDelivery as ORMDelivery
+
+_DELIVERIES = cast(Table, ORMDelivery.__table__)
+_TASKS = cast(Table, ORMTask.__table__)
+
+_TASK_ID_BY_UUID = select(_TASKS.c.id).where(_TASKS.c.uuid == bindparam("task_uuid"))
+
+# One statement claims a batch, and the lease makes an abandoned claim due
+# again. Concurrent dispatchers (other workers) never receive the same row:
+# SQLite serialises writers, so the second UPDATE re-reads the leased rows as
+# not due; on row-locking backends FOR UPDATE SKIP LOCKED makes a concurrent
+# claim pass over rows another dispatcher is claiming (SQLite omits the clause).
+_DUE_IDS = (
+    select(_DELIVERIES.c.id)
+    .where(
+        _DELIVERIES.c.status == "pending",
+        _DELIVERIES.c.next_attempt_at <= bindparam("now"),
+    )
+    .order_by(_DELIVERIES.c.next_attempt_at)
+    .limit(bindparam("limit"))
+    .with_for_update(skip_locked=True)
+)
+_CLAIM_DUE = (
+    update(_DELIVERIES)
+    .where(_DELIVERIES.c.id.in_(_DUE_IDS))
+    .values(
+        attempts=_DELIVERIES.c.attempts + 1,
+        next_attempt_at=bindparam("lease_until"),
+    )
+    .returning(
+        _DELIVERIES.c.id,
+        _DELIVERIES.c.task_id,
+        _DELIVERIES.c.url,
+        _DELIVERIES.c.payload,
+        _DELIVERIES.c.attempts,
+    )
+)
+_UPDATE_DELIVERY = update(_DELIVERIES).where(_DELIVERIES.c.id == bindparam("delivery_id"))
+_UPDATE_TASK_CALLBACK_STATUS = (
+    update(_TASKS)
+    .where(_TASKS.c.id == bindparam("task_id"))
+    .values(callback_status=bindparam("callback_status"))
+)
+
+
+class SQLAlchemyWebhookDeliveryRepository:
+    """SQLAlchemy implementation of IWebhookDeliveryRepository.
+
+    Core statements throughout: the dispatcher handles batches of plain
+    rows and never needs ORM identity. Logging hygiene: payloads carry
+    transcripts — log ids and URLs only.
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialise repository with a SQLAlchemy session."""
+        self.session = session
+
+    def enqueue(self, task_uuid: str, url: str, payload: str, due_at: datetime) -> int | None:
+        """Insert a pending delivery and mark the task ``pending``; return its id."""
+        try:
+            task_id = self.session.execute(
+                _TASK_ID_BY_UUID, {"task_uuid": task_uuid}
+            ).scalar_one_or_none()
+            if task_id is None:
+                logger.warning("Callback not enqueued: task %s no longer exists", task_uuid)
+                return None
+            delivery_id = self.session.execute(
+                insert(_DELIVERIES).returning(_DELIVERIES.c.id),
+                {
+                    "task_id": task_id,
+                    "url": url,
+                    "payload": payload,
+                    "status": "pending",
+                    "attempts": 0,
+                    "next_attempt_at": due_at,
+                    "created_at": due_at,
+                },
+            ).scalar_one()
+            self._set_task_status(task_id, "pending")
+            self.session.commit()
+            logger.info("Callback enqueued delivery_id=%s task_id=%s", delivery_id, task_id)
+            return int(delivery_id)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error("Failed to enqueue callback for task %s: %s", task_uuid, str(e))
+            raise DatabaseOperationError(
+                operation="enqueue_webhook_delivery",
+                reason=str(e),
+                original_error=e,
+            )
+
+    def claim_due(
+        self, now: datetime, lease_until: datetime, limit: int
+    ) -> list[WebhookDelivery]:
+        """Claim up to ``limit`` due pending rows in one UPDATE ... RETURNING."""
+        try:
+            rows = self.session.execute(
+                _CLAIM_DUE, {"now": now, "lease_until": lease_until, "limit": limit}
+            ).all()
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error("Failed to claim due webhook deliveries: %s", str(e))
+            raise DatabaseOperationError(
+                operation="claim_webhook_deliveries",
+                reason=str(e),
+                original_error=e,
+            )
+        return [
+            WebhookDelivery(
+                id=row.id,
+                task_id=row.task_id,
+                url=row.url,
+                payload=row.payload,
+                attempt=row.attempts,
+            )
+            for row in rows
+        ]
+
+    def mark_delivered(
+        self, delivery: WebhookDelivery, status_code: int, delivered_at: datetime
+    ) -> None:
+        """Record a successful attempt."""
+        self._finish(
+            delivery,
+            "delivered",
+            {
+                "status": "delivered",
+                "delivered_at": delivered_at,
+                "last_status_code": status_code,
+                "last_error": None,
+            },
+        )
+
+    def mark_retry(
+        self,
+        delivery: WebhookDelivery,
+        status_code: int | None,
+        error: str,
+        next_attempt_at: datetime,
+    ) -> None:
+        """Record a failed attempt; the row is due again at ``next_attempt_at``."""
+        self._finish(
+            delivery,
+            None,
+            {
+                "next_attempt_at": next_attempt_at,
+                "last_status_code": status_code,
+                "last_error": error[:500],
+            },
+        )
+
+    def mark_failed(
+        self, delivery: WebhookDelivery, status_code: int | None, error: str
+    ) -> None:
+        """Record the final failed attempt; the row is never retried."""
+        self._finish(
+            delivery,
+            "failed",
+            {"status": "failed", "last_status_code": status_code, "last_error": error[:500]},
+        )
+
+    def _finish(
+        self, delivery: WebhookDelivery, task_status: str | None, values: dict[str, Any]
+    ) -> None:
+        try:
+            self.session.execute(
+                _UPDATE_DELIVERY.values(**values), {"delivery_id": delivery.id}
+            )
+            if task_status is not None:
+                self._set_task_status(delivery.task_id, task_status)
+            self.session.commit()
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            logger.error(
+                "Failed to record webhook delivery %s outcome: %s", delivery.id, str(e)
+            )
+            raise DatabaseOperationError(
+                operation="update_webhook_delivery",
+                reason=str(e),
+                original_error=e,
+            )
+
+    def _set_task_status(self, task_id: int, callback_status: str) -> None:
+        self.session.execute(
+            _UPDATE_TASK_CALLBACK_STATUS,
+            {"task_id": task_id, "callback_status": callback_status},
+        )
@@ -0,0 +1,143 @@
+"""Prebuilt Core statements for the per-request repository lookups.
+
+Bearer auth (``get_by_prefix`` + user ``get_by_id``), cookie auth, rate-limit
+``get_by_key`` and progress polling run on nearly every request. Through
+``session.query(...)`` each call rebuilt the Query, derived its cache key
+from scratch and materialised full ORM objects in the identity map only to
+copy them into domain entities.
+
+These statements are built once at import with ``bindparam`` placeholders:
+their cache key is memoised on the statement, so every execution after the
+first is a compiled-cache hit, and selecting columns (not entities) returns
+plain rows that the mappers read by attribute. Shared by the sync and async
+repositories. Rows are read-only — paths that mutate the loaded object
+(``mark_used``, ``upsert_atomic``) keep loading ORM entities; the batched
+bucket and ``last_used_at`` writes (``upsert_many_atomic``,
+``mark_used_many``) are Core executemany statements.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+from typing import Any, cast
+
+from sqlalchemy import Select, Table, bindparam, insert, or_, select, update
+from sqlalchemy.orm import Bundle
+
+from app.infrastructure.database.models import ApiKey as ORMApiKey
+from app.infrastructure.database.models import RateLimitBucket as ORMBucket
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+
+# KEY-08: served by idx_api_keys_prefix; revoked keys never match (T-11-12).
+ACTIVE_API_KEYS_BY_PREFIX = select(*ORMApiKey.__table__.c).where(
+    ORMApiKey.prefix == bindparam("prefix"),
+    ORMApiKey.revoked_at.is_(None),
+)
+
+# Bearer-cache miss: candidate keys and their owners in one JOIN. Rows carry
+# two bundles, ``row.key`` (api_keys columns) and ``row.user`` (users).
+_API_KEYS = cast(Table, ORMApiKey.__table__)
+_USERS = cast(Table, ORMUser.__table__)
+ACTIVE_API_KEYS_WITH_USER_BY_PREFIX: Select[Any] = (
+    select(Bundle("key", *_API_KEYS.c), Bundle("user", *_USERS.c))
+    .join_from(_API_KEYS, _USERS, _API_KEYS.c.user_id == _USERS.c.id)
+    .where(_API_KEYS.c.prefix == bindparam("prefix"), _API_KEYS.c.revoked_at.is_(None))
+)
+
+# Batched ``last_used_at`` flush; never moves a stamp backwards (another
+# worker may have flushed a newer one).
+UPDATE_API_KEY_LAST_USED = (
+    update(_API_KEYS)
+    .where(
+        _API_KEYS.c.id == bindparam("key_id"),
+        or_(
+            _API_KEYS.c.last_used_at.is_(None),
+            _API_KEYS.c.last_used_at < bindparam("used_at"),
+        ),
+    )
+    .values(last_used_at=bindparam("used_at"))
+)
+
+USER_BY_ID = select(*ORMUser.__table__.c).where(ORMUser.id == bindparam("user_id"))
+
+RATE_LIMIT_BUCKET_BY_KEY = select(*ORMBucket.__table__.c).where(
+    ORMBucket.bucket_key == bindparam("bucket_key")
+)
+
+# Batched gate evaluation (``upsert_many_atomic``): one read for all of a
+# request's buckets, then executemany writes. The SET clause of the update
+# comes from the parameter keys (``tokens``, ``last_refill``).
+RATE_LIMIT_BUCKETS_BY_KEYS = select(*ORMBucket.__table__.c).where(
+    ORMBucket.bucket_key.in_(bindparam("bucket_keys", expanding=True))
+)
+_BUCKETS = cast(Table, ORMBucket.__table__)
+UPDATE_RATE_LIMIT_BUCKET = update(_BUCKETS).where(_BUCKETS.c.bucket_key == bindparam("key"))
+INSERT_RATE_LIMIT_BUCKET = insert(_BUCKETS)
+
+# Everything ``to_domain_summary`` reads — never ``result`` / ``task_params``.
+_TASK_SUMMARY_COLUMNS = (
+    ORMTask.uuid,
+    ORMTask.status,
+    ORMTask.task_type,
+    ORMTask.file_name,
+    ORMTask.url,
+    ORMTask.callback_url,
+    ORMTask.callback_status,
+    ORMTask.audio_duration,
+    ORMTask.language,
+    ORMTask.duration,
+    ORMTask.start_time,
+    ORMTask.end_time,
+    ORMTask.error,
+    ORMTask.created_at,
+    ORMTask.updated_at,
+    ORMTask.progress_percentage,
+    ORMTask.progress_stage,
+    ORMTask.user_id,
+)
+_TASK_SUMMARY_BY_UUID = select(*_TASK_SUMMARY_COLUMNS).where(
+    ORMTask.uuid == bindparam("uuid")
+)
+_SCOPED_TASK_SUMMARY_BY_UUID = _TASK_SUMMARY_BY_UUID.where(
+    ORMTask.user_id == bindparam("user_id")
+)
+
+
+def task_summary_by_uuid(user_scope: int | None) -> tuple[Select, dict[str, object]]:
+    """Statement + parameters for a (scoped) task summary lookup by UUID.
+
+    Args:
+        user_scope: Owner filter; ``None`` for unscoped (admin / CLI) reads.
+
+    Returns:
+        ``(statement, params)`` — one of two prebuilt statements, so the
+        scope predicate never forces a rebuild.
+    """
+    if user_scope is None:
+        return _TASK_SUMMARY_BY_UUID, {}
+    return _SCOPED_TASK_SUMMARY_BY_UUID, {"user_id": user_scope}
+
+
+def bucket_write_params(
+    existing_keys: Collection[str], new_states: Mapping[str, Mapping[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Split new bucket states into executemany parameter lists.
+
+    Args:
+        existing_keys: Bucket keys that already have a row.
+        new_states: ``bucket_key -> {"tokens", "last_refill"}`` to persist.
+
+    Returns:
+        ``(updates, inserts)`` for ``UPDATE_RATE_LIMIT_BUCKET`` and
+        ``INSERT_RATE_LIMIT_BUCKET`` respectively.
+    """
+    updates: list[dict[str, Any]] = []
+    inserts: list[dict[str, Any]] = []
+    for bucket_key, state in new_states.items():
+        values = {"tokens": state["tokens"], "last_refill": state["last_refill"]}
+        if bucket_key in existing_keys:
+            updates.append({"key": bucket_key, **values})
+        else:
+            inserts.append({"bucket_key": bucket_key, **values})
+    return updates, inserts
@@ -0,0 +1,118 @@
+"""Out-of-row, zstd-compressed storage for task results.
+
+A finished transcript is the largest thing the app stores — word-level
+timestamps push long recordings into megabytes of JSON. Inline in
+``tasks.result`` that JSON was decoded on every full-row read and bloated
+the pages every status query walks. Results now live in ``task_results``
+(one row per task, keyed by ``tasks.id``); the task row keeps only
+``result_size``, the uncompressed byte count.
+
+Format: the result is serialised once as compact UTF-8 JSON and compressed
+with zstd (``ZSTD_LEVEL``). The stored bytes are exactly the ``result``
+JSON the API returns, so ``GET /task/{id}`` streams them through a zstd
+decompressor without building the dict, the response model, or the
+serialised body in memory (``StoredResult.iter_json``).
+
+Consistency: ``SQLAlchemyTaskRepository.update`` calls ``store_result`` in
+the same transaction that sets ``result_size``. Deleting a task drops its
+result via ``ON DELETE CASCADE``. Migration ``0006_task_results`` moves
+pre-existing inline results here.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import zstandard
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models import TaskResult
+
+RESULT_CODEC = "zstd"
+ZSTD_LEVEL = 3
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+def serialize_result(result: Mapping[str, Any]) -> bytes:
+    """Compact UTF-8 JSON for ``result`` — the exact bytes that get stored."""
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _require_known_codec(codec: str) -> None:
+    """Fail loud on a codec this build cannot read (never guess)."""
+    if codec != RESULT_CODEC:
+        raise ValueError(f"Unsupported task result codec: {codec!r}")
+
+
+@dataclass(frozen=True)
+class StoredResult:
+    """A task's compressed result, detached from the session."""
+
+    codec: str
+    raw_size: int
+    data: bytes
+
+    @classmethod
+    def encode(cls, result: Mapping[str, Any]) -> StoredResult:
+        """Serialise ``result`` as compact UTF-8 JSON and compress it."""
+        raw = serialize_result(result)
+        return cls(
+            codec=RESULT_CODEC,
+            raw_size=len(raw),
+            data=zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw),
+        )
+
+    def decode(self) -> dict[str, Any]:
+        """Decompress and parse into the result dict."""
+        _require_known_codec(self.codec)
+        raw = zstandard.ZstdDecompressor().decompress(
+            self.data, max_output_size=self.raw_size
+        )
+        return json.loads(raw)
+
+    def iter_json(self, chunk_size: int = STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+        """Yield the result JSON in ``chunk_size`` pieces as it decompresses.
+
+        Only one chunk of decompressed output is held at a time; the
+        compressed frame is already in memory.
+        """
+        _require_known_codec(self.codec)
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(self.data))
+        with reader:
+            while chunk := reader.read(chunk_size):
+                yield chunk
+
+
+def store_result(session: Session, *, task_id: int, stored: StoredResult) -> None:
+    """Write (or replace) ``task_id``'s result inside the caller's transaction."""
+    drop_result(session, task_id=task_id)
+    session.execute(
+        insert(TaskResult).values(
+            task_id=task_id,
+            codec=stored.codec,
+            raw_size=stored.raw_size,
+            data=stored.data,
+        )
+    )
+
+
+def drop_result(session: Session, *, task_id: int) -> None:
+    """Remove ``task_id``'s stored result, if any (caller commits)."""
+    session.execute(delete(TaskResult).where(TaskResult.task_id == task_id))
+
+
+def load_result(session: Session, *, task_id: int) -> StoredResult | None:
+    """Fetch ``task_id``'s compressed result, or None when it has none."""
+    row = session.execute(
+        select(TaskResult.codec, TaskResult.raw_size, TaskResult.data).where(
+            TaskResult.task_id == task_id
+        )
+    ).one_or_none()
+    if row is None:
+        return None
+    return StoredResult(codec=row.codec, raw_size=row.raw_size, data=row.data)
@@ -0,0 +1,73 @@
+"""Short-TTL cache for per-user / per-status task counts.
+
+``GET /task/all`` renders a total on every page view. Under the user's
+scope that is a ``SELECT COUNT(*)`` walking every matching index entry —
+cheap for a handful of tasks, noticeable for accounts with tens of
+thousands. Counts change rarely relative to page views, so a process-local
+cache with a short TTL absorbs repeat views of the queue.
+
+Only unfiltered-by-``q`` counts are cached: keys are ``(user_id, status)``
+so the key space per user is bounded by the status vocabulary. Free-text
+searches always hit SQL.
+
+Consistency: ``SQLAlchemyTaskRepository`` drops a user's entries on add,
+delete, and status-changing update made through a scoped repository.
+Background workers update tasks through unscoped repositories, so their
+status transitions surface once the entry ages out (``COUNT_TTL_SECONDS``).
+Single-process scope, like ``WsTicketService`` — each uvicorn worker keeps
+its own cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+COUNT_TTL_SECONDS = 5.0
+
+
+class TaskCountCache:
+    """In-memory ``(user_id, status) -> count`` map with TTL expiry.
+
+    Thread-safe via ``threading.Lock``; sync route handlers run in the
+    threadpool, so concurrent page views share one instance.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = COUNT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: dict[tuple[int, str], tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, status: str | None) -> int | None:
+        """Return the cached count, or None when absent or expired."""
+        key = (user_id, status or "")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+        return value
+
+    def put(self, user_id: int, status: str | None, value: int) -> None:
+        """Store ``value`` for ``(user_id, status)`` for one TTL window."""
+        with self._lock:
+            self._entries[(user_id, status or "")] = (
+                self._clock() + self._ttl_seconds,
+                value,
+            )
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every cached count for ``user_id`` (all statuses)."""
+        with self._lock:
+            stale_keys = [key for key in self._entries if key[0] == user_id]
+            for key in stale_keys:
+                del self._entries[key]
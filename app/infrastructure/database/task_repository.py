@@ -6,6 +6,7 @@ from typing import Any
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from app.infrastructure.database import result_store
 from app.infrastructure.database.connection import (
     get_db_session,
     handle_database_errors,
@@ -85,8 +86,21 @@ def update_task_status_in_db(
     """
     task = session.query(Task).filter_by(uuid=identifier).first()
     if task:
+        update_data = dict(update_data)
+        writes_result = "result" in update_data
+        new_result = update_data.pop("result", None)
         for key, value in update_data.items():
             setattr(task, key, value)
+        if writes_result:
+            # Results live out of row in task_results (see result_store).
+            task.result = None
+            if new_result is None:
+                task.result_size = None
+                result_store.drop_result(session, task_id=task.id)
+            else:
+                stored = result_store.StoredResult.encode(new_result)
+                task.result_size = stored.raw_size
+                result_store.store_result(session, task_id=task.id, stored=stored)
         session.commit()
 
 
@@ -107,9 +121,14 @@ def get_task_status_from_db(
     """
     task = session.query(Task).filter(Task.uuid == identifier).first()
     if task:
+        stored = (
+            result_store.load_result(session, task_id=task.id)
+            if task.result_size is not None
+            else None
+        )
         return {
             "status": task.status,
-            "result": task.result,
+            "result": stored.decode() if stored is not None else task.result,
             "metadata": {
                 "task_type": task.task_type,
                 "task_params": task.task_params,
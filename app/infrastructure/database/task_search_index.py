@@ -0,0 +1,196 @@
+"""SQLite FTS5 full-text index over task file names and transcripts.
+
+``tasks_fts`` holds one row per indexed unit of a completed task:
+
+* segment 0 — the task's ``file_name``;
+* segments 1..N — one row per transcript segment, carrying the segment's
+  ``start`` / ``end`` seconds as UNINDEXED columns so a hit can point at
+  the moment in the recording.
+
+Row ids are packed as ``task_id << SEGMENT_BITS | segment``. A task's rows
+therefore occupy one contiguous rowid range, which FTS5 deletes by range
+without scanning, and ``rowid >> SEGMENT_BITS`` joins back to ``tasks.id``
+for user scoping (the index itself stores no ownership).
+
+Sync model:
+  * insert / re-index — repository-maintained: ``SQLAlchemyTaskRepository``
+    calls ``index_task`` in the same transaction that writes a result, and
+    ``drop_task`` when the result is cleared or empty.
+  * delete — trigger-maintained (``tasks_fts_after_delete``), so rows go
+    away however the task row is removed.
+  * existing rows — ``python -m app.cli backfill-search-index``.
+
+The DDL below is attached to ``tasks`` ``after_create`` so
+``Base.metadata.create_all`` (tests, fresh dev DBs) matches what migration
+0005_tasks_fts builds. SQLite only; other dialects skip it, so callers
+check ``is_supported`` first — on PostgreSQL indexing is a no-op and search
+finds nothing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.models import Task as ORMTask
+
+FTS_TABLE = "tasks_fts"
+SEGMENT_BITS = 20
+MAX_SEGMENTS = (1 << SEGMENT_BITS) - 1
+
+SNIPPET_OPEN = "["
+SNIPPET_CLOSE = "]"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 12
+
+_CREATE_FTS_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "file_name, text, seg_start UNINDEXED, seg_end UNINDEXED, "
+    "tokenize = 'unicode61 remove_diacritics 2')"
+)
+_CREATE_DELETE_TRIGGER_SQL = (
+    f"CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_after_delete "
+    f"AFTER DELETE ON tasks BEGIN "
+    f"DELETE FROM {FTS_TABLE} WHERE rowid BETWEEN "
+    f"OLD.id << {SEGMENT_BITS} AND (OLD.id << {SEGMENT_BITS}) + {MAX_SEGMENTS}; "
+    f"END"
+)
+_DROP_DELETE_TRIGGER_SQL = f"DROP TRIGGER IF EXISTS {FTS_TABLE}_after_delete"
+_DROP_FTS_SQL = f"DROP TABLE IF EXISTS {FTS_TABLE}"
+
+_DELETE_TASK_ROWS_SQL = text(
+    f"DELETE FROM {FTS_TABLE} WHERE rowid BETWEEN :lo AND :hi"
+)
+_INSERT_ROW_SQL = text(
+    f"INSERT INTO {FTS_TABLE} (rowid, file_name, text, seg_start, seg_end) "
+    "VALUES (:rowid, :file_name, :text, :seg_start, :seg_end)"
+)
+
+event.listen(
+    ORMTask.__table__,
+    "after_create",
+    DDL(_CREATE_FTS_SQL).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ORMTask.__table__,
+    "after_create",
+    DDL(_CREATE_DELETE_TRIGGER_SQL).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ORMTask.__table__,
+    "before_drop",
+    DDL(_DROP_DELETE_TRIGGER_SQL).execute_if(dialect="sqlite"),
+)
+event.listen(
+    ORMTask.__table__,
+    "before_drop",
+    DDL(_DROP_FTS_SQL).execute_if(dialect="sqlite"),
+)
+
+
+def flatten_segments(
+    result: Mapping[str, Any] | None,
+) -> list[tuple[float | None, float | None, str]]:
+    """Return ``(start, end, text)`` for every non-empty transcript segment.
+
+    Tolerates partial results — a missing ``segments`` key or segments
+    without timestamps index what is there rather than failing the write.
+    """
+    if not result:
+        return []
+    segments: Iterable[Any] = result.get("segments") or []
+    flattened = []
+    for segment in segments:
+        if not isinstance(segment, Mapping):
+            continue
+        segment_text = str(segment.get("text") or "").strip()
+        if segment_text:
+            flattened.append((segment.get("start"), segment.get("end"), segment_text))
+    return flattened[:MAX_SEGMENTS]
+
+
+def is_supported(session: Session) -> bool:
+    """True when the session's database has ``tasks_fts`` (SQLite only)."""
+    return session.get_bind().dialect.name == "sqlite"
+
+
+def task_rowid_range(task_id: int) -> tuple[int, int]:
+    """Inclusive ``(lo, hi)`` FTS rowid range owned by ``task_id``."""
+    lo = task_id << SEGMENT_BITS
+    return lo, lo + MAX_SEGMENTS
+
+
+def drop_task(session: Session, *, task_id: int) -> None:
+    """Remove every index row of one task inside the caller's transaction."""
+    lo, hi = task_rowid_range(task_id)
+    session.execute(_DELETE_TASK_ROWS_SQL, {"lo": lo, "hi": hi})
+
+
+def index_task(
+    session: Session,
+    *,
+    task_id: int,
+    file_name: str | None,
+    result: Mapping[str, Any] | None,
+) -> int:
+    """(Re)index one task inside the caller's transaction.
+
+    Replaces any rows the task already had, so re-running is idempotent.
+    The caller owns commit / rollback.
+
+    Returns:
+        Number of transcript segments indexed.
+    """
+    drop_task(session, task_id=task_id)
+    lo, _ = task_rowid_range(task_id)
+    segments = flatten_segments(result)
+    rows = [
+        {
+            "rowid": lo,
+            "file_name": file_name or "",
+            "text": "",
+            "seg_start": None,
+            "seg_end": None,
+        }
+    ]
+    rows.extend(
+        {
+            "rowid": lo + position,
+            "file_name": "",
+            "text": segment_text,
+            "seg_start": start,
+            "seg_end": end,
+        }
+        for position, (start, end, segment_text) in enumerate(segments, start=1)
+    )
+    session.execute(_INSERT_ROW_SQL, rows)
+    return len(segments)
+
+
+def to_match_expression(query: str) -> str:
+    """Turn free user input into a safe FTS5 MATCH expression.
+
+    Every whitespace-separated term becomes a quoted phrase (implicit AND),
+    so FTS5 operators and stray quotes in user input can never produce a
+    syntax error or an unintended query.
+    """
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+def build_search_sql(*, scoped: bool) -> Any:
+    """Segment-level ranked search joined back to ``tasks`` for scoping."""
+    scope_clause = "AND t.user_id = :user_id " if scoped else ""
+    return text(
+        f"SELECT t.uuid AS uuid, t.file_name AS file_name, "
+        f"f.rowid & {MAX_SEGMENTS} AS segment, "
+        f"f.seg_start AS seg_start, f.seg_end AS seg_end, "
+        f"snippet({FTS_TABLE}, -1, :open, :close, :ellipsis, :tokens) AS snippet, "
+        f"bm25({FTS_TABLE}) AS rank "
+        f"FROM {FTS_TABLE} f JOIN tasks t ON t.id = (f.rowid >> {SEGMENT_BITS}) "
+        f"WHERE {FTS_TABLE} MATCH :match {scope_clause}"
+        f"ORDER BY rank LIMIT :limit"
+    )
@@ -0,0 +1,64 @@
+"""In-process cache of user snapshots for session-cookie auth.
+
+Cookie auth loads the user row on every request (every progress poll
+included) only to compare ``token_version`` with the JWT's ``ver`` claim.
+``UserSnapshotCache`` keeps the loaded user for ``ttl_seconds`` keyed by
+``(user_id, token_version)``: a token whose ``ver`` matches a cached
+snapshot resolves without a query.
+
+Keying on the version means a bumped ``token_version`` never matches an
+older snapshot once it has been loaded; until then the user-repository
+writes (token_version bump, update, delete) drop the user's entries.
+Invalidation only reaches this process: another worker may accept a
+logged-out session for at most one TTL window.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import replace
+
+from app.core.ttl_cache import TTLCache
+from app.domain.entities.user import User
+
+DEFAULT_TTL_SECONDS = 15.0
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class UserSnapshotCache:
+    """``(user_id, token_version) -> User`` with TTL expiry and LRU eviction.
+
+    Built on ``TTLCache``; callers get a private copy of the cached user,
+    so a route mutating its ``User`` cannot leak into the cache.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._entries: TTLCache[tuple[int, int], User] = TTLCache(max_entries, clock)
+
+    def get(self, user_id: int, token_version: int) -> User | None:
+        """Return a copy of the cached user, or None when absent or expired."""
+        user = self._entries.get((user_id, token_version))
+        return None if user is None else replace(user)
+
+    def put(self, user: User) -> None:
+        """Cache ``user`` under its current ``token_version`` for one TTL window."""
+        if user.id is None:
+            return
+        self._entries.put(
+            (int(user.id), user.token_version), replace(user), self._ttl_seconds
+        )
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop every snapshot of ``user_id`` (all token versions)."""
+        self._entries.discard_where(lambda key, _: key[0] == user_id)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
@@ -0,0 +1,273 @@
+"""Interval-index speaker assignment — a drop-in for whisperX's.
+
+``whisperx.assign_word_speakers`` recomputes the overlap of one word (or
+segment) against *every* diarization turn with pandas, then groups and
+sorts — O(words × turns) with heavy per-call overhead, which dominates the
+"combining" stage on long meetings.
+
+``SpeakerTurnIndex`` sorts the turns once and answers every query from
+that index:
+
+* default mode — a turn can only overlap ``[s, e)`` if it starts before
+  ``e`` and ends after ``s``. Turns sorted by start plus a running maximum
+  of their ends turn both bounds into one ``numpy.searchsorted`` each
+  (vectorised over all queries); only the handful of turns in between are
+  examined.
+* ``fill_nearest`` — whisperX sums the (possibly negative) intersection
+  over *all* of a speaker's turns. Per speaker that sum has a closed form
+  over sorted starts / ends and their prefix sums, evaluated for all
+  queries at once. Queries whose top two speakers are within the
+  floating-point error bound of that closed form are recomputed exactly.
+
+Output is identical to whisperX: intersections use the same
+``min(end) - max(start)`` arithmetic, per-speaker totals are accumulated
+in diarization row order with the same compensated (Kahan) summation as
+``pandas`` ``groupby().sum()``, and ties resolve through the same
+``sort_values(ascending=False)`` argsort over label-sorted speakers.
+Turn times are compared as float64.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from collections.abc import Hashable, Iterable, MutableMapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+_EPS = sys.float_info.epsilon
+
+
+def _kahan_add(
+    totals: list[float], compensation: list[float], group: int, value: float
+) -> None:
+    """One step of pandas' ``group_sum`` compensated summation."""
+    y = value - compensation[group]
+    t = totals[group] + y
+    compensation[group] = t - totals[group] - y
+    if math.isnan(compensation[group]):
+        compensation[group] = 0.0
+    totals[group] = t
+
+
+def _pick_speaker(groups: list[int], totals: list[float]) -> int:
+    """Winner of ``Series(totals, groups).sort_values(ascending=False)``.
+
+    ``groups`` are speaker codes in ascending (label-sorted) order, as
+    ``groupby`` emits them. A unique maximum wins outright; exact ties go
+    through pandas' descending ``nargsort`` so the same label wins.
+    """
+    best = max(totals)
+    if totals.count(best) == 1:
+        return groups[totals.index(best)]
+    values = np.asarray(totals, dtype=np.float64)
+    positions = np.arange(len(values))[::-1]
+    indexer = positions[values[::-1].argsort(kind="quicksort")][::-1]
+    return groups[int(indexer[0])]
+
+
+class SpeakerTurnIndex:
+    """Diarization turns indexed for max-overlap speaker queries.
+
+    Build once per diarization result; query with ``assign`` for any
+    number of ``(start, end)`` intervals.
+    """
+
+    def __init__(self, diarize_df: pd.DataFrame) -> None:
+        """Index ``diarize_df`` (columns ``start``, ``end``, ``speaker``)."""
+        starts = diarize_df["start"].to_numpy(dtype=np.float64)
+        ends = diarize_df["end"].to_numpy(dtype=np.float64)
+        labels, codes = np.unique(
+            diarize_df["speaker"].to_numpy(dtype=object), return_inverse=True
+        )
+        self.labels: list[Hashable] = list(labels)
+        self._starts = starts
+        self._ends = ends
+        self._codes = codes.astype(np.int64)
+        valid = ~(np.isnan(starts) | np.isnan(ends))
+        self._valid = valid
+
+        # Default mode: valid turns sorted by start + running max of ends.
+        order = np.flatnonzero(valid)
+        order = order[np.argsort(starts[order], kind="stable")]
+        self._order = order
+        self._sorted_starts = starts[order]
+        self._sorted_ends = ends[order]
+        self._running_max_end = (
+            np.maximum.accumulate(self._sorted_ends)
+            if order.size
+            else self._sorted_ends
+        )
+        self._py_starts = starts.tolist()
+        self._py_ends = ends.tolist()
+        self._py_codes = self._codes.tolist()
+
+        # fill_nearest: per-speaker sorted starts / ends with prefix sums.
+        self._per_speaker = []
+        for code in range(len(self.labels)):
+            rows = valid & (self._codes == code)
+            s = np.sort(starts[rows])
+            e = np.sort(ends[rows])
+            self._per_speaker.append(
+                (
+                    s,
+                    np.concatenate(([0.0], np.cumsum(s))),
+                    e,
+                    np.concatenate(([0.0], np.cumsum(e))),
+                    float(np.abs(s).sum() + np.abs(e).sum()),
+                )
+            )
+
+    def assign(
+        self,
+        query_starts: Iterable[float],
+        query_ends: Iterable[float],
+        *,
+        fill_nearest: bool = False,
+    ) -> list[Hashable | None]:
+        """Max-overlap speaker for every ``[start, end]`` query.
+
+        Args:
+            query_starts: Interval starts (seconds).
+            query_ends: Interval ends (seconds), same length.
+            fill_nearest: whisperX's ``fill_nearest`` — also assign when no
+                turn overlaps, by largest total (negative) intersection.
+
+        Returns:
+            One speaker label per query, or None where whisperX would leave
+            the interval unassigned.
+        """
+        qs = np.asarray(list(query_starts), dtype=np.float64)
+        qe = np.asarray(list(query_ends), dtype=np.float64)
+        if not self.labels:
+            return [None] * len(qs)
+        if fill_nearest:
+            return self._assign_fill_nearest(qs, qe)
+        return self._assign_overlapping(qs, qe)
+
+    # -- default mode ----------------------------------------------------
+
+    def _assign_overlapping(
+        self, qs: np.ndarray, qe: np.ndarray
+    ) -> list[Hashable | None]:
+        """Only turns with positive intersection count (whisperX default)."""
+        his = np.searchsorted(self._sorted_starts, qe, side="left").tolist()
+        los = np.searchsorted(self._running_max_end, qs, side="right").tolist()
+        order = self._order.tolist()
+        starts, ends, codes = self._py_starts, self._py_ends, self._py_codes
+        speakers: list[Hashable | None] = []
+        for q_start, q_end, lo, hi in zip(qs.tolist(), qe.tolist(), los, his):
+            if hi <= lo or math.isnan(q_start) or math.isnan(q_end):
+                code = None
+            elif hi - lo == 1:
+                row = order[lo]
+                overlap = min(ends[row], q_end) - max(starts[row], q_start)
+                code = codes[row] if overlap > 0 else None
+            else:
+                rows = sorted(order[lo:hi])
+                code = self._exact_winner(rows, q_start, q_end, positive_only=True)
+            speakers.append(None if code is None else self.labels[code])
+        return speakers
+
+    def _exact_winner(
+        self, rows: list[int], q_start: float, q_end: float, *, positive_only: bool
+    ) -> int | None:
+        """whisperX's groupby-sum-argmax over ``rows`` (ascending row ids)."""
+        totals = [0.0] * len(self.labels)
+        compensation = [0.0] * len(self.labels)
+        seen = [False] * len(self.labels)
+        for row in rows:
+            group = self._py_codes[row]
+            inter = min(self._py_ends[row], q_end) - max(self._py_starts[row], q_start)
+            if positive_only and not inter > 0:
+                continue
+            seen[group] = True
+            if not math.isnan(inter):
+                _kahan_add(totals, compensation, group, inter)
+        groups = [g for g in range(len(self.labels)) if seen[g]]
+        if not groups:
+            return None
+        return _pick_speaker(groups, [totals[g] for g in groups])
+
+    # -- fill_nearest ----------------------------------------------------
+
+    def _assign_fill_nearest(
+        self, qs: np.ndarray, qe: np.ndarray
+    ) -> list[Hashable | None]:
+        """All turns count; closed-form totals with exact near-tie fallback."""
+        n_speakers = len(self.labels)
+        approx = np.empty((len(qs), n_speakers), dtype=np.float64)
+        error = np.empty_like(approx)
+        for code, (s, s_prefix, e, e_prefix, magnitude) in enumerate(
+            self._per_speaker
+        ):
+            n = s.size
+            j_end = np.searchsorted(e, qe, side="left")
+            sum_min_end = e_prefix[j_end] + qe * (n - j_end)
+            j_start = np.searchsorted(s, qs, side="left")
+            sum_max_start = qs * j_start + (s_prefix[-1] - s_prefix[j_start])
+            approx[:, code] = sum_min_end - sum_max_start
+            error[:, code] = (
+                4.0 * (n + 2) * _EPS * (magnitude + n * (np.abs(qs) + np.abs(qe)))
+            )
+
+        all_rows = list(range(len(self._py_codes)))
+        near_tie = np.isnan(approx).any(axis=1)
+        if n_speakers > 1:
+            ranked = np.argsort(approx, axis=1)[:, ::-1][:, :2]
+            top = np.take_along_axis(approx, ranked, axis=1)
+            bound = np.take_along_axis(error, ranked, axis=1).sum(axis=1)
+            near_tie |= top[:, 0] - top[:, 1] <= bound
+        best = np.argmax(approx, axis=1).tolist()
+
+        speakers: list[Hashable | None] = []
+        for i, code in enumerate(best):
+            winner = (
+                self._exact_winner(
+                    all_rows, float(qs[i]), float(qe[i]), positive_only=False
+                )
+                if near_tie[i]
+                else code
+            )
+            speakers.append(None if winner is None else self.labels[winner])
+        return speakers
+
+
+def assign_word_speakers(
+    diarize_df: pd.DataFrame,
+    transcript_result: MutableMapping[str, Any],
+    speaker_embeddings: dict[str, list[float]] | None = None,
+    fill_nearest: bool = False,
+) -> MutableMapping[str, Any]:
+    """Same contract and output as ``whisperx.assign_word_speakers``.
+
+    Sets ``speaker`` on every segment and every word with a ``start`` key
+    whose interval overlaps a diarization turn (or, with ``fill_nearest``,
+    on all of them), mutating ``transcript_result`` in place and returning
+    it. ``diarize_df`` is not modified.
+    """
+    targets: list[MutableMapping[str, Any]] = []
+    starts: list[float] = []
+    ends: list[float] = []
+    for segment in transcript_result["segments"]:
+        targets.append(segment)
+        starts.append(segment["start"])
+        ends.append(segment["end"])
+        for word in segment.get("words", ()):
+            if "start" in word:
+                targets.append(word)
+                starts.append(word["start"])
+                ends.append(word["end"])
+
+    index = SpeakerTurnIndex(diarize_df)
+    for target, speaker in zip(
+        targets, index.assign(starts, ends, fill_nearest=fill_nearest)
+    ):
+        if speaker is not None:
+            target["speaker"] = speaker
+
+    if speaker_embeddings is not None:
+        transcript_result["speaker_embeddings"] = speaker_embeddings
+    return transcript_result
@@ -3,22 +3,30 @@
 from typing import Any
 
 import pandas as pd
-import whisperx
 
 from app.core.logging import logger
+from app.infrastructure.ml.speaker_interval_index import assign_word_speakers
 
 
 class WhisperXSpeakerAssignmentService:
     """
     WhisperX-based implementation of speaker assignment service.
 
-    This service wraps the WhisperX speaker assignment functionality to
-    combine diarization results with aligned transcripts.
+    Combines diarization results with aligned transcripts. Uses the
+    interval-index engine in ``speaker_interval_index``, whose output is
+    identical to ``whisperx.assign_word_speakers`` without its
+    O(words x turns) pandas scan.
     """
 
-    def __init__(self) -> None:
-        """Initialize the speaker assignment service."""
+    def __init__(self, fill_nearest: bool = False) -> None:
+        """Initialize the speaker assignment service.
+
+        Args:
+            fill_nearest: Also label words/segments that overlap no turn
+                with the nearest speaker (whisperX ``fill_nearest``).
+        """
         self.logger = logger
+        self.fill_nearest = fill_nearest
 
     def assign_speakers(
         self,
@@ -26,7 +34,7 @@ class WhisperXSpeakerAssignmentService:
         transcript: dict[str, Any],
     ) -> dict[str, Any]:
         """
-        Assign speaker labels to transcript words using WhisperX.
+        Assign speaker labels to transcript segments and words.
 
         Args:
             diarization_segments: DataFrame with speaker segments
@@ -37,8 +45,10 @@ class WhisperXSpeakerAssignmentService:
         """
         self.logger.debug("Starting to combine transcript with diarization results")
 
-        result = whisperx.assign_word_speakers(diarization_segments, transcript)
+        result = assign_word_speakers(
+            diarization_segments, transcript, fill_nearest=self.fill_nearest
+        )
 
         self.logger.debug("Completed combining transcript with diarization results")
 
-        return result  # type: ignore[no-any-return]
+        return result  # type: ignore[return-value]
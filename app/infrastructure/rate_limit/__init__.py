@@ -0,0 +1,18 @@
+"""Rate-limit stores beyond the ``rate_limit_buckets`` table and slowapi's memory storage."""
+
+from app.infrastructure.rate_limit.bucket_store import ShardedBucketStore
+from app.infrastructure.rate_limit.in_memory_rate_limit_repository import (
+    AsyncInMemoryRateLimitRepository,
+    InMemoryRateLimitRepository,
+)
+from app.infrastructure.rate_limit.sqlite_limits_storage import SQLiteLimitsStorage
+from app.infrastructure.rate_limit.write_behind import flush_buckets, load_buckets
+
+__all__ = [
+    "AsyncInMemoryRateLimitRepository",
+    "InMemoryRateLimitRepository",
+    "SQLiteLimitsStorage",
+    "ShardedBucketStore",
+    "flush_buckets",
+    "load_buckets",
+]
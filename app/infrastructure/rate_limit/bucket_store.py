@@ -0,0 +1,172 @@
+"""Process-local, lock-striped token-bucket store.
+
+Rate-limit decisions are a few integer operations
+(``app.core.rate_limit.consume``); routed through ``rate_limit_buckets``
+each one also costs a ``BEGIN IMMEDIATE`` write lock on the whole SQLite
+file. ``ShardedBucketStore`` keeps the buckets in memory instead.
+
+Keys hash onto ``shards`` independent dicts, each guarded by its own
+``threading.Lock`` — requests for different users rarely share a lock, and
+a multi-bucket update locks only the shards it touches (in index order, so
+two batches can never deadlock). Every write marks its key dirty; the
+write-behind job (``write_behind.flush_buckets``) drains the dirty set into
+the table and startup reloads it (``write_behind.load_buckets``).
+
+Single-process scope, like ``TaskCountCache``: each uvicorn worker keeps
+its own buckets, so limits are per worker. Multi-worker deploys keep the
+``database`` backend — one SQLite file (or server database) shared by every
+worker.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from app.core.rate_limit import BucketState
+from app.domain.entities.rate_limit_bucket import RateLimitBucket
+
+DEFAULT_SHARDS = 64
+
+
+def _state(new_state: Mapping[str, Any]) -> BucketState:
+    """Copy the two columns the math reads out of a decided state."""
+    return {"tokens": new_state["tokens"], "last_refill": new_state["last_refill"]}
+
+
+def _bucket(bucket_key: str, state: BucketState) -> RateLimitBucket:
+    return RateLimitBucket(
+        id=None,
+        bucket_key=bucket_key,
+        tokens=state["tokens"],
+        last_refill=state["last_refill"],
+    )
+
+
+class ShardedBucketStore:
+    """In-memory ``bucket_key -> BucketState`` map with dirty tracking.
+
+    Thread-safe: sync routes run in the threadpool, async routes on the
+    loop, and the write-behind job in the scheduler's executor all share
+    one instance. Critical sections are dict operations only — never IO.
+    """
+
+    def __init__(self, shards: int = DEFAULT_SHARDS) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        self._buckets: list[dict[str, BucketState]] = [{} for _ in range(shards)]
+        self._dirty: list[set[str]] = [set() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def _shard(self, bucket_key: str) -> int:
+        return hash(bucket_key) % len(self._locks)
+
+    def get(self, bucket_key: str) -> RateLimitBucket | None:
+        """Return the bucket for ``bucket_key``; ``None`` if never written."""
+        index = self._shard(bucket_key)
+        with self._locks[index]:
+            state = self._buckets[index].get(bucket_key)
+        return None if state is None else _bucket(bucket_key, state)
+
+    def put(self, bucket_key: str, new_state: Mapping[str, Any]) -> None:
+        """Store ``{"tokens", "last_refill"}`` for ``bucket_key`` and mark it dirty."""
+        index = self._shard(bucket_key)
+        with self._locks[index]:
+            self._buckets[index][bucket_key] = _state(new_state)
+            self._dirty[index].add(bucket_key)
+
+    def update_many(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, RateLimitBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read, decide and write several buckets atomically.
+
+        Holds the lock of every shard involved for the whole step, so no
+        other update interleaves between the read and the writes. An
+        exception from ``decide`` propagates and nothing is written.
+
+        Args:
+            bucket_keys: Keys to read; missing buckets are absent from the
+                mapping passed to ``decide``.
+            decide: Returns the new state of each bucket to write.
+        """
+        indexes = sorted({self._shard(key) for key in bucket_keys})
+        for index in indexes:
+            self._locks[index].acquire()
+        try:
+            current: dict[str, RateLimitBucket] = {}
+            for key in bucket_keys:
+                state = self._buckets[self._shard(key)].get(key)
+                if state is not None:
+                    current[key] = _bucket(key, state)
+            new_states = decide(current)
+            unrequested = new_states.keys() - set(bucket_keys)
+            if unrequested:
+                raise ValueError(f"decide wrote unrequested bucket keys: {sorted(unrequested)}")
+            for key, new_state in new_states.items():
+                index = self._shard(key)
+                self._buckets[index][key] = _state(new_state)
+                self._dirty[index].add(key)
+        finally:
+            for index in reversed(indexes):
+                self._locks[index].release()
+
+    def load(self, buckets: Iterable[RateLimitBucket]) -> int:
+        """Seed the store with persisted buckets (not marked dirty).
+
+        Returns:
+            Number of buckets loaded.
+        """
+        loaded = 0
+        for bucket in buckets:
+            index = self._shard(bucket.bucket_key)
+            with self._locks[index]:
+                self._buckets[index][bucket.bucket_key] = {
+                    "tokens": bucket.tokens,
+                    "last_refill": bucket.last_refill,
+                }
+            loaded += 1
+        return loaded
+
+    def take_dirty(self) -> dict[str, BucketState]:
+        """Snapshot every bucket written since the last call and clear the flags.
+
+        A key written again after the snapshot is re-flagged by that write,
+        so the next flush picks up the newer state.
+
+        Returns:
+            ``bucket_key -> {"tokens", "last_refill"}`` to persist.
+        """
+        snapshot: dict[str, BucketState] = {}
+        for index, lock in enumerate(self._locks):
+            with lock:
+                for key in self._dirty[index]:
+                    snapshot[key] = _state(self._buckets[index][key])
+                self._dirty[index].clear()
+        return snapshot
+
+    def mark_dirty(self, bucket_keys: Iterable[str]) -> None:
+        """Re-flag keys whose flush failed so the next flush retries them."""
+        for key in bucket_keys:
+            index = self._shard(key)
+            with self._locks[index]:
+                if key in self._buckets[index]:
+                    self._dirty[index].add(key)
+
+    def discard_prefix(self, prefix: str) -> int:
+        """Forget every bucket whose key starts with ``prefix`` (dirty or not).
+
+        Returns:
+            Number of buckets dropped.
+        """
+        dropped = 0
+        for index, lock in enumerate(self._locks):
+            with lock:
+                stale = [key for key in self._buckets[index] if key.startswith(prefix)]
+                for key in stale:
+                    del self._buckets[index][key]
+                    self._dirty[index].discard(key)
+                dropped += len(stale)
+        return dropped
@@ -0,0 +1,66 @@
+"""``IRateLimitRepository`` / ``IAsyncRateLimitRepository`` over a ``ShardedBucketStore``.
+
+Drop-in replacements for the SQLAlchemy rate-limit repositories when
+``AUTH__RATE_LIMIT_BACKEND=memory``: same contracts, no database IO on the
+request path. Persistence is write-behind (see ``write_behind``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from app.domain.entities.rate_limit_bucket import RateLimitBucket as DomainBucket
+from app.infrastructure.rate_limit.bucket_store import ShardedBucketStore
+
+
+class InMemoryRateLimitRepository:
+    """Sync rate-limit repository backed by the process-wide bucket store."""
+
+    def __init__(self, store: ShardedBucketStore) -> None:
+        """Initialise repository on ``store``."""
+        self.store = store
+
+    def get_by_key(self, bucket_key: str) -> DomainBucket | None:
+        """Read a bucket by its unique key; ``None`` if never written."""
+        return self.store.get(bucket_key)
+
+    def upsert_atomic(self, bucket_key: str, new_state: dict[str, Any]) -> None:
+        """Replace the bucket's state (one shard lock)."""
+        self.store.put(bucket_key, new_state)
+
+    def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, DomainBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read, decide and write several buckets under their shard locks."""
+        self.store.update_many(bucket_keys, decide)
+
+
+class AsyncInMemoryRateLimitRepository:
+    """Async face of ``InMemoryRateLimitRepository`` for the request path.
+
+    The store's critical sections are dict operations, so the methods run
+    inline on the event loop — nothing to await.
+    """
+
+    def __init__(self, store: ShardedBucketStore) -> None:
+        """Initialise repository on ``store``."""
+        self.store = store
+
+    async def get_by_key(self, bucket_key: str) -> DomainBucket | None:
+        """Read a bucket by its unique key; ``None`` if never written."""
+        return self.store.get(bucket_key)
+
+    async def upsert_atomic(self, bucket_key: str, new_state: dict[str, Any]) -> None:
+        """Replace the bucket's state (one shard lock)."""
+        self.store.put(bucket_key, new_state)
+
+    async def upsert_many_atomic(
+        self,
+        bucket_keys: Sequence[str],
+        decide: Callable[[dict[str, DomainBucket]], dict[str, dict[str, Any]]],
+    ) -> None:
+        """Read, decide and write several buckets under their shard locks."""
+        self.store.update_many(bucket_keys, decide)
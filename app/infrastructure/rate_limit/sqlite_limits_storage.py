@@ -0,0 +1,259 @@
+"""SQLite-file storage for the ``limits`` package (slowapi's limiter backend).
+
+slowapi's default ``memory://`` storage is per process: with N uvicorn
+workers every per-subnet limit is effectively multiplied by N. This
+storage keeps the counters in one SQLite file that every worker on the
+host opens, registered with ``limits`` under the ``sqlite`` scheme::
+
+    AUTH__RATE_LIMIT_STORAGE_URI=sqlite:///limits.db
+
+Each check is one short ``BEGIN IMMEDIATE`` transaction, so the
+read-count-insert of a moving window is atomic across processes. Use a
+file of its own (not ``records.db``): limiter writes then never queue
+behind task or bucket writes on the main database lock.
+
+slowapi runs the check synchronously, on the event loop for async routes,
+so the wait for another worker's write lock is capped at a few
+milliseconds (``DEFAULT_BUSY_TIMEOUT_SECONDS``). A check that cannot get
+the lock in time fails closed: the hit counts as over the limit (429).
+
+Supports the ``fixed-window`` and ``moving-window`` strategies.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+from limits.storage import MovingWindowSupport, Storage
+
+from app.core.logging import logger
+
+# Transactions here take well under a millisecond; waiting longer than
+# this for the write lock would stall the event loop.
+DEFAULT_BUSY_TIMEOUT_SECONDS = 0.005
+_SETUP_TIMEOUT_SECONDS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS limiter_counters (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS limiter_window_entries (
+    key TEXT NOT NULL,
+    acquired_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_limiter_window_entries_key_at
+    ON limiter_window_entries (key, acquired_at);
+"""
+
+
+def _database_path(uri: str) -> str:
+    """``sqlite:///relative.db`` / ``sqlite:////abs/path.db`` -> filesystem path."""
+    parsed = urlparse(uri)
+    if parsed.scheme != "sqlite" or not parsed.path.startswith("/"):
+        raise ValueError(f"Expected sqlite:///<path> limiter storage URI, got {uri!r}")
+    path = parsed.path[1:]
+    if path in ("", ":memory:"):
+        raise ValueError("Limiter storage needs a database file shared by all workers")
+    return path
+
+
+class SQLiteLimitsStorage(Storage, MovingWindowSupport):
+    """``limits`` storage on a SQLite file shared by every worker process.
+
+    One connection per thread (slowapi checks run on the event loop and in
+    the threadpool), autocommit mode with explicit ``BEGIN IMMEDIATE``
+    around every read-modify-write.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]  # noqa: RUF012 — an instance attribute on limits.Storage
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        clock: Callable[[], float] = time.time,
+        **options: float | str | bool,
+    ) -> None:
+        """Open (and if needed create) the limiter database.
+
+        Args:
+            uri: ``sqlite:///<path>`` of the shared limiter file.
+            wrap_exceptions: Wrap ``sqlite3`` errors in ``limits.errors.StorageError``.
+            clock: Wall-clock source (seconds); injectable for tests.
+            **options: ``timeout`` — seconds to wait on another worker's
+                write lock (default ``DEFAULT_BUSY_TIMEOUT_SECONDS``).
+        """
+        self._path = _database_path(uri or "")
+        self._timeout = float(options.pop("timeout", DEFAULT_BUSY_TIMEOUT_SECONDS))
+        self._clock = clock
+        self._local = threading.local()
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        # Startup may race other workers creating the file: wait longer here.
+        setup = sqlite3.connect(self._path, timeout=_SETUP_TIMEOUT_SECONDS)
+        try:
+            setup.execute("PRAGMA journal_mode = WAL")
+            setup.executescript(_SCHEMA)
+        finally:
+            setup.close()
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        return sqlite3.Error
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA synchronous = NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def _begin(self, connection: sqlite3.Connection, key: str) -> bool:
+        """Take the write lock; False if another worker held it past the timeout."""
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+        except sqlite3.OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            logger.warning("Limiter storage busy, denying hit for %s", key)
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Fixed window
+    # ------------------------------------------------------------------
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Add ``amount`` to the window counter; a new window expires in ``expiry`` s.
+
+        Returns ``sys.maxsize`` (over any limit) when the write lock is busy.
+        """
+        connection = self._connection()
+        now = self._clock()
+        if not self._begin(connection, key):
+            return sys.maxsize
+        try:
+            connection.execute(
+                "DELETE FROM limiter_counters WHERE key = ? AND expires_at <= ?",
+                (key, now),
+            )
+            (value,) = connection.execute(
+                "INSERT INTO limiter_counters (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = value + excluded.value "
+                "RETURNING value",
+                (key, amount, now + expiry),
+            ).fetchone()
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return int(value)
+
+    def get(self, key: str) -> int:
+        """Current window counter for ``key`` (0 once expired)."""
+        row = self._connection().execute(
+            "SELECT value FROM limiter_counters WHERE key = ? AND expires_at > ?",
+            (key, self._clock()),
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get_expiry(self, key: str) -> float:
+        """Epoch seconds at which the window for ``key`` resets."""
+        row = self._connection().execute(
+            "SELECT expires_at FROM limiter_counters WHERE key = ?", (key,)
+        ).fetchone()
+        return float(row[0]) if row else self._clock()
+
+    # ------------------------------------------------------------------
+    # Moving window
+    # ------------------------------------------------------------------
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """Record ``amount`` hits if the last ``expiry`` seconds leave room.
+
+        Prune, count and insert run in one ``BEGIN IMMEDIATE`` transaction,
+        so concurrent workers can never jointly exceed ``limit``. Returns
+        False when the write lock is busy.
+        """
+        if amount > limit:
+            return False
+        connection = self._connection()
+        now = self._clock()
+        if not self._begin(connection, key):
+            return False
+        try:
+            connection.execute(
+                "DELETE FROM limiter_window_entries WHERE key = ? AND acquired_at <= ?",
+                (key, now - expiry),
+            )
+            (count,) = connection.execute(
+                "SELECT COUNT(*) FROM limiter_window_entries WHERE key = ?", (key,)
+            ).fetchone()
+            acquired: bool = count + amount <= limit
+            if acquired:
+                connection.executemany(
+                    "INSERT INTO limiter_window_entries (key, acquired_at) VALUES (?, ?)",
+                    [(key, now)] * amount,
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return acquired
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        """``(oldest hit in the window, hits in the window)`` for ``key``."""
+        now = self._clock()
+        oldest, count = self._connection().execute(
+            "SELECT MIN(acquired_at), COUNT(*) FROM limiter_window_entries "
+            "WHERE key = ? AND acquired_at > ?",
+            (key, now - expiry),
+        ).fetchone()
+        return (float(oldest) if oldest is not None else now), int(count)
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
+    def check(self) -> bool:
+        """Health check: the limiter file answers a query."""
+        self._connection().execute("SELECT 1").fetchone()
+        return True
+
+    def reset(self) -> int | None:
+        """Drop every counter and window entry; returns the number of keys cleared."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            (keys,) = connection.execute(
+                "SELECT COUNT(*) FROM (SELECT key FROM limiter_counters "
+                "UNION SELECT key FROM limiter_window_entries)"
+            ).fetchone()
+            connection.execute("DELETE FROM limiter_counters")
+            connection.execute("DELETE FROM limiter_window_entries")
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return int(keys)
+
+    def clear(self, key: str) -> None:
+        """Reset the counter and window entries of one key."""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM limiter_counters WHERE key = ?", (key,))
+            connection.execute("DELETE FROM limiter_window_entries WHERE key = ?", (key,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
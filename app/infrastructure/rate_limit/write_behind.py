@@ -0,0 +1,88 @@
+"""Write-behind persistence for ``ShardedBucketStore``.
+
+``load_buckets`` seeds the store from ``rate_limit_buckets`` at startup;
+``flush_buckets`` writes the buckets changed since the previous flush back
+in one transaction. Both run off the request path: at lifespan start /
+stop and from the scheduler's interval job. A failed flush re-flags its
+keys, so the next run retries them. State changed after the last
+successful flush is lost on a hard crash — a bounded, at most one-interval
+window of rate-limit leniency, never a lockout.
+
+The store is per process: with N workers each one enforces its own
+buckets, so every quota is effectively N times higher. Flushes merge with
+the stored row on ``last_refill``: a row another worker wrote later than
+this process's state is kept; otherwise this process's state — including
+refunds and refills, which raise the token count — is written.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.logging import logger
+from app.domain.entities.rate_limit_bucket import RateLimitBucket
+from app.infrastructure.database.mappers.rate_limit_bucket_mapper import to_domain
+from app.infrastructure.database.models import RateLimitBucket as ORMBucket
+from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
+    SQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.rate_limit.bucket_store import ShardedBucketStore
+
+
+def load_buckets(
+    store: ShardedBucketStore, session_factory: Callable[[], Session]
+) -> int:
+    """Seed ``store`` with every persisted bucket.
+
+    Returns:
+        Number of buckets loaded.
+    """
+    with session_factory() as session:
+        rows = session.execute(select(*ORMBucket.__table__.c))
+        loaded = store.load(to_domain(row) for row in rows)
+    logger.info("Loaded %d rate-limit buckets into the in-memory store", loaded)
+    return loaded
+
+
+def flush_buckets(
+    store: ShardedBucketStore, session_factory: Callable[[], Session]
+) -> int:
+    """Persist buckets written since the last flush (one transaction).
+
+    A bucket whose stored row has a later ``last_refill`` (written by
+    another process) is left as stored; on a tie this process wins, so a
+    refund (same ``last_refill``, more tokens) is persisted.
+
+    Returns:
+        Number of buckets written (0 when nothing changed).
+
+    Raises:
+        DatabaseOperationError: If the write fails; the keys stay dirty.
+    """
+    pending = store.take_dirty()
+    if not pending:
+        return 0
+    written: dict[str, dict[str, Any]] = {}
+
+    def decide(current: dict[str, RateLimitBucket]) -> dict[str, dict[str, Any]]:
+        written.clear()
+        for key, state in pending.items():
+            stored = current.get(key)
+            if stored is None or state["last_refill"] >= stored.last_refill:
+                written[key] = dict(state)
+        return written
+
+    try:
+        with session_factory() as session:
+            SQLAlchemyRateLimitRepository(session).upsert_many_atomic(
+                list(pending), decide
+            )
+    except Exception:
+        store.mark_dirty(pending)
+        raise
+    logger.debug("Flushed %d rate-limit buckets", len(written))
+    return len(written)
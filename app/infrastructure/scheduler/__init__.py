@@ -1,8 +1,23 @@
 """Background scheduling infrastructure."""
 
+from app.infrastructure.scheduler.api_key_last_used_scheduler import (
+    start_api_key_last_used_flush,
+    stop_api_key_last_used_flush,
+)
 from app.infrastructure.scheduler.cleanup_scheduler import (
     start_cleanup_scheduler,
     stop_cleanup_scheduler,
 )
+from app.infrastructure.scheduler.rate_limit_flush_scheduler import (
+    start_rate_limit_write_behind,
+    stop_rate_limit_write_behind,
+)
 
-__all__ = ["start_cleanup_scheduler", "stop_cleanup_scheduler"]
+__all__ = [
+    "start_api_key_last_used_flush",
+    "start_cleanup_scheduler",
+    "start_rate_limit_write_behind",
+    "stop_api_key_last_used_flush",
+    "stop_cleanup_scheduler",
+    "stop_rate_limit_write_behind",
+]
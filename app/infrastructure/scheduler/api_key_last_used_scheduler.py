@@ -0,0 +1,77 @@
+"""Batched ``api_keys.last_used_at`` writes for bearer auth.
+
+Bearer requests only record their stamp in the process-wide
+``LastUsedBuffer``; an interval job on the shared APScheduler writes the
+buffered stamps every ``AUTH__API_KEY_LAST_USED_FLUSH_SECONDS`` in one
+executemany UPDATE (sync job — it runs in the scheduler's thread pool,
+never on the event loop), and shutdown does a final flush. A failed flush
+re-queues its stamps for the next run.
+"""
+
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.core.services import get_last_used_buffer
+from app.infrastructure.database.api_key_cache import LastUsedBuffer
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
+    SQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.scheduler.cleanup_scheduler import scheduler
+
+FLUSH_JOB_ID = "flush_api_key_last_used"
+
+
+def flush_last_used(
+    buffer: LastUsedBuffer, session_factory: Callable[[], Session]
+) -> int:
+    """Write every buffered stamp in one transaction.
+
+    Returns:
+        Number of rows updated (0 when nothing was buffered).
+
+    Raises:
+        DatabaseOperationError: If the write fails; the stamps are re-queued.
+    """
+    stamps = buffer.drain()
+    if not stamps:
+        return 0
+    try:
+        with session_factory() as session:
+            updated = SQLAlchemyApiKeyRepository(session).mark_used_many(stamps)
+    except Exception:
+        buffer.restore(stamps)
+        raise
+    logger.debug("Flushed last_used_at for %d api keys", updated)
+    return updated
+
+
+def flush_api_key_last_used() -> None:
+    """Flush buffered stamps; errors are logged, never propagated to the scheduler."""
+    try:
+        flush_last_used(get_last_used_buffer(), SessionLocal)
+    except DatabaseOperationError:
+        logger.exception("Error flushing api_keys.last_used_at")
+
+
+def start_api_key_last_used_flush() -> None:
+    """Schedule the periodic ``last_used_at`` flush."""
+    interval = get_settings().auth.API_KEY_LAST_USED_FLUSH_SECONDS
+    scheduler.add_job(
+        flush_api_key_last_used,
+        trigger="interval",
+        seconds=interval,
+        id=FLUSH_JOB_ID,
+        replace_existing=True,
+    )
+    logger.info("Scheduled api key last_used_at flush (interval: %.1f s)", interval)
+
+
+def stop_api_key_last_used_flush() -> None:
+    """Final flush at shutdown; run after the scheduler stops."""
+    flush_api_key_last_used()
+    logger.info("Flushed api key last_used_at on shutdown")
@@ -0,0 +1,55 @@
+"""Write-behind job for the in-memory rate-limit bucket store.
+
+Only active with ``AUTH__RATE_LIMIT_BACKEND=memory``: startup reloads the
+persisted buckets into the store, an interval job on the shared
+APScheduler flushes changed buckets every
+``AUTH__RATE_LIMIT_FLUSH_INTERVAL_SECONDS`` (sync job — it runs in the
+scheduler's thread pool, never on the event loop), and shutdown does a
+final flush.
+"""
+
+from app.core.config import get_settings
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.core.services import get_bucket_store
+from app.infrastructure.database.connection import SessionLocal
+from app.infrastructure.rate_limit.write_behind import flush_buckets, load_buckets
+from app.infrastructure.scheduler.cleanup_scheduler import scheduler
+
+FLUSH_JOB_ID = "flush_rate_limit_buckets"
+
+
+def _write_behind_enabled() -> bool:
+    return get_settings().auth.RATE_LIMIT_BACKEND == "memory"
+
+
+def flush_rate_limit_buckets() -> None:
+    """Flush changed buckets; errors are logged, never propagated to the scheduler."""
+    try:
+        flush_buckets(get_bucket_store(), SessionLocal)
+    except DatabaseOperationError:
+        logger.exception("Error flushing in-memory rate-limit buckets")
+
+
+def start_rate_limit_write_behind() -> None:
+    """Reload persisted buckets and schedule the periodic flush (memory backend only)."""
+    if not _write_behind_enabled():
+        return
+    load_buckets(get_bucket_store(), SessionLocal)
+    interval = get_settings().auth.RATE_LIMIT_FLUSH_INTERVAL_SECONDS
+    scheduler.add_job(
+        flush_rate_limit_buckets,
+        trigger="interval",
+        seconds=interval,
+        id=FLUSH_JOB_ID,
+        replace_existing=True,
+    )
+    logger.info("Scheduled rate-limit bucket write-behind (interval: %.1f s)", interval)
+
+
+def stop_rate_limit_write_behind() -> None:
+    """Final flush at shutdown (memory backend only); run after the scheduler stops."""
+    if not _write_behind_enabled():
+        return
+    flush_rate_limit_buckets()
+    logger.info("Flushed rate-limit buckets on shutdown")
@@ -6,9 +6,12 @@ from app.infrastructure.storage.magic_validator import (
     validate_magic_bytes_from_header,
 )
 from app.infrastructure.storage.streaming_target import StreamingFileTarget
+from app.infrastructure.storage.url_downloader import DownloadedFile, UrlDownloader
 
 __all__ = [
+    "DownloadedFile",
     "StreamingFileTarget",
+    "UrlDownloader",
     "get_file_type_from_magic",
     "validate_magic_bytes",
     "validate_magic_bytes_from_header",
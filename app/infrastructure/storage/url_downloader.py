@@ -0,0 +1,376 @@
+"""Async streaming download of ``/speech-to-text-url`` sources, with a disk cache.
+
+The URL route used to fetch with blocking ``requests`` in 8 KB chunks from
+inside an async handler — stalling the event loop for the whole transfer —
+with no size limit, and fetched a re-submitted URL again every time.
+
+``UrlDownloader`` streams over ``httpx.AsyncClient`` in ``chunk_bytes``
+pieces, writes through the thread pool, and enforces ``max_bytes`` from
+``Content-Length`` up front *and* while streaming (the header can lie or be
+absent). A body of at least ``range_min_bytes`` from a server advertising
+``Accept-Ranges: bytes`` is fetched as ``range_segments`` parallel
+``Range`` requests written at their offsets; each segment carries
+``If-Range``, so a file that changes mid-download falls back to one plain
+stream instead of mixing versions.
+
+Responses carrying a validator (``ETag`` / ``Last-Modified``) are kept in
+``cache_dir`` keyed by URL. A re-submitted URL is revalidated with
+``If-None-Match`` / ``If-Modified-Since``; on ``304`` the cached copy is
+hard-linked (or copied) to a fresh temp file instead of downloading again.
+The cache is bounded by ``cache_max_bytes`` and evicts least recently used
+entries. Entries are written to a ``.part`` file and renamed into place,
+so readers never see a half-written body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+import httpx
+
+from app.core.exceptions import AudioTooLargeError
+from app.core.logging import logger
+
+# ``(url, Content-Disposition) -> (filename, suffix)``; raises to reject.
+NameResolver = Callable[[str, str | None], tuple[str, str]]
+
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class DownloadedFile:
+    """A downloaded source: caller-owned temp file plus its original name."""
+
+    path: str
+    filename: str
+    from_cache: bool = False
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    url: str
+    filename: str
+    suffix: str
+    size: int
+    etag: str | None
+    last_modified: str | None
+
+
+class _RangeNotHonoured(Exception):
+    """A segment came back as something other than the requested 206."""
+
+
+class UrlDownloader:
+    """Stream URL sources to temp files, revalidating cached copies.
+
+    One short-lived ``httpx.AsyncClient`` per download (shared by its range
+    segments): downloads are rare and long, and this keeps the downloader
+    usable from any event loop. Cache bookkeeping runs in the thread pool.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        timeout_seconds: float = 30.0,
+        range_segments: int = 4,
+        range_min_bytes: int = 64 * 1024 * 1024,
+        cache_dir: str | Path | None = None,
+        cache_max_bytes: int = 0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        if range_segments < 1:
+            raise ValueError(f"range_segments must be >= 1, got {range_segments}")
+        self._max_bytes = max_bytes
+        self._chunk_bytes = chunk_bytes
+        self._timeout_seconds = timeout_seconds
+        self._range_segments = range_segments
+        self._range_min_bytes = range_min_bytes
+        self._cache_dir = (
+            Path(cache_dir) if cache_dir is not None and cache_max_bytes > 0 else None
+        )
+        self._cache_max_bytes = cache_max_bytes
+        self._transport = transport
+
+    async def download(self, url: str, resolve_name: NameResolver) -> DownloadedFile:
+        """
+        Download ``url`` to a new temp file (served from cache when still valid).
+
+        Args:
+            url: Source URL
+            resolve_name: Validates the response name; raises to reject it
+
+        Returns:
+            DownloadedFile: The caller owns (and may delete) ``path``
+
+        Raises:
+            AudioTooLargeError: If the body exceeds ``max_bytes``
+            httpx.HTTPError: If the transfer fails or the status is not 2xx
+        """
+        key = hashlib.sha256(url.encode()).hexdigest()
+        cached = await asyncio.to_thread(self._lookup, key, url)
+        target: Path | None = None
+        ranged: tuple[int, str] | None = None
+        async with httpx.AsyncClient(
+            timeout=self._timeout_seconds,
+            follow_redirects=True,
+            transport=self._transport,
+        ) as client:
+            try:
+                async with client.stream(
+                    "GET", url, headers=_conditional_headers(cached)
+                ) as response:
+                    if response.status_code == httpx.codes.NOT_MODIFIED and cached:
+                        logger.info("URL source not modified, serving cached copy: %s", url)
+                        return await asyncio.to_thread(self._materialise, key, cached)
+                    response.raise_for_status()
+                    filename, suffix = resolve_name(
+                        url, response.headers.get("Content-Disposition")
+                    )
+                    length = _content_length(response)
+                    if length is not None and length > self._max_bytes:
+                        raise AudioTooLargeError(length, self._max_bytes)
+                    entry = _CacheEntry(
+                        url=url,
+                        filename=filename,
+                        suffix=suffix,
+                        size=0,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                    cacheable = self._is_cacheable(entry, length or 0)
+                    target = await asyncio.to_thread(
+                        self._new_target, key, suffix, cacheable
+                    )
+                    if self._use_ranges(response, length):
+                        assert length is not None
+                        ranged = (length, entry.etag or entry.last_modified or "")
+                    else:
+                        size = await self._write_stream(response, target)
+                # Segments go out once the probing response is closed.
+                if ranged is not None:
+                    size = await self._fetch_ranged(client, url, target, *ranged)
+            except BaseException:
+                if target is not None:
+                    _remove(target)
+                raise
+
+        logger.info("Downloaded %d bytes from %s", size, url)
+        entry = _CacheEntry(**{**asdict(entry), "size": size})
+        if cacheable:
+            return await asyncio.to_thread(self._commit, key, entry, target)
+        return DownloadedFile(path=str(target), filename=filename)
+
+    # -- transfer ------------------------------------------------------------
+
+    def _use_ranges(self, response: httpx.Response, length: int | None) -> bool:
+        return (
+            self._range_segments > 1
+            and length is not None
+            and length >= self._range_min_bytes
+            and response.headers.get("Accept-Ranges", "").lower() == "bytes"
+            and bool(response.headers.get("ETag") or response.headers.get("Last-Modified"))
+        )
+
+    async def _write_stream(self, response: httpx.Response, target: Path) -> int:
+        """Write the body to ``target``, enforcing ``max_bytes`` as it arrives."""
+        size = 0
+        async with _open_off_loop(target, "wb") as out:
+            async for chunk in response.aiter_bytes(self._chunk_bytes):
+                size += len(chunk)
+                if size > self._max_bytes:
+                    raise AudioTooLargeError(size, self._max_bytes)
+                await asyncio.to_thread(out.write, chunk)
+        return size
+
+    async def _fetch_ranged(
+        self, client: httpx.AsyncClient, url: str, target: Path, length: int, validator: str
+    ) -> int:
+        """Fetch ``length`` bytes as parallel ``Range`` segments written in place."""
+        step = -(-length // self._range_segments)
+        bounds = [(start, min(start + step, length) - 1) for start in range(0, length, step)]
+        await asyncio.to_thread(os.truncate, target, length)
+        segments = [
+            asyncio.create_task(self._fetch_segment(client, url, target, start, end, validator))
+            for start, end in bounds
+        ]
+        try:
+            await asyncio.gather(*segments)
+        except BaseException as e:
+            # One segment failed: stop the others before touching the file.
+            for segment in segments:
+                segment.cancel()
+            await asyncio.gather(*segments, return_exceptions=True)
+            if not isinstance(e, _RangeNotHonoured):
+                raise
+            logger.info("Range download not honoured (%s), streaming instead: %s", e, url)
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                return await self._write_stream(response, target)
+        return length
+
+    async def _fetch_segment(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        target: Path,
+        start: int,
+        end: int,
+        validator: str,
+    ) -> None:
+        headers = {"Range": f"bytes={start}-{end}", "If-Range": validator}
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code != httpx.codes.PARTIAL_CONTENT:
+                raise _RangeNotHonoured(f"HTTP {response.status_code}")
+            # Own handle per segment: closing it waits for an in-flight write.
+            async with _open_off_loop(target, "r+b") as out:
+                out.seek(start)
+                written = 0
+                async for chunk in response.aiter_bytes(self._chunk_bytes):
+                    written += len(chunk)
+                    if written > end + 1 - start:
+                        raise _RangeNotHonoured("segment overrun")
+                    await asyncio.to_thread(out.write, chunk)
+            if written != end + 1 - start:
+                raise httpx.RemoteProtocolError(
+                    f"Range {start}-{end} ended after {written} bytes"
+                )
+
+    # -- cache (thread pool) -------------------------------------------------
+
+    def _is_cacheable(self, entry: _CacheEntry, size: int) -> bool:
+        """Cache responses with a validator that fit the budget (as announced)."""
+        return (
+            self._cache_dir is not None
+            and bool(entry.etag or entry.last_modified)
+            and size <= self._cache_max_bytes
+        )
+
+    def _new_target(self, key: str, suffix: str, cacheable: bool) -> Path:
+        """Where the body is written: a ``.part`` in the cache, else a temp file."""
+        if cacheable:
+            assert self._cache_dir is not None
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            part = self._cache_dir / f"{key}.{uuid.uuid4().hex}.part"
+            part.touch()
+            return part
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        return Path(path)
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        assert self._cache_dir is not None
+        return self._cache_dir / f"{key}.bin", self._cache_dir / f"{key}.json"
+
+    def _lookup(self, key: str, url: str) -> _CacheEntry | None:
+        if self._cache_dir is None:
+            return None
+        data_path, meta_path = self._paths(key)
+        try:
+            entry = _CacheEntry(**json.loads(meta_path.read_text()))
+            if entry.url != url or data_path.stat().st_size != entry.size:
+                return None
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry
+
+    def _commit(self, key: str, entry: _CacheEntry, part: Path) -> DownloadedFile:
+        """Move a finished ``.part`` into the cache and hand out a private copy."""
+        data_path, meta_path = self._paths(key)
+        if entry.size > self._cache_max_bytes:
+            # Larger than announced: hand the body over without caching it.
+            fd, path = tempfile.mkstemp(suffix=entry.suffix)
+            os.close(fd)
+            shutil.move(part, path)
+            return DownloadedFile(path=path, filename=entry.filename)
+        os.replace(part, data_path)
+        meta_part = meta_path.with_suffix(f".{uuid.uuid4().hex}.part")
+        meta_part.write_text(json.dumps(asdict(entry)))
+        os.replace(meta_part, meta_path)
+        downloaded = self._materialise(key, entry, from_cache=False)
+        self._evict()
+        return downloaded
+
+    def _materialise(
+        self, key: str, entry: _CacheEntry, from_cache: bool = True
+    ) -> DownloadedFile:
+        """Link (or copy) the cached body to a caller-owned temp file."""
+        data_path, _ = self._paths(key)
+        fd, path = tempfile.mkstemp(suffix=entry.suffix)
+        os.close(fd)
+        try:
+            os.unlink(path)
+            os.link(data_path, path)
+        except OSError:
+            shutil.copyfile(data_path, path)
+        with contextlib.suppress(OSError):
+            os.utime(data_path)  # recency for LRU eviction
+        return DownloadedFile(path=path, filename=entry.filename, from_cache=from_cache)
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits its budget."""
+        assert self._cache_dir is not None
+        entries = []
+        for data_path in self._cache_dir.glob("*.bin"):
+            with contextlib.suppress(OSError):
+                stat = data_path.stat()
+                entries.append((stat.st_mtime, stat.st_size, data_path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, data_path in sorted(entries):
+            if total <= self._cache_max_bytes:
+                break
+            _remove(data_path.with_suffix(".json"))
+            _remove(data_path)
+            total -= size
+
+
+def _conditional_headers(cached: _CacheEntry | None) -> dict[str, str]:
+    if cached is None:
+        return {}
+    headers = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
+
+
+def _content_length(response: httpx.Response) -> int | None:
+    # A transfer-encoded body's length is unknown until it has been read.
+    if "Content-Encoding" in response.headers:
+        return None
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+@contextlib.asynccontextmanager
+async def _open_off_loop(
+    path: Path, mode: Literal["wb", "r+b"]
+) -> AsyncIterator[BinaryIO]:
+    """Open and close ``path`` in the thread pool (both may block on disk)."""
+    handle: BinaryIO = await asyncio.to_thread(lambda: path.open(mode))
+    try:
+        yield handle
+    finally:
+        await asyncio.to_thread(handle.close)
+
+
+def _remove(path: Path) -> None:
+    with contextlib.suppress(OSError):
+        path.unlink()
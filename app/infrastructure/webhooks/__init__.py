@@ -0,0 +1,5 @@
+"""Task-callback (webhook) delivery infrastructure."""
+
+from app.infrastructure.webhooks.dispatcher import WebhookDispatcher
+
+__all__ = ["WebhookDispatcher"]
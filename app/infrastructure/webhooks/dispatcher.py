@@ -0,0 +1,282 @@
+"""Asyncio dispatcher for the task-callback outbox (``webhook_deliveries``).
+
+The transcription worker used to POST its callback inline: a fresh blocking
+client per attempt and ``time.sleep`` backoff kept the worker — and the
+user's concurrency slot — busy for as long as the endpoint was slow or
+down. Now the worker only calls ``enqueue`` (one INSERT) and returns.
+
+``WebhookDispatcher`` runs on the application event loop. Each pass claims
+a batch of due rows (one ``UPDATE ... RETURNING``; the claim leases the row,
+so a dispatcher that dies mid-delivery only delays it) and POSTs them
+concurrently over one pooled ``httpx.AsyncClient``, at most
+``max_per_host`` at a time per callback host. Failures are rescheduled with
+capped exponential backoff persisted on the row, so retries survive
+restarts; after ``max_attempts`` the delivery is marked failed. Delivery is
+at-least-once: receivers should treat the payload idempotently.
+
+Bodies of at least ``gzip_min_bytes`` are sent with ``Content-Encoding:
+gzip`` — transcripts are repetitive JSON and shrink several-fold —
+compressed in the thread pool so a multi-MB result never blocks the loop.
+
+Database work is a handful of short statements per batch; it runs in the
+default thread pool via ``asyncio.to_thread`` with the sync session, like
+the scheduler jobs, never on the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import math
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+import httpx
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import DatabaseOperationError
+from app.core.logging import logger
+from app.domain.entities.webhook_delivery import WebhookDelivery
+from app.infrastructure.database.repositories.sqlalchemy_webhook_delivery_repository import (
+    SQLAlchemyWebhookDeliveryRepository,
+)
+
+# Added to the worst-case batch duration when leasing claimed rows.
+_LEASE_MARGIN_SECONDS = 30.0
+# zlib's default trade-off; higher levels gain little on JSON.
+_GZIP_LEVEL = 6
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class _HostSlot:
+    """Per-host concurrency gate; dropped once no delivery holds or awaits it."""
+
+    semaphore: asyncio.Semaphore
+    users: int = field(default=0)
+
+
+class WebhookDispatcher:
+    """Deliver outbox rows over a pooled async HTTP client.
+
+    ``enqueue`` and ``notify`` are thread-safe (worker threads call them);
+    everything else runs on the loop that called ``start``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        timeout_seconds: float = 10.0,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 2.0,
+        retry_max_seconds: float = 300.0,
+        max_connections: int = 50,
+        max_per_host: int = 4,
+        poll_seconds: float = 5.0,
+        batch_size: int = 20,
+        gzip_min_bytes: int = 1024,
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {max_attempts}")
+        self._session_factory = session_factory
+        self._timeout_seconds = timeout_seconds
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._max_connections = max_connections
+        self._max_per_host = max_per_host
+        self._poll_seconds = poll_seconds
+        self._batch_size = batch_size
+        self._gzip_min_bytes = gzip_min_bytes
+        self._transport = transport
+        self._clock = clock
+        # A claimed row must stay leased while its batch queues per host.
+        self._lease = timedelta(
+            seconds=timeout_seconds * math.ceil(batch_size / max_per_host)
+            + _LEASE_MARGIN_SECONDS
+        )
+        self._hosts: dict[str, _HostSlot] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._runner: asyncio.Task[None] | None = None
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the dispatch loop on the running loop."""
+        if self._runner is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._runner = asyncio.create_task(self._run(), name="webhook-dispatcher")
+        logger.info("Webhook dispatcher started (poll: %.1f s)", self._poll_seconds)
+
+    async def stop(self) -> None:
+        """Cancel the loop and close the HTTP pool; in-flight rows retry after their lease."""
+        runner, self._runner = self._runner, None
+        if runner is not None:
+            runner.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await runner
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+        logger.info("Webhook dispatcher stopped")
+
+    # -- producer side (any thread) ----------------------------------------
+
+    def enqueue(self, task_uuid: str, url: str, payload: str) -> int | None:
+        """Persist a callback for ``task_uuid`` and wake the dispatcher.
+
+        Returns:
+            The outbox row id, or ``None`` if the task no longer exists.
+
+        Raises:
+            DatabaseOperationError: If the row cannot be written.
+        """
+        with self._session_factory() as session:
+            delivery_id = SQLAlchemyWebhookDeliveryRepository(session).enqueue(
+                task_uuid, url, payload, self._clock()
+            )
+        if delivery_id is not None:
+            self.notify()
+        return delivery_id
+
+    def notify(self) -> None:
+        """Wake the dispatch loop now instead of at the next poll."""
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None or loop.is_closed():
+            return  # not started here: the next poll (any worker) picks it up
+        loop.call_soon_threadsafe(wake.set)
+
+    # -- dispatch ----------------------------------------------------------
+
+    async def dispatch_once(self) -> int:
+        """Claim one batch of due rows and deliver them; return the batch size."""
+        now = self._clock()
+        deliveries = await asyncio.to_thread(self._claim, now, now + self._lease)
+        if deliveries:
+            await asyncio.gather(*(self._deliver(delivery) for delivery in deliveries))
+        return len(deliveries)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            self._wake.clear()
+            try:
+                claimed = await self.dispatch_once()
+            except Exception:  # noqa: BLE001 — one bad pass must not end the loop
+                logger.exception("Webhook dispatch pass failed")
+                claimed = 0
+            if claimed >= self._batch_size:
+                continue  # more may be due right now
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self._poll_seconds)
+
+    def _http(self) -> httpx.AsyncClient:
+        """The shared client, opened on first use (``stop`` closes it)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def _deliver(self, delivery: WebhookDelivery) -> None:
+        status_code: int | None = None
+        error: str | None = None
+        body, headers = await self._encode(delivery.payload)
+        async with self._host_slot(httpx.URL(delivery.url).host):
+            try:
+                response = await self._http().post(
+                    delivery.url, content=body, headers=headers
+                )
+                status_code = response.status_code
+                if not response.is_success:
+                    error = f"HTTP {status_code}: {response.text[:200]}"
+            except httpx.HTTPError as e:
+                error = f"{type(e).__name__}: {e}"
+        try:
+            await asyncio.to_thread(self._record, delivery, status_code, error)
+        except DatabaseOperationError:
+            # The lease expires and the row is retried: at-least-once.
+            logger.exception("Failed to record webhook delivery %s outcome", delivery.id)
+
+    async def _encode(self, payload: str) -> tuple[bytes, dict[str, str]]:
+        """Request body and headers; gzip-encoded from ``gzip_min_bytes`` up (0: never)."""
+        body = payload.encode()
+        headers = {"Content-Type": "application/json"}
+        if self._gzip_min_bytes <= 0 or len(body) < self._gzip_min_bytes:
+            return body, headers
+        compressed = await asyncio.to_thread(gzip.compress, body, _GZIP_LEVEL)
+        return compressed, {**headers, "Content-Encoding": "gzip"}
+
+    @contextlib.asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        slot = self._hosts.get(host)
+        if slot is None:
+            slot = self._hosts[host] = _HostSlot(asyncio.Semaphore(self._max_per_host))
+        slot.users += 1
+        try:
+            async with slot.semaphore:
+                yield
+        finally:
+            slot.users -= 1
+            if slot.users == 0:
+                del self._hosts[host]
+
+    def backoff(self, attempt: int) -> timedelta:
+        """Delay after failed attempt number ``attempt`` (1-based), capped."""
+        delay = self._retry_base_seconds * 2 ** (attempt - 1)
+        return timedelta(seconds=min(delay, self._retry_max_seconds))
+
+    # -- database (thread pool) ---------------------------------------------
+
+    def _claim(self, now: datetime, lease_until: datetime) -> list[WebhookDelivery]:
+        with self._session_factory() as session:
+            return SQLAlchemyWebhookDeliveryRepository(session).claim_due(
+                now, lease_until, self._batch_size
+            )
+
+    def _record(
+        self, delivery: WebhookDelivery, status_code: int | None, error: str | None
+    ) -> None:
+        with self._session_factory() as session:
+            repository = SQLAlchemyWebhookDeliveryRepository(session)
+            if error is None:
+                assert status_code is not None
+                repository.mark_delivered(delivery, status_code, self._clock())
+                logger.info("Callback delivered delivery_id=%s to %s", delivery.id, delivery.url)
+            elif delivery.attempt >= self._max_attempts:
+                repository.mark_failed(delivery, status_code, error)
+                logger.error(
+                    "Callback to %s failed after %d attempts: %s",
+                    delivery.url,
+                    delivery.attempt,
+                    error,
+                )
+            else:
+                retry_at = self._clock() + self.backoff(delivery.attempt)
+                repository.mark_retry(delivery, status_code, error, retry_at)
+                logger.warning(
+                    "Callback to %s failed (attempt %d/%d), retry at %s: %s",
+                    delivery.url,
+                    delivery.attempt,
+                    self._max_attempts,
+                    retry_at.isoformat(),
+                    error,
+                )
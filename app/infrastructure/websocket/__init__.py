@@ -7,7 +7,6 @@ from app.infrastructure.websocket.connection_manager import (
 from app.infrastructure.websocket.progress_emitter import (
     ProgressEmitter,
     get_progress_emitter,
-    set_main_loop,
 )
 
 __all__ = [
@@ -15,5 +14,4 @@ __all__ = [
     "connection_manager",
     "ProgressEmitter",
     "get_progress_emitter",
-    "set_main_loop",
 ]
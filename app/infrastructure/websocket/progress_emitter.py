@@ -1,8 +1,33 @@
-"""Progress emission service for bridging sync background tasks to WebSocket clients."""
+"""Progress emission service for bridging sync background tasks to WebSocket clients.
+
+Transcription stages run in worker threads. Emitting used to schedule
+``send_to_task`` on the main loop and then block the worker on the result
+(up to 5 s), so one slow WebSocket client stretched every stage of the job.
+
+Now ``emit_progress`` / ``emit_error`` only put the message into a bounded,
+lock-guarded pending map and, if the consumer is idle, wake it with
+``call_soon_threadsafe`` — no network I/O on the worker thread, ever.
+
+- Coalescing: progress is keyed by task, so a newer update replaces a still
+  pending one (clients only need the latest stage/percentage). Errors are
+  never coalesced and are delivered after the task's earlier progress.
+- Bound: at most ``max_pending`` messages wait. When full, the oldest pending
+  progress update is dropped (an error only if nothing else is left) and
+  counted in ``dropped``.
+- Delivery: one consumer task on the loop that called ``start`` takes the
+  whole pending map per pass and sends tasks concurrently; each send is
+  capped at ``send_timeout_seconds`` so a stalled client only delays its own
+  task's updates.
+"""
+
+from __future__ import annotations
 
 import asyncio
+import itertools
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from app.core.logging import logger
 from app.schemas import TaskProgressStage
@@ -10,27 +35,72 @@ from app.schemas import TaskProgressStage
 if TYPE_CHECKING:
     from app.infrastructure.websocket.connection_manager import ConnectionManager
 
+# Outbound messages waiting for the consumer; coalescing keeps this to about
+# one per running task, so the bound only matters if the loop is starved.
+MAX_PENDING_MESSAGES = 1000
 
-# Store reference to main event loop for cross-thread scheduling
-_main_loop: asyncio.AbstractEventLoop | None = None
-
-
-def set_main_loop(loop: asyncio.AbstractEventLoop) -> None:
-    """Store reference to main event loop for WebSocket operations."""
-    global _main_loop
-    _main_loop = loop
+_PendingKey = tuple[str, str | int]
 
 
 class ProgressEmitter:
     """
     Emits progress updates from synchronous background tasks to WebSocket clients.
 
-    Background tasks run in a thread pool without an event loop.
-    This service bridges that gap by scheduling sends on the main event loop.
+    ``emit_progress`` and ``emit_error`` are thread-safe and never wait;
+    ``start``/``stop`` and delivery run on the application event loop.
     """
 
-    def __init__(self, connection_manager: "ConnectionManager") -> None:
+    def __init__(
+        self,
+        connection_manager: "ConnectionManager",
+        *,
+        max_pending: int = MAX_PENDING_MESSAGES,
+        send_timeout_seconds: float = 5.0,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
         self.manager = connection_manager
+        self._max_pending = max_pending
+        self._send_timeout_seconds = send_timeout_seconds
+        self._lock = threading.Lock()
+        self._pending: OrderedDict[_PendingKey, tuple[str, dict[str, Any]]] = OrderedDict()
+        self._error_ids = itertools.count()
+        self._wake_scheduled = False
+        self.dropped = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._runner: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        if self._runner is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._stopping = False
+        with self._lock:
+            self._wake_scheduled = False
+            if self._pending:
+                self._wake.set()
+        self._runner = asyncio.create_task(self._run(), name="progress-emitter")
+
+    async def stop(self) -> None:
+        """Flush what is pending, then stop the consumer.
+
+        Each send is capped by ``send_timeout_seconds``, so this is bounded.
+        """
+        runner, self._runner = self._runner, None
+        if runner is not None and self._wake is not None:
+            self._stopping = True
+            self._wake.set()
+            await runner
+        self._loop = None
+        self._wake = None
+
+    # -- producer side (any thread) ----------------------------------------
 
     def emit_progress(
         self,
@@ -40,10 +110,9 @@ class ProgressEmitter:
         message: str = "",
     ) -> None:
         """
-        Emit progress update from sync code (background tasks run in thread pool).
+        Queue a progress update for the task's WebSocket clients.
 
-        Uses asyncio.run_coroutine_threadsafe to schedule the send on the main
-        event loop where WebSocket connections were established.
+        Replaces any update for the same task that has not been sent yet.
 
         Args:
             task_id: The task identifier
@@ -51,32 +120,14 @@ class ProgressEmitter:
             percentage: Progress percentage (0-100)
             message: Optional status message
         """
-        if _main_loop is None:
-            logger.warning("Main event loop not set, cannot emit progress for task %s", task_id)
-            return
-
-        try:
-            logger.info("Emitting progress: task=%s stage=%s percentage=%d", task_id, stage.value, percentage)
-            coro = self.manager.send_to_task(task_id, {
-                "type": "progress",
-                "task_id": task_id,
-                "stage": stage.value,
-                "percentage": percentage,
-                "message": message,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
-            # Schedule on main event loop and wait for completion
-            future = asyncio.run_coroutine_threadsafe(coro, _main_loop)
-            # Wait with timeout to avoid blocking forever
-            future.result(timeout=5.0)
-            logger.info("Progress emitted successfully: task=%s stage=%s", task_id, stage.value)
-        except Exception as e:
-            # Don't let WebSocket errors crash the background task
-            logger.warning(
-                "Failed to emit progress for task %s: %s",
-                task_id,
-                str(e)
-            )
+        self._enqueue(("progress", task_id), task_id, {
+            "type": "progress",
+            "task_id": task_id,
+            "stage": stage.value,
+            "percentage": percentage,
+            "message": message,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
 
     def emit_error(
         self,
@@ -86,10 +137,7 @@ class ProgressEmitter:
         technical_detail: str | None = None,
     ) -> None:
         """
-        Emit error message from sync code.
-
-        Uses asyncio.run_coroutine_threadsafe to schedule the send on the main
-        event loop where WebSocket connections were established.
+        Queue an error message for the task's WebSocket clients.
 
         Args:
             task_id: The task identifier
@@ -97,28 +145,98 @@ class ProgressEmitter:
             user_message: User-friendly error message
             technical_detail: Optional technical details for debugging
         """
-        if _main_loop is None:
-            logger.warning("Main event loop not set, cannot emit error for task %s", task_id)
-            return
-
-        try:
-            coro = self.manager.send_to_task(task_id, {
-                "type": "error",
-                "task_id": task_id,
-                "error_code": error_code,
-                "user_message": user_message,
-                "technical_detail": technical_detail,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
-            # Schedule on main event loop and wait for completion
-            future = asyncio.run_coroutine_threadsafe(coro, _main_loop)
-            future.result(timeout=5.0)
-        except Exception as e:
+        self._enqueue(("error", next(self._error_ids)), task_id, {
+            "type": "error",
+            "task_id": task_id,
+            "error_code": error_code,
+            "user_message": user_message,
+            "technical_detail": technical_detail,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+    @property
+    def pending_count(self) -> int:
+        """Messages queued and not yet handed to the connection manager."""
+        with self._lock:
+            return len(self._pending)
+
+    def _enqueue(self, key: _PendingKey, task_id: str, message: dict[str, Any]) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is None or wake is None:
             logger.warning(
-                "Failed to emit error for task %s: %s",
+                "Progress emitter not started, dropping %s for task %s",
+                message["type"],
                 task_id,
-                str(e)
             )
+            return
+
+        with self._lock:
+            if key in self._pending:
+                del self._pending[key]  # re-append: stay behind earlier errors
+            elif len(self._pending) >= self._max_pending:
+                self._evict_one()
+            self._pending[key] = (task_id, message)
+            notify, self._wake_scheduled = not self._wake_scheduled, True
+
+        if notify:
+            try:
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                logger.debug("Event loop closed, progress for task %s not sent", task_id)
+
+    def _evict_one(self) -> None:
+        """Drop the oldest pending progress update (the oldest error if none). Lock held."""
+        victim = next(
+            (key for key in self._pending if key[0] == "progress"),
+            next(iter(self._pending)),
+        )
+        task_id, _ = self._pending.pop(victim)
+        self.dropped += 1
+        logger.debug("Progress queue full, dropped %s for task %s", victim[0], task_id)
+
+    # -- consumer (event loop) ---------------------------------------------
+
+    async def drain_once(self) -> int:
+        """Send everything pending now; return the number of messages taken."""
+        with self._lock:
+            batch, self._pending = self._pending, OrderedDict()
+            self._wake_scheduled = False
+        by_task: dict[str, list[dict[str, Any]]] = {}
+        for task_id, message in batch.values():
+            by_task.setdefault(task_id, []).append(message)
+        if by_task:
+            await asyncio.gather(
+                *(self._send(task_id, messages) for task_id, messages in by_task.items())
+            )
+        return len(batch)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self.drain_once()
+            except Exception:
+                logger.exception("Progress emission pass failed")
+            if self._stopping and not self.pending_count:
+                return
+
+    async def _send(self, task_id: str, messages: list[dict[str, Any]]) -> None:
+        for message in messages:
+            try:
+                await asyncio.wait_for(
+                    self.manager.send_to_task(task_id, message),
+                    self._send_timeout_seconds,
+                )
+            except Exception as e:
+                # Don't let one client's failure hold up the rest of the queue
+                logger.warning(
+                    "Failed to emit %s for task %s: %s",
+                    message["type"],
+                    task_id,
+                    str(e) or type(e).__name__,
+                )
 
 
 # Lazy singleton - initialized on first use
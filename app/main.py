@@ -1,6 +1,5 @@
 """Main entry point for the FastAPI application."""
 
-import asyncio
 from collections.abc import AsyncGenerator
 
 from app.core.warnings_filter import filter_warnings
@@ -10,6 +9,7 @@ filter_warnings()
 import logging  # noqa: E402
 import time  # noqa: E402
 from contextlib import asynccontextmanager  # noqa: E402
+from dataclasses import asdict  # noqa: E402
 
 from dotenv import load_dotenv  # noqa: E402
 from fastapi import FastAPI, status  # noqa: E402
@@ -25,11 +25,13 @@ from app.api import (  # noqa: E402
     key_router,
     service_router,
     stt_router,
+    task_result_link_router,
     task_router,
     usage_router,
     websocket_router,
     ws_ticket_router,
 )
+from app.api.query_count_middleware import QueryCountMiddleware  # noqa: E402
 from app.api.streaming_upload_api import streaming_upload_router  # noqa: E402
 from app.api.tus_upload_api import tus_upload_router, TUS_UPLOAD_DIR  # noqa: E402
 from app.api.exception_handlers import (  # noqa: E402
@@ -39,6 +41,7 @@ from app.api.exception_handlers import (  # noqa: E402
     generic_error_handler,
     infrastructure_error_handler,
     invalid_credentials_handler,
+    password_hasher_busy_handler,
     rate_limit_exceeded_handler,
     task_not_found_handler,
     trial_expired_handler,
@@ -51,17 +54,30 @@ from app.core.exceptions import (  # noqa: E402
     FreeTierViolationError,
     InfrastructureError,
     InvalidCredentialsError,
+    PasswordHasherBusyError,
     RateLimitExceededError,
     TaskNotFoundError,
     TrialExpiredError,
     ValidationError,
 )
 from app.core.rate_limiter import limiter, rate_limit_handler  # noqa: E402
+from app.core.services import (  # noqa: E402
+    get_password_hash_pool,
+    get_webhook_dispatcher,
+)
 from slowapi.errors import RateLimitExceeded  # noqa: E402
 from app.docs import generate_db_schema, save_openapi_json  # noqa: E402
-from app.infrastructure.scheduler import start_cleanup_scheduler, stop_cleanup_scheduler  # noqa: E402
+from app.infrastructure.scheduler import (  # noqa: E402
+    start_api_key_last_used_flush,
+    start_cleanup_scheduler,
+    start_rate_limit_write_behind,
+    stop_api_key_last_used_flush,
+    stop_cleanup_scheduler,
+    stop_rate_limit_write_behind,
+)
 from app.infrastructure.database import Base, engine  # noqa: E402
-from app.infrastructure.websocket import set_main_loop  # noqa: E402
+from app.infrastructure.database.async_connection import dispose_async_engines  # noqa: E402
+from app.infrastructure.websocket import get_progress_emitter  # noqa: E402
 from app.spa_handler import setup_spa_routes  # noqa: E402
 
 # Load environment variables from .env
@@ -79,9 +95,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Args:
         app (FastAPI): The FastAPI application instance.
     """
-    # Store main event loop for WebSocket progress emission from background tasks
-    set_main_loop(asyncio.get_running_loop())
-
     # Ensure TUS upload directory exists
     TUS_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -89,9 +102,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     save_openapi_json(app)
     generate_db_schema(Base.metadata.tables.values())
+    start_rate_limit_write_behind()
+    start_api_key_last_used_flush()
     start_cleanup_scheduler()
+    await get_webhook_dispatcher().start()
+    # Drains WebSocket progress queued by worker threads
+    await get_progress_emitter().start()
     yield
+    await get_progress_emitter().stop()
+    await get_webhook_dispatcher().stop()
+    await dispose_async_engines()
     stop_cleanup_scheduler()
+    stop_rate_limit_write_behind()
+    stop_api_key_last_used_flush()
 
     # Clean up container on shutdown
     logging.info("Shutting down application")
@@ -178,8 +201,9 @@ TUS_HEADERS: list[str] = [
 # Phase 19 single-stack middleware — auth lives in Depends(authenticated_user)
 # (D2 lock); CSRF lives in Depends(csrf_protected) on every state-mutating
 # cookie-auth router (Plan 19-12 deleted the legacy CSRF middleware). The
-# middleware stack now contains only CORSMiddleware. CORS is locked to
-# FRONTEND_URL (never wildcard) per ANTI-06 / T-13-42.
+# middleware stack contains CORSMiddleware plus the per-request DB query
+# counter. CORS is locked to FRONTEND_URL (never wildcard) per ANTI-06 /
+# T-13-42.
 settings = get_settings()
 
 # slowapi state — required for @limiter.limit decorators on routes.
@@ -197,6 +221,8 @@ app.add_middleware(
     allow_credentials=True,
     expose_headers=TUS_HEADERS,
 )
+# Per-request SQL statement count — debug log, optional X-DB-Query-Count.
+app.add_middleware(QueryCountMiddleware)
 
 # Register exception handlers
 app.add_exception_handler(TaskNotFoundError, task_not_found_handler)
@@ -211,11 +237,13 @@ app.add_exception_handler(TrialExpiredError, trial_expired_handler)
 app.add_exception_handler(FreeTierViolationError, free_tier_violation_handler)
 app.add_exception_handler(RateLimitExceededError, rate_limit_exceeded_handler)
 app.add_exception_handler(ConcurrencyLimitError, concurrency_limit_handler)
+app.add_exception_handler(PasswordHasherBusyError, password_hasher_busy_handler)
 app.add_exception_handler(RateLimitExceeded, rate_limit_handler)  # slowapi
 
 # Include existing v1.1 routers (active under both V2 branches).
 app.include_router(stt_router)
 app.include_router(task_router)
+app.include_router(task_result_link_router)
 app.include_router(service_router)
 app.include_router(websocket_router)
 app.include_router(streaming_upload_router)
@@ -301,5 +329,21 @@ async def readiness_check() -> JSONResponse:
         )
 
 
+@app.get(
+    "/health/password-hashing", tags=["Health"], summary="Argon2 pool metrics"
+)
+async def password_hashing_health() -> JSONResponse:
+    """Report the Argon2 pool's queue depth, shed count and hash latency.
+
+    ``pending`` near ``max_pending`` or a growing ``rejected`` count means
+    register/login are being shed with 503; raise
+    ``AUTH__ARGON2_MAX_CONCURRENCY`` only if the host has cores and RAM to spare.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_200_OK,
+        content=asdict(get_password_hash_pool().stats()),
+    )
+
+
 # Setup SPA routes (must be last - catch-all for client-side routing)
 setup_spa_routes(app)
@@ -0,0 +1,55 @@
+"""The ``Result`` JSON document of a task, built without parsing the transcript.
+
+Shared by ``GET /task/{id}`` and the task-completion callback. The stored
+result is already JSON (see ``ITaskRepository.get_result_stream``): it is
+spliced into the document as it decompresses, and only the small envelope
+is encoded, by pydantic-core — datetimes included, with no pre-pass over
+the structure.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+
+from app.domain.entities.task import Task
+from app.schemas import Metadata
+
+
+def task_metadata(task: Task) -> Metadata:
+    """``Result.metadata`` for ``task``."""
+    return Metadata(
+        task_type=task.task_type,
+        task_params=task.task_params,
+        language=task.language,
+        file_name=task.file_name,
+        url=task.url,
+        callback_url=task.callback_url,
+        duration=task.duration,
+        audio_duration=task.audio_duration,
+        start_time=task.start_time,
+        end_time=task.end_time,
+        callback_status=task.callback_status,
+    )
+
+
+def iter_result_json(
+    task: Task, result_chunks: Iterator[bytes] | None
+) -> Iterator[bytes]:
+    """Yield ``task``'s ``Result`` JSON document with the result spliced in unparsed.
+
+    Key order matches the ``Result`` model. ``result_chunks`` is passed
+    through as it decompresses instead of being parsed and re-serialised.
+    """
+    yield b'{"status":' + json.dumps(task.status).encode() + b',"result":'
+    if result_chunks is None:
+        yield b"null"
+    else:
+        yield from result_chunks
+    yield (
+        b',"metadata":'
+        + task_metadata(task).model_dump_json().encode()
+        + b',"error":'
+        + json.dumps(task.error).encode()
+        + b"}"
+    )
@@ -11,6 +11,8 @@ from app.schemas.core_schemas import (
     AlignmentParams,
     AlignmentSegment,
     ASROptions,
+    CallbackMode,
+    CallbackReference,
     ComputeType,
     Device,
     DiarizationParams,
@@ -53,6 +55,8 @@ __all__ = [
     "AlignmentParams",
     "AlignmentSegment",
     "ASROptions",
+    "CallbackMode",
+    "CallbackReference",
     "ComputeType",
     "Device",
     "DiarizationParams",
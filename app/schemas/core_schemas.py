@@ -30,6 +30,7 @@ class Metadata(BaseModel):
     audio_duration: float | None = None
     start_time: datetime | None = None
     end_time: datetime | None = None
+    callback_status: str | None = None
 
 
 class TaskSimple(BaseModel):
@@ -47,6 +48,7 @@ class TaskSimple(BaseModel):
     audio_duration: float | None = None
     start_time: datetime | None = None
     end_time: datetime | None = None
+    callback_status: str | None = None
 
     @classmethod
     def from_domain(cls, task: object) -> "TaskSimple":
@@ -69,6 +71,7 @@ class TaskSimple(BaseModel):
             audio_duration=getattr(task, "audio_duration", None),
             start_time=getattr(task, "start_time", None),
             end_time=getattr(task, "end_time", None),
+            callback_status=getattr(task, "callback_status", None),
         )
 
 
@@ -84,6 +87,23 @@ class TaskEventReceived(BaseModel):
     ok: bool
 
 
+class CallbackMode(str, Enum):
+    """What a task-completion callback carries."""
+
+    full = "full"  # the whole ``Result``
+    reference = "reference"  # a ``CallbackReference`` with a signed result link
+
+
+class CallbackReference(BaseModel):
+    """Reference-mode callback body: fetch the ``Result`` from ``result_url``."""
+
+    identifier: str
+    status: str
+    error: str | None
+    result_url: str
+    result_expires_at: datetime
+
+
 class TranscriptionSegment(BaseModel):
     """Model for a segment of transcription."""
 
@@ -409,6 +429,7 @@ class SpeechToTextProcessingParams(BaseModel):
     alignment_params: AlignmentParams
     diarization_params: DiarizationParams
     callback_url: str | None = None
+    callback_mode: CallbackMode = CallbackMode.full
 
 
 class TaskType(str, Enum):
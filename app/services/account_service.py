@@ -25,6 +25,7 @@ from app.domain.repositories.user_repository import IUserRepository
 from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
+from app.infrastructure.rate_limit.bucket_store import ShardedBucketStore
 
 TUS_UPLOAD_DIR: Path = UPLOAD_DIR / "tus"
 
@@ -41,14 +42,18 @@ class AccountService:
         self,
         session: Session,
         user_repository: IUserRepository | None = None,
+        bucket_store: ShardedBucketStore | None = None,
     ) -> None:
         """Bind a DB session and (optionally) a pre-built user repository.
 
         SCOPE-05 callers pass ``session`` only; we lazy-construct the repo to
         keep them working untouched. Plan 15-03+15-04 callers inject the repo
         for testability and to share a single instance across methods (DRY).
+        ``bucket_store`` is the in-memory store of the ``memory`` rate-limit
+        backend; account deletion drops the user's buckets from it too.
         """
         self.session = session
+        self._bucket_store = bucket_store
         self._user_repository: IUserRepository = (
             user_repository or SQLAlchemyUserRepository(session)
         )
@@ -184,6 +189,10 @@ class AccountService:
             ),
             {"pattern": f"user:{user_id}:%"},
         ).rowcount or 0
+        # Memory backend: forget the buckets before the commit, or the next
+        # write-behind flush would write them back.
+        if self._bucket_store is not None:
+            self._bucket_store.discard_prefix(f"user:{user_id}:")
 
         # Step 3: user row → ORM CASCADE fires for the 4 CASCADE FKs.
         # PRAGMA foreign_keys=ON enforced globally (Phase 10-04 boot).
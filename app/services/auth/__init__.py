@@ -6,12 +6,17 @@ package layout ``app/services/auth/<service>.py``.
 
 from app.services.auth.auth_service import AuthService
 from app.services.auth.csrf_service import CsrfService
-from app.services.auth.key_service import KeyService
+from app.services.auth.key_service import AsyncKeyService, KeyService
 from app.services.auth.password_service import PasswordService
-from app.services.auth.rate_limit_service import RateLimitService
+from app.services.auth.rate_limit_service import (
+    AsyncRateLimitService,
+    RateLimitService,
+)
 from app.services.auth.token_service import TokenService
 
 __all__ = [
+    "AsyncKeyService",
+    "AsyncRateLimitService",
     "AuthService",
     "CsrfService",
     "KeyService",
@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
+import secrets
 from datetime import datetime, timezone
 
 from app.core import api_key
 from app.core.exceptions import InvalidApiKeyHashError
 from app.core.logging import logger
 from app.domain.entities.api_key import ApiKey
-from app.domain.repositories.api_key_repository import IApiKeyRepository
+from app.domain.entities.user import User
+from app.domain.repositories.api_key_repository import (
+    IApiKeyRepository,
+    IAsyncApiKeyRepository,
+)
+from app.infrastructure.database.api_key_cache import ApiKeyCache, LastUsedBuffer
+
+
+def _match_candidate(plaintext: str, candidates: list[ApiKey]) -> ApiKey | None:
+    """First candidate whose hash matches ``plaintext`` (constant-time compare)."""
+    for candidate in candidates:
+        if api_key.verify(plaintext, candidate.hash):
+            return candidate
+    return None
+
+
+def _persisted_id(key: ApiKey) -> int:
+    """Id of a key read from the repository (only unsaved keys lack one)."""
+    assert key.id is not None, "persisted api key has an id"
+    return key.id
 
 
 class KeyService:
@@ -51,19 +71,17 @@ class KeyService:
         - Raises InvalidApiKeyHashError if no candidate matches.
         """
         prefix_value = api_key.parse_prefix(plaintext)
-        candidates = self.repository.get_by_prefix(prefix_value)
-        for candidate in candidates:
-            if api_key.verify(plaintext, candidate.hash):
-                self.repository.mark_used(
-                    int(candidate.id), datetime.now(timezone.utc)
-                )
-                logger.debug(
-                    "ApiKey verified id=%s prefix=%s",
-                    candidate.id, prefix_value,
-                )
-                return candidate
-        logger.debug("ApiKey verify failed prefix=%s", prefix_value)
-        raise InvalidApiKeyHashError()
+        candidate = _match_candidate(
+            plaintext, self.repository.get_by_prefix(prefix_value)
+        )
+        if candidate is None:
+            logger.debug("ApiKey verify failed prefix=%s", prefix_value)
+            raise InvalidApiKeyHashError()
+        self.repository.mark_used(_persisted_id(candidate), datetime.now(timezone.utc))
+        logger.debug(
+            "ApiKey verified id=%s prefix=%s", candidate.id, prefix_value,
+        )
+        return candidate
 
     def revoke_key(self, key_id: int) -> None:
         """Soft-delete an API key."""
@@ -73,3 +91,89 @@ class KeyService:
     def list_for_user(self, user_id: int) -> list[ApiKey]:
         """Return all keys (active+revoked) for a user."""
         return self.repository.get_by_user(user_id)
+
+
+class AsyncKeyService:
+    """Request-path bearer verification on an async api_key repository.
+
+    Same semantics as ``KeyService.verify_plaintext``; key creation and
+    revocation stay on the sync ``KeyService``. ``authenticate`` resolves
+    straight to the owning user and, when wired with an ``ApiKeyCache`` and
+    a ``LastUsedBuffer``, serves repeat callers from memory and defers the
+    ``last_used_at`` write to the batched flush.
+    """
+
+    def __init__(
+        self,
+        repository: IAsyncApiKeyRepository,
+        cache: ApiKeyCache | None = None,
+        last_used: LastUsedBuffer | None = None,
+    ) -> None:
+        self.repository = repository
+        self._cache = cache
+        self._last_used = last_used
+
+    async def authenticate(self, plaintext: str) -> User:
+        """Resolve a presented plaintext to the owning User.
+
+        Cache hit: no query. Miss: one JOIN for candidate keys + owners,
+        constant-time hash compare, then the result is cached.
+
+        Raises:
+            InvalidApiKeyFormatError: If the plaintext is not key-shaped.
+            InvalidApiKeyHashError: If no active candidate matches.
+        """
+        prefix_value = api_key.parse_prefix(plaintext)
+        key_hash = api_key.digest(plaintext)
+        cached = self._cache.get(key_hash) if self._cache is not None else None
+        if cached is not None:
+            await self._touch(cached.key_id)
+            return cached.user
+        candidates = await self.repository.get_active_with_user_by_prefix(prefix_value)
+        match = next(
+            (
+                (key, user) for key, user in candidates
+                if secrets.compare_digest(key_hash, key.hash)
+            ),
+            None,
+        )
+        if match is None:
+            logger.debug("ApiKey verify failed prefix=%s", prefix_value)
+            raise InvalidApiKeyHashError()
+        key, user = match
+        key_id = _persisted_id(key)
+        if self._cache is not None:
+            self._cache.put(key_hash, key_id, user)
+        await self._touch(key_id)
+        logger.debug("ApiKey verified id=%s prefix=%s", key_id, prefix_value)
+        return user
+
+    async def _touch(self, key_id: int) -> None:
+        """Stamp ``last_used_at``: buffered when a flush buffer is wired, else inline."""
+        now = datetime.now(timezone.utc)
+        if self._last_used is not None:
+            self._last_used.record(key_id, now)
+            return
+        await self.repository.mark_used(key_id, now)
+
+    async def verify_plaintext(self, plaintext: str) -> ApiKey:
+        """Resolve a presented plaintext to an active ApiKey.
+
+        Raises:
+            InvalidApiKeyFormatError: If the plaintext is not key-shaped.
+            InvalidApiKeyHashError: If no active candidate matches.
+        """
+        prefix_value = api_key.parse_prefix(plaintext)
+        candidate = _match_candidate(
+            plaintext, await self.repository.get_by_prefix(prefix_value)
+        )
+        if candidate is None:
+            logger.debug("ApiKey verify failed prefix=%s", prefix_value)
+            raise InvalidApiKeyHashError()
+        await self.repository.mark_used(
+            _persisted_id(candidate), datetime.now(timezone.utc)
+        )
+        logger.debug(
+            "ApiKey verified id=%s prefix=%s", candidate.id, prefix_value,
+        )
+        return candidate
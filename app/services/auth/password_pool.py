@@ -0,0 +1,142 @@
+"""Bounded worker pool for Argon2 hashing with admission control.
+
+One Argon2id call (m=19456 KiB, t=2) costs tens of milliseconds of CPU and
+~19 MB of RAM. Run inline, a login burst stalls the event loop and can
+allocate memory without bound. ``PasswordHashPool`` runs them on a
+dedicated, fixed-size thread pool — argon2-cffi releases the GIL inside
+the C call, so workers hash in parallel without the fork/IPC cost of a
+process pool — and admits at most ``max_pending`` calls (running +
+queued). Past that it raises ``PasswordHasherBusyError`` immediately, which
+the API maps to 503 + Retry-After instead of queueing unbounded work.
+
+``stats()`` exposes queue depth and latency for the health endpoint.
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from app.core.exceptions import PasswordHasherBusyError
+from app.core.logging import logger
+
+T = TypeVar("T")
+
+# Recent calls kept for latency percentiles.
+_LATENCY_WINDOW = 512
+
+
+@dataclass(frozen=True)
+class PasswordHashStats:
+    """Point-in-time pool metrics (latencies in milliseconds, recent window)."""
+
+    workers: int
+    max_pending: int
+    pending: int
+    completed: int
+    rejected: int
+    wait_p50_ms: float
+    hash_p50_ms: float
+    hash_p95_ms: float
+    hash_max_ms: float
+
+
+class PasswordHashPool:
+    """Fixed-size executor with a pending-call cap and latency tracking.
+
+    Thread-safe; ``run`` is called from Starlette's threadpool (auth routes
+    offload ``AuthService``) and from the CLI. Only the pending counter and
+    the latency windows are guarded by the lock — never the hash itself.
+    """
+
+    def __init__(
+        self, workers: int, max_pending: int, retry_after_seconds: int = 1
+    ) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if max_pending < workers:
+            raise ValueError(
+                f"max_pending ({max_pending}) must be >= workers ({workers})"
+            )
+        self._workers = workers
+        self._max_pending = max_pending
+        self._retry_after_seconds = retry_after_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="argon2"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._hash_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def run(self, fn: Callable[..., T], *args: object) -> T:
+        """Run ``fn(*args)`` on a pool worker and return its result.
+
+        Raises:
+            PasswordHasherBusyError: If ``max_pending`` calls are already
+                admitted; nothing is queued.
+        """
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                pending = self._pending
+                admitted = False
+            else:
+                self._pending += 1
+                admitted = True
+        if not admitted:
+            logger.warning("Password hashing saturated pending=%d", pending)
+            raise PasswordHasherBusyError(pending, self._retry_after_seconds)
+        submitted = time.perf_counter()
+        try:
+            return self._executor.submit(self._timed, submitted, fn, *args).result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _timed(self, submitted: float, fn: Callable[..., T], *args: object) -> T:
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self._completed += 1
+                self._wait_ms.append((started - submitted) * 1000.0)
+                self._hash_ms.append((finished - started) * 1000.0)
+
+    def stats(self) -> PasswordHashStats:
+        """Snapshot of queue depth, counters and recent latencies."""
+        with self._lock:
+            wait_ms = list(self._wait_ms)
+            hash_ms = sorted(self._hash_ms)
+            pending, completed, rejected = self._pending, self._completed, self._rejected
+
+        def percentile(samples: list[float], fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return round(samples[min(len(samples) - 1, int(fraction * len(samples)))], 2)
+
+        return PasswordHashStats(
+            workers=self._workers,
+            max_pending=self._max_pending,
+            pending=pending,
+            completed=completed,
+            rejected=rejected,
+            wait_p50_ms=round(statistics.median(wait_ms), 2) if wait_ms else 0.0,
+            hash_p50_ms=percentile(hash_ms, 0.50),
+            hash_p95_ms=percentile(hash_ms, 0.95),
+            hash_max_ms=round(hash_ms[-1], 2) if hash_ms else 0.0,
+        )
+
+    def shutdown(self) -> None:
+        """Stop accepting work and join the workers."""
+        self._executor.shutdown(wait=True)
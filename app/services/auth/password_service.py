@@ -4,20 +4,32 @@ from __future__ import annotations
 
 from app.core import password_hasher
 from app.core.logging import logger
+from app.services.auth.password_pool import PasswordHashPool
 
 
 class PasswordService:
     """Hash and verify passwords. Single responsibility — no storage,
     no user lookup (that lives in AuthService).
+
+    With a ``PasswordHashPool`` every Argon2 call runs on the bounded pool
+    (and may raise ``PasswordHasherBusyError``); without one it runs inline
+    (CLI, tests).
     """
 
+    def __init__(self, pool: PasswordHashPool | None = None) -> None:
+        self._pool = pool
+
     def hash_password(self, plain: str) -> str:
         """Return Argon2id PHC-string hash. Caller passes plain — service
         does NOT log it.
         """
         logger.debug("PasswordService.hash_password called")
-        return password_hasher.hash(plain)
+        if self._pool is None:
+            return password_hasher.hash(plain)
+        return self._pool.run(password_hasher.hash, plain)
 
     def verify_password(self, plain: str, hashed: str) -> bool:
         """Constant-time verify; returns False on mismatch."""
-        return password_hasher.verify(plain, hashed)
+        if self._pool is None:
+            return password_hasher.verify(plain, hashed)
+        return self._pool.run(password_hasher.verify, plain, hashed)
@@ -2,11 +2,93 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
+from typing import Any, NamedTuple
 
 from app.core import rate_limit
 from app.core.logging import logger
-from app.domain.repositories.rate_limit_repository import IRateLimitRepository
+from app.domain.entities.rate_limit_bucket import RateLimitBucket
+from app.domain.repositories.rate_limit_repository import (
+    IAsyncRateLimitRepository,
+    IRateLimitRepository,
+)
+
+
+def _consume(
+    existing: RateLimitBucket | None,
+    *,
+    tokens_needed: int,
+    rate: float,
+    capacity: int,
+) -> tuple[rate_limit.BucketState, bool]:
+    """Bucket math for one check: seed a missing bucket full, then consume."""
+    now = datetime.now(timezone.utc)
+    bucket: rate_limit.BucketState
+    if existing is None:
+        bucket = {"tokens": capacity, "last_refill": now}
+    else:
+        bucket = {
+            "tokens": existing.tokens,
+            "last_refill": existing.last_refill,
+        }
+    return rate_limit.consume(
+        bucket,
+        tokens_needed=tokens_needed,
+        now=now,
+        rate=rate,
+        capacity=capacity,
+    )
+
+
+class BucketRequest(NamedTuple):
+    """One bucket charge in a batched ``check_and_consume_all`` call."""
+
+    bucket_key: str
+    tokens_needed: int
+    rate: float
+    capacity: int
+
+
+def _batch_decider(
+    requests: Sequence[BucketRequest],
+    settle: Callable[[list[bool]], None] | None,
+    allowed: list[bool],
+) -> Callable[[dict[str, RateLimitBucket]], dict[str, dict[str, Any]]]:
+    """Build the ``upsert_many_atomic`` decide step for a batch of charges.
+
+    Fills ``allowed`` with one flag per request, lets ``settle`` raise to
+    abort, and writes new states only when every request was allowed —
+    a denied batch leaves every bucket exactly as it was.
+    """
+    keys = [request.bucket_key for request in requests]
+    if len(set(keys)) != len(keys):
+        raise ValueError(f"Duplicate bucket keys in batch: {keys}")
+
+    def decide(current: dict[str, RateLimitBucket]) -> dict[str, dict[str, Any]]:
+        outcomes = [
+            _consume(
+                current.get(request.bucket_key),
+                tokens_needed=request.tokens_needed,
+                rate=request.rate,
+                capacity=request.capacity,
+            )
+            for request in requests
+        ]
+        allowed[:] = [ok for _state, ok in outcomes]
+        if settle is not None:
+            settle(allowed)
+        if not all(allowed):
+            return {}
+        return {key: dict(state) for key, (state, _ok) in zip(keys, outcomes)}
+
+    return decide
+
+
+def _log_batch_denials(requests: Sequence[BucketRequest], allowed: list[bool]) -> None:
+    for request, ok in zip(requests, allowed):
+        if not ok:
+            logger.debug("RateLimit denied bucket=%s (batch)", request.bucket_key)
 
 
 class RateLimitService:
@@ -28,20 +110,9 @@ class RateLimitService:
         capacity: int,
     ) -> bool:
         """Check + consume + persist atomically. Returns True if allowed."""
-        now = datetime.now(timezone.utc)
-        existing = self.repository.get_by_key(bucket_key)
-        bucket: rate_limit.BucketState
-        if existing is None:
-            bucket = {"tokens": capacity, "last_refill": now}
-        else:
-            bucket = {
-                "tokens": existing.tokens,
-                "last_refill": existing.last_refill,
-            }
-        new_state, allowed = rate_limit.consume(
-            bucket,
+        new_state, allowed = _consume(
+            self.repository.get_by_key(bucket_key),
             tokens_needed=tokens_needed,
-            now=now,
             rate=rate,
             capacity=capacity,
         )
@@ -50,6 +121,39 @@ class RateLimitService:
             logger.debug("RateLimit denied bucket=%s", bucket_key)
         return allowed
 
+    def check_and_consume_all(
+        self,
+        requests: Sequence[BucketRequest],
+        *,
+        settle: Callable[[list[bool]], None] | None = None,
+    ) -> list[bool]:
+        """Check several buckets in one transaction; consume from all or none.
+
+        One read loads every bucket and one ``BEGIN IMMEDIATE`` covers the
+        whole decision, so a request charged against N buckets costs one
+        write lock instead of N — and a denial on a later bucket can no
+        longer leave earlier ones consumed.
+
+        Args:
+            requests: Bucket charges (distinct keys).
+            settle: Called with the per-request outcomes while the lock is
+                held; raise from it to abort without consuming anything.
+
+        Returns:
+            One allowed flag per request. Tokens were consumed only if
+            every flag is True and ``settle`` returned normally.
+
+        Raises:
+            ValueError: If two requests share a bucket key.
+        """
+        allowed: list[bool] = []
+        self.repository.upsert_many_atomic(
+            [request.bucket_key for request in requests],
+            _batch_decider(requests, settle, allowed),
+        )
+        _log_batch_denials(requests, allowed)
+        return allowed
+
     def release(
         self,
         bucket_key: str,
@@ -86,3 +190,49 @@ class RateLimitService:
             new_tokens,
             capacity,
         )
+
+
+class AsyncRateLimitService:
+    """``RateLimitService`` on an async repository — request-path checks.
+
+    Identical bucket semantics; the ``BEGIN IMMEDIATE`` lock wait happens
+    off the event loop.
+    """
+
+    def __init__(self, repository: IAsyncRateLimitRepository) -> None:
+        self.repository = repository
+
+    async def check_and_consume(
+        self,
+        bucket_key: str,
+        *,
+        tokens_needed: int,
+        rate: float,
+        capacity: int,
+    ) -> bool:
+        """Check + consume + persist atomically. Returns True if allowed."""
+        new_state, allowed = _consume(
+            await self.repository.get_by_key(bucket_key),
+            tokens_needed=tokens_needed,
+            rate=rate,
+            capacity=capacity,
+        )
+        await self.repository.upsert_atomic(bucket_key, dict(new_state))
+        if not allowed:
+            logger.debug("RateLimit denied bucket=%s", bucket_key)
+        return allowed
+
+    async def check_and_consume_all(
+        self,
+        requests: Sequence[BucketRequest],
+        *,
+        settle: Callable[[list[bool]], None] | None = None,
+    ) -> list[bool]:
+        """Batched all-or-nothing check (see ``RateLimitService.check_and_consume_all``)."""
+        allowed: list[bool] = []
+        await self.repository.upsert_many_atomic(
+            [request.bucket_key for request in requests],
+            _batch_decider(requests, settle, allowed),
+        )
+        _log_batch_denials(requests, allowed)
+        return allowed
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 from app.core import jwt_codec
@@ -17,9 +18,23 @@ class TokenService:
     ``Settings()`` lookup at call time).
     """
 
-    def __init__(self, secret: str, ttl_days: int = 7) -> None:
+    def __init__(
+        self,
+        secret: str,
+        ttl_days: int = 7,
+        refresh_threshold_seconds: float | None = None,
+    ) -> None:
+        """Bind the signing secret and expiry policy.
+
+        Args:
+            secret: HS256 signing secret.
+            ttl_days: Lifetime of an issued token.
+            refresh_threshold_seconds: ``refresh_if_due`` re-issues only once
+                a token has less than this left; ``None`` re-issues always.
+        """
         self.secret = secret
         self.ttl_days = ttl_days
+        self.refresh_threshold_seconds = refresh_threshold_seconds
 
     def issue(self, user_id: int, token_version: int) -> str:
         """Encode a fresh HS256 session token."""
@@ -47,3 +62,29 @@ class TokenService:
         # Per RFC 7519 §4.1.2 sub is a string on the wire; recover int here.
         new_token = self.issue(int(payload["sub"]), current_token_version)
         return payload, new_token
+
+    def refresh_if_due(
+        self,
+        payload: dict[str, Any],
+        current_token_version: int,
+    ) -> str | None:
+        """Sliding refresh for an already-decoded token, only when it is due.
+
+        A token with more than ``refresh_threshold_seconds`` left is kept
+        as is — no signing, no Set-Cookie. Raises JwtTamperedError on
+        token_version mismatch.
+
+        Returns:
+            A fresh token, or ``None`` when the presented one is still fresh.
+        """
+        if payload.get("ver") != current_token_version:
+            raise JwtTamperedError("token version mismatch")
+        expires_at = payload.get("exp")
+        threshold = self.refresh_threshold_seconds
+        if (
+            threshold is not None
+            and expires_at is not None
+            and float(expires_at) - time.time() > threshold
+        ):
+            return None
+        return self.issue(int(payload["sub"]), current_token_version)
@@ -2,13 +2,16 @@
 
 import os
 import re
+import shutil
 from tempfile import NamedTemporaryFile
 
-import requests
+import httpx
 from fastapi import HTTPException, UploadFile
 
 from app.core.config import Config
 from app.core.logging import logger
+from app.core.upload_config import MAX_FILE_SIZE
+from app.infrastructure.storage.url_downloader import UrlDownloader
 
 
 class FileService:
@@ -18,6 +21,10 @@ class FileService:
     filename sanitization, and file extension validation.
     """
 
+    def __init__(self, downloader: UrlDownloader | None = None) -> None:
+        """Initialise with the URL downloader (default: uncached, 5 GB limit)."""
+        self._downloader = downloader or UrlDownloader(max_bytes=MAX_FILE_SIZE)
+
     @staticmethod
     def secure_filename(filename: str) -> str:
         """
@@ -95,10 +102,9 @@ class FileService:
         # Extract the original file extension
         _, original_extension = os.path.splitext(file.filename)
 
-        # Create a temporary file with the original extension
-        temp_file = NamedTemporaryFile(suffix=original_extension, delete=False)
-        temp_file.write(file.file.read())
-        temp_file.close()
+        # Copy into a temporary file with the original extension
+        with NamedTemporaryFile(suffix=original_extension, delete=False) as temp_file:
+            shutil.copyfileobj(file.file, temp_file)
 
         logger.debug(
             "Saved uploaded file %s to temporary location: %s",
@@ -109,10 +115,58 @@ class FileService:
         return temp_file.name
 
     @staticmethod
-    def download_from_url(url: str) -> tuple[str, str]:
+    def resolve_download_name(
+        url: str, content_disposition: str | None
+    ) -> tuple[str, str]:
+        """
+        Name a URL download and map it to an allowed extension.
+
+        Args:
+            url: URL of the file
+            content_disposition: The response's Content-Disposition header, if any
+
+        Returns:
+            Tuple of (original_filename, canonical_suffix)
+
+        Raises:
+            ValueError: If the file extension is not allowed
+        """
+        # Check for filename in Content-Disposition header
+        if content_disposition and "filename=" in content_disposition:
+            filename = content_disposition.split("filename=")[1].strip('"')
+        else:
+            # Fall back to extracting from the URL path
+            filename = os.path.basename(url)
+            filename = FileService.secure_filename(filename)
+
+        # Get the file extension
+        _, ext_candidate = os.path.splitext(filename)
+        ext_candidate = ext_candidate.lower().strip()
+
+        # Validate extension format
+        if not ext_candidate or not ext_candidate.startswith("."):
+            raise ValueError(f"Invalid file extension: {ext_candidate}")
+
+        ext_clean = ext_candidate[1:]  # remove leading dot for lookup
+
+        # Map to canonical extension from allowed set
+        extension_to_suffix = {
+            ext.lower().lstrip("."): ext for ext in Config.ALLOWED_EXTENSIONS
+        }
+        if ext_clean not in extension_to_suffix:
+            raise ValueError(f"Invalid file extension: {ext_candidate}")
+
+        # Use the canonical extension from allowed set
+        return filename, extension_to_suffix[ext_clean]
+
+    async def download_from_url(self, url: str) -> tuple[str, str]:
         """
         Download a file from a URL to a temporary location.
 
+        Streams asynchronously through the ``UrlDownloader``: size-limited,
+        optionally in parallel ranges, and revalidated against the local
+        download cache when the URL was fetched before.
+
         Args:
             url: URL of the file to download
 
@@ -121,60 +175,26 @@ class FileService:
 
         Raises:
             ValueError: If the URL is invalid or file extension is not allowed
+            AudioTooLargeError: If the file exceeds the download size limit
             HTTPException: If download fails
         """
         logger.info("Downloading file from URL: %s", url)
 
         try:
-            with requests.get(url, stream=True, timeout=30) as response:
-                response.raise_for_status()
-
-                # Check for filename in Content-Disposition header
-                content_disposition = response.headers.get("Content-Disposition")
-                if content_disposition and "filename=" in content_disposition:
-                    filename = content_disposition.split("filename=")[1].strip('"')
-                else:
-                    # Fall back to extracting from the URL path
-                    filename = os.path.basename(url)
-                    filename = FileService.secure_filename(filename)
-
-                # Get the file extension
-                _, ext_candidate = os.path.splitext(filename)
-                ext_candidate = ext_candidate.lower().strip()
-
-                # Validate extension format
-                if not ext_candidate or not ext_candidate.startswith("."):
-                    raise ValueError(f"Invalid file extension: {ext_candidate}")
-
-                ext_clean = ext_candidate[1:]  # remove leading dot for lookup
-
-                # Map to canonical extension from allowed set
-                extension_to_suffix = {
-                    ext.lower().lstrip("."): ext for ext in Config.ALLOWED_EXTENSIONS
-                }
-                if ext_clean not in extension_to_suffix:
-                    raise ValueError(f"Invalid file extension: {ext_candidate}")
-
-                # Use the canonical extension from allowed set
-                safe_suffix = extension_to_suffix[ext_clean]
-
-                # Save the file to a temporary location
-                temp_audio_file = NamedTemporaryFile(suffix=safe_suffix, delete=False)
-                for chunk in response.iter_content(chunk_size=8192):
-                    temp_audio_file.write(chunk)
-                temp_audio_file.close()
-
-                logger.info(
-                    "File downloaded successfully: %s -> %s",
-                    url,
-                    temp_audio_file.name,
-                )
-
-                return temp_audio_file.name, filename
-
-        except requests.RequestException as e:
+            downloaded = await self._downloader.download(
+                url, FileService.resolve_download_name
+            )
+        except httpx.HTTPError as e:
             logger.error("Failed to download file from URL %s: %s", url, str(e))
             raise HTTPException(
                 status_code=400,
                 detail=f"Failed to download file from URL: {str(e)}",
             )
+
+        logger.info(
+            "File downloaded successfully: %s -> %s%s",
+            url,
+            downloaded.path,
+            " (cached)" if downloaded.from_cache else "",
+        )
+        return downloaded.path, downloaded.filename
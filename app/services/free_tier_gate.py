@@ -16,12 +16,18 @@ Concurrency slot lifecycle (W1 fix):
     try/finally so the slot is ALWAYS refunded (success OR failure).
 
 SRP: gating only. Persistence + bucket math live in RateLimitService.
+``AsyncFreeTierGate`` runs the same gates in the same order on the async
+request path; the gate definitions below are shared by both. It evaluates
+all three buckets in one transaction (one read, one write lock) and
+consumes from all of them or none.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
 
 from app.core.exceptions import (
     ConcurrencyLimitError,
@@ -37,13 +43,18 @@ from app.core.plan_tiers import (
     policy_for,
 )
 from app.domain.entities.user import User
-from app.services.auth.rate_limit_service import RateLimitService
+from app.services.auth.rate_limit_service import (
+    AsyncRateLimitService,
+    BucketRequest,
+    RateLimitService,
+)
 
 logger = logging.getLogger(__name__)
 
 # Re-export DRY-imported names so legacy callers that still
 # `from app.services.free_tier_gate import FREE_POLICY` keep working.
 __all__ = [
+    "AsyncFreeTierGate",
     "FreeTierGate",
     "FREE_POLICY",
     "PRO_POLICY",
@@ -58,6 +69,104 @@ def concurrency_bucket_key(user_id: int) -> str:
     return f"user:{user_id}:concurrent"
 
 
+class _BucketCharge(NamedTuple):
+    """One token-bucket gate: what to consume and what to raise on denial."""
+
+    request: BucketRequest
+    denied: Callable[[], Exception]
+
+
+def _hourly_charge(user_id: int, policy: TierPolicy) -> _BucketCharge:
+    bucket_key = f"user:{user_id}:tx:hour"
+    return _BucketCharge(
+        BucketRequest(
+            bucket_key,
+            tokens_needed=1,
+            rate=policy.max_per_hour / 3600.0,
+            capacity=policy.max_per_hour,
+        ),
+        denied=lambda: RateLimitExceededError(
+            bucket_key=bucket_key, retry_after_seconds=60
+        ),
+    )
+
+
+def _daily_minutes_charge(
+    user_id: int, file_seconds: float, policy: TierPolicy
+) -> _BucketCharge:
+    bucket_key = f"user:{user_id}:audio_min:day"
+    capacity_minutes = policy.max_daily_seconds // 60
+    return _BucketCharge(
+        BucketRequest(
+            bucket_key,
+            tokens_needed=max(1, int(file_seconds / 60)),
+            rate=capacity_minutes / 86400.0,
+            capacity=capacity_minutes,
+        ),
+        denied=lambda: RateLimitExceededError(
+            bucket_key=bucket_key, retry_after_seconds=3600
+        ),
+    )
+
+
+def _concurrency_charge(user_id: int, policy: TierPolicy) -> _BucketCharge:
+    # Slot held until process_audio_common completion-hook calls
+    # release_concurrency(user). rate=0 -> no auto-refill; release is
+    # the only path back to a full bucket (W1).
+    return _BucketCharge(
+        BucketRequest(
+            concurrency_bucket_key(user_id),
+            tokens_needed=1,
+            rate=0.0,
+            capacity=policy.max_concurrent,
+        ),
+        denied=ConcurrencyLimitError,
+    )
+
+
+def _raise_if_denied(charge: _BucketCharge, allowed: bool) -> None:
+    if not allowed:
+        raise charge.denied()
+
+
+def _check_trial_expiry(user: User) -> None:
+    if user.plan_tier != "trial":
+        return
+    if user.trial_started_at is None:
+        return
+    now = datetime.now(timezone.utc)
+    if user.trial_started_at + timedelta(days=TRIAL_DAYS) < now:
+        raise TrialExpiredError()
+
+
+def _check_file_duration(file_seconds: float, policy: TierPolicy) -> None:
+    if file_seconds > policy.max_file_seconds:
+        raise FreeTierViolationError(
+            f"File duration {int(file_seconds)}s exceeds tier limit "
+            f"{policy.max_file_seconds}s"
+        )
+
+
+def _check_model(model: str, policy: TierPolicy) -> None:
+    if model not in policy.allowed_models:
+        raise FreeTierViolationError(
+            f"Model '{model}' not available on your plan"
+        )
+
+
+def _check_diarization(diarize: bool, policy: TierPolicy) -> None:
+    if diarize and not policy.diarization_allowed:
+        raise FreeTierViolationError(
+            "Diarization not available on your plan"
+        )
+
+
+def _check_diarize_route(user: User) -> None:
+    _check_trial_expiry(user)
+    if not policy_for(user.plan_tier).diarization_allowed:
+        raise FreeTierViolationError("Diarization not available on your plan")
+
+
 class FreeTierGate:
     """Enforce free / pro / trial tier policies (CONTEXT §137-145).
 
@@ -102,19 +211,17 @@ class FreeTierGate:
         """
         policy = self._policy_for(user)
         user_id = int(user.id)  # type: ignore[arg-type]
-        self._check_trial_expiry(user)
-        self._check_hourly_rate(user_id, policy)
-        self._check_file_duration(file_seconds, policy)
-        self._check_model(model, policy)
-        self._check_diarization(diarize, policy)
+        _check_trial_expiry(user)
+        self._charge(_hourly_charge(user_id, policy))
+        _check_file_duration(file_seconds, policy)
+        _check_model(model, policy)
+        _check_diarization(diarize, policy)
         self._check_daily_minutes(user_id, file_seconds, policy)
         self._check_concurrency(user_id, policy)
 
     def check_diarize_route(self, user: User) -> None:
         """Pro-only diarize-route guard (no transcribe rate hit)."""
-        self._check_trial_expiry(user)
-        if not self._policy_for(user).diarization_allowed:
-            raise FreeTierViolationError("Diarization not available on your plan")
+        _check_diarize_route(user)
 
     def release_concurrency(self, user: User) -> None:
         """Release 1 concurrency slot for ``user``.
@@ -133,80 +240,75 @@ class FreeTierGate:
         )
 
     # ------------------------------------------------------------------
-    # Per-gate guards (SRP — one method per policy dimension)
+    # Bucket gates
     # ------------------------------------------------------------------
 
-    def _check_trial_expiry(self, user: User) -> None:
-        if user.plan_tier != "trial":
-            return
-        if user.trial_started_at is None:
-            return
-        now = datetime.now(timezone.utc)
-        if user.trial_started_at + timedelta(days=TRIAL_DAYS) < now:
-            raise TrialExpiredError()
-
-    def _check_hourly_rate(self, user_id: int, policy: TierPolicy) -> None:
-        bucket_key = f"user:{user_id}:tx:hour"
+    def _charge(self, charge: _BucketCharge) -> None:
+        request = charge.request
         allowed = self.rate_limit_service.check_and_consume(
-            bucket_key,
-            tokens_needed=1,
-            rate=policy.max_per_hour / 3600.0,
-            capacity=policy.max_per_hour,
+            request.bucket_key,
+            tokens_needed=request.tokens_needed,
+            rate=request.rate,
+            capacity=request.capacity,
         )
         if not allowed:
-            raise RateLimitExceededError(
-                bucket_key=bucket_key, retry_after_seconds=60
-            )
-
-    def _check_file_duration(
-        self, file_seconds: float, policy: TierPolicy
-    ) -> None:
-        if file_seconds > policy.max_file_seconds:
-            raise FreeTierViolationError(
-                f"File duration {int(file_seconds)}s exceeds tier limit "
-                f"{policy.max_file_seconds}s"
-            )
-
-    def _check_model(self, model: str, policy: TierPolicy) -> None:
-        if model not in policy.allowed_models:
-            raise FreeTierViolationError(
-                f"Model '{model}' not available on your plan"
-            )
-
-    def _check_diarization(
-        self, diarize: bool, policy: TierPolicy
-    ) -> None:
-        if diarize and not policy.diarization_allowed:
-            raise FreeTierViolationError(
-                "Diarization not available on your plan"
-            )
+            raise charge.denied()
 
     def _check_daily_minutes(
         self, user_id: int, file_seconds: float, policy: TierPolicy
     ) -> None:
-        tokens_needed = max(1, int(file_seconds / 60))
-        bucket_key = f"user:{user_id}:audio_min:day"
-        capacity_minutes = policy.max_daily_seconds // 60
-        allowed = self.rate_limit_service.check_and_consume(
-            bucket_key,
-            tokens_needed=tokens_needed,
-            rate=capacity_minutes / 86400.0,
-            capacity=capacity_minutes,
-        )
-        if not allowed:
-            raise RateLimitExceededError(
-                bucket_key=bucket_key, retry_after_seconds=3600
-            )
+        self._charge(_daily_minutes_charge(user_id, file_seconds, policy))
 
     def _check_concurrency(self, user_id: int, policy: TierPolicy) -> None:
-        # Slot held until process_audio_common completion-hook calls
-        # release_concurrency(user). rate=0 -> no auto-refill; release is
-        # the only path back to a full bucket (W1).
-        allowed = self.rate_limit_service.check_and_consume(
-            concurrency_bucket_key(user_id),
-            tokens_needed=1,
-            rate=0.0,
-            capacity=policy.max_concurrent,
+        self._charge(_concurrency_charge(user_id, policy))
+
+
+class AsyncFreeTierGate:
+    """``FreeTierGate.check`` for async routes — same gates, same order.
+
+    The three bucket gates are evaluated in one ``check_and_consume_all``
+    batch: one read of the user's buckets, one ``BEGIN IMMEDIATE``, and
+    tokens are consumed only when every gate passes — a 403 / 429 / 402
+    leaves every bucket untouched. The pure gates run between the bucket
+    outcomes inside the batch, so the first failure raised is the same one
+    the sequential gate raises. Slot release stays on the sync gate: it
+    runs in the worker, not a route.
+    """
+
+    def __init__(self, rate_limit_service: AsyncRateLimitService) -> None:
+        self.rate_limit_service = rate_limit_service
+
+    async def check(
+        self,
+        *,
+        user: User,
+        file_seconds: float,
+        model: str,
+        diarize: bool,
+    ) -> None:
+        """Run all 6 fail-fast gates (see ``FreeTierGate.check``)."""
+        policy = policy_for(user.plan_tier)
+        user_id = int(user.id)  # type: ignore[arg-type]
+        _check_trial_expiry(user)
+        hourly, daily, concurrency = (
+            _hourly_charge(user_id, policy),
+            _daily_minutes_charge(user_id, file_seconds, policy),
+            _concurrency_charge(user_id, policy),
         )
-        if not allowed:
-            raise ConcurrencyLimitError()
+
+        def settle(allowed: list[bool]) -> None:
+            hourly_ok, daily_ok, concurrency_ok = allowed
+            _raise_if_denied(hourly, hourly_ok)
+            _check_file_duration(file_seconds, policy)
+            _check_model(model, policy)
+            _check_diarization(diarize, policy)
+            _raise_if_denied(daily, daily_ok)
+            _raise_if_denied(concurrency, concurrency_ok)
+
+        await self.rate_limit_service.check_and_consume_all(
+            [hourly.request, daily.request, concurrency.request], settle=settle
+        )
+
+    def check_diarize_route(self, user: User) -> None:
+        """Pro-only diarize-route guard (pure; no bucket IO)."""
+        _check_diarize_route(user)
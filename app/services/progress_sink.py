@@ -0,0 +1,99 @@
+"""Coalescing task-progress sink for the transcription worker.
+
+WebSocket clients get every progress report immediately. The database row
+(the polling fallback) is written only when the stage changes or when at
+least ``min_interval_seconds`` have passed since the last write — one
+UPDATE, through a writer that opens its own short-lived session — so a
+chatty pipeline neither holds a connection nor contends for the SQLite
+write lock between reports.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.infrastructure.websocket import get_progress_emitter
+from app.schemas import TaskProgressStage
+
+# (identifier, update_data) -> None; must open and close its own session.
+ProgressWriter = Callable[[str, dict[str, Any]], None]
+
+
+class ProgressSink:
+    """Latest stage/percentage for one task, persisted on transition or timer."""
+
+    def __init__(
+        self,
+        identifier: str,
+        writer: ProgressWriter,
+        *,
+        min_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a sink for ``identifier``.
+
+        Args:
+            identifier: Task UUID.
+            writer: Persists ``update_data`` for the task in one statement.
+            min_interval_seconds: Minimum gap between two writes within the
+                same stage; 0 writes every report.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.identifier = identifier
+        self._writer = writer
+        self._min_interval = min_interval_seconds
+        self._clock = clock
+        self._stage: TaskProgressStage | None = None
+        self._percentage = 0
+        self._written: tuple[TaskProgressStage, int] | None = None
+        self._written_at = 0.0
+
+    def report(self, stage: TaskProgressStage, percentage: int) -> None:
+        """Emit progress to WebSocket clients; persist it if a write is due."""
+        self._stage = stage
+        self._percentage = percentage
+        get_progress_emitter().emit_progress(self.identifier, stage, percentage)
+
+        if (
+            self._written is None
+            or self._written[0] != stage
+            or self._clock() - self._written_at >= self._min_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist the latest reported progress unless it is already stored."""
+        if self._stage is None:
+            return
+        if (self._stage, self._percentage) == self._written:
+            return
+        self._write({})
+
+    def finish(
+        self, stage: TaskProgressStage, percentage: int, update_data: dict[str, Any]
+    ) -> None:
+        """Emit the final progress and persist it with ``update_data`` in one write.
+
+        The terminal status (result, timings) and the last progress land in
+        the same UPDATE instead of two back-to-back statements.
+        """
+        self._stage = stage
+        self._percentage = percentage
+        get_progress_emitter().emit_progress(self.identifier, stage, percentage)
+        self._write(update_data)
+
+    def _write(self, update_data: dict[str, Any]) -> None:
+        assert self._stage is not None
+        latest = (self._stage, self._percentage)
+        self._writer(
+            self.identifier,
+            {
+                **update_data,
+                "progress_stage": latest[0].value,
+                "progress_percentage": latest[1],
+            },
+        )
+        self._written = latest
+        self._written_at = self._clock()
@@ -1,12 +1,42 @@
 """Service for task management operations."""
 
+import base64
+import binascii
+import json
+from collections.abc import Iterator
+from datetime import datetime
 from typing import Any
 
+from app.core.exceptions import ValidationError
 from app.core.logging import logger
 from app.domain.entities.task import Task
+from app.domain.entities.task_search_hit import TaskSearchHit
 from app.domain.repositories.task_repository import ITaskRepository
 
 
+def encode_task_cursor(key: tuple[datetime, int]) -> str:
+    """Encode a ``(created_at, id)`` keyset position as an opaque token."""
+    created_at, task_id = key
+    raw = json.dumps([created_at.isoformat(), task_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_task_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a token from ``encode_task_cursor``.
+
+    Raises:
+        ValidationError: If the token is malformed (tampered or truncated).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(task_id, int):
+            raise TypeError("cursor id must be an integer")
+        return datetime.fromisoformat(created_at), task_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor", field="cursor") from e
+
+
 class TaskManagementService:
     """Service for managing task operations.
 
@@ -58,6 +88,36 @@ class TaskManagementService:
 
         return task
 
+    def get_task_summary(self, identifier: str) -> Task | None:
+        """
+        Retrieve a task without its result / task_params payloads.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            The task domain entity (``result`` and ``task_params`` unset)
+            if found, None otherwise
+        """
+        logger.debug("Retrieving task summary with identifier: %s", identifier)
+        return self.repository.get_summary_by_id(identifier)
+
+    def get_task_result_stream(
+        self, identifier: str
+    ) -> tuple[Task, Iterator[bytes] | None] | None:
+        """
+        Retrieve a task and its result as a stream of JSON chunks.
+
+        Args:
+            identifier: The UUID of the task to retrieve
+
+        Returns:
+            ``(task, chunks)`` if found (``chunks`` None when the task has
+            no result), None otherwise
+        """
+        logger.debug("Retrieving task result stream with identifier: %s", identifier)
+        return self.repository.get_result_stream(identifier)
+
     def get_all_tasks(self) -> list[Task]:
         """
         Retrieve all tasks from the repository.
@@ -117,6 +177,68 @@ class TaskManagementService:
         )
         return tasks, total
 
+    def list_tasks_by_cursor(
+        self,
+        *,
+        q: str | None,
+        status: str | None,
+        cursor: str | None,
+        page_size: int,
+    ) -> tuple[list[Task], str | None, int]:
+        """List tasks with keyset pagination (``GET /task/all`` cursor mode).
+
+        Unlike ``list_tasks_paginated`` the page query cost is independent
+        of how deep the caller has scrolled — the repository seeks to the
+        ``(created_at, id)`` position encoded in ``cursor``.
+
+        Args:
+            q: Case-insensitive substring match against file_name (or None).
+            status: Exact-match status filter (or None).
+            cursor: Opaque token from a previous page's ``next_cursor``;
+                None (or empty) for the first page.
+            page_size: Items per page (1..200).
+
+        Returns:
+            (tasks, next_cursor, total) — ``next_cursor`` is None on the
+            last page; ``total`` is the count under the same filters.
+
+        Raises:
+            ValidationError: If ``cursor`` is not a token this service issued.
+        """
+        assert 1 <= page_size <= 200, (
+            f"page_size must be in [1, 200], got {page_size}"
+        )
+
+        after = decode_task_cursor(cursor) if cursor else None
+        tasks, next_after = self.repository.list_keyset(
+            q=q, status=status, after=after, limit=page_size
+        )
+        next_cursor = encode_task_cursor(next_after) if next_after else None
+        total = self.repository.count(q=q, status=status)
+        logger.info(
+            "Cursor-paginated tasks: size=%d returned=%d total=%d more=%s",
+            page_size,
+            len(tasks),
+            total,
+            next_cursor is not None,
+        )
+        return tasks, next_cursor, total
+
+    def search_tasks(self, query: str, *, limit: int) -> list[TaskSearchHit]:
+        """Full-text search the caller's tasks (file names + transcripts).
+
+        Args:
+            query: Free-text query; every term must match.
+            limit: Maximum number of tasks to return (1..100).
+
+        Returns:
+            Matching tasks, most relevant first.
+        """
+        assert 1 <= limit <= 100, f"limit must be in [1, 100], got {limit}"
+        hits = self.repository.search(query, limit=limit)
+        logger.info("Task search returned %d hits (limit=%d)", len(hits), limit)
+        return hits
+
     def delete_task(self, identifier: str) -> bool:
         """
         Delete a task by its identifier.
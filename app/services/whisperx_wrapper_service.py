@@ -1,12 +1,13 @@
 """This module provides services for transcribing, diarizing, and aligning audio using Whisper and other models."""
 
 import gc
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import torch
+from sqlalchemy.orm import Session
 from whisperx import (
     align,
     load_align_model,
@@ -14,19 +15,17 @@ from whisperx import (
 )
 from whisperx.diarize import DiarizationPipeline
 
-from app.callbacks import post_task_callback
+from app.callbacks import build_callback_payload
+from app.core import services as core_services
 from app.core.config import Config, get_settings
+from app.core.exceptions import DatabaseOperationError
 from app.core.logging import logger
 from app.domain.entities.user import User
-from app.domain.repositories.task_repository import ITaskRepository
 from app.domain.services.alignment_service import IAlignmentService
 from app.domain.services.diarization_service import IDiarizationService
 from app.domain.services.speaker_assignment_service import ISpeakerAssignmentService
 from app.domain.services.transcription_service import ITranscriptionService
 from app.infrastructure.database.connection import SessionLocal
-from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
-    SQLAlchemyRateLimitRepository,
-)
 from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
 )
@@ -36,39 +35,30 @@ from app.infrastructure.database.repositories.sqlalchemy_user_repository import
 from app.infrastructure.websocket import get_progress_emitter
 from app.services.auth.rate_limit_service import RateLimitService
 from app.services.free_tier_gate import FreeTierGate
+from app.services.progress_sink import ProgressSink
 from app.services.usage_event_writer import UsageEventWriter
 from app.schemas import (
-    AlignedTranscription,
     ComputeType,
     Device,
-    Metadata,
-    Result,
     SpeechToTextProcessingParams,
     TaskProgressStage,
     TaskStatus,
     WhisperModel,
 )
-from app.transcript import filter_aligned_transcription
+from app.transcript import filter_aligned_result
 
 
-def _update_progress(
-    repository: ITaskRepository,
-    identifier: str,
-    stage: TaskProgressStage,
-    percentage: int,
-) -> None:
-    """Update progress in database and emit to WebSocket clients."""
-    # Update database for polling fallback
-    repository.update(
-        identifier=identifier,
-        update_data={
-            "progress_stage": stage.value,
-            "progress_percentage": percentage,
-        },
-    )
-    # Emit to WebSocket clients
-    progress_emitter = get_progress_emitter()
-    progress_emitter.emit_progress(identifier, stage, percentage)
+def _write_task(identifier: str, update_data: dict[str, Any]) -> None:
+    """Apply one task UPDATE in its own short-lived worker session.
+
+    The worker never holds a session across model inference: each write
+    opens, commits and closes, so the connection (and SQLite's write lock)
+    is released between pipeline stages.
+    """
+    with SessionLocal() as db:
+        SQLAlchemyTaskRepository(db).update(
+            identifier=identifier, update_data=update_data
+        )
 
 
 def transcribe_with_whisper(
@@ -217,7 +207,7 @@ def diarize(
         )
 
     logger.debug("Completed diarization with device: %s", device.value)
-    return result  # type: ignore[no-any-return]
+    return result
 
 
 def align_whisper_output(
@@ -311,7 +301,7 @@ def _release_slot_if_authed(
     Phase 19-09 — replaces the previous nested-if in process_audio_common
     finally block. Module-scope so it is greppable and unit-testable.
     """
-    completed_task = repo.get_by_id(identifier)
+    completed_task = repo.get_summary_by_id(identifier)
     if completed_task is None:
         return
     if completed_task.user_id is None:
@@ -322,6 +312,68 @@ def _release_slot_if_authed(
     free_tier_gate.release_concurrency(user)
 
 
+def _finalise_usage_and_slot(
+    db: Session,
+    *,
+    identifier: str,
+    record_usage: bool,
+    user_id: int | None,
+    task_uuid: str,
+    gpu_seconds: float,
+    file_seconds: float,
+    model: str,
+) -> None:
+    """Write the usage_events row (success only) and release the slot.
+
+    Each step is wrapped on its own so a failure in one never skips the
+    other — above all the slot release, without which the user stays
+    locked out until the bucket resets.
+    """
+    # Phase 13-08 — write usage_events row on success-only path
+    # (idempotent: duplicate task_uuid replays are silent no-ops).
+    if record_usage and user_id is not None:
+        try:
+            UsageEventWriter(session=db).record(
+                user_id=user_id,
+                task_uuid=task_uuid,
+                gpu_seconds=gpu_seconds,
+                file_seconds=file_seconds,
+                model=model,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to record usage_events for task %s: %s",
+                identifier,
+                exc,
+            )
+
+    # Phase 13-08 W1 — ALWAYS release the concurrency slot (success
+    # OR failure). Slot was consumed at transcribe-start by
+    # FreeTierGate.check; without this release the user is locked
+    # out of further transcribes until the bucket resets.
+    # Phase 19-09: flat-guard helper at module scope replaces the
+    # previous nested-if; a single try/except wraps it so a slot-
+    # release crash never blocks the context-manager exit.
+    free_tier_gate = FreeTierGate(
+        rate_limit_service=RateLimitService(
+            repository=core_services.rate_limit_repository(db)
+        )
+    )
+    try:
+        _release_slot_if_authed(
+            SQLAlchemyTaskRepository(db),
+            SQLAlchemyUserRepository(db),
+            identifier,
+            free_tier_gate,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to release concurrency slot task=%s: %s",
+            identifier,
+            exc,
+        )
+
+
 def process_audio_common(
     params: SpeechToTextProcessingParams,
     transcription_service: ITranscriptionService | None = None,
@@ -363,266 +415,255 @@ def process_audio_common(
     )
     speaker_svc = speaker_service or WhisperXSpeakerAssignmentService()
 
-    # Phase 19-09 — single SessionLocal context-manager owns the worker
-    # session lifecycle. Legacy DI lookups removed. Repositories +
-    # services constructed inline; FreeTierGate + UsageEventWriter share
-    # the same Session (DRY) and finalise together on context-manager exit.
-    with SessionLocal() as db:
-        repository: ITaskRepository = SQLAlchemyTaskRepository(db)
-        user_repo = SQLAlchemyUserRepository(db)
-        rate_limit_service = RateLimitService(
-            repository=SQLAlchemyRateLimitRepository(db)
+    # Short-lived sessions: progress and status writes each open their own
+    # session (_write_task); the finally block opens one for the completion
+    # hooks. Nothing holds a connection across model inference.
+    progress = ProgressSink(
+        params.identifier,
+        _write_task,
+        min_interval_seconds=get_settings().database.PROGRESS_WRITE_INTERVAL_SECONDS,
+    )
+
+    # Track success-only state for usage_events write
+    transcription_succeeded = False
+    duration_observed: float = 0.0
+    task_user_id: int | None = None
+    task_uuid: str = ""
+    task_audio_duration: float = 0.0
+    task_model: str = "unknown"
+
+    # Initial progress: queued
+    progress.report(TaskProgressStage.queued, 0)
+
+    try:
+        start_time = datetime.now()
+        logger.info(
+            "Starting speech-to-text processing for identifier: %s",
+            params.identifier,
         )
-        free_tier_gate = FreeTierGate(rate_limit_service=rate_limit_service)
-        usage_writer = UsageEventWriter(session=db)
 
-        # Track success-only state for usage_events write
-        transcription_succeeded = False
-        duration_observed: float = 0.0
-        task_user_id: int | None = None
-        task_uuid: str = ""
-        task_audio_duration: float = 0.0
-        task_model: str = "unknown"
+        # Progress: starting transcription
+        progress.report(TaskProgressStage.transcribing, 10)
 
-        # Initial progress: queued
-        _update_progress(repository, params.identifier, TaskProgressStage.queued, 0)
+        logger.debug(
+            "Transcription parameters - task: %s, language: %s, batch_size: %d, chunk_size: %d, model: %s, device: %s, device_index: %d, compute_type: %s, threads: %d",
+            params.whisper_model_params.task.value,
+            params.whisper_model_params.language,
+            params.whisper_model_params.batch_size,
+            params.whisper_model_params.chunk_size,
+            params.whisper_model_params.model.value,
+            params.whisper_model_params.device.value,
+            params.whisper_model_params.device_index,
+            params.whisper_model_params.compute_type.value,
+            params.whisper_model_params.threads,
+        )
 
-        try:
-            start_time = datetime.now()
-            logger.info(
-                "Starting speech-to-text processing for identifier: %s",
-                params.identifier,
-            )
+        segments_before_alignment = transcription_svc.transcribe(
+            audio=params.audio,
+            task=params.whisper_model_params.task.value,
+            asr_options=params.asr_options.model_dump(),
+            vad_options=params.vad_options.model_dump(),
+            language=params.whisper_model_params.language,
+            batch_size=params.whisper_model_params.batch_size,
+            chunk_size=params.whisper_model_params.chunk_size,
+            model=params.whisper_model_params.model.value,
+            device=params.whisper_model_params.device.value,
+            device_index=params.whisper_model_params.device_index,
+            compute_type=params.whisper_model_params.compute_type.value,
+            threads=params.whisper_model_params.threads,
+        )
 
-            # Progress: starting transcription
-            _update_progress(repository, params.identifier, TaskProgressStage.transcribing, 10)
-
-            logger.debug(
-                "Transcription parameters - task: %s, language: %s, batch_size: %d, chunk_size: %d, model: %s, device: %s, device_index: %d, compute_type: %s, threads: %d",
-                params.whisper_model_params.task.value,
-                params.whisper_model_params.language,
-                params.whisper_model_params.batch_size,
-                params.whisper_model_params.chunk_size,
-                params.whisper_model_params.model.value,
-                params.whisper_model_params.device.value,
-                params.whisper_model_params.device_index,
-                params.whisper_model_params.compute_type.value,
-                params.whisper_model_params.threads,
-            )
+        # Progress: transcription complete, starting alignment
+        progress.report(TaskProgressStage.aligning, 40)
 
-            segments_before_alignment = transcription_svc.transcribe(
-                audio=params.audio,
-                task=params.whisper_model_params.task.value,
-                asr_options=params.asr_options.model_dump(),
-                vad_options=params.vad_options.model_dump(),
-                language=params.whisper_model_params.language,
-                batch_size=params.whisper_model_params.batch_size,
-                chunk_size=params.whisper_model_params.chunk_size,
-                model=params.whisper_model_params.model.value,
-                device=params.whisper_model_params.device.value,
-                device_index=params.whisper_model_params.device_index,
-                compute_type=params.whisper_model_params.compute_type.value,
-                threads=params.whisper_model_params.threads,
-            )
+        logger.debug(
+            "Alignment parameters - align_model: %s, interpolate_method: %s, return_char_alignments: %s, language_code: %s",
+            params.alignment_params.align_model,
+            params.alignment_params.interpolate_method,
+            params.alignment_params.return_char_alignments,
+            segments_before_alignment["language"],
+        )
+        segments_transcript = alignment_svc.align(
+            transcript=segments_before_alignment["segments"],
+            audio=params.audio,
+            language_code=segments_before_alignment["language"],
+            device=params.whisper_model_params.device.value,
+            align_model=params.alignment_params.align_model,
+            interpolate_method=params.alignment_params.interpolate_method,
+            return_char_alignments=params.alignment_params.return_char_alignments,
+        )
+        # removing words within each segment that have missing start, end, or score values
+        # (dict fast path; pydantic-validated in DEV mode)
+        transcript_dict = filter_aligned_result(
+            segments_transcript, validate=get_settings().DEV
+        )
 
-            # Progress: transcription complete, starting alignment
-            _update_progress(repository, params.identifier, TaskProgressStage.aligning, 40)
+        # Progress: alignment complete, starting diarization
+        progress.report(TaskProgressStage.diarizing, 60)
 
-            logger.debug(
-                "Alignment parameters - align_model: %s, interpolate_method: %s, return_char_alignments: %s, language_code: %s",
-                params.alignment_params.align_model,
-                params.alignment_params.interpolate_method,
-                params.alignment_params.return_char_alignments,
-                segments_before_alignment["language"],
-            )
-            segments_transcript = alignment_svc.align(
-                transcript=segments_before_alignment["segments"],
-                audio=params.audio,
-                language_code=segments_before_alignment["language"],
-                device=params.whisper_model_params.device.value,
-                align_model=params.alignment_params.align_model,
-                interpolate_method=params.alignment_params.interpolate_method,
-                return_char_alignments=params.alignment_params.return_char_alignments,
-            )
-            transcript = AlignedTranscription(**segments_transcript)
-            # removing words within each segment that have missing start, end, or score values
-            filtered_transcript = filter_aligned_transcription(transcript)
-            transcript_dict = filtered_transcript.model_dump()
-
-            # Progress: alignment complete, starting diarization
-            _update_progress(repository, params.identifier, TaskProgressStage.diarizing, 60)
-
-            logger.debug(
-                "Diarization parameters - device: %s, min_speakers: %s, max_speakers: %s",
-                params.whisper_model_params.device.value,
-                params.diarization_params.min_speakers,
-                params.diarization_params.max_speakers,
-            )
-            diarization_segments = diarization_svc.diarize(
-                audio=params.audio,
-                device=params.whisper_model_params.device.value,
-                min_speakers=params.diarization_params.min_speakers,
-                max_speakers=params.diarization_params.max_speakers,
-            )
+        logger.debug(
+            "Diarization parameters - device: %s, min_speakers: %s, max_speakers: %s",
+            params.whisper_model_params.device.value,
+            params.diarization_params.min_speakers,
+            params.diarization_params.max_speakers,
+        )
+        diarization_segments = diarization_svc.diarize(
+            audio=params.audio,
+            device=params.whisper_model_params.device.value,
+            min_speakers=params.diarization_params.min_speakers,
+            max_speakers=params.diarization_params.max_speakers,
+        )
 
-            # Progress: diarization complete, combining results
-            _update_progress(repository, params.identifier, TaskProgressStage.diarizing, 80)
+        # Progress: diarization complete, combining results
+        progress.report(TaskProgressStage.diarizing, 80)
 
-            logger.debug("Starting to combine transcript with diarization results")
-            result = speaker_svc.assign_speakers(diarization_segments, transcript_dict)
+        logger.debug("Starting to combine transcript with diarization results")
+        result = speaker_svc.assign_speakers(diarization_segments, transcript_dict)
 
-            logger.debug("Completed combining transcript with diarization results")
+        logger.debug("Completed combining transcript with diarization results")
 
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            logger.info(
-                "Completed speech-to-text processing for identifier: %s. Duration: %ss",
-                params.identifier,
-                duration,
-            )
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        logger.info(
+            "Completed speech-to-text processing for identifier: %s. Duration: %ss",
+            params.identifier,
+            duration,
+        )
 
-            # Progress: complete
-            _update_progress(repository, params.identifier, TaskProgressStage.complete, 100)
+        # Progress: complete, persisted with the result in one UPDATE
+        progress.finish(
+            TaskProgressStage.complete,
+            100,
+            {
+                "status": TaskStatus.completed,
+                "result": result,
+                "duration": duration,
+                "start_time": start_time,
+                "end_time": end_time,
+            },
+        )
 
-            repository.update(
-                identifier=params.identifier,
-                update_data={
-                    "status": TaskStatus.completed,
-                    "result": result,
-                    "duration": duration,
-                    "start_time": start_time,
-                    "end_time": end_time,
-                },
-            )
+        # Phase 13-08 success-path snapshot — usage_events written in finally
+        transcription_succeeded = True
+        duration_observed = duration
 
-            # Phase 13-08 success-path snapshot — usage_events written in finally
-            transcription_succeeded = True
-            duration_observed = duration
+    except (RuntimeError, ValueError, KeyError) as e:
+        logger.error(
+            "Speech-to-text processing failed for identifier: %s. Error: %s",
+            params.identifier,
+            str(e),
+        )
+        # Emit error to WebSocket clients
+        progress_emitter = get_progress_emitter()
+        progress_emitter.emit_error(
+            params.identifier,
+            error_code="PROCESSING_FAILED",
+            user_message="Transcription processing failed. Please try again.",
+            technical_detail=str(e),
+        )
+        # Persist the last coalesced progress first, so the failed row
+        # shows how far the job got.
+        progress.flush()
+        _write_task(
+            params.identifier,
+            {
+                "status": TaskStatus.failed,
+                "error": str(e),
+            },
+        )
 
-        except (RuntimeError, ValueError, KeyError) as e:
-            logger.error(
-                "Speech-to-text processing failed for identifier: %s. Error: %s",
-                params.identifier,
-                str(e),
+    except MemoryError as e:
+        logger.error(
+            f"Task failed for identifier {params.identifier} due to out of memory. Error: {str(e)}"
+        )
+        # Emit error to WebSocket clients
+        progress_emitter = get_progress_emitter()
+        progress_emitter.emit_error(
+            params.identifier,
+            error_code="PROCESSING_FAILED",
+            user_message="Transcription processing failed due to memory constraints. Please try with a smaller file.",
+            technical_detail=str(e),
+        )
+        progress.flush()
+        _write_task(
+            params.identifier,
+            {"status": TaskStatus.failed, "error": str(e)},
+        )
+
+    finally:
+        # No-op unless an unhandled error skipped the branches above.
+        try:
+            progress.flush()
+        except (DatabaseOperationError, ValueError) as exc:  # pragma: no cover
+            logger.warning(
+                "Failed to flush progress for %s: %s", params.identifier, exc
             )
-            # Emit error to WebSocket clients
-            progress_emitter = get_progress_emitter()
-            progress_emitter.emit_error(
+
+        # Capture per-task data needed for usage_events + slot release.
+        # Single repo lookup serves callback + W1 release paths (DRT); the
+        # result stays compressed JSON — only a full-mode callback reads it.
+        completed_task = None
+        result_chunks = None
+        try:
+            with SessionLocal() as db:
+                found = SQLAlchemyTaskRepository(db).get_result_stream(
+                    params.identifier
+                )
+            if found is not None:
+                completed_task, result_chunks = found
+        except Exception as exc:  # pragma: no cover — defensive
+            logger.warning(
+                "Failed to load completed task %s: %s",
                 params.identifier,
-                error_code="PROCESSING_FAILED",
-                user_message="Transcription processing failed. Please try again.",
-                technical_detail=str(e),
+                exc,
             )
-            repository.update(
-                identifier=params.identifier,
-                update_data={
-                    "status": TaskStatus.failed,
-                    "error": str(e),
-                },
+
+        if completed_task is not None:
+            task_user_id = completed_task.user_id
+            task_uuid = completed_task.uuid
+            task_audio_duration = completed_task.audio_duration or 0.0
+            params_dict = completed_task.task_params or {}
+            model_value = params_dict.get("model", "unknown")
+            task_model = (
+                model_value.value if hasattr(model_value, "value") else str(model_value)
             )
 
-        except MemoryError as e:
+        # Callback: persist to the outbox; the webhook dispatcher POSTs it
+        # off this thread, so a slow endpoint never holds the worker.
+        try:
+            if params.callback_url and completed_task is not None:
+                settings = get_settings()
+                payload = build_callback_payload(
+                    completed_task,
+                    result_chunks,
+                    params.callback_mode,
+                    public_base_url=settings.callback.CALLBACK_PUBLIC_BASE_URL,
+                    secret=settings.auth.JWT_SECRET.get_secret_value(),
+                    link_ttl_seconds=settings.callback.CALLBACK_RESULT_LINK_TTL_SECONDS,
+                    now=datetime.now(tz=timezone.utc),
+                )
+                core_services.get_webhook_dispatcher().enqueue(
+                    params.identifier, params.callback_url, payload
+                )
+        except Exception as e:
             logger.error(
-                f"Task failed for identifier {params.identifier} due to out of memory. Error: {str(e)}"
-            )
-            # Emit error to WebSocket clients
-            progress_emitter = get_progress_emitter()
-            progress_emitter.emit_error(
+                "Failed to enqueue callback for identifier %s: %s",
                 params.identifier,
-                error_code="PROCESSING_FAILED",
-                user_message="Transcription processing failed due to memory constraints. Please try with a smaller file.",
-                technical_detail=str(e),
+                str(e),
             )
-            repository.update(
+
+        # Completion hooks share one short session, opened after the
+        # callback enqueue (which uses its own).
+        with SessionLocal() as db:
+            _finalise_usage_and_slot(
+                db,
                 identifier=params.identifier,
-                update_data={"status": TaskStatus.failed, "error": str(e)},
+                record_usage=(
+                    transcription_succeeded and task_user_id is not None and bool(task_uuid)
+                ),
+                user_id=task_user_id,
+                task_uuid=task_uuid,
+                gpu_seconds=duration_observed,
+                file_seconds=task_audio_duration,
+                model=task_model,
             )
-
-        finally:
-            # Capture per-task data needed for usage_events + slot release.
-            # Single repo lookup serves callback + W1 release paths (DRT).
-            completed_task = None
-            try:
-                completed_task = repository.get_by_id(params.identifier)
-            except Exception as exc:  # pragma: no cover — defensive
-                logger.warning(
-                    "Failed to load completed task %s: %s",
-                    params.identifier,
-                    exc,
-                )
-
-            if completed_task is not None:
-                task_user_id = completed_task.user_id
-                task_uuid = completed_task.uuid
-                task_audio_duration = completed_task.audio_duration or 0.0
-                params_dict = completed_task.task_params or {}
-                model_value = params_dict.get("model", "unknown")
-                task_model = (
-                    model_value.value if hasattr(model_value, "value") else str(model_value)
-                )
-
-            # Existing callback path — unchanged behavior, reusing completed_task.
-            try:
-                if params.callback_url and completed_task is not None:
-                    metadata = Metadata(
-                        task_type=completed_task.task_type,
-                        task_params=completed_task.task_params,
-                        language=completed_task.language,
-                        file_name=completed_task.file_name,
-                        url=completed_task.url,
-                        callback_url=completed_task.callback_url,
-                        duration=completed_task.duration,
-                        audio_duration=completed_task.audio_duration,
-                        start_time=completed_task.start_time,
-                        end_time=completed_task.end_time,
-                    )
-                    result_payload = Result(
-                        status=completed_task.status,
-                        result=completed_task.result,
-                        metadata=metadata,
-                        error=completed_task.error,
-                    )
-                    post_task_callback(params.callback_url, result_payload.model_dump())
-            except Exception as e:
-                logger.error(
-                    "Failed to send callback for identifier %s: %s",
-                    params.identifier,
-                    str(e),
-                )
-
-            # Phase 13-08 — write usage_events row on success-only path
-            # (idempotent: duplicate task_uuid replays are silent no-ops).
-            if transcription_succeeded and task_user_id is not None and task_uuid:
-                try:
-                    usage_writer.record(
-                        user_id=task_user_id,
-                        task_uuid=task_uuid,
-                        gpu_seconds=duration_observed,
-                        file_seconds=task_audio_duration,
-                        model=task_model,
-                    )
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to record usage_events for task %s: %s",
-                        params.identifier,
-                        exc,
-                    )
-
-            # Phase 13-08 W1 — ALWAYS release the concurrency slot (success
-            # OR failure). Slot was consumed at transcribe-start by
-            # FreeTierGate.check; without this release the user is locked
-            # out of further transcribes until the bucket resets.
-            # Phase 19-09: flat-guard helper at module scope replaces the
-            # previous nested-if; a single try/except wraps it so a slot-
-            # release crash never blocks the context-manager exit.
-            try:
-                _release_slot_if_authed(
-                    repository, user_repo, params.identifier, free_tier_gate
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Failed to release concurrency slot task=%s: %s",
-                    params.identifier,
-                    exc,
-                )
-
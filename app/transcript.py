@@ -1,5 +1,8 @@
 """This module provides functions to filter aligned transcriptions."""
 
+from collections.abc import Mapping
+from typing import Any
+
 from app.schemas import AlignedTranscription, AlignmentSegment
 
 
@@ -40,3 +43,61 @@ def filter_aligned_transcription(
         segments=filtered_segments, word_segments=[]
     )
     return filtered_transcription
+
+
+def _is_complete(word: Mapping[str, Any]) -> bool:
+    """True when ``word`` has a start, an end and a score."""
+    return (
+        word.get("start") is not None
+        and word.get("end") is not None
+        and word.get("score") is not None
+    )
+
+
+def filter_aligned_result(
+    aligned_result: Mapping[str, Any], *, validate: bool = False
+) -> dict[str, Any]:
+    """
+    Filter an aligned result dict without building pydantic models.
+
+    Fast path for trusted whisperX output: produces exactly
+    ``filter_aligned_transcription(AlignedTranscription(**aligned_result))
+    .model_dump()`` — same dropped words and segments, same keys (extra
+    keys such as ``chars`` are not carried over), numbers as ``float`` —
+    in a single pass over plain dicts, with no per-word validation.
+
+    Args:
+        aligned_result (Mapping): The aligner's ``{"segments": [...]}`` output.
+        validate (bool): Run the pydantic path instead, so malformed input
+            fails loudly (debug / development mode).
+
+    Returns:
+        dict: Filtered ``{"segments": [...], "word_segments": []}``.
+    """
+    if validate:
+        return filter_aligned_transcription(
+            AlignedTranscription(**aligned_result)
+        ).model_dump()
+
+    filtered_segments = []
+    for segment in aligned_result["segments"]:
+        filtered_words = [
+            {
+                "word": word["word"],
+                "start": float(word["start"]),
+                "end": float(word["end"]),
+                "score": float(word["score"]),
+            }
+            for word in segment["words"]
+            if _is_complete(word)
+        ]
+        if filtered_words:
+            filtered_segments.append(
+                {
+                    "start": float(segment["start"]),
+                    "end": float(segment["end"]),
+                    "text": segment["text"],
+                    "words": filtered_words,
+                }
+            )
+    return {"segments": filtered_segments, "word_segments": []}
@@ -0,0 +1,348 @@
+"""Columnar representation of word-level transcription results.
+
+A finished result is a list of segments, each holding a list of per-word
+dicts (``word``, ``start``, ``end``, ``score``, ``speaker``). Repeated keys
+and per-object overhead cost hundreds of bytes per word, both in memory and
+as JSON. ``ColumnarTranscript`` holds the same data as parallel arrays:
+
+* words — ``start`` / ``end`` / ``score`` as float32 (NaN = missing),
+  ``speaker`` as an int16 index into ``speakers`` (-1 = none) and ``text``
+  as an int32 index into a de-duplicated ``strings`` table;
+* segments — float32 ``start`` / ``end``, their text, an int16 speaker
+  index, and ``word_offsets`` (length segments + 1) so segment ``i`` owns
+  words ``word_offsets[i]:word_offsets[i + 1]``.
+
+Top-level keys other than ``segments`` / ``word_segments`` (e.g.
+``language``) are carried through unchanged in ``extra``.
+
+Conversions are lazy in both directions: ``from_result`` walks the
+verbose shape once — dicts or the ``AlignedTranscription`` pydantic models
+alike, without a ``model_dump`` round-trip — and ``iter_segments`` rebuilds
+verbose segments one at a time on demand.
+
+Serialised forms: ``to_json`` (parallel lists — ``GET /task/{id}
+?format=columnar``) and ``to_npz`` / ``from_npz`` (a NumPy ``.npz``
+archive, ``?format=npz``).
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+COLUMNAR_FORMAT = "columnar-v1"
+NO_SPEAKER = -1
+
+# Values read back out of float32 columns are rounded to this many
+# decimals — whisperX timestamps carry millisecond precision, and float32
+# noise beyond it would only bloat the payload.
+_JSON_DECIMALS = 3
+
+_WORD_FLOAT_COLUMNS = ("start", "end", "score")
+
+
+def _get(obj: Any, name: str) -> Any:
+    """Read ``name`` from a dict or an attribute-style model (None if absent)."""
+    if isinstance(obj, Mapping):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _as_float(value: Any) -> float:
+    """Column value for an optional number — NaN marks "missing"."""
+    return math.nan if value is None else float(value)
+
+
+def _as_optional(value: Any) -> float | None:
+    """Inverse of ``_as_float`` for one float32 cell (rounded, NaN → None)."""
+    value = float(value)
+    return None if math.isnan(value) else round(value, _JSON_DECIMALS)
+
+
+def _json_floats(column: np.ndarray) -> list[float | None]:
+    """float32 column → JSON list (rounded; NaN → null)."""
+    rounded = np.round(column.astype(np.float64), _JSON_DECIMALS)
+    return [None if math.isnan(v) else v for v in rounded.tolist()]
+
+
+def _pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Encode a string list as one UTF-8 buffer plus int32 end offsets."""
+    encoded = [s.encode() for s in strings]
+    ends = np.cumsum([len(b) for b in encoded], dtype=np.int64).astype(np.int32)
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), ends
+
+
+def _unpack_strings(buffer: np.ndarray, ends: np.ndarray) -> list[str]:
+    """Inverse of ``_pack_strings``."""
+    raw = buffer.tobytes()
+    starts = [0, *ends[:-1].tolist()]
+    return [raw[s:e].decode() for s, e in zip(starts, ends.tolist())]
+
+
+@dataclass(frozen=True)
+class ColumnarTranscript:
+    """Parallel-array form of a word-level transcription result.
+
+    Attributes:
+        strings: De-duplicated word texts; ``word_text`` indexes into it.
+        speakers: Speaker labels; speaker columns index into it.
+        word_text / word_start / word_end / word_score / word_speaker:
+            One entry per word, in segment order.
+        segment_start / segment_end / segment_speaker / segment_text:
+            One entry per segment.
+        word_offsets: Segment ``i`` owns words
+            ``word_offsets[i]:word_offsets[i + 1]``.
+        extra: Non-segment top-level keys of the original result.
+    """
+
+    strings: list[str]
+    speakers: list[str]
+    word_text: np.ndarray
+    word_start: np.ndarray
+    word_end: np.ndarray
+    word_score: np.ndarray
+    word_speaker: np.ndarray
+    segment_start: np.ndarray
+    segment_end: np.ndarray
+    segment_speaker: np.ndarray
+    segment_text: list[str]
+    word_offsets: np.ndarray
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def word_count(self) -> int:
+        """Number of words across all segments."""
+        return int(self.word_text.shape[0])
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segments."""
+        return len(self.segment_text)
+
+    @classmethod
+    def from_result(cls, result: Any) -> ColumnarTranscript:
+        """Build the columnar form from a verbose result in one pass.
+
+        Args:
+            result: A result dict (``{"segments": [...], ...}``) or an
+                ``AlignedTranscription`` model; segments and words may be
+                dicts or models. Missing timings / scores / speakers are
+                kept as missing, not dropped.
+
+        Returns:
+            ColumnarTranscript: The same words and segments as arrays.
+        """
+        string_index: dict[str, int] = {}
+        speaker_index: dict[str, int] = {}
+
+        def speaker_id(label: Any) -> int:
+            if label is None:
+                return NO_SPEAKER
+            return speaker_index.setdefault(str(label), len(speaker_index))
+
+        word_text: list[int] = []
+        word_floats: dict[str, list[float]] = {
+            name: [] for name in _WORD_FLOAT_COLUMNS
+        }
+        word_speaker: list[int] = []
+        segment_start: list[float] = []
+        segment_end: list[float] = []
+        segment_speaker: list[int] = []
+        segment_text: list[str] = []
+        word_offsets = [0]
+
+        for segment in _get(result, "segments") or []:
+            segment_start.append(_as_float(_get(segment, "start")))
+            segment_end.append(_as_float(_get(segment, "end")))
+            segment_speaker.append(speaker_id(_get(segment, "speaker")))
+            segment_text.append(_get(segment, "text") or "")
+            for word in _get(segment, "words") or []:
+                text = _get(word, "word") or ""
+                word_text.append(string_index.setdefault(text, len(string_index)))
+                for name in _WORD_FLOAT_COLUMNS:
+                    word_floats[name].append(_as_float(_get(word, name)))
+                word_speaker.append(speaker_id(_get(word, "speaker")))
+            word_offsets.append(len(word_text))
+
+        extra = (
+            {k: v for k, v in result.items() if k not in ("segments", "word_segments")}
+            if isinstance(result, Mapping)
+            else {}
+        )
+        return cls(
+            strings=list(string_index),
+            speakers=list(speaker_index),
+            word_text=np.asarray(word_text, dtype=np.int32),
+            word_start=np.asarray(word_floats["start"], dtype=np.float32),
+            word_end=np.asarray(word_floats["end"], dtype=np.float32),
+            word_score=np.asarray(word_floats["score"], dtype=np.float32),
+            word_speaker=np.asarray(word_speaker, dtype=np.int16),
+            segment_start=np.asarray(segment_start, dtype=np.float32),
+            segment_end=np.asarray(segment_end, dtype=np.float32),
+            segment_speaker=np.asarray(segment_speaker, dtype=np.int16),
+            segment_text=segment_text,
+            word_offsets=np.asarray(word_offsets, dtype=np.int32),
+            extra=extra,
+        )
+
+    def _speaker_label(self, index: int) -> str | None:
+        return None if index == NO_SPEAKER else self.speakers[index]
+
+    def iter_words(
+        self, start: int = 0, stop: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield verbose word dicts for ``[start, stop)``, one at a time.
+
+        Keys that were missing in the source (timings, score, speaker) are
+        omitted, matching the verbose shape; numbers come back rounded to
+        milliseconds (float32 storage).
+        """
+        stop = self.word_count if stop is None else stop
+        for i in range(start, stop):
+            word: dict[str, Any] = {"word": self.strings[self.word_text[i]]}
+            for name in _WORD_FLOAT_COLUMNS:
+                value = _as_optional(getattr(self, f"word_{name}")[i])
+                if value is not None:
+                    word[name] = value
+            speaker = self._speaker_label(int(self.word_speaker[i]))
+            if speaker is not None:
+                word["speaker"] = speaker
+            yield word
+
+    def iter_segments(self) -> Iterator[dict[str, Any]]:
+        """Yield verbose segment dicts (with their words) lazily."""
+        for i in range(self.segment_count):
+            segment: dict[str, Any] = {
+                "start": _as_optional(self.segment_start[i]),
+                "end": _as_optional(self.segment_end[i]),
+                "text": self.segment_text[i],
+                "words": list(
+                    self.iter_words(
+                        int(self.word_offsets[i]), int(self.word_offsets[i + 1])
+                    )
+                ),
+            }
+            speaker = self._speaker_label(int(self.segment_speaker[i]))
+            if speaker is not None:
+                segment["speaker"] = speaker
+            yield segment
+
+    def without_incomplete_words(self) -> ColumnarTranscript:
+        """Drop words missing a start, end or score — vectorised.
+
+        Array counterpart of ``app.transcript.filter_aligned_result``:
+        segments left without words are dropped too. The string and
+        speaker tables are shared, not compacted.
+        """
+        keep = ~(
+            np.isnan(self.word_start)
+            | np.isnan(self.word_end)
+            | np.isnan(self.word_score)
+        )
+        kept_before = np.concatenate(([0], np.cumsum(keep, dtype=np.int64)))
+        offsets = self.word_offsets
+        kept_per_segment = kept_before[offsets[1:]] - kept_before[offsets[:-1]]
+        keep_segment = kept_per_segment > 0
+        return ColumnarTranscript(
+            strings=self.strings,
+            speakers=self.speakers,
+            word_text=self.word_text[keep],
+            word_start=self.word_start[keep],
+            word_end=self.word_end[keep],
+            word_score=self.word_score[keep],
+            word_speaker=self.word_speaker[keep],
+            segment_start=self.segment_start[keep_segment],
+            segment_end=self.segment_end[keep_segment],
+            segment_speaker=self.segment_speaker[keep_segment],
+            segment_text=[
+                text for text, kept in zip(self.segment_text, keep_segment) if kept
+            ],
+            word_offsets=np.concatenate(
+                ([0], np.cumsum(kept_per_segment[keep_segment]))
+            ).astype(np.int32),
+            extra=self.extra,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        """JSON-ready dict of parallel lists (floats rounded, NaN → null)."""
+        return {
+            **self.extra,
+            "format": COLUMNAR_FORMAT,
+            "strings": self.strings,
+            "speakers": self.speakers,
+            "words": {
+                "text": self.word_text.tolist(),
+                "start": _json_floats(self.word_start),
+                "end": _json_floats(self.word_end),
+                "score": _json_floats(self.word_score),
+                "speaker": self.word_speaker.tolist(),
+            },
+            "segments": {
+                "start": _json_floats(self.segment_start),
+                "end": _json_floats(self.segment_end),
+                "text": self.segment_text,
+                "speaker": self.segment_speaker.tolist(),
+                "word_offsets": self.word_offsets.tolist(),
+            },
+        }
+
+    def to_npz(self) -> bytes:
+        """Serialise to a compressed NumPy ``.npz`` archive.
+
+        String lists are stored as a UTF-8 byte buffer plus int32 end
+        offsets, so the archive loads with ``allow_pickle=False``. ``extra``
+        is not included — it belongs to the JSON envelope.
+        """
+        arrays: dict[str, np.ndarray] = {
+            "format": np.array(COLUMNAR_FORMAT),
+            "word_text": self.word_text,
+            "word_start": self.word_start,
+            "word_end": self.word_end,
+            "word_score": self.word_score,
+            "word_speaker": self.word_speaker,
+            "segment_start": self.segment_start,
+            "segment_end": self.segment_end,
+            "segment_speaker": self.segment_speaker,
+            "word_offsets": self.word_offsets,
+        }
+        for name in ("strings", "speakers", "segment_text"):
+            arrays[f"{name}_utf8"], arrays[f"{name}_ends"] = _pack_strings(
+                getattr(self, name)
+            )
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_npz(cls, data: bytes) -> ColumnarTranscript:
+        """Inverse of ``to_npz``.
+
+        Raises:
+            ValueError: If the archive is not a ``columnar-v1`` transcript.
+        """
+        with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+            if "format" not in archive or str(archive["format"]) != COLUMNAR_FORMAT:
+                raise ValueError(f"Not a {COLUMNAR_FORMAT} archive")
+            texts = {
+                name: _unpack_strings(archive[f"{name}_utf8"], archive[f"{name}_ends"])
+                for name in ("strings", "speakers", "segment_text")
+            }
+            return cls(
+                strings=texts["strings"],
+                speakers=texts["speakers"],
+                word_text=archive["word_text"],
+                word_start=archive["word_start"],
+                word_end=archive["word_end"],
+                word_score=archive["word_score"],
+                word_speaker=archive["word_speaker"],
+                segment_start=archive["segment_start"],
+                segment_end=archive["segment_end"],
+                segment_speaker=archive["segment_speaker"],
+                segment_text=texts["segment_text"],
+                word_offsets=archive["word_offsets"],
+            )
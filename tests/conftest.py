@@ -1,5 +1,6 @@
 """Pytest configuration file for setting up test environment."""
 
+import asyncio
 import os
 
 from typing import Generator
@@ -71,8 +72,23 @@ def _clear_lru_caches():
     """
     yield
     from app.core import services
+    from app.infrastructure.database.async_connection import dispose_async_engines
+
     services.get_password_service.cache_clear()
     services.get_csrf_service.cache_clear()
     services.get_token_service.cache_clear()
     services.get_ws_ticket_service.cache_clear()
+    services.get_task_count_cache.cache_clear()
+    services.get_bucket_store.cache_clear()
+    services.get_api_key_cache.cache_clear()
+    services.get_last_used_buffer.cache_clear()
+    services.get_user_snapshot_cache.cache_clear()
+    if services.get_password_hash_pool.cache_info().currsize:
+        services.get_password_hash_pool().shutdown()  # join idle argon2 workers
+    services.get_password_hash_pool.cache_clear()
+    services.get_webhook_dispatcher.cache_clear()
+    services.get_callback_url_validator.cache_clear()
+    services.get_url_downloader.cache_clear()
+    # Pooled aiosqlite connections each hold a non-daemon thread
+    asyncio.run(dispose_async_engines())
     # Add any other lru-cached services factories here as Plan 02 evolves.
@@ -8,6 +8,7 @@ This module contains E2E tests for the callback notification feature:
 - Invalid callback URL handling
 """
 
+import gzip
 import json
 import os
 import time
@@ -110,6 +111,8 @@ class CallbackHTTPRequestHandler(BaseHTTPRequestHandler):
         """Handle POST requests and capture callback payload."""
         content_length = int(self.headers.get("Content-Length", 0))
         post_data = self.rfile.read(content_length)
+        if self.headers.get("Content-Encoding") == "gzip":
+            post_data = gzip.decompress(post_data)
 
         try:
             callback_data = json.loads(post_data.decode("utf-8"))
@@ -9,12 +9,14 @@ Covers Phase 10 success criteria:
   - uq_usage_events_idempotency_key rejects duplicate idempotency keys
 """
 
+import json
 import os
 import subprocess
 import sys
 from pathlib import Path
 
 import pytest
+import zstandard
 from sqlalchemy import create_engine, inspect
 from sqlalchemy.exc import IntegrityError
 
@@ -28,6 +30,17 @@ EXPECTED_TABLES = {
     "usage_events",
     "rate_limit_buckets",
     "device_fingerprints",
+    # 0005: FTS5 virtual table + the shadow tables SQLite creates for it.
+    "tasks_fts",
+    "tasks_fts_config",
+    "tasks_fts_content",
+    "tasks_fts_data",
+    "tasks_fts_docsize",
+    "tasks_fts_idx",
+    # 0006: out-of-row compressed results.
+    "task_results",
+    # 0007: webhook delivery outbox.
+    "webhook_deliveries",
 }
 
 
@@ -255,3 +268,154 @@ class TestAlembicMigration:
                     "VALUES (1, 'k1', '2026-01-01 00:00:00+00:00')"
                 )
         engine.dispose()
+
+    def test_upgrade_creates_tasks_hot_path_indexes(self, tmp_path: Path) -> None:
+        """0004: tasks.uuid UNIQUE + (user_id, created_at) + (user_id, status) indexes."""
+        db_path = tmp_path / "alembic_indexes.db"
+        db_url = f"sqlite:///{db_path}"
+        _run_alembic(["upgrade", "head"], db_url)
+
+        engine = _make_engine(db_path)
+        indexes = {ix["name"]: ix for ix in inspect(engine).get_indexes("tasks")}
+        engine.dispose()
+
+        assert indexes["idx_tasks_uuid"]["unique"], f"idx_tasks_uuid not unique: {indexes}"
+        assert indexes["idx_tasks_user_id_status"]["column_names"] == ["user_id", "status"]
+        assert "idx_tasks_user_id_created_at" in indexes, f"got {sorted(indexes)}"
+
+    def test_upgrade_creates_tasks_fts_and_delete_trigger(self, tmp_path: Path) -> None:
+        """0005: tasks_fts is searchable and deleting a task drops its rows."""
+        db_path = tmp_path / "alembic_fts.db"
+        db_url = f"sqlite:///{db_path}"
+        _run_alembic(["upgrade", "head"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, email, password_hash, created_at, updated_at) "
+                "VALUES (1, 'a@example.com', 'x', '2026-01-01', '2026-01-01')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tasks (id, uuid, status, task_type, user_id, "
+                "created_at, updated_at) VALUES "
+                "(3, 'u-3', 'completed', 't', 1, '2026-01-01', '2026-01-01')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tasks_fts (rowid, file_name, text) "
+                "VALUES ((3 << 20) + 1, '', 'hello world')"
+            )
+            hits = conn.exec_driver_sql(
+                "SELECT COUNT(*) FROM tasks_fts WHERE tasks_fts MATCH 'hello'"
+            ).scalar()
+            conn.exec_driver_sql("DELETE FROM tasks WHERE id = 3")
+            remaining = conn.exec_driver_sql("SELECT COUNT(*) FROM tasks_fts").scalar()
+        engine.dispose()
+
+        assert hits == 1
+        assert remaining == 0
+
+    def test_upgrade_moves_inline_results_into_task_results(
+        self, tmp_path: Path
+    ) -> None:
+        """0006: inline tasks.result is compressed into task_results and back."""
+        db_path = tmp_path / "alembic_results.db"
+        db_url = f"sqlite:///{db_path}"
+        _run_alembic(["upgrade", "0005_tasks_fts"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, email, password_hash, created_at, updated_at) "
+                "VALUES (1, 'a@example.com', 'x', '2026-01-01', '2026-01-01')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tasks (id, uuid, status, task_type, user_id, result, "
+                "created_at, updated_at) VALUES "
+                "(1, 'u-1', 'completed', 't', 1, "
+                "'{\"segments\": [{\"text\": \"héllo\"}]}', "
+                "'2026-01-01', '2026-01-01'), "
+                "(2, 'u-2', 'processing', 't', 1, NULL, '2026-01-01', '2026-01-01')"
+            )
+        engine.dispose()
+
+        _run_alembic(["upgrade", "head"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.connect() as conn:
+            tasks = conn.exec_driver_sql(
+                "SELECT id, result, result_size FROM tasks ORDER BY id"
+            ).all()
+            stored = conn.exec_driver_sql(
+                "SELECT task_id, codec, raw_size, data FROM task_results"
+            ).all()
+        engine.dispose()
+
+        raw = '{"segments":[{"text":"héllo"}]}'.encode()
+        assert tasks == [(1, None, len(raw)), (2, None, None)]
+        assert [(row[0], row[1], row[2]) for row in stored] == [(1, "zstd", len(raw))]
+        assert zstandard.ZstdDecompressor().decompress(stored[0][3]) == raw
+
+        _run_alembic(["downgrade", "0005_tasks_fts"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.connect() as conn:
+            restored = conn.exec_driver_sql("SELECT result FROM tasks WHERE id = 1").scalar()
+            columns = {col["name"] for col in inspect(conn).get_columns("tasks")}
+            tables = set(inspect(conn).get_table_names())
+            triggers = conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            ).scalars().all()
+        engine.dispose()
+
+        assert json.loads(restored) == {"segments": [{"text": "héllo"}]}
+        assert "result_size" not in columns
+        assert "task_results" not in tables
+        # The batch rebuild of tasks keeps 0005's FTS delete trigger.
+        assert triggers == ["tasks_fts_after_delete"]
+
+    def test_upgrade_creates_webhook_outbox_with_task_cascade(
+        self, tmp_path: Path
+    ) -> None:
+        """0007: outbox rows follow their task; downgrade drops the outbox."""
+        db_path = tmp_path / "alembic_webhooks.db"
+        db_url = f"sqlite:///{db_path}"
+        _run_alembic(["upgrade", "head"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO users (id, email, password_hash, created_at, updated_at) "
+                "VALUES (1, 'a@example.com', 'x', '2026-01-01', '2026-01-01')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO tasks (id, uuid, status, task_type, user_id, "
+                "callback_status, created_at, updated_at) VALUES "
+                "(1, 'u-1', 'completed', 't', 1, 'pending', '2026-01-01', '2026-01-01')"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO webhook_deliveries (task_id, url, payload, status, "
+                "attempts, next_attempt_at, created_at) VALUES "
+                "(1, 'http://hook.test/cb', '{}', 'pending', 0, "
+                "'2026-01-01', '2026-01-01')"
+            )
+            with pytest.raises(IntegrityError):
+                with conn.begin_nested():
+                    conn.exec_driver_sql(
+                        "UPDATE webhook_deliveries SET status = 'bogus'"
+                    )
+            conn.exec_driver_sql("DELETE FROM tasks WHERE id = 1")
+            remaining = conn.exec_driver_sql(
+                "SELECT COUNT(*) FROM webhook_deliveries"
+            ).scalar()
+        engine.dispose()
+        assert remaining == 0
+
+        _run_alembic(["downgrade", "0006_task_results"], db_url)
+
+        engine = _make_engine(db_path)
+        with engine.connect() as conn:
+            columns = {col["name"] for col in inspect(conn).get_columns("tasks")}
+            tables = set(inspect(conn).get_table_names())
+        engine.dispose()
+        assert "callback_status" not in columns
+        assert "webhook_deliveries" not in tables
@@ -0,0 +1,201 @@
+"""Load test: request-path auth on a blocking Session vs the AsyncSession.
+
+Every authenticated request resolves its bearer key (prefix lookup, user
+lookup, ``last_used_at`` UPDATE). The legacy resolver ran those queries on
+the sync Session inside an ``async def`` dependency, so whenever the
+transcription worker held the SQLite write lock the ``UPDATE`` waited on
+``busy_timeout`` *on the event loop* — stalling every other request in the
+process, including ones that never touch the database.
+
+This drives concurrent bearer-authenticated requests through the ASGI
+app, with a steady DB-free ping probe alongside, while a background
+thread plays the worker (short ``BEGIN IMMEDIATE`` progress writes) —
+once with the legacy blocking resolver and once with
+``authenticated_user`` — and compares p99 latency.
+
+Gated behind the slow pytest marker — not part of the default `pytest`
+run. Invoke explicitly:
+    pytest -m slow tests/integration/test_async_request_path_load.py -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import statistics
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.dependencies import authenticated_user, get_db
+from app.core.exceptions import InvalidApiKeyFormatError, InvalidApiKeyHashError
+from app.domain.entities.user import User
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
+    SQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from app.services.auth import KeyService
+
+# Below the sync engine's QueuePool limit (5 + 10 overflow): past it the
+# blocking resolver deadlocks the loop until the 30 s checkout timeout.
+_CONCURRENCY = 12
+_ROUNDS = 20
+_PROBE_INTERVAL_S = 0.005
+_WORKER_LOCK_HOLD_S = 0.02
+_WORKER_PAUSE_S = 0.1
+
+
+def _blocking_authenticated_user(
+    request: Request, db: Session = Depends(get_db)
+) -> User:
+    """The pre-async bearer resolver: sync repositories on the event loop."""
+    plaintext = request.headers["authorization"].removeprefix("Bearer ").strip()
+    try:
+        api_key = KeyService(SQLAlchemyApiKeyRepository(db)).verify_plaintext(plaintext)
+    except (InvalidApiKeyFormatError, InvalidApiKeyHashError):
+        raise HTTPException(status_code=401)
+    user = SQLAlchemyUserRepository(db).get_by_id(api_key.user_id)
+    if user is None:
+        raise HTTPException(status_code=401)
+    return user
+
+
+def _build_app(engine: Engine) -> FastAPI:
+    app = FastAPI()
+    session_factory = sessionmaker(autoflush=False, bind=engine)
+
+    def _override_get_db() -> Generator[Session, None, None]:
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    # Route handlers resolve the dependency inside the coroutine — exactly
+    # where the legacy resolver ran its queries.
+    @app.get("/before")
+    async def before(request: Request, db: Session = Depends(get_db)) -> dict:
+        user = _blocking_authenticated_user(request, db)
+        return {"user_id": user.id}
+
+    @app.get("/after")
+    async def after(user: User = Depends(authenticated_user)) -> dict:
+        return {"user_id": user.id}
+
+    @app.get("/ping")
+    async def ping() -> dict:
+        return {"ok": True}
+
+    app.dependency_overrides[get_db] = _override_get_db
+    return app
+
+
+def _seed(engine: Engine) -> str:
+    with sessionmaker(bind=engine)() as session:
+        session.add(ORMUser(id=1, email="load@example.com", password_hash="x"))
+        session.commit()
+        plaintext, _key = KeyService(SQLAlchemyApiKeyRepository(session)).create_key(1, "load")
+    return plaintext
+
+
+def _worker_writes(engine: Engine, stop: threading.Event) -> None:
+    """Transcription-worker stand-in: short write transactions in a loop."""
+    with engine.connect() as conn:
+        while not stop.is_set():
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            conn.execute(text("UPDATE users SET email = email WHERE id = 1"))
+            time.sleep(_WORKER_LOCK_HOLD_S)
+            conn.exec_driver_sql("COMMIT")
+            time.sleep(_WORKER_PAUSE_S)
+
+
+async def _drive(app: FastAPI, path: str, bearer: str) -> tuple[list[float], list[float]]:
+    """Concurrent authed requests + a steady ping probe; returns (auth_ms, ping_ms)."""
+    auth_ms: list[float] = []
+    ping_ms: list[float] = []
+    headers = {"Authorization": f"Bearer {bearer}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+
+        async def timed(url: str, sink: list[float], **kwargs: object) -> None:
+            start = time.perf_counter()
+            response = await client.get(url, **kwargs)
+            sink.append((time.perf_counter() - start) * 1000.0)
+            assert response.status_code == 200, response.text
+
+        async def probe(done: asyncio.Event) -> None:
+            # Latency counted from the *scheduled* send time, so a stalled
+            # loop shows up instead of just delaying the next sample.
+            while not done.is_set():
+                due = time.perf_counter() + _PROBE_INTERVAL_S
+                await asyncio.sleep(_PROBE_INTERVAL_S)
+                response = await client.get("/ping")
+                ping_ms.append((time.perf_counter() - due) * 1000.0)
+                assert response.status_code == 200, response.text
+
+        # Untimed warm-up: first connect, dialect init, statement caches.
+        for _ in range(_CONCURRENCY):
+            await client.get(path, headers=headers)
+
+        done = asyncio.Event()
+        prober = asyncio.create_task(probe(done))
+        for _ in range(_ROUNDS):
+            await asyncio.gather(
+                *(timed(path, auth_ms, headers=headers) for _ in range(_CONCURRENCY))
+            )
+        done.set()
+        await prober
+    return auth_ms, ping_ms
+
+
+def _p99(samples: list[float]) -> float:
+    return statistics.quantiles(samples, n=100)[98]
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_async_auth_keeps_event_loop_responsive(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path}/load.db")
+    Base.metadata.create_all(engine)
+    bearer = _seed(engine)
+    app = _build_app(engine)
+
+    # Keep full collections of the test session's heap out of the timed
+    # windows — they land on whichever path allocates more, not on the DB.
+    gc.collect()
+    gc.freeze()
+    stop = threading.Event()
+    worker = threading.Thread(target=_worker_writes, args=(engine, stop), daemon=True)
+    worker.start()
+    try:
+        results = {path: asyncio.run(_drive(app, path, bearer)) for path in ("/before", "/after")}
+    finally:
+        stop.set()
+        worker.join()
+        gc.unfreeze()
+        engine.dispose()
+
+    before_auth, before_ping = results["/before"]
+    after_auth, after_ping = results["/after"]
+    print(
+        f"\n{_CONCURRENCY} concurrent bearer requests x {_ROUNDS} rounds, worker "
+        f"holding the write lock {_WORKER_LOCK_HOLD_S * 1000:.0f} ms at a time:\n"
+        f"  blocking Session: auth p50 {statistics.median(before_auth):.1f} ms "
+        f"p99 {_p99(before_auth):.1f} ms | ping p99 {_p99(before_ping):.1f} ms\n"
+        f"  AsyncSession:     auth p50 {statistics.median(after_auth):.1f} ms "
+        f"p99 {_p99(after_auth):.1f} ms | ping p99 {_p99(after_ping):.1f} ms"
+    )
+    # Wall-clock ratios vary with the host; the direction must not.
+    assert _p99(before_ping) > _p99(after_ping)
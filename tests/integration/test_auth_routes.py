@@ -22,6 +22,10 @@ Phase 15-02 additions (AUTH-06 — /auth/logout-all):
 15. logout-all invalidates the caller's existing JWT (token_version invariant)
 16. logout-all without auth returns 401 "Authentication required"
 
+Argon2 admission control:
+
+17. login while the hash pool is saturated — 503 + Retry-After, nothing queued
+
 Phase 19 Plan 10 fixture migration:
   - slim FastAPI app per test (auth_router only)
   - app.dependency_overrides[get_db] is the SOLE DB-binding seam — drives
@@ -54,9 +58,15 @@ from app.api import dependencies
 from app.api.auth_routes import auth_router
 from app.api.exception_handlers import (
     invalid_credentials_handler,
+    password_hasher_busy_handler,
     validation_error_handler,
 )
-from app.core.exceptions import InvalidCredentialsError, ValidationError
+from app.core import services as core_services
+from app.core.exceptions import (
+    InvalidCredentialsError,
+    PasswordHasherBusyError,
+    ValidationError,
+)
 from app.core.rate_limiter import limiter, rate_limit_handler
 from app.infrastructure.database.models import Base
 
@@ -479,3 +489,45 @@ def test_logout_all_requires_auth(
 
     assert response.status_code == 401
     assert response.json()["detail"] == "Authentication required"
+
+
+# ---------------------------------------------------------------
+# Argon2 admission control
+# ---------------------------------------------------------------
+
+
+@pytest.mark.integration
+def test_login_sheds_with_503_when_hash_pool_saturated(
+    auth_app: FastAPI, client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A full Argon2 pool answers 503 + Retry-After instead of queueing."""
+    import threading
+
+    from app.services.auth.password_pool import PasswordHashPool
+    from app.services.auth.password_service import PasswordService
+
+    auth_app.add_exception_handler(PasswordHasherBusyError, password_hasher_busy_handler)
+    _register(client, "busy@example.com")
+    pool = PasswordHashPool(workers=1, max_pending=1, retry_after_seconds=2)
+    monkeypatch.setattr(
+        core_services, "get_password_service", lambda: PasswordService(pool=pool)
+    )
+    release = threading.Event()
+    blocker = threading.Thread(target=pool.run, args=(release.wait,))
+    blocker.start()
+    try:
+        while pool.stats().pending < 1:
+            release.wait(0.001)
+        response = client.post(
+            "/auth/login",
+            json={"email": "busy@example.com", "password": "supersecret123"},
+        )
+    finally:
+        release.set()
+        blocker.join()
+        pool.shutdown()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "2"
+    assert response.json()["error"]["code"] == "PASSWORD_HASHER_BUSY"
+    assert pool.stats().rejected == 1
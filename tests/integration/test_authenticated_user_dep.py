@@ -346,11 +346,15 @@ class TestAuthenticatedUserDep:
 
     # 9
     def test_sliding_refresh_stamps_fresh_session_cookie(
-        self, client: TestClient
+        self, client: TestClient, jwt_secret: str
     ) -> None:
-        _seat_cookie_session(client, "sliding@example.com")
-        original_cookie = client.cookies.get("session")
-        assert original_cookie is not None
+        user_id = _seat_cookie_session(client, "sliding@example.com")
+        assert client.cookies.get("session") is not None
+        # One day left: inside the refresh threshold, so the slide is due.
+        client.cookies.set(
+            "session",
+            _forge_jwt(alg=JWT_HS256, user_id=user_id, secret=jwt_secret),
+        )
 
         response = client.get("/protected")
         assert response.status_code == 200, response.text
@@ -370,6 +374,35 @@ class TestAuthenticatedUserDep:
             session_set_cookie
         )
 
+    # 9b
+    def test_fresh_session_cookie_is_not_reissued(self, client: TestClient) -> None:
+        _seat_cookie_session(client, "fresh@example.com")
+        for _ in range(2):  # miss (loads the user), then snapshot-cache hit
+            response = client.get("/protected")
+            assert response.status_code == 200, response.text
+            assert not any(
+                h.startswith("session=") for h in response.headers.get_list("set-cookie")
+            )
+
+    # 9c
+    def test_logout_all_drops_cached_cookie_snapshot(
+        self,
+        app_and_factory: tuple[FastAPI, sessionmaker],
+        jwt_secret: str,
+    ) -> None:
+        app, _ = app_and_factory
+        seater = TestClient(app)
+        _seat_cookie_session(seater, "cached-ver@example.com")
+        old_cookie = seater.cookies.get("session")
+        assert seater.get("/protected").status_code == 200  # snapshot cached
+        csrf = seater.cookies.get("csrf_token")
+        response = seater.post("/auth/logout-all", headers={"X-CSRF-Token": csrf})
+        assert response.status_code == 204, response.text
+
+        replay = TestClient(app)
+        replay.cookies.set("session", old_cookie)
+        assert replay.get("/protected").status_code == 401
+
     # 10
     def test_optional_anonymous_returns_anonymous(
         self, client: TestClient
@@ -156,7 +156,7 @@ def app_and_container(
     ) -> None:  # noqa: ARG001
         return None
 
-    def _fake_download_from_url(self: Any, url: str) -> tuple[str, str]:  # noqa: ARG001
+    async def _fake_download_from_url(self: Any, url: str) -> tuple[str, str]:  # noqa: ARG001
         return "/tmp/fake.wav", "fake.wav"
 
     def _fake_process_audio_common(params: Any, *_args, **_kwargs) -> None:  # noqa: ARG001
@@ -0,0 +1,133 @@
+"""Benchmark: per-bucket vs batched FreeTierGate evaluation under concurrent submits.
+
+The gate charges three token buckets per transcription request (hourly,
+daily minutes, concurrency). Charged one at a time, each bucket costs a
+read plus a ``BEGIN IMMEDIATE`` re-read + commit — three exclusive write
+locks per request, all contending with every other submit. The batched
+``AsyncFreeTierGate.check`` reads the user's buckets in one query and
+commits all three under a single lock.
+
+This runs the same concurrent submits (distinct users, fresh
+request-scoped ``AsyncSession`` each) through both and compares
+per-submit latency.
+
+Gated behind the slow pytest marker — not part of the default `pytest`
+run. Invoke explicitly:
+    pytest -m slow tests/integration/test_free_tier_gate_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert
+
+from app.core.plan_tiers import policy_for
+from app.domain.entities.user import User
+from app.infrastructure.database.async_connection import async_session_factory
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.async_sqlalchemy_rate_limit_repository import (
+    AsyncSQLAlchemyRateLimitRepository,
+)
+from app.services.auth.rate_limit_service import AsyncRateLimitService
+from app.services.free_tier_gate import (
+    AsyncFreeTierGate,
+    _concurrency_charge,
+    _daily_minutes_charge,
+    _hourly_charge,
+)
+
+_CONCURRENCY = 16
+_ROUNDS = 15
+_MIN_SPEEDUP = 1.5
+
+Submit = Callable[[AsyncRateLimitService, User], Awaitable[None]]
+
+
+async def _per_bucket_check(service: AsyncRateLimitService, user: User) -> None:
+    """The pre-batch gate: one check_and_consume (read + locked upsert) per bucket."""
+    policy = policy_for(user.plan_tier)
+    user_id = int(user.id)  # type: ignore[arg-type]
+    for charge in (
+        _hourly_charge(user_id, policy),
+        _daily_minutes_charge(user_id, 120.0, policy),
+        _concurrency_charge(user_id, policy),
+    ):
+        request = charge.request
+        allowed = await service.check_and_consume(
+            request.bucket_key,
+            tokens_needed=request.tokens_needed,
+            rate=request.rate,
+            capacity=request.capacity,
+        )
+        assert allowed
+
+
+async def _batched_check(service: AsyncRateLimitService, user: User) -> None:
+    await AsyncFreeTierGate(service).check(
+        user=user, file_seconds=120.0, model="tiny", diarize=False
+    )
+
+
+async def _drive(engine: object, submit: Submit, first_user_id: int) -> list[float]:
+    factory = async_session_factory(engine)  # type: ignore[arg-type]
+    latencies: list[float] = []
+
+    async def one(user_id: int) -> None:
+        user = User(id=user_id, email=f"u{user_id}@x.com", password_hash="x", plan_tier="pro")
+        start = time.perf_counter()
+        async with factory() as session:
+            await submit(AsyncRateLimitService(AsyncSQLAlchemyRateLimitRepository(session)), user)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+
+    user_id = first_user_id
+    for _ in range(_ROUNDS):
+        await asyncio.gather(*(one(user_id + i) for i in range(_CONCURRENCY)))
+        user_id += _CONCURRENCY
+    return latencies
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_batched_gate_cuts_submit_latency(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path}/gate.db")
+    Base.metadata.create_all(engine)
+    per_run = _CONCURRENCY * _ROUNDS
+    with engine.begin() as conn:
+        conn.execute(
+            insert(ORMUser),
+            [
+                {"id": i, "email": f"u{i}@x.com", "password_hash": "x", "plan_tier": "pro"}
+                for i in range(1, 3 * per_run + 1)
+            ],
+        )
+
+    gc.collect()
+    gc.freeze()
+    try:
+        # Untimed warm-up run on its own users, then each path on fresh users.
+        asyncio.run(_drive(engine, _batched_check, 1))
+        legacy = asyncio.run(_drive(engine, _per_bucket_check, per_run + 1))
+        batched = asyncio.run(_drive(engine, _batched_check, 2 * per_run + 1))
+    finally:
+        gc.unfreeze()
+        engine.dispose()
+
+    def p99(samples: list[float]) -> float:
+        return statistics.quantiles(samples, n=100)[98]
+
+    print(
+        f"\n{_CONCURRENCY} concurrent submits x {_ROUNDS} rounds:\n"
+        f"  per-bucket (3 locks): p50 {statistics.median(legacy):6.1f} ms "
+        f"p99 {p99(legacy):6.1f} ms\n"
+        f"  batched    (1 lock):  p50 {statistics.median(batched):6.1f} ms "
+        f"p99 {p99(batched):6.1f} ms"
+    )
+    assert statistics.median(legacy) / statistics.median(batched) >= _MIN_SPEEDUP
@@ -0,0 +1,147 @@
+"""Microbenchmark: hot repository lookups via ``session.query`` vs prebuilt statements.
+
+Bearer auth (api-key prefix + user by id), rate-limit bucket reads and
+task-summary polling run on nearly every request. The legacy repositories
+built a fresh ``session.query(...)`` for each call and materialised ORM
+entities into the identity map; they now execute prebuilt Core
+``select()`` statements (``repositories.statements``) that return plain
+rows. This times both on a warm tmp-file SQLite database and asserts the
+combined per-request cost went down.
+
+Gated behind the slow pytest marker — not part of the default `pytest`
+run. Invoke explicitly:
+    pytest -m slow tests/integration/test_hot_query_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import gc
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infrastructure.database.mappers.api_key_mapper import to_domain as key_to_domain
+from app.infrastructure.database.mappers.rate_limit_bucket_mapper import (
+    to_domain as bucket_to_domain,
+)
+from app.infrastructure.database.mappers.task_mapper import to_domain_summary
+from app.infrastructure.database.mappers.user_mapper import to_domain as user_to_domain
+from app.infrastructure.database.models import ApiKey as ORMApiKey
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import RateLimitBucket as ORMBucket
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
+    SQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
+    SQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
+    SUMMARY_LOAD_OPTIONS,
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+
+_ITERATIONS = 2000
+_MIN_SPEEDUP = 1.3
+
+
+def _legacy_lookups(session: Session) -> Callable[[], None]:
+    """The pre-change repository bodies: Query builder + ORM entities."""
+
+    def run() -> None:
+        keys = (
+            session.query(ORMApiKey)
+            .filter(ORMApiKey.prefix == "abcd1234")
+            .filter(ORMApiKey.revoked_at.is_(None))
+            .all()
+        )
+        [key_to_domain(k) for k in keys]
+        user_to_domain(session.query(ORMUser).filter(ORMUser.id == 1).first())
+        bucket_to_domain(
+            session.query(ORMBucket).filter(ORMBucket.bucket_key == "user:1:tx:hour").first()
+        )
+        to_domain_summary(
+            session.query(ORMTask)
+            .filter(ORMTask.user_id == 1)
+            .options(*SUMMARY_LOAD_OPTIONS)
+            .filter(ORMTask.uuid == "task-1")
+            .first()
+        )
+        # Request-scoped sessions start with an empty identity map.
+        session.expunge_all()
+
+    return run
+
+
+def _statement_lookups(session: Session) -> Callable[[], None]:
+    keys = SQLAlchemyApiKeyRepository(session)
+    users = SQLAlchemyUserRepository(session)
+    buckets = SQLAlchemyRateLimitRepository(session)
+    tasks = SQLAlchemyTaskRepository(session)
+    tasks.set_user_scope(1)
+
+    def run() -> None:
+        keys.get_by_prefix("abcd1234")
+        users.get_by_id(1)
+        buckets.get_by_key("user:1:tx:hour")
+        tasks.get_summary_by_id("task-1")
+
+    return run
+
+
+def _us_per_call(run: Callable[[], None]) -> float:
+    for _ in range(200):
+        run()
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        run()
+    return (time.perf_counter() - start) / _ITERATIONS * 1e6
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_prebuilt_statements_beat_query_builder(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path}/hot.db")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(ORMUser(id=1, email="hot@example.com", password_hash="x"))
+        session.commit()
+        session.add_all(
+            [
+                ORMApiKey(id=1, user_id=1, name="live", prefix="abcd1234", hash="h1"),
+                ORMBucket(
+                    bucket_key="user:1:tx:hour", tokens=5,
+                    last_refill=datetime.now(timezone.utc),
+                ),
+                ORMTask(uuid="task-1", status="processing", task_type="transcription",
+                        user_id=1, progress_percentage=40),
+            ]
+        )
+        session.commit()
+
+    gc.collect()
+    gc.freeze()
+    try:
+        with sessionmaker(bind=engine)() as session:
+            legacy = _us_per_call(_legacy_lookups(session))
+            current = _us_per_call(_statement_lookups(session))
+    finally:
+        gc.unfreeze()
+        engine.dispose()
+
+    print(
+        f"\nkey prefix + user + rate bucket + task summary, {_ITERATIONS} iterations:\n"
+        f"  session.query + ORM entities: {legacy:7.1f} us/request\n"
+        f"  prebuilt select + rows:       {current:7.1f} us/request "
+        f"({legacy / current:.2f}x)"
+    )
+    assert legacy / current >= _MIN_SPEEDUP
@@ -41,8 +41,10 @@ from app.api.exception_handlers import (
     invalid_credentials_handler,
     validation_error_handler,
 )
-from app.api.task_api import task_router
+from app.api.task_api import task_result_link_router, task_router
 from app.api.ws_ticket_routes import ws_ticket_router
+from app.callbacks import signed_result_url
+from app.core.config import get_settings
 from app.core.exceptions import (
     InvalidCredentialsError,
     TaskNotFoundError,
@@ -54,6 +56,7 @@ from app.infrastructure.database.models import Task as ORMTask
 from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
 )
+from app.transcript_columnar import ColumnarTranscript
 
 
 # ---------------------------------------------------------------
@@ -111,6 +114,7 @@ def app_and_container(
     app.add_exception_handler(TaskNotFoundError, _task_not_found_handler)
     app.include_router(auth_router)
     app.include_router(task_router)
+    app.include_router(task_result_link_router)
     app.include_router(ws_ticket_router)
 
     def _override_get_db():
@@ -217,6 +221,73 @@ def test_get_all_tasks_returns_only_caller_tasks(
     assert a_uuids == {"alice-1", "alice-2", "alice-3"}
 
 
+@pytest.mark.integration
+def test_get_all_tasks_cursor_mode_pages_only_caller_tasks(
+    client: TestClient, session_factory
+) -> None:
+    """Cursor mode walks the caller's tasks page by page — no foreign rows."""
+    user_a = _register(client, "alice-cursor@example.com")
+    for i in range(5):
+        _insert_task(session_factory, user_id=user_a, uuid=f"alice-c{i}")
+    client.cookies.clear()
+    user_b = _register(client, "bob-cursor@example.com")
+    _insert_task(session_factory, user_id=user_b, uuid="bob-c0")
+    client.cookies.clear()
+    client.post(
+        "/auth/login",
+        json={"email": "alice-cursor@example.com", "password": "supersecret123"},
+    )
+
+    seen: list[str] = []
+    resp = client.get("/task/all", params={"pagination": "cursor", "page_size": 2})
+    while True:
+        assert resp.status_code == 200, resp.text
+        body = resp.json()
+        assert body["total"] == 5
+        seen.extend(t["identifier"] for t in body["tasks"])
+        if body["next_cursor"] is None:
+            break
+        resp = client.get(
+            "/task/all", params={"cursor": body["next_cursor"], "page_size": 2}
+        )
+
+    assert sorted(seen) == [f"alice-c{i}" for i in range(5)]
+    assert len(seen) == len(set(seen))
+
+
+@pytest.mark.integration
+def test_get_all_tasks_malformed_cursor_returns_422(client: TestClient) -> None:
+    """A tampered cursor is a validation error, not a 500."""
+    _register(client, "alice-badcursor@example.com")
+    resp = client.get("/task/all", params={"cursor": "not-a-cursor!"})
+    assert resp.status_code == 422
+
+
+@pytest.mark.integration
+def test_search_tasks_returns_only_caller_matches(
+    client: TestClient, session_factory
+) -> None:
+    """/task/search never surfaces another user's transcript."""
+    result = {"segments": [{"start": 3.0, "end": 4.5, "text": "secret roadmap"}]}
+    user_a = _register(client, "alice-search@example.com")
+    _insert_task(session_factory, user_id=user_a, uuid="alice-s1")
+    with session_factory() as session:
+        SQLAlchemyTaskRepository(session).update(
+            "alice-s1", {"status": "completed", "result": result}
+        )
+    resp_a = client.get("/task/search", params={"q": "roadmap"})
+    assert resp_a.status_code == 200, resp_a.text
+    [hit] = resp_a.json()["results"]
+    assert hit["identifier"] == "alice-s1"
+    assert hit["segments"][0]["start"] == 3.0
+
+    client.cookies.clear()
+    _register(client, "bob-search@example.com")
+    resp_b = client.get("/task/search", params={"q": "roadmap"})
+    assert resp_b.status_code == 200
+    assert resp_b.json()["results"] == []
+
+
 # ---------------------------------------------------------------
 # 2. GET /task/{id} cross-user → 404
 # ---------------------------------------------------------------
@@ -250,6 +321,127 @@ def test_get_task_by_id_own_returns_200(
     assert resp.status_code == 200
 
 
+@pytest.mark.integration
+def test_get_task_by_id_streams_stored_result(
+    client: TestClient, session_factory
+) -> None:
+    """GET /task/{id} returns the Result shape with the decompressed result."""
+    result = {"segments": [{"start": 0.0, "end": 1.0, "text": "Grüße"}]}
+    user_a = _register(client, "dave@example.com")
+    _insert_task(session_factory, user_id=user_a, uuid="dave-task")
+    with session_factory() as session:
+        SQLAlchemyTaskRepository(session).update(
+            "dave-task", {"status": "completed", "result": result}
+        )
+
+    resp = client.get("/task/dave-task")
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"] == "application/json"
+    body = resp.json()
+    assert list(body) == ["status", "result", "metadata", "error"]
+    assert body["status"] == "completed"
+    assert body["result"] == result
+    assert body["metadata"]["file_name"] == "audio.mp3"
+    assert body["error"] is None
+
+
+def _result_link(task_uuid: str, expires_at: int) -> str:
+    """Path + query of the signed callback result link (no host)."""
+    return signed_result_url(
+        task_uuid,
+        expires_at,
+        public_base_url="",
+        secret=get_settings().auth.JWT_SECRET.get_secret_value(),
+    )
+
+
+@pytest.mark.integration
+def test_callback_result_link_serves_result_without_session(
+    client: TestClient, session_factory
+) -> None:
+    """A signed reference-mode link needs no cookie or API key."""
+    result = {"segments": [{"start": 0.0, "end": 1.0, "text": "hello"}]}
+    user_a = _register(client, "frank@example.com")
+    _insert_task(session_factory, user_id=user_a, uuid="frank-task")
+    with session_factory() as session:
+        SQLAlchemyTaskRepository(session).update(
+            "frank-task", {"status": "completed", "result": result}
+        )
+    client.cookies.clear()
+
+    expires_at = int(datetime.now(timezone.utc).timestamp()) + 600
+    resp = client.get(_result_link("frank-task", expires_at))
+
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["status"] == "completed"
+    assert body["result"] == result
+    assert client.get("/task/frank-task").status_code == 401
+
+
+@pytest.mark.integration
+def test_callback_result_link_rejects_tampered_or_expired_links(
+    client: TestClient, session_factory
+) -> None:
+    """Forged, re-targeted and expired links get the unknown-task 404."""
+    user_a = _register(client, "grace@example.com")
+    _insert_task(session_factory, user_id=user_a, uuid="grace-task")
+    _insert_task(session_factory, user_id=user_a, uuid="grace-other")
+    client.cookies.clear()
+
+    now = int(datetime.now(timezone.utc).timestamp())
+    valid = _result_link("grace-task", now + 600)
+    retargeted = valid.replace("/task/grace-task/", "/task/grace-other/")
+    extended = valid.replace(f"expires={now + 600}", f"expires={now + 6000}")
+    expired = _result_link("grace-task", now - 1)
+
+    for link in (retargeted, extended, expired):
+        resp = client.get(link)
+        assert resp.status_code == 404, link
+        assert resp.json()["detail"] == "Task not found"
+    assert client.get(valid).status_code == 200
+
+
+@pytest.mark.integration
+def test_get_task_by_id_columnar_and_npz_formats(
+    client: TestClient, session_factory
+) -> None:
+    """?format=columnar returns parallel arrays; ?format=npz the archive."""
+    result = {
+        "segments": [
+            {"start": 0.0, "end": 1.0, "text": "hi there",
+             "words": [{"word": "hi", "start": 0.0, "end": 0.4, "score": 0.9},
+                       {"word": "there", "start": 0.5, "end": 1.0, "score": 0.8}]}
+        ]
+    }
+    user_a = _register(client, "erin@example.com")
+    _insert_task(session_factory, user_id=user_a, uuid="erin-task")
+
+    resp_pending = client.get("/task/erin-task", params={"format": "npz"})
+    assert resp_pending.status_code == 404
+
+    with session_factory() as session:
+        SQLAlchemyTaskRepository(session).update(
+            "erin-task", {"status": "completed", "result": result}
+        )
+
+    resp = client.get("/task/erin-task", params={"format": "columnar"})
+    assert resp.status_code == 200, resp.text
+    columnar = resp.json()["result"]
+    assert columnar["format"] == "columnar-v1"
+    assert columnar["strings"] == ["hi", "there"]
+    assert columnar["words"]["start"] == [0.0, 0.5]
+    assert columnar["segments"]["word_offsets"] == [0, 2]
+
+    resp_npz = client.get("/task/erin-task", params={"format": "npz"})
+    assert resp_npz.status_code == 200
+    assert resp_npz.headers["content-type"] == "application/octet-stream"
+    restored = ColumnarTranscript.from_npz(resp_npz.content)
+    assert list(restored.iter_segments()) == result["segments"]
+
+    assert client.get("/task/erin-task", params={"format": "xml"}).status_code == 422
+
+
 # ---------------------------------------------------------------
 # 3. DELETE /task/{id} cross-user → 404 + row preserved
 # ---------------------------------------------------------------
@@ -0,0 +1,84 @@
+"""Several worker processes share one slowapi limit through ``SQLiteLimitsStorage``.
+
+With slowapi's default ``memory://`` storage each uvicorn worker counts on
+its own, so N workers admit N times the limit. Here separate OS processes
+(one per simulated worker) hammer the same key on one limiter file at the
+same moment; the number of admitted hits across all of them must equal
+the limit exactly — no over-admission from interleaved read-count-insert.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+_WORKERS = 4
+_HITS_PER_WORKER = 40
+_LIMIT = 50
+
+_WORKER_SCRIPT = textwrap.dedent(
+    """
+    import os, sys, time
+    from pathlib import Path
+
+    from limits import parse
+    from limits.strategies import {strategy}
+
+    from app.infrastructure.rate_limit.sqlite_limits_storage import SQLiteLimitsStorage
+
+    uri, go_file, hits, limit = sys.argv[1], Path(sys.argv[2]), int(sys.argv[3]), sys.argv[4]
+    limiter = {strategy}(SQLiteLimitsStorage(uri, timeout=30))
+    item = parse(limit)
+    limiter.hit(parse("1000/hour"), "warm-up")  # open the connection before the race
+    (go_file.parent / f"ready-{{os.getpid()}}").touch()
+    while not go_file.exists():
+        time.sleep(0.005)
+    print(sum(limiter.hit(item, "203.0.113.0/24") for _ in range(hits)))
+    """
+)
+
+
+def _run_workers(tmp_path: Path, strategy: str) -> list[int]:
+    uri = f"sqlite:///{tmp_path}/limits.db"
+    go_file = tmp_path / "go"
+    script = _WORKER_SCRIPT.format(strategy=strategy)
+    workers: list[subprocess.Popen[str]] = []
+    # Start workers one at a time: importing ``app`` rewrites the uvicorn log
+    # config on disk, which concurrent imports would race on. The race under
+    # test starts at the shared ``go`` barrier, not at process start.
+    for ready in range(1, _WORKERS + 1):
+        workers.append(
+            subprocess.Popen(
+                [sys.executable, "-c", script, uri, str(go_file), str(_HITS_PER_WORKER),
+                 f"{_LIMIT}/hour"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=Path(__file__).resolve().parents[2],
+            )
+        )
+        deadline = time.monotonic() + 60
+        while len(list(tmp_path.glob("ready-*"))) < ready:
+            assert time.monotonic() < deadline, "worker never became ready"
+            assert workers[-1].poll() is None, workers[-1].communicate()[1]
+            time.sleep(0.01)
+    go_file.touch()
+    admitted = []
+    for worker in workers:
+        stdout, stderr = worker.communicate(timeout=60)
+        assert worker.returncode == 0, stderr
+        admitted.append(int(stdout.strip()))
+    return admitted
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("strategy", ["MovingWindowRateLimiter", "FixedWindowRateLimiter"])
+def test_workers_share_one_limit(tmp_path: Path, strategy: str) -> None:
+    admitted = _run_workers(tmp_path, strategy)
+    assert sum(admitted) == _LIMIT
+    assert _WORKERS * _HITS_PER_WORKER > _LIMIT
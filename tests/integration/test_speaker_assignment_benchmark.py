@@ -0,0 +1,91 @@
+"""Benchmark: speaker assignment on a synthetic 5-hour meeting.
+
+``whisperx.assign_word_speakers`` scans every diarization turn with pandas
+for every word and segment — O(words x turns). ``SpeakerTurnIndex`` sorts
+the turns once and answers queries with ``numpy.searchsorted``. whisperX
+takes over a minute on the full meeting, so it runs on a slice and its
+per-query cost is extrapolated; the engine always runs on all of it.
+
+Gated behind the slow pytest marker — not part of the default `pytest`
+run. Invoke explicitly:
+    pytest -m slow tests/integration/test_speaker_assignment_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+import time
+from typing import Any
+
+import pandas as pd
+import pytest
+from whisperx.diarize import assign_word_speakers as whisperx_assign_word_speakers
+
+from app.infrastructure.ml.speaker_interval_index import assign_word_speakers
+
+_MEETING_SECONDS = 5 * 3600
+_SPEAKERS = 6
+_WORDS_PER_SEGMENT = 12
+_REFERENCE_SEGMENTS = 150
+_MIN_SPEEDUP = 20.0
+
+
+def _meeting() -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Overlapping 1-20 s turns and ~0.35 s words across five hours."""
+    rng = random.Random(7)
+    turns = []
+    t = 0.0
+    while t < _MEETING_SECONDS:
+        length = rng.uniform(1.0, 20.0)
+        speaker = f"SPEAKER_{rng.randrange(_SPEAKERS):02d}"
+        turns.append({"start": t, "end": t + length, "speaker": speaker})
+        t += length * rng.uniform(0.8, 1.05)
+
+    segments = []
+    t = 0.0
+    while t < _MEETING_SECONDS:
+        words = []
+        first = t
+        for _ in range(_WORDS_PER_SEGMENT):
+            length = rng.uniform(0.1, 0.5)
+            words.append({"word": "w", "start": t, "end": t + length})
+            t += length + 0.05
+        segments.append({"start": first, "end": t, "text": "w", "words": words})
+        t += rng.uniform(0.0, 1.0)
+    return pd.DataFrame(turns), {"segments": segments}
+
+
+def _queries(transcript: dict[str, Any]) -> int:
+    return sum(1 + len(segment["words"]) for segment in transcript["segments"])
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.parametrize("fill_nearest", [False, True])
+def test_interval_index_beats_whisperx(fill_nearest: bool) -> None:
+    diarization, transcript = _meeting()
+    sample = {"segments": transcript["segments"][:_REFERENCE_SEGMENTS]}
+
+    reference_input = copy.deepcopy(sample)
+    start = time.perf_counter()
+    expected = whisperx_assign_word_speakers(
+        diarization.copy(), reference_input, fill_nearest=fill_nearest
+    )
+    reference_per_query = (time.perf_counter() - start) / _queries(sample)
+    assert assign_word_speakers(
+        diarization, copy.deepcopy(sample), fill_nearest=fill_nearest
+    ) == expected
+
+    full_input = copy.deepcopy(transcript)
+    start = time.perf_counter()
+    assign_word_speakers(diarization, full_input, fill_nearest=fill_nearest)
+    engine_s = time.perf_counter() - start
+    projected_s = reference_per_query * _queries(transcript)
+
+    print(
+        f"\n{len(diarization)} turns, {_queries(transcript)} words+segments "
+        f"(fill_nearest={fill_nearest}): whisperX ~{projected_s:.1f} s (projected), "
+        f"interval index {engine_s * 1000:.0f} ms ({projected_s / engine_s:.0f}x)"
+    )
+    assert projected_s / engine_s >= _MIN_SPEEDUP
@@ -0,0 +1,222 @@
+"""SQLite performance profile: pragma checks + mixed read/write concurrency benchmark.
+
+The pragma tests run by default and assert that every new connection picks
+up the DatabaseSettings.SQLITE_* profile from the connect listener.
+
+The concurrency benchmark is gated behind the slow pytest marker — not part
+of the default `pytest` run. It drives worker-style progress updates,
+BEGIN IMMEDIATE rate-limit upserts and API-style reads from parallel
+threads, once under the legacy rollback-journal settings and once under
+the configured profile. Invoke explicitly:
+    pytest -m slow tests/integration/test_sqlite_profile_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import DatabaseSettings, get_settings
+from app.core.exceptions import DatabaseOperationError
+from app.infrastructure.database.connection import build_sqlite_pragmas
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
+    SQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+_TASKS = 200
+_WRITERS = 4
+_LIMITERS = 2
+_READERS = 8
+_DURATION_S = 5.0
+
+# Pre-profile behaviour: rollback journal, FULL sync, pysqlite's 5s busy wait.
+_LEGACY_PRAGMAS = (
+    "PRAGMA journal_mode = DELETE",
+    "PRAGMA synchronous = FULL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 0",
+    "PRAGMA temp_store = DEFAULT",
+    "PRAGMA cache_size = -2000",
+)
+
+
+def _make_engine(db_path: Path, pragmas: tuple[str, ...] | None = None) -> Engine:
+    """File-backed engine; ``pragmas`` override the global profile when given."""
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    if pragmas is not None:
+
+        @event.listens_for(engine, "connect")
+        def _override(dbapi_connection: Any, _record: Any) -> None:
+            for pragma in pragmas:
+                dbapi_connection.execute(pragma)
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _seed(engine: Engine) -> None:
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(ORMUser),
+            [{"id": 1, "email": "bench@example.com", "password_hash": "x",
+              "created_at": now, "updated_at": now}],
+        )
+        conn.execute(
+            insert(ORMTask),
+            [
+                {
+                    "uuid": f"bench-{i:05d}",
+                    "status": "processing",
+                    "task_type": "full_process",
+                    "user_id": 1,
+                    "result": {"segments": [{"text": "x" * 200}] * 20},
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(_TASKS)
+            ],
+        )
+
+
+def _run_mixed_load(engine: Engine) -> dict[str, float]:
+    """Run writers, rate-limit upserters and readers in parallel for _DURATION_S."""
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    stop = threading.Event()
+    lock = threading.Lock()
+    stats = {"writes": 0.0, "upserts": 0.0, "reads": 0.0, "locked": 0.0}
+    read_ms: list[float] = []
+
+    def loop(name: str, op: Callable[[Any, int], None]) -> None:
+        session = Session()
+        i = 0
+        try:
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                try:
+                    op(session, i)
+                except (OperationalError, DatabaseOperationError) as e:
+                    session.rollback()
+                    if "locked" not in str(e):
+                        raise
+                    with lock:
+                        stats["locked"] += 1
+                    continue
+                elapsed = (time.perf_counter() - t0) * 1000.0
+                with lock:
+                    stats[name] += 1
+                    if name == "reads":
+                        read_ms.append(elapsed)
+                i += 1
+        finally:
+            session.close()
+
+    def write(session: Any, i: int) -> None:
+        SQLAlchemyTaskRepository(session).update(
+            f"bench-{i % _TASKS:05d}", {"progress_percentage": i % 100}
+        )
+
+    def upsert(session: Any, i: int) -> None:
+        SQLAlchemyRateLimitRepository(session).upsert_atomic(
+            f"user:1:{i % 3}", {"tokens": i % 10, "last_refill": datetime.now(timezone.utc)}
+        )
+
+    def read(session: Any, i: int) -> None:
+        repo = SQLAlchemyTaskRepository(session)
+        repo.set_user_scope(1)
+        repo.get_by_id(f"bench-{i % _TASKS:05d}")
+        repo.list_paginated(q=None, status=None, offset=0, limit=20)
+        session.rollback()  # end the read transaction like a request would
+
+    threads = (
+        [threading.Thread(target=loop, args=("writes", write)) for _ in range(_WRITERS)]
+        + [threading.Thread(target=loop, args=("upserts", upsert)) for _ in range(_LIMITERS)]
+        + [threading.Thread(target=loop, args=("reads", read)) for _ in range(_READERS)]
+    )
+    for t in threads:
+        t.start()
+    time.sleep(_DURATION_S)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    read_ms.sort()
+    stats["read_p99_ms"] = read_ms[int(len(read_ms) * 0.99) - 1] if read_ms else float("inf")
+    return stats
+
+
+@pytest.mark.integration
+class TestSqliteProfilePragmas:
+    """Every new connection carries the configured SQLite profile."""
+
+    def test_build_sqlite_pragmas_renders_cache_size_in_kib(self) -> None:
+        settings = DatabaseSettings(SQLITE_CACHE_SIZE_KIB=1024)
+        pragmas = build_sqlite_pragmas(settings)
+        assert pragmas[0] == "PRAGMA journal_mode = WAL"
+        assert "PRAGMA cache_size = -1024" in pragmas
+
+    def test_build_sqlite_pragmas_omits_zero_cache_size(self) -> None:
+        pragmas = build_sqlite_pragmas(DatabaseSettings(SQLITE_CACHE_SIZE_KIB=0))
+        assert not any("cache_size" in p for p in pragmas)
+
+    def test_new_file_connection_uses_profile(self, tmp_path: Path) -> None:
+        settings = get_settings().database
+        engine = _make_engine(tmp_path / "profile.db")
+        try:
+            with engine.connect() as conn:
+                journal = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+                busy = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+                mmap = conn.exec_driver_sql("PRAGMA mmap_size").scalar()
+                temp_store = conn.exec_driver_sql("PRAGMA temp_store").scalar()
+        finally:
+            engine.dispose()
+        assert str(journal).upper() == settings.SQLITE_JOURNAL_MODE
+        assert busy == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert mmap == settings.SQLITE_MMAP_SIZE
+        assert temp_store == 2  # MEMORY
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+class TestSqliteProfileBenchmark:
+    """Mixed read/write load: the profile removes lock errors and read stalls."""
+
+    def test_mixed_read_write_concurrency(self, tmp_path: Path) -> None:
+        legacy_engine = _make_engine(tmp_path / "legacy.db", _LEGACY_PRAGMAS)
+        _seed(legacy_engine)
+        legacy = _run_mixed_load(legacy_engine)
+        legacy_engine.dispose()
+
+        profile_engine = _make_engine(tmp_path / "profile.db")
+        _seed(profile_engine)
+        profile = _run_mixed_load(profile_engine)
+        profile_engine.dispose()
+
+        for label, stats in (("legacy ", legacy), ("profile", profile)):
+            print(
+                f"{label} writes={stats['writes']:.0f} upserts={stats['upserts']:.0f} "
+                f"reads={stats['reads']:.0f} locked={stats['locked']:.0f} "
+                f"read_p99={stats['read_p99_ms']:.1f}ms"
+            )
+
+        assert profile["locked"] == 0, f"profile hit {profile['locked']:.0f} lock errors"
+        assert profile["reads"] > 0 and profile["writes"] > 0
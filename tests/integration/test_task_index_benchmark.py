@@ -0,0 +1,188 @@
+"""Benchmark: tasks hot-path latency at 10k / 100k / 1M rows (0004 indexes).
+
+The query-plan tests run by default and assert that get_by_id / update /
+list_paginated resolve through the 0004 indexes instead of a table scan.
+
+The latency benchmark is gated behind the slow pytest marker — not part of
+the default `pytest` run. Invoke explicitly:
+    pytest -m slow tests/integration/test_task_index_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+_USERS = 20
+_SAMPLES = 200
+_INSERT_BATCH = 50_000
+_BUDGET_MS = 50.0  # update includes a COMMIT (fsync) per call
+_STATUSES = ("pending", "processing", "completed", "failed")
+
+
+def _make_engine(db_path: Path) -> Engine:
+    """Create a file-backed SQLite engine with the ORM schema (incl. indexes)."""
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _seed(engine: Engine, n_rows: int) -> None:
+    """Insert _USERS users and ``n_rows`` tasks spread round-robin across them."""
+    now = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(ORMUser),
+            [
+                {
+                    "id": uid,
+                    "email": f"bench{uid}@example.com",
+                    "password_hash": "x",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for uid in range(1, _USERS + 1)
+            ],
+        )
+        for start in range(0, n_rows, _INSERT_BATCH):
+            conn.execute(
+                insert(ORMTask),
+                [
+                    {
+                        "uuid": f"bench-{i:08d}",
+                        "status": _STATUSES[i % len(_STATUSES)],
+                        "task_type": "full_process",
+                        "file_name": f"file-{i}.mp3",
+                        "user_id": (i % _USERS) + 1,
+                        "created_at": now - timedelta(seconds=n_rows - i),
+                        "updated_at": now,
+                        "progress_percentage": 0,
+                    }
+                    for i in range(start, min(start + _INSERT_BATCH, n_rows))
+                ],
+            )
+
+
+def _query_plan(engine: Engine, sql: str, params: dict[str, object]) -> str:
+    """Return the SQLite EXPLAIN QUERY PLAN detail text for ``sql``."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).all()
+    return " | ".join(str(row[-1]) for row in rows)
+
+
+def _p99_ms(op: Callable[[int], object]) -> tuple[float, float]:
+    """Run ``op`` _SAMPLES times; return (median_ms, p99_ms)."""
+    durations_ms: list[float] = []
+    for i in range(_SAMPLES):
+        t0 = time.perf_counter()
+        op(i)
+        durations_ms.append((time.perf_counter() - t0) * 1000.0)
+    durations_ms.sort()
+    return statistics.median(durations_ms), durations_ms[int(_SAMPLES * 0.99) - 1]
+
+
+@pytest.mark.integration
+class TestTaskIndexQueryPlans:
+    """The hot-path predicates resolve through the 0004 indexes."""
+
+    @pytest.fixture
+    def engine(self, tmp_path: Path):
+        engine = _make_engine(tmp_path / "plans.db")
+        _seed(engine, 1_000)
+        yield engine
+        engine.dispose()
+
+    def test_uuid_lookup_uses_unique_index(self, engine: Engine) -> None:
+        plan = _query_plan(
+            engine,
+            "SELECT * FROM tasks WHERE uuid = :uuid AND user_id = :uid",
+            {"uuid": "bench-00000001", "uid": 2},
+        )
+        assert "idx_tasks_uuid" in plan, plan
+
+    def test_scoped_listing_uses_created_at_index_without_sort(
+        self, engine: Engine
+    ) -> None:
+        plan = _query_plan(
+            engine,
+            "SELECT * FROM tasks WHERE user_id = :uid "
+            "ORDER BY created_at DESC LIMIT 50 OFFSET 0",
+            {"uid": 3},
+        )
+        assert "idx_tasks_user_id_created_at" in plan, plan
+        assert "TEMP B-TREE" not in plan, f"ORDER BY not served by index: {plan}"
+
+    def test_scoped_status_count_uses_status_index(self, engine: Engine) -> None:
+        plan = _query_plan(
+            engine,
+            "SELECT COUNT(*) FROM tasks WHERE user_id = :uid AND status = :status",
+            {"uid": 3, "status": "completed"},
+        )
+        assert "idx_tasks_user_id_status" in plan, plan
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+class TestTaskIndexBenchmark:
+    """get_by_id / update / list_paginated p99 stays flat as the table grows."""
+
+    @pytest.mark.parametrize("n_rows", [10_000, 100_000, 1_000_000])
+    def test_hot_path_latency(self, tmp_path: Path, n_rows: int) -> None:
+        engine = _make_engine(tmp_path / f"bench_{n_rows}.db")
+        _seed(engine, n_rows)
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        repo = SQLAlchemyTaskRepository(session)
+        step = max(n_rows // _SAMPLES, 1)
+
+        def uuid_for(i: int) -> str:
+            return f"bench-{(i * step) % n_rows:08d}"
+
+        def owner_of(i: int) -> int:
+            return ((i * step) % n_rows) % _USERS + 1
+
+        def get_by_id(i: int) -> object:
+            repo.set_user_scope(owner_of(i))
+            return repo.get_by_id(uuid_for(i))
+
+        def update(i: int) -> object:
+            repo.set_user_scope(owner_of(i))
+            repo.update(uuid_for(i), {"progress_percentage": i % 100})
+            return None
+
+        def list_paginated(i: int) -> object:
+            repo.set_user_scope((i % _USERS) + 1)
+            return repo.list_paginated(q=None, status=None, offset=0, limit=50)
+
+        results = {
+            "get_by_id": _p99_ms(get_by_id),
+            "update": _p99_ms(update),
+            "list_paginated": _p99_ms(list_paginated),
+        }
+        session.close()
+        engine.dispose()
+
+        for name, (median, p99) in results.items():
+            print(f"rows={n_rows:>9,} {name:<15} median={median:7.3f}ms p99={p99:7.3f}ms")
+        for name, (_median, p99) in results.items():
+            assert p99 < _BUDGET_MS, (
+                f"{name} p99={p99:.1f}ms at {n_rows:,} rows exceeded "
+                f"{_BUDGET_MS:.0f}ms budget"
+            )
@@ -0,0 +1,90 @@
+"""Benchmark: filtering aligned transcripts — pydantic vs dict fast path.
+
+``process_audio_common`` used to validate the aligner output into
+``AlignedTranscription``, rebuild every segment in
+``filter_aligned_transcription`` and ``model_dump()`` it back to dicts.
+``filter_aligned_result`` does the same filtering in one pass over the
+dicts; ``ColumnarTranscript.without_incomplete_words`` does it with NumPy
+masks on the columnar form.
+
+Gated behind the slow pytest marker — not part of the default `pytest`
+run. Invoke explicitly:
+    pytest -m slow tests/integration/test_transcript_filter_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from app.schemas import AlignedTranscription
+from app.transcript import filter_aligned_result, filter_aligned_transcription
+from app.transcript_columnar import ColumnarTranscript
+
+# ~3 hours of speech at ~150 words per minute.
+_WORDS = 27_000
+_WORDS_PER_SEGMENT = 15
+_ROUNDS = 5
+_MIN_SPEEDUP = 3.0
+
+
+def _aligned_output(n_words: int) -> dict[str, Any]:
+    """Synthetic aligner output; ~2% of words lack timings (numbers, symbols)."""
+    rng = random.Random(42)
+    segments = []
+    t = 0.0
+    for first in range(0, n_words, _WORDS_PER_SEGMENT):
+        words = []
+        for i in range(first, min(first + _WORDS_PER_SEGMENT, n_words)):
+            if rng.random() < 0.02:
+                words.append({"word": str(i)})
+            else:
+                words.append(
+                    {"word": f"word{i % 500}", "start": round(t, 3),
+                     "end": round(t + 0.3, 3), "score": round(rng.random(), 3)}
+                )
+            t += 0.4
+        segments.append(
+            {"start": words[0].get("start", t), "end": round(t, 3),
+             "text": " ".join(w["word"] for w in words), "words": words}
+        )
+    return {"segments": segments, "word_segments": []}
+
+
+def _pydantic_path(aligned: dict[str, Any]) -> dict[str, Any]:
+    return filter_aligned_transcription(AlignedTranscription(**aligned)).model_dump()
+
+
+def _median_seconds(fn: Callable[[], object]) -> float:
+    samples = []
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+def test_dict_fast_path_beats_pydantic_round_trip() -> None:
+    aligned = _aligned_output(_WORDS)
+    assert filter_aligned_result(aligned) == _pydantic_path(aligned)
+
+    pydantic_s = _median_seconds(lambda: _pydantic_path(aligned))
+    fast_s = _median_seconds(lambda: filter_aligned_result(aligned))
+    columnar = ColumnarTranscript.from_result(aligned)
+    convert_s = _median_seconds(lambda: ColumnarTranscript.from_result(aligned))
+    vector_s = _median_seconds(columnar.without_incomplete_words)
+
+    print(
+        f"\n{_WORDS} words: pydantic {pydantic_s * 1000:.1f} ms, "
+        f"dict fast path {fast_s * 1000:.1f} ms "
+        f"({pydantic_s / fast_s:.1f}x), columnar convert {convert_s * 1000:.1f} ms "
+        f"+ mask {vector_s * 1000:.2f} ms"
+    )
+    assert pydantic_s / fast_s >= _MIN_SPEEDUP
@@ -0,0 +1,248 @@
+"""Integration tests for the TUS upload router and its concatenation route.
+
+Drives the real ``tus_upload_router`` (tuspyserver + ``FinalConcatRoute``)
+through a slim FastAPI app. Verifies:
+
+  * only ``Upload-Concat: final;`` POSTs reach ``create_final_concat_upload``;
+    plain and ``partial`` creations still go to tuspyserver
+  * a finished plain upload fires the transcription hook; finished
+    ``partial`` uploads do not (``_is_partial_upload``)
+  * final concatenation assembles partials in header order, deletes them
+    and fires the hook exactly once, on the assembled file
+  * final-concat errors: 400 (incomplete / not partial / bad list),
+    404 (unknown id), 412 (protocol version), 413 (assembled size)
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import tus_upload_api
+from app.api.dependencies import get_scoped_task_repository
+from app.api.tus_upload_api import TUS_UPLOAD_DIR, TUS_VERSION, tus_upload_router
+from app.services.upload_session_service import UploadSessionService
+
+_FILES = "/uploads/files/"
+
+
+class _HookRecorder:
+    """Records what UploadSessionService.start_transcription was called with."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any], bytes]] = []
+
+
+@pytest.fixture
+def hook(monkeypatch: pytest.MonkeyPatch) -> _HookRecorder:
+    recorder = _HookRecorder()
+
+    async def start_transcription(
+        service: UploadSessionService,
+        file_path: str,
+        metadata: dict[str, Any],
+        background_tasks: BackgroundTasks,
+    ) -> None:
+        recorder.calls.append((file_path, metadata, Path(file_path).read_bytes()))
+
+    monkeypatch.setattr(UploadSessionService, "start_transcription", start_transcription)
+    return recorder
+
+
+@pytest.fixture
+def concat_calls(monkeypatch: pytest.MonkeyPatch) -> list[list[Path]]:
+    """Spy on concatenate_files: non-empty only if the final-concat route ran."""
+    calls: list[list[Path]] = []
+    real = tus_upload_api.concatenate_files
+
+    def spy(destination: Path, sources: list[Path]) -> int:
+        calls.append(list(sources))
+        return real(destination, sources)
+
+    monkeypatch.setattr(tus_upload_api, "concatenate_files", spy)
+    return calls
+
+
+@pytest.fixture
+def client(hook: _HookRecorder) -> Generator[TestClient, None, None]:
+    TUS_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    before = set(TUS_UPLOAD_DIR.rglob("*"))
+    app = FastAPI()
+    app.include_router(tus_upload_router)
+    app.dependency_overrides[get_scoped_task_repository] = lambda: object()
+    try:
+        yield TestClient(app)
+    finally:
+        created = set(TUS_UPLOAD_DIR.rglob("*")) - before
+        for path in sorted(created, key=lambda p: len(p.parts), reverse=True):
+            if path.is_dir():
+                path.rmdir()
+            else:
+                path.unlink(missing_ok=True)
+
+
+def _metadata(**values: str) -> str:
+    return ",".join(
+        f"{key} {base64.b64encode(value.encode()).decode()}" for key, value in values.items()
+    )
+
+
+def _create(client: TestClient, length: int, *, concat: str | None = None) -> str:
+    headers = {
+        "Tus-Resumable": TUS_VERSION,
+        "Upload-Length": str(length),
+        "Upload-Metadata": _metadata(filename="talk.mp3"),
+    }
+    if concat is not None:
+        headers["Upload-Concat"] = concat
+    response = client.post(_FILES, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.headers["Location"]
+
+
+def _patch(client: TestClient, location: str, data: bytes, offset: int = 0) -> None:
+    response = client.patch(
+        location,
+        content=data,
+        headers={
+            "Tus-Resumable": TUS_VERSION,
+            "Upload-Offset": str(offset),
+            "Content-Type": "application/offset+octet-stream",
+        },
+    )
+    assert response.status_code == 204, response.text
+
+
+def _upload_partial(client: TestClient, data: bytes) -> str:
+    location = _create(client, len(data), concat="partial")
+    _patch(client, location, data)
+    return location
+
+
+def _final(client: TestClient, *locations: str, **headers: str) -> Any:
+    return client.post(
+        _FILES,
+        headers={
+            "Tus-Resumable": TUS_VERSION,
+            "Upload-Concat": "final;" + " ".join(locations),
+            "Upload-Metadata": _metadata(filename="talk.mp3", language="en"),
+            **headers,
+        },
+    )
+
+
+def _uid(location: str) -> str:
+    return location.rstrip("/").rsplit("/", 1)[-1]
+
+
+@pytest.mark.integration
+class TestTusRouting:
+    def test_plain_upload_reaches_tuspyserver_and_fires_hook(
+        self, client: TestClient, hook: _HookRecorder, concat_calls: list[list[Path]]
+    ) -> None:
+        location = _create(client, 6)
+        _patch(client, location, b"abc")
+        assert hook.calls == []
+
+        _patch(client, location, b"def", offset=3)
+
+        assert concat_calls == []
+        [(file_path, metadata, body)] = hook.calls
+        assert Path(file_path).name == _uid(location)
+        assert metadata == {"filename": "talk.mp3"}
+        assert body == b"abcdef"
+
+    def test_finished_partials_do_not_fire_hook(
+        self, client: TestClient, hook: _HookRecorder, concat_calls: list[list[Path]]
+    ) -> None:
+        _upload_partial(client, b"first")
+        _upload_partial(client, b"second")
+
+        assert concat_calls == []
+        assert hook.calls == []
+
+    def test_final_concat_assembles_in_header_order_and_fires_hook_once(
+        self, client: TestClient, hook: _HookRecorder, concat_calls: list[list[Path]]
+    ) -> None:
+        parts = [os.urandom(2048), b"middle", os.urandom(10)]
+        locations = [_upload_partial(client, part) for part in parts]
+        ordered = [locations[2], locations[0], locations[1]]
+
+        response = _final(client, *ordered)
+
+        assert response.status_code == 201, response.text
+        assert response.headers["Tus-Resumable"] == TUS_VERSION
+        assert [p.name for p in concat_calls[0]] == [_uid(loc) for loc in ordered]
+        [(file_path, metadata, body)] = hook.calls
+        assert Path(file_path).name == _uid(response.headers["Location"])
+        assert metadata == {"filename": "talk.mp3", "language": "en"}
+        assert body == parts[2] + parts[0] + parts[1]
+        for location in locations:  # partials are consumed
+            assert not (TUS_UPLOAD_DIR / _uid(location)).exists()
+
+
+@pytest.mark.integration
+class TestFinalConcatErrors:
+    def test_incomplete_partial_is_rejected(
+        self, client: TestClient, hook: _HookRecorder
+    ) -> None:
+        location = _create(client, 10, concat="partial")
+        _patch(client, location, b"12345")
+
+        response = _final(client, location)
+
+        assert response.status_code == 400
+        assert "not complete" in response.json()["detail"]
+        assert hook.calls == []
+
+    def test_non_partial_upload_is_rejected(
+        self, client: TestClient, hook: _HookRecorder
+    ) -> None:
+        location = _create(client, 3)
+        _patch(client, location, b"abc")
+        hook.calls.clear()
+
+        response = _final(client, location)
+
+        assert response.status_code == 400
+        assert "not a partial upload" in response.json()["detail"]
+        assert hook.calls == []
+
+    def test_malformed_partial_list_is_rejected(self, client: TestClient) -> None:
+        response = _final(client, "/uploads/files/../../etc/passwd")
+        assert response.status_code == 400
+
+    def test_unknown_partial_is_404(self, client: TestClient) -> None:
+        response = _final(client, f"{_FILES}{'0' * 32}")
+        assert response.status_code == 404
+
+    def test_wrong_protocol_version_is_412(self, client: TestClient) -> None:
+        location = _upload_partial(client, b"abc")
+
+        response = _final(client, location, **{"Tus-Resumable": "0.2.0"})
+
+        assert response.status_code == 412
+        assert response.headers["Tus-Version"] == TUS_VERSION
+
+    def test_assembled_size_over_limit_is_413(
+        self,
+        client: TestClient,
+        hook: _HookRecorder,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        locations = [_upload_partial(client, b"x" * 6) for _ in range(2)]
+        monkeypatch.setattr(tus_upload_api, "MAX_FILE_SIZE", 10)
+
+        response = _final(client, *locations)
+
+        assert response.status_code == 413
+        assert hook.calls == []
+        for location in locations:  # nothing consumed on rejection
+            assert (TUS_UPLOAD_DIR / _uid(location)).exists()
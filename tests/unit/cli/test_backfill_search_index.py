@@ -0,0 +1,157 @@
+"""Unit tests for `python -m app.cli backfill-search-index`.
+
+Runs the command in-process via Typer's CliRunner against a tmp SQLite
+file (``_get_container`` patched to hand it out). Coverage:
+  0. Non-SQLite database → exit 1 before any query
+  1. Missing tasks_fts → exit 1 with a migrate hint
+  2. No completed tasks → exit 0 "No completed tasks", nothing written
+  3. --dry-run → exit 0 "Would index N", nothing written
+  4. Real run → completed tasks searchable; pending ones skipped; idempotent
+  5. Results stored compressed in task_results are decompressed and indexed
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from typer.testing import CliRunner
+
+from app.cli import app
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.result_store import StoredResult
+
+_SEED_SQL = (
+    (
+        "INSERT INTO users (id, email, password_hash, created_at, updated_at) "
+        "VALUES (1, 'a@example.com', 'x', '2026-01-01', '2026-01-01')"
+    ),
+    (
+        "INSERT INTO tasks (id, uuid, status, task_type, user_id, file_name, result, "
+        "created_at, updated_at) VALUES "
+        "(1, 'done-1', 'completed', 't', 1, 'interview.mp3', "
+        "'{\"segments\": [{\"start\": 1.0, \"end\": 2.0, \"text\": \"quarterly numbers\"}]}', "
+        "'2026-01-01', '2026-01-01'), "
+        "(2, 'pending-1', 'processing', 't', 1, 'later.mp3', NULL, "
+        "'2026-01-01', '2026-01-01')"
+    ),
+)
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    return CliRunner()
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'cli_fts.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def _run(runner: CliRunner, engine: Engine, *args: str):
+    container = MagicMock()
+    container.db_engine.return_value = engine
+    with patch(
+        "app.cli.commands.backfill_search_index._get_container",
+        return_value=container,
+    ):
+        return runner.invoke(app, ["backfill-search-index", *args])
+
+
+def _fts_count(engine: Engine, match: str | None = None) -> int:
+    sql = "SELECT COUNT(*) FROM tasks_fts"
+    if match is not None:
+        sql += f" WHERE tasks_fts MATCH '{match}'"
+    with engine.connect() as conn:
+        return conn.execute(text(sql)).scalar_one()
+
+
+def _seed(engine: Engine) -> None:
+    with engine.begin() as conn:
+        for sql in _SEED_SQL:
+            conn.execute(text(sql))
+
+
+@pytest.mark.unit
+def test_non_sqlite_database_exits_1(runner: CliRunner) -> None:
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+
+    result = _run(runner, engine)
+
+    assert result.exit_code == 1
+    assert "only maintained on SQLite" in result.stderr
+    engine.connect.assert_not_called()
+
+
+@pytest.mark.unit
+def test_missing_fts_table_exits_1(runner: CliRunner, engine: Engine) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE tasks_fts"))
+    result = _run(runner, engine)
+    assert result.exit_code == 1
+    assert "alembic upgrade head" in result.stderr
+
+
+@pytest.mark.unit
+def test_no_completed_tasks_is_a_noop(runner: CliRunner, engine: Engine) -> None:
+    result = _run(runner, engine)
+    assert result.exit_code == 0, result.output
+    assert "No completed tasks to index." in result.stdout
+
+
+@pytest.mark.unit
+def test_dry_run_writes_nothing(runner: CliRunner, engine: Engine) -> None:
+    _seed(engine)
+    result = _run(runner, engine, "--dry-run")
+    assert result.exit_code == 0, result.output
+    assert "Would index 1 completed tasks" in result.stdout
+    assert _fts_count(engine) == 0
+
+
+@pytest.mark.unit
+def test_backfill_indexes_completed_tasks_idempotently(
+    runner: CliRunner, engine: Engine
+) -> None:
+    _seed(engine)
+    for _ in range(2):
+        result = _run(runner, engine, "--batch-size", "1")
+        assert result.exit_code == 0, result.output
+        assert "Indexed 1 tasks (1 transcript segments)." in result.stdout
+
+    assert _fts_count(engine, "quarterly") == 1
+    assert _fts_count(engine, "interview") == 1
+    assert _fts_count(engine, "later") == 0
+    assert _fts_count(engine) == 2  # file-name row + one segment
+
+
+@pytest.mark.unit
+def test_backfill_reads_compressed_results(runner: CliRunner, engine: Engine) -> None:
+    _seed(engine)
+    stored = StoredResult.encode(
+        {"segments": [{"start": 0.0, "end": 1.0, "text": "compressed minutes"}]}
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO task_results (task_id, codec, raw_size, data) "
+                "VALUES (1, :codec, :raw_size, :data)"
+            ),
+            {"codec": stored.codec, "raw_size": stored.raw_size, "data": stored.data},
+        )
+        conn.execute(
+            text("UPDATE tasks SET result = NULL, result_size = :n WHERE id = 1"),
+            {"n": stored.raw_size},
+        )
+
+    result = _run(runner, engine)
+    assert result.exit_code == 0, result.output
+    assert _fts_count(engine, "minutes") == 1
+    assert _fts_count(engine, "quarterly") == 0
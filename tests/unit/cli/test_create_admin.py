@@ -127,3 +127,15 @@ def test_weak_password_exits_one(
     assert result.exit_code == 1
     combined = (result.stderr or "") + (result.stdout or "")
     assert "too short" in combined or "weak" in combined.lower()
+
+
+def test_cli_auth_service_hashes_inline() -> None:
+    """The CLI never shares the request path's bounded Argon2 pool."""
+    from app.cli._helpers import _build_auth_service
+
+    with patch("app.core.services.get_password_hash_pool") as pool:
+        service = _build_auth_service()
+        hashed = service.password_service.hash_password("pw-correct-12345")
+
+    pool.assert_not_called()
+    assert service.password_service.verify_password("pw-correct-12345", hashed)
@@ -3,6 +3,9 @@
 import os
 from unittest.mock import patch
 
+import pytest
+from pydantic import ValidationError
+
 from app.core.config import (
     DatabaseSettings,
     LoggingSettings,
@@ -39,6 +42,20 @@ class TestDatabaseSettings:
             assert settings.DB_URL == "postgresql://localhost/test"
             assert settings.DB_ECHO is True
 
+    def test_sqlite_profile_defaults(self) -> None:
+        """Test that the SQLite performance profile defaults to WAL + NORMAL."""
+        settings = DatabaseSettings()
+        assert settings.SQLITE_JOURNAL_MODE == "WAL"
+        assert settings.SQLITE_SYNCHRONOUS == "NORMAL"
+        assert settings.SQLITE_TEMP_STORE == "MEMORY"
+        assert settings.SQLITE_BUSY_TIMEOUT_MS > 0
+
+    def test_sqlite_profile_rejects_unknown_journal_mode(self) -> None:
+        """Test that only known journal modes can reach the PRAGMA string."""
+        with patch.dict(os.environ, {"SQLITE_JOURNAL_MODE": "WAL; DROP TABLE tasks"}):
+            with pytest.raises(ValidationError):
+                DatabaseSettings()
+
 
 class TestWhisperSettings:
     """Test WhisperSettings class."""
@@ -0,0 +1,51 @@
+"""Unit tests for app.core.result_link.
+
+Covers signed callback result links: round trip, tampering, expiry and
+secret separation.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core import result_link
+
+_SECRET = "test-secret"
+_NOW = 1_700_000_000.0
+
+
+@pytest.mark.unit
+class TestResultLink:
+    def test_signature_is_urlsafe_and_fixed_length(self) -> None:
+        signature = result_link.sign("task-1", int(_NOW) + 60, _SECRET)
+        assert len(signature) == 43
+        assert "=" not in signature and "+" not in signature and "/" not in signature
+
+    def test_verify_accepts_own_signature_before_expiry(self) -> None:
+        expires_at = int(_NOW) + 60
+        signature = result_link.sign("task-1", expires_at, _SECRET)
+        assert result_link.verify("task-1", expires_at, signature, _SECRET, now=_NOW)
+
+    def test_verify_rejects_expired_link(self) -> None:
+        expires_at = int(_NOW) + 60
+        signature = result_link.sign("task-1", expires_at, _SECRET)
+        assert not result_link.verify(
+            "task-1", expires_at, signature, _SECRET, now=_NOW + 60
+        )
+
+    def test_verify_rejects_other_task_or_expiry(self) -> None:
+        expires_at = int(_NOW) + 60
+        signature = result_link.sign("task-1", expires_at, _SECRET)
+        assert not result_link.verify("task-2", expires_at, signature, _SECRET, now=_NOW)
+        assert not result_link.verify(
+            "task-1", expires_at + 1, signature, _SECRET, now=_NOW
+        )
+
+    def test_verify_rejects_other_secret_and_garbage(self) -> None:
+        expires_at = int(_NOW) + 60
+        signature = result_link.sign("task-1", expires_at, _SECRET)
+        assert not result_link.verify(
+            "task-1", expires_at, signature, "other-secret", now=_NOW
+        )
+        assert not result_link.verify("task-1", expires_at, "", _SECRET, now=_NOW)
+        assert not result_link.verify("task-1", expires_at, "x" * 43, _SECRET, now=_NOW)
@@ -0,0 +1,66 @@
+"""Unit tests for the shared TTL + LRU map.
+
+Verifies:
+
+  * entries expire after their own TTL; a TTL <= 0 stores nothing
+  * the least recently used entry is evicted past ``max_entries``
+  * discard_where drops matching entries only
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    def test_entries_expire_after_their_own_ttl(self) -> None:
+        clock = _Clock()
+        cache: TTLCache[str, int] = TTLCache(max_entries=10, clock=clock)
+        cache.put("short", 1, ttl_seconds=5)
+        cache.put("long", 2, ttl_seconds=30)
+        cache.put("never", 3, ttl_seconds=0)
+
+        clock.now += 5
+
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+        assert cache.get("never") is None
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(max_entries=2)
+        cache.put("a", 1, ttl_seconds=60)
+        cache.put("b", 2, ttl_seconds=60)
+        assert cache.get("a") == 1  # "b" is now the least recent
+
+        cache.put("c", 3, ttl_seconds=60)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    def test_discard_where_and_clear(self) -> None:
+        cache: TTLCache[tuple[int, int], str] = TTLCache(max_entries=10)
+        cache.put((1, 0), "x", ttl_seconds=60)
+        cache.put((1, 1), "y", ttl_seconds=60)
+        cache.put((2, 0), "z", ttl_seconds=60)
+
+        cache.discard_where(lambda key, _: key[0] == 1)
+
+        assert len(cache) == 1 and cache.get((2, 0)) == "z"
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_rejects_zero_capacity(self) -> None:
+        with pytest.raises(ValueError, match="max_entries"):
+            TTLCache(max_entries=0)
@@ -0,0 +1,262 @@
+"""Unit tests for the async request-path repositories + async engine.
+
+Runs against a tmp-file SQLite database (an in-memory database cannot be
+shared between the sync seeding engine and the aiosqlite engine) —
+verifies:
+
+  * sync -> async URL mapping; in-memory / unknown drivers fail loud
+  * the async engine applies FK enforcement like the sync engine
+  * user / api_key / rate-limit / task reads match the sync repositories
+  * api_key.mark_used is a single UPDATE that fails loud on a missing row
+  * task summary reads honour the per-user scope
+  * batched bucket upserts write all buckets, or none when decide raises
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Generator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.exceptions import DatabaseOperationError
+from app.infrastructure.database.async_connection import (
+    async_session_factory,
+    dispose_async_engines,
+    get_async_engine,
+    to_async_url,
+)
+from app.infrastructure.database.models import ApiKey as ORMApiKey
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.async_sqlalchemy_api_key_repository import (
+    AsyncSQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_rate_limit_repository import (
+    AsyncSQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_task_repository import (
+    AsyncSQLAlchemyTaskRepository,
+)
+from app.infrastructure.database.repositories.async_sqlalchemy_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
+
+T = TypeVar("T")
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Tmp-file SQLite with two users, an active + revoked key and two tasks."""
+    engine = create_engine(f"sqlite:///{tmp_path}/async.db")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all(
+            [
+                ORMUser(id=1, email="one@example.com", password_hash="x"),
+                ORMUser(id=2, email="two@example.com", password_hash="x"),
+            ]
+        )
+        session.commit()
+        session.add_all(
+            [
+                ORMApiKey(id=1, user_id=1, name="live", prefix="abcd1234", hash="h1"),
+                ORMApiKey(
+                    id=2, user_id=1, name="old", prefix="abcd1234", hash="h2",
+                    revoked_at=datetime.now(timezone.utc),
+                ),
+                ORMTask(uuid="task-1", status="processing", task_type="transcription",
+                        user_id=1, progress_percentage=40,
+                        progress_stage="transcribing"),
+                ORMTask(uuid="task-2", status="processing", task_type="transcription",
+                        user_id=2),
+            ]
+        )
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _run(engine: Engine, body: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    async def main() -> T:
+        async with async_session_factory(engine)() as session:
+            return await body(session)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+class TestToAsyncUrl:
+    def test_maps_sync_drivers(self) -> None:
+        assert to_async_url("sqlite:///records.db").drivername == "sqlite+aiosqlite"
+        assert (
+            to_async_url("postgresql+psycopg2://u:p@db/app").drivername
+            == "postgresql+asyncpg"
+        )
+
+    def test_rejects_in_memory_sqlite(self) -> None:
+        with pytest.raises(ValueError, match="In-memory"):
+            to_async_url("sqlite:///:memory:")
+
+    def test_rejects_unknown_driver(self) -> None:
+        with pytest.raises(ValueError, match="No async driver"):
+            to_async_url("mysql+pymysql://u:p@db/app")
+
+
+@pytest.mark.unit
+def test_async_engine_pools_connections_until_disposed(engine: Engine) -> None:
+    async def main() -> tuple[int, int, int]:
+        seen = []
+        for _ in range(3):
+            async with async_session_factory(engine)() as session:
+                connection = await session.connection()
+                raw = await connection.get_raw_connection()
+                seen.append(id(raw.driver_connection))
+        pool = get_async_engine(
+            engine.url.render_as_string(hide_password=False)
+        ).sync_engine.pool
+        idle = pool.checkedin()  # type: ignore[attr-defined]
+        await dispose_async_engines()
+        return len(set(seen)), idle, pool.checkedin()  # type: ignore[attr-defined]
+
+    distinct, idle_before, idle_after = asyncio.run(main())
+    assert distinct == 1  # one aiosqlite connection reused, not reopened
+    assert idle_before == 1
+    assert idle_after == 0
+
+
+@pytest.mark.unit
+def test_async_engine_enforces_foreign_keys(engine: Engine) -> None:
+    async def body(session: AsyncSession) -> None:
+        await session.execute(
+            text(
+                "INSERT INTO tasks (uuid, status, task_type, user_id) "
+                "VALUES ('x', 'pending', 'transcription', 999)"
+            )
+        )
+
+    with pytest.raises(IntegrityError):
+        _run(engine, body)
+
+
+@pytest.mark.unit
+def test_user_get_by_id(engine: Engine) -> None:
+    async def body(session: AsyncSession) -> tuple:
+        repo = AsyncSQLAlchemyUserRepository(session)
+        return await repo.get_by_id(1), await repo.get_by_id(404)
+
+    found, missing = _run(engine, body)
+    assert found.email == "one@example.com"
+    assert missing is None
+
+
+@pytest.mark.unit
+def test_api_key_get_by_prefix_excludes_revoked(engine: Engine) -> None:
+    async def body(session: AsyncSession) -> list:
+        return await AsyncSQLAlchemyApiKeyRepository(session).get_by_prefix("abcd1234")
+
+    assert [k.id for k in _run(engine, body)] == [1]
+
+
+@pytest.mark.unit
+def test_api_key_mark_used_sets_timestamp(engine: Engine) -> None:
+    when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    async def body(session: AsyncSession) -> None:
+        await AsyncSQLAlchemyApiKeyRepository(session).mark_used(1, when)
+
+    _run(engine, body)
+    with engine.connect() as conn:
+        stored = conn.execute(text("SELECT last_used_at FROM api_keys WHERE id = 1")).scalar()
+    assert stored is not None and stored.startswith("2026-01-02 03:04:05")
+
+
+@pytest.mark.unit
+def test_api_key_mark_used_missing_row_fails_loud(engine: Engine) -> None:
+    async def body(session: AsyncSession) -> None:
+        await AsyncSQLAlchemyApiKeyRepository(session).mark_used(404, datetime.now(timezone.utc))
+
+    with pytest.raises(DatabaseOperationError):
+        _run(engine, body)
+
+
+@pytest.mark.unit
+def test_rate_limit_upsert_then_get(engine: Engine) -> None:
+    refill = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def body(session: AsyncSession) -> tuple:
+        repo = AsyncSQLAlchemyRateLimitRepository(session)
+        before = await repo.get_by_key("user:1:tx:hour")
+        await repo.upsert_atomic("user:1:tx:hour", {"tokens": 3, "last_refill": refill})
+        await repo.upsert_atomic("user:1:tx:hour", {"tokens": 2, "last_refill": refill})
+        return before, await repo.get_by_key("user:1:tx:hour")
+
+    before, after = _run(engine, body)
+    assert before is None
+    assert after.tokens == 2
+
+
+@pytest.mark.unit
+def test_task_summary_honours_user_scope(engine: Engine) -> None:
+    async def body(session: AsyncSession) -> tuple:
+        repo = AsyncSQLAlchemyTaskRepository(session)
+        unscoped = await repo.get_summary_by_id("task-2")
+        repo.set_user_scope(1)
+        return unscoped, await repo.get_summary_by_id("task-1"), await repo.get_summary_by_id("task-2")
+
+    unscoped, own, foreign = _run(engine, body)
+    assert unscoped is not None and unscoped.user_id == 2
+    assert own.progress_percentage == 40
+    assert own.result is None
+    assert foreign is None
+
+
+@pytest.mark.unit
+def test_rate_limit_upsert_many_writes_all_buckets(engine: Engine) -> None:
+    refill = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def body(session: AsyncSession) -> tuple:
+        repo = AsyncSQLAlchemyRateLimitRepository(session)
+        await repo.upsert_atomic("a", {"tokens": 5, "last_refill": refill})
+        seen: dict = {}
+
+        def decide(current: dict) -> dict:
+            seen.update(current)
+            return {
+                "a": {"tokens": current["a"].tokens - 1, "last_refill": refill},
+                "b": {"tokens": 9, "last_refill": refill},
+            }
+
+        await repo.upsert_many_atomic(["a", "b"], decide)
+        return set(seen), await repo.get_by_key("a"), await repo.get_by_key("b")
+
+    seen, a, b = _run(engine, body)
+    assert seen == {"a"}
+    assert (a.tokens, b.tokens) == (4, 9)
+
+
+@pytest.mark.unit
+def test_rate_limit_upsert_many_aborts_when_decide_raises(engine: Engine) -> None:
+    refill = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def body(session: AsyncSession) -> object:
+        repo = AsyncSQLAlchemyRateLimitRepository(session)
+
+        def decide(current: dict) -> dict:
+            raise RuntimeError("gate denied")
+
+        with pytest.raises(RuntimeError, match="gate denied"):
+            await repo.upsert_many_atomic(["a"], decide)
+        # The session is usable again and nothing was written.
+        await repo.upsert_atomic("b", {"tokens": 1, "last_refill": refill})
+        return await repo.get_by_key("a")
+
+    assert _run(engine, body) is None
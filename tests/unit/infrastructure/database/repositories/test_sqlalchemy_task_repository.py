@@ -19,8 +19,10 @@ class TestSQLAlchemyTaskRepository:
 
     @pytest.fixture
     def mock_session(self) -> MagicMock:
-        """Create a mock database session."""
-        return MagicMock()
+        """Create a mock database session (bound to SQLite, so search indexing runs)."""
+        session = MagicMock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+        return session
 
     @pytest.fixture
     def repository(self, mock_session: MagicMock) -> SQLAlchemyTaskRepository:
@@ -38,6 +40,7 @@ class TestSQLAlchemyTaskRepository:
         task = TaskFactory(uuid="test-123")
         orm_task = MagicMock(spec=ORMTask)
         orm_task.uuid = "test-123"
+        orm_task.result = None
         mock_to_orm.return_value = orm_task
 
         result = repository.add(task)
@@ -59,6 +62,7 @@ class TestSQLAlchemyTaskRepository:
         task = TaskFactory(uuid="")
         orm_task = MagicMock(spec=ORMTask)
         orm_task.uuid = "generated-uuid"
+        orm_task.result = None
         mock_to_orm.return_value = orm_task
 
         result = repository.add(task)
@@ -76,7 +80,7 @@ class TestSQLAlchemyTaskRepository:
     ) -> None:
         """Test add rolls back transaction on error."""
         task = TaskFactory()
-        mock_to_orm.return_value = MagicMock(spec=ORMTask)
+        mock_to_orm.return_value = MagicMock(spec=ORMTask, result=None)
         mock_session.commit.side_effect = SQLAlchemyError("Database error")
 
         with pytest.raises(DatabaseOperationError) as exc_info:
@@ -97,6 +101,7 @@ class TestSQLAlchemyTaskRepository:
     ) -> None:
         """Test get_by_id returns task when found."""
         orm_task = MagicMock(spec=ORMTask)
+        orm_task.result_size = None
         domain_task = TaskFactory(uuid="test-123")
         mock_session.query.return_value.filter.return_value.first.return_value = (
             orm_task
@@ -129,11 +134,11 @@ class TestSQLAlchemyTaskRepository:
         assert result is None
 
     @patch(
-        "app.infrastructure.database.repositories.sqlalchemy_task_repository.to_domain"
+        "app.infrastructure.database.repositories.sqlalchemy_task_repository.to_domain_summary"
     )
     def test_get_all_returns_all_tasks(
         self,
-        mock_to_domain: Mock,
+        mock_to_domain_summary: Mock,
         repository: SQLAlchemyTaskRepository,
         mock_session: MagicMock,
     ) -> None:
@@ -143,8 +148,11 @@ class TestSQLAlchemyTaskRepository:
         domain_task1 = TaskFactory(uuid="task-1")
         domain_task2 = TaskFactory(uuid="task-2")
 
-        mock_session.query.return_value.all.return_value = [orm_task1, orm_task2]
-        mock_to_domain.side_effect = [domain_task1, domain_task2]
+        mock_session.query.return_value.options.return_value.all.return_value = [
+            orm_task1,
+            orm_task2,
+        ]
+        mock_to_domain_summary.side_effect = [domain_task1, domain_task2]
 
         result = repository.get_all()
 
@@ -156,26 +164,27 @@ class TestSQLAlchemyTaskRepository:
         self, repository: SQLAlchemyTaskRepository, mock_session: MagicMock
     ) -> None:
         """Test get_all returns empty list when no tasks exist."""
-        mock_session.query.return_value.all.return_value = []
+        mock_session.query.return_value.options.return_value.all.return_value = []
 
         result = repository.get_all()
 
         assert result == []
 
     @patch(
-        "app.infrastructure.database.repositories.sqlalchemy_task_repository.to_domain"
+        "app.infrastructure.database.repositories.sqlalchemy_task_repository.result_store.store_result"
+    )
+    @patch(
+        "app.infrastructure.database.repositories.sqlalchemy_task_repository.task_search_index.index_task"
     )
     def test_update_updates_task_successfully(
         self,
-        mock_to_domain: Mock,
+        mock_index_task: Mock,
+        mock_store_result: Mock,
         repository: SQLAlchemyTaskRepository,
         mock_session: MagicMock,
     ) -> None:
-        """Test updating a task successfully."""
-        orm_task = MagicMock(spec=ORMTask)
-        mock_session.query.return_value.filter.return_value.first.return_value = (
-            orm_task
-        )
+        """Test updating a task issues one UPDATE without loading the row."""
+        mock_session.execute.return_value.rowcount = 1
 
         update_data = {
             "status": "completed",
@@ -185,31 +194,52 @@ class TestSQLAlchemyTaskRepository:
 
         repository.update("test-123", update_data)
 
-        # Verify update occurred
-        assert orm_task.status == "completed"
-        assert orm_task.result == {"text": "updated"}
-        assert orm_task.duration == pytest.approx(15.5)
+        mock_session.query.assert_not_called()
+        stmt = mock_session.execute.call_args_list[0].args[0]
+        params = stmt.compile().params
+        assert params["status"] == "completed"
+        # The result goes to task_results; the row keeps only its size.
+        assert params["result"] is None
+        assert params["result_size"] == len(b'{"text":"updated"}')
+        assert params["duration"] == pytest.approx(15.5)
+        assert params["uuid_1"] == "test-123"
+        mock_store_result.assert_called_once()
+        assert mock_store_result.call_args.kwargs["stored"].decode() == {
+            "text": "updated"
+        }
+        # Writing a result re-indexes the task for search before the commit.
+        mock_index_task.assert_called_once()
+        assert mock_index_task.call_args.kwargs["result"] == {"text": "updated"}
         mock_session.commit.assert_called_once()
 
     def test_update_returns_none_when_task_not_found(
         self, repository: SQLAlchemyTaskRepository, mock_session: MagicMock
     ) -> None:
         """Test update raises ValueError when task doesn't exist."""
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_session.execute.return_value.rowcount = 0
 
         with pytest.raises(ValueError, match="Task not found"):
             repository.update("non-existent", {"status": "completed"})
 
         mock_session.commit.assert_not_called()
 
+    def test_update_ignores_unknown_keys(
+        self, repository: SQLAlchemyTaskRepository, mock_session: MagicMock
+    ) -> None:
+        """Test keys that are not task columns never reach the UPDATE."""
+        mock_session.execute.return_value.rowcount = 1
+
+        repository.update("test-123", {"status": "completed", "not_a_column": 1})
+
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert "not_a_column" not in params
+        assert params["status"] == "completed"
+
     def test_update_rolls_back_on_error(
         self, repository: SQLAlchemyTaskRepository, mock_session: MagicMock
     ) -> None:
         """Test update rolls back transaction on database error."""
-        orm_task = MagicMock(spec=ORMTask)
-        mock_session.query.return_value.filter.return_value.first.return_value = (
-            orm_task
-        )
+        mock_session.execute.return_value.rowcount = 1
         mock_session.commit.side_effect = SQLAlchemyError("Database error")
 
         with pytest.raises(DatabaseOperationError) as exc_info:
@@ -0,0 +1,175 @@
+"""Unit tests for out-of-row, compressed task results (task_results).
+
+Uses an in-memory SQLite engine. Verifies:
+
+  * update() stores the result compressed in task_results, never inline
+  * get_by_id() decompresses it back onto the entity
+  * get_result_stream() yields the exact compact JSON, chunk by chunk
+  * clearing a result drops its blob; deleting a task cascades
+  * legacy inline results (pre-0006 rows) still read through
+  * an unknown codec fails loud
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.infrastructure.database.connection  # noqa: F401  (PRAGMA foreign_keys listener)
+from app.domain.entities.task import Task as DomainTask
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import TaskResult
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+from app.infrastructure.database.result_store import StoredResult
+
+RESULT = {
+    "segments": [{"start": 0.0, "end": 1.5, "text": "Grüße aus Riga"}],
+    "language": "de",
+}
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    sess = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    sess.add(ORMUser(id=1, email="u1@example.com", password_hash="x"))
+    sess.commit()
+    try:
+        yield sess
+    finally:
+        sess.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def repo(session: Session) -> SQLAlchemyTaskRepository:
+    repo = SQLAlchemyTaskRepository(session)
+    repo.add(
+        DomainTask(uuid="t-1", status="processing", task_type="t",
+                   file_name="a.mp3", user_id=1)
+    )
+    return repo
+
+
+@pytest.mark.unit
+def test_update_stores_result_compressed_out_of_row(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    repo.update("t-1", {"status": "completed", "result": RESULT})
+
+    row = session.execute(select(ORMTask.result, ORMTask.result_size)).one()
+    blob = session.execute(select(TaskResult)).scalar_one()
+    raw = json.dumps(RESULT, ensure_ascii=False, separators=(",", ":")).encode()
+
+    assert row.result is None
+    assert row.result_size == len(raw)
+    assert blob.codec == "zstd"
+    assert blob.raw_size == len(raw)
+    assert blob.data != raw
+
+
+@pytest.mark.unit
+def test_get_by_id_decompresses_result(repo: SQLAlchemyTaskRepository) -> None:
+    repo.update("t-1", {"result": RESULT})
+
+    task = repo.get_by_id("t-1")
+
+    assert task is not None
+    assert task.result == RESULT
+
+
+@pytest.mark.unit
+def test_get_result_stream_yields_compact_json_in_chunks(
+    repo: SQLAlchemyTaskRepository,
+) -> None:
+    big = {"segments": [{"text": f"segment {i}"} for i in range(20_000)]}
+    repo.update("t-1", {"result": big})
+
+    found = repo.get_result_stream("t-1")
+
+    assert found is not None
+    task, chunks = found
+    assert task.result is None
+    assert chunks is not None
+    pieces = list(chunks)
+    assert len(pieces) > 1
+    assert json.loads(b"".join(pieces)) == big
+
+
+@pytest.mark.unit
+def test_get_result_stream_without_result_and_out_of_scope(
+    repo: SQLAlchemyTaskRepository,
+) -> None:
+    found = repo.get_result_stream("t-1")
+    assert found is not None and found[1] is None
+
+    repo.set_user_scope(2)
+    assert repo.get_result_stream("t-1") is None
+
+
+@pytest.mark.unit
+def test_clearing_result_drops_blob(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    repo.update("t-1", {"result": RESULT})
+    repo.update("t-1", {"result": None})
+
+    assert session.execute(select(TaskResult)).first() is None
+    assert session.execute(select(ORMTask.result_size)).scalar_one() is None
+    assert repo.get_by_id("t-1").result is None
+
+
+@pytest.mark.unit
+def test_delete_cascades_to_task_results(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    repo.update("t-1", {"result": RESULT})
+
+    assert repo.delete("t-1") is True
+    assert session.execute(select(TaskResult)).first() is None
+
+
+@pytest.mark.unit
+def test_add_with_result_stores_out_of_row(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    repo.add(
+        DomainTask(uuid="t-2", status="completed", task_type="t",
+                   result=RESULT, user_id=1)
+    )
+
+    assert session.execute(
+        select(ORMTask.result).where(ORMTask.uuid == "t-2")
+    ).scalar_one() is None
+    assert repo.get_by_id("t-2").result == RESULT
+
+
+@pytest.mark.unit
+def test_legacy_inline_result_reads_through(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    session.execute(update(ORMTask).where(ORMTask.uuid == "t-1").values(result=RESULT))
+    session.commit()
+
+    assert repo.get_by_id("t-1").result == RESULT
+    found = repo.get_result_stream("t-1")
+    assert found is not None and found[1] is not None
+    assert json.loads(b"".join(found[1])) == RESULT
+
+
+@pytest.mark.unit
+def test_unknown_codec_fails_loud() -> None:
+    stored = StoredResult.encode(RESULT)
+    foreign = StoredResult(codec="lz4", raw_size=stored.raw_size, data=stored.data)
+
+    with pytest.raises(ValueError, match="Unsupported task result codec"):
+        foreign.decode()
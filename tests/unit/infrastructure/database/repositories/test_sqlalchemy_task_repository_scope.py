@@ -7,14 +7,19 @@ Uses an in-memory SQLite engine (no factory_boy dependency) — verifies:
   * scope auto-injects user_id on add() when entity has no owner
   * fail-loud refuses to persist orphan task
   * cross-user get_by_id / update / delete all behave as if not found
+  * update() is a single scoped UPDATE statement (no row load)
+  * list / summary reads never SELECT result or task_params
+  * list_keyset pages through ties without gaps; scoped counts are cached
 """
 
 from __future__ import annotations
 
+import re
+from datetime import datetime
 from typing import Generator
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.domain.entities.task import Task as DomainTask
@@ -24,6 +29,7 @@ from app.infrastructure.database.models import User as ORMUser
 from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
     SQLAlchemyTaskRepository,
 )
+from app.infrastructure.database.task_count_cache import TaskCountCache
 
 
 def _seed_users(session: Session, ids: list[int]) -> None:
@@ -162,6 +168,134 @@ def test_scoped_update_cross_user_raises_not_found(repo: SQLAlchemyTaskRepositor
         repo.update("alice-task", {"status": "completed"})
 
 
+@pytest.mark.unit
+def test_scoped_update_own_task_is_single_statement(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    """Owner update is one UPDATE scoped by uuid + user_id — no SELECT of result."""
+    repo.add(_new_task(uuid="alice-task", user_id=1))
+    repo.set_user_scope(1)
+    before = session.query(ORMTask.updated_at).filter_by(uuid="alice-task").scalar()
+
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many) -> None:
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        repo.update(
+            "alice-task", {"progress_percentage": 40, "progress_stage": "aligning"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert len(statements) == 1, statements
+    assert statements[0].startswith("UPDATE tasks SET")
+    assert "user_id = ?" in statements[0]
+
+    row = session.query(ORMTask).filter_by(uuid="alice-task").one()
+    assert row.progress_percentage == 40
+    assert row.progress_stage == "aligning"
+    assert row.updated_at >= before
+
+
+@pytest.mark.unit
+def test_summary_reads_never_select_heavy_columns(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    """get_all / list_paginated / get_summary_by_id skip result + task_params."""
+    task = _new_task(uuid="heavy", user_id=1)
+    task.result = {"segments": [{"text": "x" * 1000}]}
+    task.task_params = {"model": "tiny"}
+    repo.add(task)
+    session.expunge_all()
+    repo.set_user_scope(1)
+
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _many) -> None:
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        listed = repo.list_paginated(q=None, status=None, offset=0, limit=10)
+        everything = repo.get_all()
+        summary = repo.get_summary_by_id("heavy")
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert [t.uuid for t in listed] == ["heavy"]
+    assert [t.uuid for t in everything] == ["heavy"]
+    assert summary is not None and summary.result is None
+    assert len(statements) == 3, statements
+    for statement in statements:
+        # \b: the small tasks.result_size column is part of the summary.
+        assert not re.search(r"tasks\.result\b", statement)
+        assert "tasks.task_params" not in statement
+
+    full = repo.get_by_id("heavy")
+    assert full is not None
+    assert full.result == {"segments": [{"text": "x" * 1000}]}
+
+
+@pytest.mark.unit
+def test_scoped_get_summary_by_id_cross_user_returns_none(
+    repo: SQLAlchemyTaskRepository,
+) -> None:
+    """Cross-user summary lookup behaves as not found."""
+    repo.add(_new_task(uuid="alice-task", user_id=1))
+    repo.set_user_scope(2)
+    assert repo.get_summary_by_id("alice-task") is None
+
+
+@pytest.mark.unit
+def test_list_keyset_walks_every_row_once_despite_created_at_ties(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    """(created_at, id) cursor breaks ties — no skipped or repeated rows."""
+    for i in range(7):
+        repo.add(_new_task(uuid=f"alice-{i}", user_id=1))
+    repo.add(_new_task(uuid="bob-0", user_id=2))
+    # Force ties so ordering relies on the id tie-break.
+    session.query(ORMTask).update({ORMTask.created_at: datetime(2026, 1, 1)})
+    session.commit()
+    repo.set_user_scope(1)
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page, after = repo.list_keyset(q=None, status=None, after=after, limit=3)
+        seen.extend(t.uuid for t in page)
+        if after is None:
+            break
+
+    assert seen == [f"alice-{i}" for i in range(7)]
+
+
+@pytest.mark.unit
+def test_scoped_count_is_cached_and_invalidated_on_add(session: Session) -> None:
+    """Scoped q-less counts come from the cache until a write invalidates them."""
+    _seed_users(session, [1])
+    cache = TaskCountCache()
+    repo = SQLAlchemyTaskRepository(session, count_cache=cache)
+    repo.set_user_scope(1)
+    repo.add(_new_task(uuid="a", user_id=1))
+    assert repo.count(q=None, status=None) == 1
+
+    # A write that bypasses the repository is invisible until the TTL lapses.
+    session.add(ORMTask(uuid="b", status="pending", task_type="t", user_id=1))
+    session.commit()
+    assert repo.count(q=None, status=None) == 1
+    assert repo.count(q="", status=None) == 1
+    assert repo.count(q="b", status=None) == 0  # q filters always hit SQL
+
+    repo.add(_new_task(uuid="c", user_id=1))
+    assert repo.count(q=None, status=None) == 3
+
+
 @pytest.mark.unit
 def test_add_injects_user_id_from_scope(repo: SQLAlchemyTaskRepository) -> None:
     """Entity without explicit user_id gets it from the scope."""
@@ -0,0 +1,165 @@
+"""Unit tests for SQLAlchemyTaskRepository full-text search (tasks_fts).
+
+Uses an in-memory SQLite engine; ``Base.metadata.create_all`` builds the
+FTS5 table through the ``after_create`` DDL hook. Verifies:
+
+  * writing a result indexes transcript segments with their timestamps
+  * file-name matches surface as ``file_name_snippet``
+  * search is scoped — another user's transcript never matches
+  * re-writing a result replaces the old index rows
+  * deleting a task removes its rows (AFTER DELETE trigger)
+  * clearing a result removes its rows
+  * without the FTS5 table (non-SQLite) writes succeed and search is empty
+  * FTS5 operators / quotes in user input cannot break the query
+"""
+
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.domain.entities.task import Task as DomainTask
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_task_repository import (
+    SQLAlchemyTaskRepository,
+)
+
+
+def _result(*texts: str) -> dict:
+    return {
+        "segments": [
+            {"start": float(i * 10), "end": float(i * 10 + 5), "text": t}
+            for i, t in enumerate(texts)
+        ]
+    }
+
+
+@pytest.fixture
+def session() -> Generator[Session, None, None]:
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    sess = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    for uid in (1, 2):
+        sess.add(ORMUser(id=uid, email=f"u{uid}@example.com", password_hash="x"))
+    sess.commit()
+    try:
+        yield sess
+    finally:
+        sess.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def repo(session: Session) -> SQLAlchemyTaskRepository:
+    repo = SQLAlchemyTaskRepository(session)
+    repo.add(
+        DomainTask(uuid="alice-task", status="processing", task_type="t",
+                   file_name="board meeting.mp3", user_id=1)
+    )
+    repo.add(
+        DomainTask(uuid="bob-task", status="processing", task_type="t",
+                   file_name="standup.mp3", user_id=2)
+    )
+    repo.update("alice-task", {"status": "completed",
+                               "result": _result("Welcome everyone", "The budget is approved")})
+    repo.update("bob-task", {"status": "completed",
+                             "result": _result("Budget talk for bob only")})
+    return repo
+
+
+@pytest.mark.unit
+def test_search_returns_segment_timestamps_and_snippet(
+    repo: SQLAlchemyTaskRepository,
+) -> None:
+    repo.set_user_scope(1)
+    hits = repo.search("budget", limit=10)
+
+    assert [h.uuid for h in hits] == ["alice-task"]
+    [segment] = hits[0].segments
+    assert (segment.start, segment.end) == (10.0, 15.0)
+    assert "[budget]" in segment.snippet
+    assert hits[0].file_name_snippet is None
+
+
+@pytest.mark.unit
+def test_search_matches_file_name(repo: SQLAlchemyTaskRepository) -> None:
+    repo.set_user_scope(1)
+    [hit] = repo.search("meeting", limit=10)
+    assert hit.uuid == "alice-task"
+    assert hit.file_name_snippet == "board [meeting].mp3"
+    assert hit.segments == []
+
+
+@pytest.mark.unit
+def test_search_is_scoped_to_user(repo: SQLAlchemyTaskRepository) -> None:
+    repo.set_user_scope(2)
+    assert [h.uuid for h in repo.search("budget", limit=10)] == ["bob-task"]
+    assert repo.search("welcome", limit=10) == []
+    repo.set_user_scope(None)
+    assert {h.uuid for h in repo.search("budget", limit=10)} == {"alice-task", "bob-task"}
+
+
+@pytest.mark.unit
+def test_search_requires_every_term(repo: SQLAlchemyTaskRepository) -> None:
+    repo.set_user_scope(1)
+    assert repo.search("budget approved", limit=10)[0].uuid == "alice-task"
+    assert repo.search("budget rejected", limit=10) == []
+
+
+@pytest.mark.unit
+def test_rewriting_result_replaces_index_rows(repo: SQLAlchemyTaskRepository) -> None:
+    repo.update("alice-task", {"result": _result("Completely new words")})
+    repo.set_user_scope(1)
+    assert repo.search("budget", limit=10) == []
+    assert [h.uuid for h in repo.search("completely", limit=10)] == ["alice-task"]
+
+
+@pytest.mark.unit
+def test_delete_removes_index_rows(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    assert repo.delete("alice-task") is True
+    count = session.execute(text("SELECT COUNT(*) FROM tasks_fts")).scalar_one()
+    assert count == 2  # bob's file-name row + one segment
+
+
+@pytest.mark.unit
+def test_clearing_result_removes_index_rows(
+    repo: SQLAlchemyTaskRepository, session: Session
+) -> None:
+    repo.update("alice-task", {"result": None})
+    repo.set_user_scope(1)
+    assert repo.search("budget", limit=10) == []
+    assert repo.search("board", limit=10) == []
+    count = session.execute(text("SELECT COUNT(*) FROM tasks_fts")).scalar_one()
+    assert count == 2  # bob's rows only
+
+
+@pytest.mark.unit
+def test_non_sqlite_dialect_skips_the_index(
+    repo: SQLAlchemyTaskRepository, session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    session.execute(text("DROP TRIGGER tasks_fts_after_delete"))
+    session.execute(text("DROP TABLE tasks_fts"))
+    session.commit()
+    monkeypatch.setattr(session.get_bind().dialect, "name", "postgresql")
+
+    repo.update("alice-task", {"result": _result("Fresh words")})
+    repo.update("bob-task", {"result": None})
+
+    repo.set_user_scope(1)
+    assert repo.get_by_id("alice-task").result == _result("Fresh words")
+    assert repo.search("fresh", limit=10) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", ['budget" OR "', "NEAR(budget", "budget*", "-budget", "   "])
+def test_search_tolerates_fts_syntax_in_user_input(
+    repo: SQLAlchemyTaskRepository, query: str
+) -> None:
+    repo.set_user_scope(1)
+    assert isinstance(repo.search(query, limit=10), list)
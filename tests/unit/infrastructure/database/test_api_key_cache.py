@@ -0,0 +1,230 @@
+"""Unit tests for the verified bearer-key cache + batched ``last_used_at``.
+
+Verifies:
+
+  * cache entries expire after the TTL and evict least-recently-used first
+  * revoke / user writes through the wired repositories invalidate entries
+  * a cache miss resolves key + user with one JOIN; a hit runs no query
+  * revoked or wrong keys never authenticate
+  * ``last_used_at`` stamps are buffered, flushed in one batch, never move
+    backwards, and are re-queued when the flush fails
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core import api_key
+from app.core.exceptions import DatabaseOperationError, InvalidApiKeyHashError
+from app.domain.entities.api_key import ApiKey
+from app.domain.entities.user import User
+from app.infrastructure.database.api_key_cache import ApiKeyCache, LastUsedBuffer
+from app.infrastructure.database.async_connection import async_session_factory
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.query_counter import count_queries
+from app.infrastructure.database.repositories.async_sqlalchemy_api_key_repository import (
+    AsyncSQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
+    SQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from app.infrastructure.scheduler.api_key_last_used_scheduler import flush_last_used
+from app.services.auth.key_service import AsyncKeyService
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user(user_id: int = 1) -> User:
+    return User(id=user_id, email=f"u{user_id}@example.com", password_hash="x")
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Tmp-file SQLite with one user."""
+    engine = create_engine(f"sqlite:///{tmp_path}/keys.db")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(ORMUser(id=1, email="u1@example.com", password_hash="x"))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _issue_key(engine: Engine) -> tuple[str, int]:
+    plaintext, prefix, hashed = api_key.generate()
+    with sessionmaker(bind=engine)() as session:
+        key_id = SQLAlchemyApiKeyRepository(session).add(
+            ApiKey(id=None, user_id=1, name="cli", prefix=prefix, hash=hashed)
+        )
+    return plaintext, key_id
+
+
+def _authenticate(
+    engine: Engine, service_kwargs: dict, plaintext: str
+) -> tuple[User | None, int]:
+    """Run ``AsyncKeyService.authenticate``; return (user or None, statements run)."""
+
+    async def main() -> tuple[User | None, int]:
+        async with async_session_factory(engine)() as session:
+            await session.execute(text("SELECT 1"))  # first connect runs PRAGMAs
+            service = AsyncKeyService(
+                AsyncSQLAlchemyApiKeyRepository(session), **service_kwargs
+            )
+            with count_queries() as counter:
+                try:
+                    user = await service.authenticate(plaintext)
+                except InvalidApiKeyHashError:
+                    user = None
+        return user, counter.statements
+
+    return asyncio.run(main())
+
+
+def _last_used(engine: Engine, key_id: int) -> str | None:
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT last_used_at FROM api_keys WHERE id = :id"), {"id": key_id}
+        ).scalar()
+
+
+@pytest.mark.unit
+class TestApiKeyCache:
+    def test_entry_expires_after_ttl(self) -> None:
+        clock = _Clock()
+        cache = ApiKeyCache(ttl_seconds=30, clock=clock)
+        cache.put("h", 7, _user())
+        clock.now += 29
+        assert cache.get("h").key_id == 7
+        clock.now += 1
+        assert cache.get("h") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ApiKeyCache(max_entries=2)
+        cache.put("a", 1, _user())
+        cache.put("b", 2, _user())
+        cache.get("a")
+        cache.put("c", 3, _user())
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+
+    def test_returns_private_user_copies(self) -> None:
+        cache = ApiKeyCache()
+        user = _user()
+        original_tier = user.plan_tier
+        cache.put("h", 1, user)
+        user.plan_tier = "pro"
+        cache.get("h").user.plan_tier = "team"
+        assert cache.get("h").user.plan_tier == original_tier
+
+    def test_invalidate_by_key_and_user(self) -> None:
+        cache = ApiKeyCache()
+        cache.put("a", 1, _user(1))
+        cache.put("b", 2, _user(1))
+        cache.put("c", 3, _user(2))
+        cache.invalidate_key(1)
+        assert cache.get("a") is None and cache.get("b") is not None
+        cache.invalidate_user(1)
+        assert cache.get("b") is None and cache.get("c") is not None
+
+    def test_zero_ttl_disables(self) -> None:
+        cache = ApiKeyCache(ttl_seconds=0)
+        cache.put("h", 1, _user())
+        assert cache.get("h") is None
+
+
+@pytest.mark.unit
+class TestAuthenticate:
+    def test_miss_joins_once_then_hit_runs_no_query(self, engine: Engine) -> None:
+        plaintext, key_id = _issue_key(engine)
+        kwargs = {"cache": ApiKeyCache(), "last_used": LastUsedBuffer()}
+        user, miss_statements = _authenticate(engine, kwargs, plaintext)
+        assert user is not None and user.id == 1
+        assert miss_statements == 1
+        user, hit_statements = _authenticate(engine, kwargs, plaintext)
+        assert user is not None and user.id == 1
+        assert hit_statements == 0
+        assert list(kwargs["last_used"].drain()) == [key_id]
+        assert _last_used(engine, key_id) is None  # buffered, not written
+
+    def test_without_buffer_marks_used_inline(self, engine: Engine) -> None:
+        plaintext, key_id = _issue_key(engine)
+        user, _ = _authenticate(engine, {}, plaintext)
+        assert user is not None
+        assert _last_used(engine, key_id) is not None
+
+    def test_wrong_and_revoked_keys_rejected(self, engine: Engine) -> None:
+        plaintext, key_id = _issue_key(engine)
+        forged = plaintext[:-1] + ("A" if plaintext[-1] != "A" else "B")
+        cache = ApiKeyCache()
+        assert _authenticate(engine, {"cache": cache}, forged)[0] is None
+        assert _authenticate(engine, {"cache": cache}, plaintext)[0] is not None
+        with sessionmaker(bind=engine)() as session:
+            SQLAlchemyApiKeyRepository(session, key_cache=cache).revoke(key_id)
+        assert _authenticate(engine, {"cache": cache}, plaintext)[0] is None
+
+    def test_token_version_bump_drops_cached_snapshot(self, engine: Engine) -> None:
+        plaintext, _ = _issue_key(engine)
+        cache = ApiKeyCache()
+        kwargs = {"cache": cache, "last_used": LastUsedBuffer()}
+        user, _ = _authenticate(engine, kwargs, plaintext)
+        assert user is not None and user.token_version == 0
+        with sessionmaker(bind=engine)() as session:
+            SQLAlchemyUserRepository(session, key_cache=cache).update_token_version(1, 1)
+        user, statements = _authenticate(engine, kwargs, plaintext)
+        assert user is not None and user.token_version == 1
+        assert statements == 1
+
+
+@pytest.mark.unit
+class TestLastUsedFlush:
+    def test_buffer_keeps_latest_stamp(self) -> None:
+        buffer = LastUsedBuffer()
+        early = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        buffer.record(1, early + timedelta(seconds=5))
+        buffer.record(1, early)
+        assert buffer.drain() == {1: early + timedelta(seconds=5)}
+        assert buffer.drain() == {}
+
+    def test_flush_writes_batch_and_never_moves_backwards(self, engine: Engine) -> None:
+        _, first = _issue_key(engine)
+        _, second = _issue_key(engine)
+        factory = sessionmaker(bind=engine)
+        now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+        buffer = LastUsedBuffer()
+        buffer.record(first, now)
+        buffer.record(second, now)
+        buffer.record(404, now)  # deleted key: skipped
+        assert flush_last_used(buffer, factory) == 2
+        assert flush_last_used(buffer, factory) == 0
+
+        buffer.record(first, now - timedelta(minutes=1))  # stale stamp from another worker
+        assert flush_last_used(buffer, factory) == 0
+        assert _last_used(engine, first).startswith("2026-01-01 12:00:00")
+
+    def test_failed_flush_requeues_stamps(self) -> None:
+        def broken_session() -> Session:
+            return sessionmaker(bind=create_engine("sqlite://"))()  # no api_keys table
+
+        buffer = LastUsedBuffer()
+        when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        buffer.record(1, when)
+        with pytest.raises(DatabaseOperationError):
+            flush_last_used(buffer, broken_session)
+        assert buffer.drain() == {1: when}
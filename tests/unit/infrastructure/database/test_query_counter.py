@@ -0,0 +1,143 @@
+"""Unit tests for the per-request SQL statement counter + its middleware.
+
+Verifies:
+
+  * statements are counted only inside a counted scope
+  * the counter follows the request into Starlette's threadpool (sync
+    dependencies) and into SQLAlchemy's greenlet (``AsyncSession``)
+  * hot repository lookups run exactly one statement
+  * ``QueryCountMiddleware`` sends ``X-DB-Query-Count`` only when enabled
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.concurrency import run_in_threadpool
+
+from app.api.query_count_middleware import QueryCountMiddleware
+from app.infrastructure.database.async_connection import async_session_factory
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.query_counter import count_queries
+from app.infrastructure.database.repositories.async_sqlalchemy_user_repository import (
+    AsyncSQLAlchemyUserRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_api_key_repository import (
+    SQLAlchemyApiKeyRepository,
+)
+from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Tmp-file SQLite with one user."""
+    engine = create_engine(f"sqlite:///{tmp_path}/count.db")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(ORMUser(id=1, email="one@example.com", password_hash="x"))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+def test_counts_only_inside_scope(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with count_queries() as counter:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+    assert counter.statements == 2
+
+
+@pytest.mark.unit
+def test_hot_lookups_run_one_statement(engine: Engine) -> None:
+    with sessionmaker(bind=engine)() as session:
+        users = SQLAlchemyUserRepository(session)
+        keys = SQLAlchemyApiKeyRepository(session)
+        users.get_by_id(1)  # first connect runs the PRAGMA profile
+        with count_queries() as counter:
+            users.get_by_id(1)
+            keys.get_by_prefix("abcd1234")
+    assert counter.statements == 2
+
+
+@pytest.mark.unit
+def test_counter_follows_context_into_threadpool(engine: Engine) -> None:
+    def query() -> None:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    async def main() -> int:
+        query()  # connect outside the counted scope
+        with count_queries() as counter:
+            await run_in_threadpool(query)
+        return counter.statements
+
+    assert asyncio.run(main()) == 1
+
+
+@pytest.mark.unit
+def test_counter_follows_context_into_async_session(engine: Engine) -> None:
+    async def main() -> int:
+        async with async_session_factory(engine)() as session:
+            repo = AsyncSQLAlchemyUserRepository(session)
+            await repo.get_by_id(1)
+            with count_queries() as counter:
+                assert (await repo.get_by_id(1)) is not None
+        return counter.statements
+
+    assert asyncio.run(main()) == 1
+
+
+def _app(engine: Engine, *, expose_header: bool) -> FastAPI:
+    app = FastAPI()
+    factory = sessionmaker(bind=engine)
+
+    def get_session() -> Generator[Session, None, None]:
+        with factory() as session:
+            yield session
+
+    @app.get("/user")
+    def user(session: Session = Depends(get_session)) -> dict:
+        SQLAlchemyUserRepository(session).get_by_id(1)
+        SQLAlchemyUserRepository(session).get_by_id(1)
+        return {}
+
+    app.add_middleware(QueryCountMiddleware, expose_header=expose_header)
+    return app
+
+
+def _get(app: FastAPI, path: str) -> httpx.Response:
+    async def main() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            await client.get(path)  # warm: first connect runs PRAGMAs
+            return await client.get(path)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.unit
+def test_middleware_sends_header_when_enabled(engine: Engine) -> None:
+    response = _get(_app(engine, expose_header=True), "/user")
+    assert response.status_code == 200
+    assert response.headers["x-db-query-count"] == "2"
+
+
+@pytest.mark.unit
+def test_middleware_omits_header_by_default(engine: Engine) -> None:
+    response = _get(_app(engine, expose_header=False), "/user")
+    assert response.status_code == 200
+    assert "x-db-query-count" not in response.headers
@@ -0,0 +1,49 @@
+"""Unit tests for TaskCountCache (TTL expiry + per-user invalidation)."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.infrastructure.database.task_count_cache import TaskCountCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestTaskCountCache:
+    """Cached counts expire after the TTL and drop on invalidate_user."""
+
+    def test_get_returns_value_within_ttl(self) -> None:
+        clock = _FakeClock()
+        cache = TaskCountCache(ttl_seconds=5.0, clock=clock)
+        cache.put(1, "completed", 42)
+        clock.now += 4.9
+        assert cache.get(1, "completed") == 42
+
+    def test_get_returns_none_after_ttl(self) -> None:
+        clock = _FakeClock()
+        cache = TaskCountCache(ttl_seconds=5.0, clock=clock)
+        cache.put(1, None, 7)
+        clock.now += 5.0
+        assert cache.get(1, None) is None
+
+    def test_none_and_empty_status_share_a_key(self) -> None:
+        cache = TaskCountCache()
+        cache.put(1, None, 3)
+        assert cache.get(1, "") == 3
+
+    def test_invalidate_user_drops_only_that_user(self) -> None:
+        cache = TaskCountCache()
+        cache.put(1, None, 3)
+        cache.put(1, "failed", 1)
+        cache.put(2, None, 9)
+        cache.invalidate_user(1)
+        assert cache.get(1, None) is None
+        assert cache.get(1, "failed") is None
+        assert cache.get(2, None) == 9
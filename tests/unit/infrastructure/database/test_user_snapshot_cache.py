@@ -0,0 +1,90 @@
+"""Unit tests for the cookie-auth user snapshot cache.
+
+Verifies:
+
+  * snapshots are keyed by (user_id, token_version) and expire after the TTL
+  * invalidate_user drops every version of a user; callers get copies
+  * a user-repository token_version bump invalidates the cached snapshot
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.user import User
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from app.infrastructure.database.user_snapshot_cache import UserSnapshotCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user(user_id: int = 1, token_version: int = 0) -> User:
+    return User(
+        id=user_id, email=f"u{user_id}@example.com", password_hash="x",
+        token_version=token_version,
+    )
+
+
+@pytest.mark.unit
+def test_keyed_by_version_and_expires() -> None:
+    clock = _Clock()
+    cache = UserSnapshotCache(ttl_seconds=15, clock=clock)
+    cache.put(_user(token_version=3))
+    assert cache.get(1, 3) is not None
+    assert cache.get(1, 2) is None
+    clock.now += 15
+    assert cache.get(1, 3) is None
+
+
+@pytest.mark.unit
+def test_invalidate_user_and_private_copies() -> None:
+    cache = UserSnapshotCache()
+    cache.put(_user(1, 0))
+    cache.put(_user(1, 1))
+    cache.put(_user(2, 0))
+    cache.get(2, 0).email = "mutated@example.com"
+    assert cache.get(2, 0).email == "u2@example.com"
+    cache.invalidate_user(1)
+    assert cache.get(1, 0) is None and cache.get(1, 1) is None
+    assert cache.get(2, 0) is not None
+
+
+@pytest.mark.unit
+def test_evicts_least_recently_used_and_zero_ttl_disables() -> None:
+    cache = UserSnapshotCache(max_entries=1)
+    cache.put(_user(1))
+    cache.put(_user(2))
+    assert cache.get(1, 0) is None and cache.get(2, 0) is not None
+    disabled = UserSnapshotCache(ttl_seconds=0)
+    disabled.put(_user(1))
+    assert disabled.get(1, 0) is None
+
+
+@pytest.mark.unit
+def test_token_version_bump_invalidates(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path}/users.db")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        session.add(ORMUser(id=1, email="u1@example.com", password_hash="x"))
+        session.commit()
+    cache = UserSnapshotCache()
+    cache.put(_user(1, 0))
+    with factory() as session:
+        SQLAlchemyUserRepository(session, snapshot_cache=cache).update_token_version(1, 1)
+    assert cache.get(1, 0) is None
+    engine.dispose()
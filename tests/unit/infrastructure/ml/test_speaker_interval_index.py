@@ -0,0 +1,140 @@
+"""Unit tests for the interval-index speaker assignment engine.
+
+Every case is checked against ``whisperx.assign_word_speakers`` itself:
+the engine must produce byte-identical transcripts, including exact ties
+(integer-aligned timings), words without timings and ``fill_nearest``.
+"""
+
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any
+
+import pandas as pd
+import pytest
+from whisperx.diarize import assign_word_speakers as whisperx_assign_word_speakers
+
+from app.infrastructure.ml.speaker_interval_index import (
+    SpeakerTurnIndex,
+    assign_word_speakers,
+)
+from app.infrastructure.ml.whisperx_speaker_assignment_service import (
+    WhisperXSpeakerAssignmentService,
+)
+
+
+def _meeting(
+    rng: random.Random, n_turns: int, n_segments: int, *, integer: bool
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Random overlapping turns and a transcript; ``integer`` forces ties."""
+
+    def duration(low: float, high: float) -> float:
+        if integer:
+            return float(rng.randint(int(low) or 1, int(high) or 1))
+        return rng.uniform(low, high)
+
+    rows = []
+    t = 0.0
+    for _ in range(n_turns):
+        length = duration(1, 5)
+        start = max(t - duration(0, 1), 0.0)
+        speaker = f"SPEAKER_{rng.randint(0, 4):02d}"
+        rows.append({"start": start, "end": start + length, "speaker": speaker})
+        t += length if integer else length * rng.uniform(0.5, 1.2)
+
+    segments = []
+    t = 0.0
+    for _ in range(n_segments):
+        seg_start = t
+        words: list[dict[str, Any]] = []
+        for _ in range(rng.randint(0, 8)):
+            length = duration(0.05, 2)
+            word: dict[str, Any] = {"word": "w"}
+            if rng.random() > 0.1:
+                word.update(start=t, end=t + length)
+            words.append(word)
+            t += length
+        t += duration(0, 3)
+        segments.append(
+            {"start": seg_start, "end": max(t, seg_start + 0.1), "text": "w", "words": words}
+        )
+    return pd.DataFrame(rows, columns=["start", "end", "speaker"]), {"segments": segments}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("fill_nearest", [False, True])
+@pytest.mark.parametrize("integer", [False, True])
+def test_matches_whisperx_on_random_meetings(fill_nearest: bool, integer: bool) -> None:
+    rng = random.Random(1234 + integer)
+    for _ in range(100):
+        diarization, transcript = _meeting(
+            rng, rng.randint(0, 40), rng.randint(1, 30), integer=integer
+        )
+        expected = whisperx_assign_word_speakers(
+            diarization.copy(), copy.deepcopy(transcript), fill_nearest=fill_nearest
+        )
+
+        actual = assign_word_speakers(
+            diarization, copy.deepcopy(transcript), fill_nearest=fill_nearest
+        )
+
+        assert actual == expected
+
+
+@pytest.mark.unit
+def test_tie_goes_to_the_same_speaker_as_whisperx() -> None:
+    diarization = pd.DataFrame(
+        {"start": [0.0, 1.0], "end": [1.0, 2.0], "speaker": ["SPEAKER_01", "SPEAKER_00"]}
+    )
+    transcript = {"segments": [{"start": 0.5, "end": 1.5, "words": []}]}
+
+    expected = whisperx_assign_word_speakers(diarization.copy(), copy.deepcopy(transcript))
+    actual = assign_word_speakers(diarization, copy.deepcopy(transcript))
+
+    assert actual == expected
+    assert actual["segments"][0]["speaker"] == "SPEAKER_00"
+
+
+@pytest.mark.unit
+def test_mutates_in_place_and_attaches_embeddings() -> None:
+    diarization = pd.DataFrame({"start": [0.0], "end": [5.0], "speaker": ["SPEAKER_00"]})
+    transcript: dict[str, Any] = {
+        "segments": [
+            {"start": 1.0, "end": 2.0, "words": [{"word": "a", "start": 1.0, "end": 1.5}, {"word": "7"}]},
+            {"start": 6.0, "end": 7.0, "words": []},
+        ]
+    }
+
+    result = assign_word_speakers(diarization, transcript, speaker_embeddings={"SPEAKER_00": [0.1]})
+
+    assert result is transcript
+    assert transcript["segments"][0]["speaker"] == "SPEAKER_00"
+    assert transcript["segments"][0]["words"][0]["speaker"] == "SPEAKER_00"
+    assert "speaker" not in transcript["segments"][0]["words"][1]
+    assert "speaker" not in transcript["segments"][1]
+    assert transcript["speaker_embeddings"] == {"SPEAKER_00": [0.1]}
+
+
+@pytest.mark.unit
+def test_index_without_turns_assigns_nothing() -> None:
+    index = SpeakerTurnIndex(pd.DataFrame(columns=["start", "end", "speaker"]))
+
+    assert index.assign([0.0, 1.0], [1.0, 2.0]) == [None, None]
+    assert index.assign([0.0], [1.0], fill_nearest=True) == [None]
+
+
+@pytest.mark.unit
+def test_service_uses_engine_and_honours_fill_nearest() -> None:
+    diarization = pd.DataFrame({"start": [0.0], "end": [1.0], "speaker": ["SPEAKER_00"]})
+    transcript = {"segments": [{"start": 3.0, "end": 4.0, "words": []}]}
+
+    plain = WhisperXSpeakerAssignmentService().assign_speakers(
+        diarization, copy.deepcopy(transcript)
+    )
+    filled = WhisperXSpeakerAssignmentService(fill_nearest=True).assign_speakers(
+        diarization, copy.deepcopy(transcript)
+    )
+
+    assert "speaker" not in plain["segments"][0]
+    assert filled["segments"][0]["speaker"] == "SPEAKER_00"
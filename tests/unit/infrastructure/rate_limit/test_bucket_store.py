@@ -0,0 +1,238 @@
+"""Unit tests for the in-memory token-bucket store + write-behind.
+
+Verifies:
+
+  * get / put round-trip; writes are flagged dirty until drained
+  * update_many is all-or-nothing and rejects writes to unrequested keys
+  * concurrent batched consumes never over-admit (per-shard locking)
+  * the free-tier gate consumes nothing on denial with the memory backend
+  * flush writes changed buckets once; a failed flush keeps them dirty
+  * load restores flushed buckets into a fresh store
+  * flushes merge on ``last_refill``: a refund survives flush + reload, and a
+    row another worker wrote later is kept
+  * account deletion drops the user's buckets from the store as well
+  * the backend setting selects the repository implementation
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Generator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import services
+from app.core.config import get_settings
+from app.core.exceptions import ConcurrencyLimitError, DatabaseOperationError
+from app.domain.entities.user import User
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.database.repositories.sqlalchemy_rate_limit_repository import (
+    SQLAlchemyRateLimitRepository,
+)
+from app.infrastructure.rate_limit import (
+    AsyncInMemoryRateLimitRepository,
+    InMemoryRateLimitRepository,
+    ShardedBucketStore,
+    flush_buckets,
+    load_buckets,
+)
+from app.services.account_service import AccountService
+from app.services.auth.rate_limit_service import (
+    AsyncRateLimitService,
+    BucketRequest,
+    RateLimitService,
+)
+from app.services.free_tier_gate import AsyncFreeTierGate, concurrency_bucket_key
+
+REFILL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    engine = create_engine(f"sqlite:///{tmp_path}/buckets.db")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.unit
+class TestShardedBucketStore:
+    def test_get_put_round_trip(self) -> None:
+        store = ShardedBucketStore(shards=4)
+        assert store.get("a") is None
+        store.put("a", {"tokens": 3, "last_refill": REFILL})
+        bucket = store.get("a")
+        assert bucket is not None
+        assert (bucket.bucket_key, bucket.tokens, bucket.last_refill) == ("a", 3, REFILL)
+
+    def test_writes_are_dirty_until_taken(self) -> None:
+        store = ShardedBucketStore(shards=4)
+        store.put("a", {"tokens": 3, "last_refill": REFILL})
+        assert store.take_dirty() == {"a": {"tokens": 3, "last_refill": REFILL}}
+        assert store.take_dirty() == {}
+        store.mark_dirty(["a", "never-written"])
+        assert list(store.take_dirty()) == ["a"]
+
+    def test_update_many_aborts_when_decide_raises(self) -> None:
+        store = ShardedBucketStore(shards=4)
+
+        def decide(current: dict) -> dict:
+            raise ConcurrencyLimitError()
+
+        with pytest.raises(ConcurrencyLimitError):
+            store.update_many(["a", "b"], decide)
+        assert store.get("a") is None
+        assert store.take_dirty() == {}
+
+    def test_update_many_rejects_unrequested_keys(self) -> None:
+        store = ShardedBucketStore(shards=1)
+        with pytest.raises(ValueError, match="unrequested"):
+            store.update_many(
+                ["a"], lambda current: {"a": {"tokens": 1, "last_refill": REFILL},
+                                        "zzz": {"tokens": 1, "last_refill": REFILL}}
+            )
+
+    def test_rejects_zero_shards(self) -> None:
+        with pytest.raises(ValueError):
+            ShardedBucketStore(shards=0)
+
+
+@pytest.mark.unit
+def test_concurrent_batches_never_over_admit() -> None:
+    store = ShardedBucketStore(shards=8)
+    service = RateLimitService(InMemoryRateLimitRepository(store))  # type: ignore[arg-type]
+    requests = [
+        BucketRequest("user:1:tx:hour", tokens_needed=1, rate=0.0, capacity=300),
+        BucketRequest("user:1:concurrent", tokens_needed=1, rate=0.0, capacity=1000),
+    ]
+    admitted: list[int] = []
+
+    def hammer() -> None:
+        admitted.append(sum(all(service.check_and_consume_all(requests)) for _ in range(100)))
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(admitted) == 300
+    assert store.get("user:1:tx:hour").tokens == 0  # type: ignore[union-attr]
+    assert store.get("user:1:concurrent").tokens == 700  # type: ignore[union-attr]
+
+
+@pytest.mark.unit
+def test_gate_denial_consumes_nothing_in_memory() -> None:
+    store = ShardedBucketStore()
+    store.put(concurrency_bucket_key(1), {"tokens": 0, "last_refill": REFILL})
+    gate = AsyncFreeTierGate(AsyncRateLimitService(AsyncInMemoryRateLimitRepository(store)))
+    user = User(id=1, email="u@x.com", password_hash="x", plan_tier="free")
+
+    with pytest.raises(ConcurrencyLimitError):
+        asyncio.run(gate.check(user=user, file_seconds=60.0, model="tiny", diarize=False))
+    assert store.get("user:1:tx:hour") is None
+
+
+@pytest.mark.unit
+class TestWriteBehind:
+    def test_flush_then_load_round_trip(self, engine: Engine) -> None:
+        factory = sessionmaker(bind=engine)
+        store = ShardedBucketStore()
+        store.put("a", {"tokens": 3, "last_refill": REFILL})
+        store.put("b", {"tokens": 7, "last_refill": REFILL})
+        assert flush_buckets(store, factory) == 2
+        store.put("a", {"tokens": 2, "last_refill": REFILL})
+        assert flush_buckets(store, factory) == 1
+        assert flush_buckets(store, factory) == 0
+
+        with factory() as session:
+            assert SQLAlchemyRateLimitRepository(session).get_by_key("a").tokens == 2  # type: ignore[union-attr]
+
+        reloaded = ShardedBucketStore()
+        assert load_buckets(reloaded, factory) == 2
+        assert reloaded.get("b").tokens == 7  # type: ignore[union-attr]
+        assert reloaded.take_dirty() == {}
+
+    def test_flush_keeps_a_bucket_another_worker_wrote_later(
+        self, engine: Engine
+    ) -> None:
+        factory = sessionmaker(bind=engine)
+        later, stale = ShardedBucketStore(), ShardedBucketStore()
+        later.put("a", {"tokens": 9, "last_refill": REFILL + timedelta(seconds=5)})
+        stale.put("a", {"tokens": 1, "last_refill": REFILL})
+        stale.put("b", {"tokens": 4, "last_refill": REFILL})
+
+        assert flush_buckets(later, factory) == 1
+        assert flush_buckets(stale, factory) == 1  # only "b"
+
+        with factory() as session:
+            repo = SQLAlchemyRateLimitRepository(session)
+            assert repo.get_by_key("a").tokens == 9  # type: ignore[union-attr]
+            assert repo.get_by_key("b").tokens == 4  # type: ignore[union-attr]
+
+    def test_released_slot_survives_flush_and_reload(self, engine: Engine) -> None:
+        """A refund keeps ``last_refill``; a rate-0 bucket must not stay drained."""
+        factory = sessionmaker(bind=engine)
+        store = ShardedBucketStore()
+        service = RateLimitService(repository=InMemoryRateLimitRepository(store))
+        key = concurrency_bucket_key(7)
+
+        assert service.check_and_consume(key, tokens_needed=1, rate=0, capacity=1)
+        flush_buckets(store, factory)
+        service.release(key, tokens=1, capacity=1)
+        assert flush_buckets(store, factory) == 1
+
+        restarted = ShardedBucketStore()
+        load_buckets(restarted, factory)
+        after_restart = RateLimitService(repository=InMemoryRateLimitRepository(restarted))
+        assert after_restart.check_and_consume(key, tokens_needed=1, rate=0, capacity=1)
+
+    def test_account_deletion_forgets_in_memory_buckets(self, engine: Engine) -> None:
+        factory = sessionmaker(bind=engine)
+        with factory() as session:
+            session.add(ORMUser(id=7, email="u7@example.com", password_hash="x"))
+            session.commit()
+        store = ShardedBucketStore()
+        store.put("user:7:concurrent", {"tokens": 0, "last_refill": REFILL})
+        store.put("user:70:concurrent", {"tokens": 0, "last_refill": REFILL})
+        flush_buckets(store, factory)
+        store.put("user:7:concurrent", {"tokens": 1, "last_refill": REFILL})
+
+        with factory() as session:
+            AccountService(session, bucket_store=store).delete_account(7, "u7@example.com")
+        flush_buckets(store, factory)
+
+        with factory() as session:
+            repo = SQLAlchemyRateLimitRepository(session)
+            assert repo.get_by_key("user:7:concurrent") is None
+            assert repo.get_by_key("user:70:concurrent") is not None
+        assert store.get("user:7:concurrent") is None
+
+    def test_failed_flush_keeps_buckets_dirty(self, tmp_path: Path) -> None:
+        no_tables = create_engine(f"sqlite:///{tmp_path}/empty.db")
+        store = ShardedBucketStore()
+        store.put("a", {"tokens": 3, "last_refill": REFILL})
+        with pytest.raises(DatabaseOperationError):
+            flush_buckets(store, sessionmaker(bind=no_tables))
+        no_tables.dispose()
+        assert list(store.take_dirty()) == ["a"]
+
+
+@pytest.mark.unit
+def test_backend_setting_selects_repository(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth = get_settings().auth
+    assert isinstance(services.rate_limit_repository(None), SQLAlchemyRateLimitRepository)  # type: ignore[arg-type]
+    monkeypatch.setattr(auth, "RATE_LIMIT_BACKEND", "memory")
+    repository = services.rate_limit_repository(None)  # type: ignore[arg-type]
+    assert isinstance(repository, InMemoryRateLimitRepository)
+    assert repository.store is services.get_bucket_store()
+    assert isinstance(
+        services.async_rate_limit_repository(None),  # type: ignore[arg-type]
+        AsyncInMemoryRateLimitRepository,
+    )
@@ -0,0 +1,163 @@
+"""Unit tests for the SQLite-file ``limits`` storage behind slowapi.
+
+Verifies:
+
+  * ``sqlite:///`` URIs resolve to the storage; in-memory paths are rejected
+  * moving window: admits up to the limit, then frees slots as hits age out
+  * fixed window: counters accumulate and reset after expiry
+  * two storage instances on one file share counters (the multi-worker case)
+  * a check that cannot take the write lock in time fails closed
+  * reset / clear drop state
+  * a slowapi route limited through the storage answers 429 past its limit
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, MovingWindowRateLimiter
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from starlette.requests import Request
+
+from app.infrastructure.rate_limit import SQLiteLimitsStorage
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def storage(tmp_path: Path, clock: _Clock) -> SQLiteLimitsStorage:
+    return SQLiteLimitsStorage(f"sqlite:///{tmp_path}/limits.db", clock=clock)
+
+
+@pytest.mark.unit
+def test_uri_scheme_registered(tmp_path: Path) -> None:
+    assert isinstance(storage_from_string(f"sqlite:///{tmp_path}/l.db"), SQLiteLimitsStorage)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("uri", ["sqlite://", "sqlite:///:memory:", "memory://"])
+def test_rejects_unshareable_uri(uri: str) -> None:
+    with pytest.raises(ValueError):
+        SQLiteLimitsStorage(uri)
+
+
+@pytest.mark.unit
+def test_moving_window_admits_up_to_limit_then_slides(
+    storage: SQLiteLimitsStorage, clock: _Clock
+) -> None:
+    assert [storage.acquire_entry("k", 3, 60) for _ in range(4)] == [True, True, True, False]
+    clock.now += 30
+    assert storage.acquire_entry("k", 3, 60) is False
+    assert storage.get_moving_window("k", 3, 60) == (1_000_000.0, 3)
+    clock.now += 31  # first three hits aged out
+    assert storage.acquire_entry("k", 3, 60) is True
+    assert storage.get_moving_window("k", 3, 60) == (clock.now, 1)
+
+
+@pytest.mark.unit
+def test_moving_window_amount_is_all_or_nothing(storage: SQLiteLimitsStorage) -> None:
+    assert storage.acquire_entry("k", 3, 60, amount=2) is True
+    assert storage.acquire_entry("k", 3, 60, amount=2) is False
+    assert storage.acquire_entry("k", 3, 60, amount=5) is False
+    assert storage.get_moving_window("k", 3, 60)[1] == 2
+
+
+@pytest.mark.unit
+def test_fixed_window_counter_expires(storage: SQLiteLimitsStorage, clock: _Clock) -> None:
+    assert storage.incr("k", 60) == 1
+    assert storage.incr("k", 60, amount=2) == 3
+    assert storage.get("k") == 3
+    assert storage.get_expiry("k") == clock.now + 60
+    clock.now += 61
+    assert storage.get("k") == 0
+    assert storage.incr("k", 60) == 1
+    assert storage.get_expiry("k") == clock.now + 60
+
+
+@pytest.mark.unit
+def test_instances_on_one_file_share_counters(tmp_path: Path) -> None:
+    uri = f"sqlite:///{tmp_path}/shared.db"
+    worker_a = MovingWindowRateLimiter(SQLiteLimitsStorage(uri))
+    worker_b = MovingWindowRateLimiter(SQLiteLimitsStorage(uri))
+    limit = parse("4/minute")
+    results = [(worker_a if i % 2 else worker_b).hit(limit, "10.0.0.0/24") for i in range(6)]
+    assert results == [True, True, True, True, False, False]
+
+    fixed_a = FixedWindowRateLimiter(SQLiteLimitsStorage(uri))
+    fixed_b = FixedWindowRateLimiter(SQLiteLimitsStorage(uri))
+    assert fixed_a.hit(parse("1/minute"), "x") is True
+    assert fixed_b.hit(parse("1/minute"), "x") is False
+
+
+@pytest.mark.unit
+def test_busy_write_lock_fails_closed(tmp_path: Path) -> None:
+    storage = SQLiteLimitsStorage(f"sqlite:///{tmp_path}/busy.db")
+    other_worker = sqlite3.connect(f"{tmp_path}/busy.db", isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert storage.acquire_entry("k", 5, 60) is False
+        assert storage.incr("k", 60) > 5
+        assert time.monotonic() - started < 0.5
+    finally:
+        other_worker.execute("ROLLBACK")
+        other_worker.close()
+    assert storage.acquire_entry("k", 5, 60) is True
+    assert storage.incr("k", 60) == 1
+
+
+@pytest.mark.unit
+def test_reset_and_clear(storage: SQLiteLimitsStorage) -> None:
+    storage.acquire_entry("a", 5, 60)
+    storage.incr("b", 60)
+    storage.incr("c", 60)
+    storage.clear("b")
+    assert storage.get("b") == 0
+    assert storage.check() is True
+    assert storage.reset() == 2
+    assert storage.get_moving_window("a", 5, 60)[1] == 0
+    assert storage.get("c") == 0
+
+
+@pytest.mark.unit
+def test_slowapi_route_limited_through_sqlite_storage(tmp_path: Path) -> None:
+    limiter = Limiter(
+        key_func=lambda request: "subnet",
+        storage_uri=f"sqlite:///{tmp_path}/limits.db",
+        strategy="moving-window",
+    )
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    @app.get("/login")
+    @limiter.limit("2/minute")
+    async def login(request: Request) -> dict:
+        return {}
+
+    async def main() -> list[int]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            return [(await client.get("/login")).status_code for _ in range(3)]
+
+    assert asyncio.run(main()) == [200, 200, 429]
@@ -0,0 +1,63 @@
+"""Unit tests for kernel-side file concatenation used by TUS final uploads."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from app.infrastructure.storage import file_concat
+from app.infrastructure.storage.file_concat import concatenate_files
+
+
+def _write_parts(tmp_path: Path, payloads: list[bytes]) -> list[Path]:
+    parts = []
+    for index, payload in enumerate(payloads):
+        part = tmp_path / f"part{index}"
+        part.write_bytes(payload)
+        parts.append(part)
+    return parts
+
+
+@pytest.mark.unit
+class TestConcatenateFiles:
+    """Test suite for concatenate_files."""
+
+    def test_parts_are_appended_in_order(self, tmp_path: Path) -> None:
+        payloads = [os.urandom(1024), b"", os.urandom(3 * 1024 * 1024 + 7)]
+        parts = _write_parts(tmp_path, payloads)
+        destination = tmp_path / "final"
+
+        written = concatenate_files(destination, parts)
+
+        assert written == sum(len(p) for p in payloads)
+        assert destination.read_bytes() == b"".join(payloads)
+
+    def test_destination_is_truncated(self, tmp_path: Path) -> None:
+        parts = _write_parts(tmp_path, [b"abc"])
+        destination = tmp_path / "final"
+        destination.write_bytes(b"stale data that is longer")
+
+        concatenate_files(destination, parts)
+
+        assert destination.read_bytes() == b"abc"
+
+    def test_falls_back_when_syscalls_unsupported(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def unsupported(*_args: object) -> int:
+            raise OSError(38, "Function not implemented")
+
+        monkeypatch.setattr(file_concat.os, "copy_file_range", unsupported, raising=False)
+        monkeypatch.setattr(file_concat.os, "sendfile", unsupported, raising=False)
+        payloads = [b"first-", b"second-", b"third"]
+        parts = _write_parts(tmp_path, payloads)
+        destination = tmp_path / "final"
+
+        written = concatenate_files(destination, parts)
+
+        assert written == len(b"first-second-third")
+        assert destination.read_bytes() == b"first-second-third"
+
+    def test_missing_part_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(OSError):
+            concatenate_files(tmp_path / "final", [tmp_path / "missing"])
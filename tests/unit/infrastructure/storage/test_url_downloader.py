@@ -0,0 +1,202 @@
+"""Unit tests for the async URL source downloader and its disk cache."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.core.exceptions import AudioTooLargeError
+from app.infrastructure.storage.url_downloader import DownloadedFile, UrlDownloader
+
+URL = "https://media.example.com/talk.mp3"
+
+
+def _resolve(url: str, content_disposition: str | None) -> tuple[str, str]:
+    return os.path.basename(url), ".mp3"
+
+
+class _Origin:
+    """In-memory origin: ETag validation, optional Range support, request log."""
+
+    def __init__(
+        self,
+        body: bytes,
+        *,
+        etag: str | None = '"v1"',
+        ranges: bool = False,
+        content_length: bool = True,
+    ) -> None:
+        self.body = body
+        self.etag = etag
+        self.ranges = ranges
+        self.content_length = content_length
+        self.requests: list[httpx.Request] = []
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self._handle)
+
+    async def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        headers = {"ETag": self.etag} if self.etag else {}
+        if self.ranges:
+            headers["Accept-Ranges"] = "bytes"
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers=headers)
+        requested = request.headers.get("Range")
+        if requested and self.ranges and request.headers.get("If-Range") == self.etag:
+            start, end = (int(n) for n in requested.removeprefix("bytes=").split("-"))
+            part = self.body[start : end + 1]
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(self.body)}"
+            return httpx.Response(206, content=part, headers=headers)
+        if not self.content_length:
+            return httpx.Response(200, stream=_Chunked(self.body), headers=headers)
+        return httpx.Response(200, content=self.body, headers=headers)
+
+
+class _Chunked(httpx.AsyncByteStream):
+    """A body without Content-Length (chunked transfer)."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def __aiter__(self):
+        for start in range(0, len(self._body), 1000):
+            yield self._body[start : start + 1000]
+
+
+def _downloader(origin: _Origin, tmp_path: Path, **kwargs: object) -> UrlDownloader:
+    options: dict[str, object] = {
+        "max_bytes": 1024 * 1024,
+        "cache_dir": tmp_path / "cache",
+        "cache_max_bytes": 1024 * 1024,
+    }
+    options.update(kwargs)
+    return UrlDownloader(transport=origin.transport(), **options)  # type: ignore[arg-type]
+
+
+def _read(downloaded: DownloadedFile) -> bytes:
+    try:
+        return Path(downloaded.path).read_bytes()
+    finally:
+        os.unlink(downloaded.path)
+
+
+@pytest.mark.unit
+class TestUrlDownloader:
+    def test_streams_body_to_a_temp_file(self, tmp_path: Path) -> None:
+        body = os.urandom(300_000)
+        origin = _Origin(body, etag=None)
+
+        downloaded = asyncio.run(_downloader(origin, tmp_path).download(URL, _resolve))
+
+        assert downloaded.filename == "talk.mp3"
+        assert downloaded.path.endswith(".mp3")
+        assert not downloaded.from_cache
+        assert _read(downloaded) == body
+        assert not (tmp_path / "cache").exists()  # no validator: not cached
+
+    def test_revalidates_cached_copy_with_conditional_request(self, tmp_path: Path) -> None:
+        body = os.urandom(50_000)
+        origin = _Origin(body)
+        downloader = _downloader(origin, tmp_path)
+
+        first = asyncio.run(downloader.download(URL, _resolve))
+        second = asyncio.run(downloader.download(URL, _resolve))
+
+        assert _read(first) == body
+        assert second.from_cache
+        assert second.path != first.path
+        assert _read(second) == body
+        assert "If-None-Match" not in origin.requests[0].headers
+        assert origin.requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_changed_source_replaces_cached_copy(self, tmp_path: Path) -> None:
+        origin = _Origin(b"old" * 100)
+        downloader = _downloader(origin, tmp_path)
+        _read(asyncio.run(downloader.download(URL, _resolve)))
+
+        origin.body, origin.etag = b"new" * 100, '"v2"'
+        changed = asyncio.run(downloader.download(URL, _resolve))
+        assert not changed.from_cache
+        assert _read(changed) == b"new" * 100
+
+        again = asyncio.run(downloader.download(URL, _resolve))
+        assert again.from_cache
+        assert _read(again) == b"new" * 100
+
+    def test_announced_size_over_limit_is_rejected_before_reading(
+        self, tmp_path: Path
+    ) -> None:
+        origin = _Origin(os.urandom(2048))
+
+        with pytest.raises(AudioTooLargeError):
+            asyncio.run(_downloader(origin, tmp_path, max_bytes=1024).download(URL, _resolve))
+        assert list((tmp_path / "cache").glob("*")) == []
+
+    def test_size_limit_is_enforced_while_streaming(self, tmp_path: Path) -> None:
+        origin = _Origin(os.urandom(5000), content_length=False)
+
+        with pytest.raises(AudioTooLargeError):
+            asyncio.run(_downloader(origin, tmp_path, max_bytes=4096).download(URL, _resolve))
+        assert list((tmp_path / "cache").glob("*")) == []
+
+    def test_large_sources_download_in_parallel_ranges(self, tmp_path: Path) -> None:
+        body = os.urandom(100_003)
+        origin = _Origin(body, ranges=True)
+        downloader = _downloader(
+            origin, tmp_path, range_segments=4, range_min_bytes=10_000
+        )
+
+        downloaded = asyncio.run(downloader.download(URL, _resolve))
+
+        assert _read(downloaded) == body
+        ranges = sorted(r.headers["Range"] for r in origin.requests if "Range" in r.headers)
+        assert len(ranges) == 4
+        assert all(r.headers["If-Range"] == '"v1"' for r in origin.requests[1:])
+
+    def test_range_refusal_falls_back_to_one_stream(self, tmp_path: Path) -> None:
+        body = os.urandom(40_000)
+        origin = _Origin(body, ranges=True)
+        origin_handle = origin._handle
+
+        async def ignore_ranges(request: httpx.Request) -> httpx.Response:
+            if "Range" in request.headers:
+                origin.requests.append(request)
+                return httpx.Response(200, content=body, headers={"ETag": '"v1"'})
+            return await origin_handle(request)
+
+        downloader = UrlDownloader(
+            max_bytes=1024 * 1024,
+            range_segments=4,
+            range_min_bytes=10_000,
+            transport=httpx.MockTransport(ignore_ranges),
+        )
+
+        downloaded = asyncio.run(downloader.download(URL, _resolve))
+        assert _read(downloaded) == body
+        plain = [r for r in origin.requests if "Range" not in r.headers]
+        assert len(plain) == 2  # the probing GET, then the fallback stream
+
+    def test_cache_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        origin = _Origin(os.urandom(600))
+        downloader = _downloader(origin, tmp_path, cache_max_bytes=1000)
+
+        for name in ("a", "b"):
+            _read(asyncio.run(downloader.download(f"{URL}?{name}", _resolve)))
+
+        assert len(list((tmp_path / "cache").glob("*.bin"))) == 1
+        latest = asyncio.run(downloader.download(f"{URL}?b", _resolve))
+        assert latest.from_cache
+        _read(latest)
+
+    def test_disabled_cache_always_downloads(self, tmp_path: Path) -> None:
+        origin = _Origin(b"x" * 100)
+        downloader = _downloader(origin, tmp_path, cache_max_bytes=0)
+
+        for _ in range(2):
+            downloaded = asyncio.run(downloader.download(URL, _resolve))
+            assert not downloaded.from_cache
+            _read(downloaded)
+        assert all("If-None-Match" not in r.headers for r in origin.requests)
@@ -0,0 +1,273 @@
+"""Unit tests for the task-callback outbox + asyncio dispatcher.
+
+Verifies:
+
+  * enqueue writes a pending row and mirrors ``tasks.callback_status``
+  * a due row is POSTed once over the pooled client and marked delivered
+  * failures back off (base * 2^n, capped), then end as failed
+  * a claimed row is leased: a second dispatcher does not take it until
+    the lease lapses (crash mid-delivery)
+  * on row-locking backends the claim skips rows another claim has locked
+  * deliveries to one host never exceed ``max_per_host`` in flight
+  * a started dispatcher delivers on ``notify`` without waiting for a poll
+  * bodies from ``gzip_min_bytes`` up are sent gzip-encoded
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from collections.abc import Callable, Generator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.infrastructure.webhooks import WebhookDispatcher
+
+URL = "http://hooks.test/callback"
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Tmp-file SQLite with one user and three tasks (u-1 .. u-3)."""
+    engine = create_engine(f"sqlite:///{tmp_path}/hooks.db")
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(ORMUser(id=1, email="u1@example.com", password_hash="x"))
+        session.flush()
+        for n in (1, 2, 3):
+            session.add(ORMTask(uuid=f"u-{n}", status="completed", task_type="t", user_id=1))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def _dispatcher(
+    engine: Engine,
+    handler: Callable[[httpx.Request], object],
+    clock: _Clock,
+    **kwargs: object,
+) -> WebhookDispatcher:
+    options: dict[str, object] = {"retry_base_seconds": 2.0, "retry_max_seconds": 5.0}
+    options.update(kwargs)
+    return WebhookDispatcher(
+        sessionmaker(bind=engine),
+        transport=httpx.MockTransport(handler),
+        clock=clock,
+        **options,
+    )
+
+
+async def _dispatch(dispatcher: WebhookDispatcher) -> int:
+    """One pass without the background loop (the test drives the clock)."""
+    try:
+        return await dispatcher.dispatch_once()
+    finally:
+        await dispatcher.stop()
+
+
+def _state(engine: Engine, task_uuid: str = "u-1") -> tuple:
+    with engine.connect() as conn:
+        return conn.execute(
+            text(
+                "SELECT d.status, d.attempts, d.last_status_code, t.callback_status "
+                "FROM webhook_deliveries d JOIN tasks t ON t.id = d.task_id "
+                "WHERE t.uuid = :uuid"
+            ),
+            {"uuid": task_uuid},
+        ).one()
+
+
+@pytest.mark.unit
+class TestWebhookDispatcher:
+    def test_enqueue_then_deliver(self, engine: Engine) -> None:
+        received: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(200)
+
+        clock = _Clock()
+        dispatcher = _dispatcher(engine, handler, clock)
+        payload = json.dumps({"status": "completed", "end_time": "2026-01-01T12:00:00"})
+        assert dispatcher.enqueue("u-1", URL, payload) is not None
+        assert _state(engine) == ("pending", 0, None, "pending")
+
+        assert asyncio.run(_dispatch(dispatcher)) == 1
+        assert _state(engine) == ("delivered", 1, 200, "delivered")
+        assert len(received) == 1
+        assert received[0].headers["content-type"] == "application/json"
+        assert json.loads(received[0].content) == json.loads(payload)
+        assert asyncio.run(_dispatch(dispatcher)) == 0  # never re-sent
+
+    def test_large_bodies_are_gzip_encoded(self, engine: Engine) -> None:
+        received: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(200)
+
+        dispatcher = _dispatcher(engine, handler, _Clock(), gzip_min_bytes=1024)
+        small = json.dumps({"status": "completed"})
+        large = json.dumps({"segments": [{"text": "word " * 10}] * 100})
+        dispatcher.enqueue("u-1", URL, small)
+        dispatcher.enqueue("u-2", URL, large)
+
+        assert asyncio.run(_dispatch(dispatcher)) == 2
+        by_encoding = {r.headers.get("content-encoding"): r for r in received}
+        assert by_encoding[None].content == small.encode()
+        compressed = by_encoding["gzip"]
+        assert compressed.headers["content-type"] == "application/json"
+        assert len(compressed.content) < len(large) // 10
+        assert gzip.decompress(compressed.content) == large.encode()
+
+    def test_gzip_can_be_disabled(self, engine: Engine) -> None:
+        received: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request)
+            return httpx.Response(200)
+
+        dispatcher = _dispatcher(engine, handler, _Clock(), gzip_min_bytes=0)
+        large = json.dumps({"segments": [{"text": "word " * 10}] * 100})
+        dispatcher.enqueue("u-1", URL, large)
+
+        assert asyncio.run(_dispatch(dispatcher)) == 1
+        assert "content-encoding" not in received[0].headers
+        assert received[0].content == large.encode()
+
+    def test_enqueue_for_deleted_task_is_dropped(self, engine: Engine) -> None:
+        dispatcher = _dispatcher(engine, lambda request: httpx.Response(200), _Clock())
+        assert dispatcher.enqueue("gone", URL, "{}") is None
+
+    def test_failures_back_off_then_mark_failed(self, engine: Engine) -> None:
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(503, text="busy")
+
+        clock = _Clock()
+        dispatcher = _dispatcher(engine, handler, clock, max_attempts=3)
+        dispatcher.enqueue("u-1", URL, "{}")
+
+        assert asyncio.run(_dispatch(dispatcher)) == 1
+        assert _state(engine) == ("pending", 1, None, "pending")
+        clock.now += timedelta(seconds=1.9)
+        assert asyncio.run(_dispatch(dispatcher)) == 0  # backing off (2 s)
+        clock.now += timedelta(seconds=0.1)
+        assert asyncio.run(_dispatch(dispatcher)) == 1
+        assert _state(engine) == ("pending", 2, 503, "pending")
+        clock.now += timedelta(seconds=4)  # 2 * 2^1
+        assert asyncio.run(_dispatch(dispatcher)) == 1
+        assert _state(engine) == ("failed", 3, 503, "failed")
+        clock.now += timedelta(hours=1)
+        assert asyncio.run(_dispatch(dispatcher)) == 0
+        assert len(calls) == 3
+
+    def test_backoff_is_capped(self, engine: Engine) -> None:
+        dispatcher = _dispatcher(engine, lambda request: httpx.Response(200), _Clock())
+        assert [dispatcher.backoff(n).total_seconds() for n in (1, 2, 3, 10)] == [
+            2.0,
+            4.0,
+            5.0,
+            5.0,
+        ]
+
+    def test_claim_is_leased_until_abandoned(self, engine: Engine) -> None:
+        clock = _Clock()
+        crashed = _dispatcher(engine, lambda request: httpx.Response(200), clock)
+        crashed.enqueue("u-1", URL, "{}")
+        assert len(crashed._claim(clock.now, clock.now + timedelta(minutes=1))) == 1
+
+        survivor = _dispatcher(engine, lambda request: httpx.Response(200), clock)
+        assert asyncio.run(_dispatch(survivor)) == 0
+        clock.now += timedelta(minutes=1)
+        assert asyncio.run(_dispatch(survivor)) == 1
+        assert _state(engine) == ("delivered", 2, 200, "delivered")
+
+    def test_claim_skips_locked_rows_on_row_locking_backends(self) -> None:
+        from sqlalchemy.dialects import postgresql, sqlite
+
+        from app.infrastructure.database.repositories.sqlalchemy_webhook_delivery_repository import (
+            _CLAIM_DUE,
+        )
+
+        assert "FOR UPDATE SKIP LOCKED" in str(_CLAIM_DUE.compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE" not in str(_CLAIM_DUE.compile(dialect=sqlite.dialect()))
+
+    def test_per_host_concurrency_is_bounded(self, engine: Engine) -> None:
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(204)
+
+        dispatcher = _dispatcher(engine, handler, _Clock(), max_per_host=2)
+        for task_uuid in ("u-1", "u-2", "u-3"):
+            dispatcher.enqueue(task_uuid, URL, "{}")
+        assert asyncio.run(_dispatch(dispatcher)) == 3
+        assert in_flight["peak"] == 2
+        assert {_state(engine, f"u-{n}")[0] for n in (1, 2, 3)} == {"delivered"}
+
+    def test_notify_wakes_running_dispatcher(self, engine: Engine) -> None:
+        delivered = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            delivered.set()
+            return httpx.Response(200)
+
+        async def main() -> None:
+            dispatcher = WebhookDispatcher(
+                sessionmaker(bind=engine),
+                transport=httpx.MockTransport(handler),
+                poll_seconds=60,
+            )
+            await dispatcher.start()
+            try:
+                await asyncio.sleep(0.05)  # first (empty) pass, then idle
+                await asyncio.to_thread(dispatcher.enqueue, "u-1", URL, "{}")
+                await asyncio.wait_for(delivered.wait(), timeout=5)
+            finally:
+                await dispatcher.stop()
+
+        asyncio.run(main())
+
+    def test_session_factory_is_only_used_for_short_transactions(self, engine: Engine) -> None:
+        opened: list[Session] = []
+        factory = sessionmaker(bind=engine)
+
+        def tracking_factory() -> Session:
+            session = factory()
+            opened.append(session)
+            return session
+
+        dispatcher = WebhookDispatcher(
+            tracking_factory,
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+            clock=_Clock(),
+        )
+        dispatcher.enqueue("u-1", URL, "{}")
+        asyncio.run(_dispatch(dispatcher))
+        assert len(opened) == 3  # enqueue, claim, record
@@ -0,0 +1,156 @@
+"""Unit tests for the non-blocking WebSocket progress emitter.
+
+Verifies:
+
+  * emitting from a worker thread returns without waiting on the send
+  * pending progress for one task coalesces to the latest update
+  * errors are never coalesced and follow the task's earlier progress
+  * the pending map is bounded; the oldest progress is dropped first
+  * a stalled client only delays its own task
+  * an emitter that was never started drops instead of queueing
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from app.infrastructure.websocket.progress_emitter import ProgressEmitter
+from app.schemas import TaskProgressStage
+
+
+class _FakeManager:
+    def __init__(self, slow_tasks: dict[str, float] | None = None) -> None:
+        self.slow_tasks = slow_tasks or {}
+        self.sent: list[tuple[str, dict[str, Any]]] = []
+
+    async def send_to_task(self, task_id: str, message: dict[str, Any]) -> None:
+        await asyncio.sleep(self.slow_tasks.get(task_id, 0.0))
+        self.sent.append((task_id, message))
+
+
+def _summary(sent: list[tuple[str, dict[str, Any]]]) -> list[tuple[str, str, Any]]:
+    return [
+        (task_id, message["type"], message.get("percentage", message.get("error_code")))
+        for task_id, message in sent
+    ]
+
+
+@pytest.mark.unit
+class TestProgressEmitter:
+    def test_emit_from_worker_thread_does_not_wait_for_delivery(self) -> None:
+        manager = _FakeManager(slow_tasks={"t": 0.2})
+        emitter = ProgressEmitter(manager)  # type: ignore[arg-type]
+        elapsed: list[float] = []
+
+        def worker() -> None:
+            started = time.perf_counter()
+            for percentage in range(0, 101, 10):
+                emitter.emit_progress("t", TaskProgressStage.transcribing, percentage)
+            elapsed.append(time.perf_counter() - started)
+
+        async def scenario() -> None:
+            await emitter.start()
+            await asyncio.to_thread(worker)
+            await emitter.stop()
+
+        asyncio.run(scenario())
+
+        assert elapsed[0] < 0.1
+        assert manager.sent[-1][1]["percentage"] == 100
+
+    def test_pending_progress_coalesces_per_task(self) -> None:
+        manager = _FakeManager()
+        emitter = ProgressEmitter(manager)  # type: ignore[arg-type]
+
+        async def scenario() -> None:
+            await emitter.start()
+            for percentage in (10, 20, 30):
+                emitter.emit_progress("a", TaskProgressStage.transcribing, percentage)
+            emitter.emit_progress("b", TaskProgressStage.aligning, 50)
+            assert emitter.pending_count == 2
+            await emitter.stop()
+
+        asyncio.run(scenario())
+
+        assert _summary(manager.sent) == [
+            ("a", "progress", 30),
+            ("b", "progress", 50),
+        ]
+
+    def test_errors_are_kept_in_order_with_progress(self) -> None:
+        manager = _FakeManager()
+        emitter = ProgressEmitter(manager)  # type: ignore[arg-type]
+
+        async def scenario() -> None:
+            await emitter.start()
+            emitter.emit_progress("a", TaskProgressStage.transcribing, 40)
+            emitter.emit_error("a", "PROCESSING_FAILED", "first")
+            emitter.emit_error("a", "PROCESSING_FAILED", "second")
+            emitter.emit_progress("a", TaskProgressStage.complete, 100)
+            await emitter.stop()
+
+        asyncio.run(scenario())
+
+        assert [m["type"] for _, m in manager.sent] == ["error", "error", "progress"]
+        assert [m.get("user_message") for _, m in manager.sent[:2]] == ["first", "second"]
+        assert manager.sent[2][1]["percentage"] == 100
+
+    def test_bounded_queue_drops_oldest_progress_first(self) -> None:
+        manager = _FakeManager()
+        emitter = ProgressEmitter(manager, max_pending=3)  # type: ignore[arg-type]
+
+        async def scenario() -> None:
+            await emitter.start()
+            emitter.emit_progress("a", TaskProgressStage.transcribing, 10)
+            emitter.emit_error("b", "PROCESSING_FAILED", "boom")
+            emitter.emit_progress("c", TaskProgressStage.transcribing, 30)
+            emitter.emit_progress("d", TaskProgressStage.transcribing, 40)
+            assert emitter.pending_count == 3
+            await emitter.stop()
+
+        asyncio.run(scenario())
+
+        assert emitter.dropped == 1
+        assert _summary(manager.sent) == [
+            ("b", "error", "PROCESSING_FAILED"),
+            ("c", "progress", 30),
+            ("d", "progress", 40),
+        ]
+
+    def test_stalled_client_only_delays_its_own_task(self) -> None:
+        manager = _FakeManager(slow_tasks={"slow": 10.0})
+        emitter = ProgressEmitter(manager, send_timeout_seconds=0.2)  # type: ignore[arg-type]
+
+        async def scenario() -> None:
+            await emitter.start()
+            emitter.emit_progress("slow", TaskProgressStage.transcribing, 10)
+            emitter.emit_progress("fast", TaskProgressStage.transcribing, 20)
+            await asyncio.sleep(0.05)
+            assert _summary(manager.sent) == [("fast", "progress", 20)]
+            await asyncio.sleep(0.3)  # the stalled send has timed out
+            emitter.emit_progress("fast", TaskProgressStage.aligning, 60)
+            await asyncio.sleep(0.05)
+            await emitter.stop()
+
+        asyncio.run(scenario())
+
+        assert _summary(manager.sent) == [
+            ("fast", "progress", 20),
+            ("fast", "progress", 60),
+        ]
+
+    def test_not_started_emitter_drops_messages(self) -> None:
+        emitter = ProgressEmitter(_FakeManager())  # type: ignore[arg-type]
+
+        emitter.emit_progress("a", TaskProgressStage.transcribing, 10)
+        emitter.emit_error("a", "PROCESSING_FAILED", "boom")
+
+        assert emitter.pending_count == 0
+
+    def test_rejects_invalid_max_pending(self) -> None:
+        with pytest.raises(ValueError):
+            ProgressEmitter(_FakeManager(), max_pending=0)  # type: ignore[arg-type]
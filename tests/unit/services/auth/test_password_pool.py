@@ -0,0 +1,69 @@
+"""Unit tests for the bounded Argon2 pool (PasswordHashPool)."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.exceptions import PasswordHasherBusyError
+from app.services.auth.password_pool import PasswordHashPool
+from app.services.auth.password_service import PasswordService
+
+
+@pytest.fixture
+def pool() -> Generator[PasswordHashPool, None, None]:
+    pool = PasswordHashPool(workers=1, max_pending=2, retry_after_seconds=3)
+    yield pool
+    pool.shutdown()
+
+
+def _occupy(pool: PasswordHashPool, count: int) -> tuple[threading.Event, ThreadPoolExecutor]:
+    """Admit ``count`` calls that block until the returned event is set."""
+    release = threading.Event()
+    callers = ThreadPoolExecutor(max_workers=count)
+    for _ in range(count):
+        callers.submit(pool.run, release.wait)
+    while pool.stats().pending < count:
+        threading.Event().wait(0.001)
+    return release, callers
+
+
+@pytest.mark.unit
+class TestPasswordHashPool:
+    def test_run_returns_result_and_records_latency(self, pool: PasswordHashPool) -> None:
+        assert pool.run(sum, [1, 2, 3]) == 6
+        stats = pool.stats()
+        assert stats.completed == 1 and stats.pending == 0
+        assert stats.hash_max_ms >= stats.hash_p50_ms >= 0
+
+    def test_saturated_pool_sheds_with_retry_after(self, pool: PasswordHashPool) -> None:
+        release, callers = _occupy(pool, 2)  # one running, one queued
+        try:
+            with pytest.raises(PasswordHasherBusyError) as excinfo:
+                pool.run(sum, [1])
+            assert excinfo.value.code == "PASSWORD_HASHER_BUSY"
+            assert excinfo.value.details["retry_after_seconds"] == 3
+            assert pool.stats().rejected == 1
+        finally:
+            release.set()
+            callers.shutdown(wait=True)
+        assert pool.run(sum, [1]) == 1  # admits again once drained
+        assert pool.stats().pending == 0
+
+    def test_worker_exception_propagates_and_frees_slot(self, pool: PasswordHashPool) -> None:
+        with pytest.raises(ZeroDivisionError):
+            pool.run(divmod, 1, 0)
+        assert pool.stats().pending == 0
+
+    def test_rejects_pending_below_workers(self) -> None:
+        with pytest.raises(ValueError):
+            PasswordHashPool(workers=4, max_pending=2)
+
+    def test_password_service_hashes_on_pool(self, pool: PasswordHashPool) -> None:
+        service = PasswordService(pool=pool)
+        hashed = service.hash_password("hunter2")
+        assert service.verify_password("hunter2", hashed) is True
+        assert pool.stats().completed == 2
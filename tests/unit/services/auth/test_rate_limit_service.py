@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from app.domain.entities.rate_limit_bucket import RateLimitBucket
-from app.services.auth.rate_limit_service import RateLimitService
+from app.services.auth.rate_limit_service import BucketRequest, RateLimitService
 
 
 @pytest.mark.unit
@@ -58,3 +58,63 @@ class TestRateLimitService:
         )
         # Bucket state still updated (last_refill bumped).
         mock_repo.upsert_atomic.assert_called_once()
+
+
+class _BatchRepo:
+    """Repository fake that runs the batch ``decide`` step like the real one."""
+
+    def __init__(self, buckets: dict[str, RateLimitBucket]) -> None:
+        self.buckets = buckets
+        self.written: dict[str, dict] | None = None
+
+    def upsert_many_atomic(self, bucket_keys, decide) -> None:
+        current = {k: self.buckets[k] for k in bucket_keys if k in self.buckets}
+        self.written = decide(current)
+
+
+@pytest.mark.unit
+class TestCheckAndConsumeAll:
+    def _requests(self) -> list[BucketRequest]:
+        return [
+            BucketRequest("user:1:tx:hour", tokens_needed=1, rate=0.0, capacity=5),
+            BucketRequest("user:1:concurrent", tokens_needed=1, rate=0.0, capacity=1),
+        ]
+
+    def test_all_allowed_writes_every_bucket(self) -> None:
+        repo = _BatchRepo({})
+        allowed = RateLimitService(repo).check_and_consume_all(self._requests())  # type: ignore[arg-type]
+        assert allowed == [True, True]
+        assert repo.written is not None
+        assert repo.written["user:1:tx:hour"]["tokens"] == 4
+        assert repo.written["user:1:concurrent"]["tokens"] == 0
+
+    def test_any_denial_writes_nothing(self) -> None:
+        now = datetime.now(timezone.utc)
+        repo = _BatchRepo(
+            {
+                "user:1:concurrent": RateLimitBucket(
+                    id=1, bucket_key="user:1:concurrent", tokens=0, last_refill=now,
+                )
+            }
+        )
+        allowed = RateLimitService(repo).check_and_consume_all(self._requests())  # type: ignore[arg-type]
+        assert allowed == [True, False]
+        assert repo.written == {}
+
+    def test_settle_exception_propagates(self) -> None:
+        def settle(allowed: list[bool]) -> None:
+            raise RuntimeError("veto")
+
+        repo = _BatchRepo({})
+        with pytest.raises(RuntimeError, match="veto"):
+            RateLimitService(repo).check_and_consume_all(  # type: ignore[arg-type]
+                self._requests(), settle=settle
+            )
+        assert repo.written is None
+
+    def test_duplicate_keys_rejected(self) -> None:
+        request = self._requests()[0]
+        with pytest.raises(ValueError, match="Duplicate"):
+            RateLimitService(_BatchRepo({})).check_and_consume_all(  # type: ignore[arg-type]
+                [request, request]
+            )
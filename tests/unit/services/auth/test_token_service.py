@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
+from app.core import jwt_codec
 from app.core.exceptions import JwtTamperedError
 from app.services.auth.token_service import TokenService
 
@@ -40,3 +43,31 @@ class TestTokenService:
         # decodes successfully rather than asserting inequality.
         payload, _ = service.verify_and_refresh(new_token, current_token_version=0)
         assert int(payload["sub"]) == 42
+
+    def test_refresh_if_due_skips_fresh_token(self) -> None:
+        service = TokenService(
+            secret="test-secret-at-least-32-bytes-long!",
+            ttl_days=7,
+            refresh_threshold_seconds=6 * 86400,
+        )
+        payload = jwt_codec.decode_session(
+            service.issue(user_id=42, token_version=0), secret=service.secret
+        )
+        assert service.refresh_if_due(payload, current_token_version=0) is None
+
+    def test_refresh_if_due_reissues_near_expiry(self) -> None:
+        service = TokenService(
+            secret="test-secret-at-least-32-bytes-long!",
+            ttl_days=7,
+            refresh_threshold_seconds=6 * 86400,
+        )
+        payload = {"sub": "42", "ver": 0, "exp": int(time.time()) + 3600}
+        new_token = service.refresh_if_due(payload, current_token_version=0)
+        assert new_token is not None
+        refreshed = jwt_codec.decode_session(new_token, secret=service.secret)
+        assert refreshed["exp"] > payload["exp"]
+
+    def test_refresh_if_due_rejects_version_mismatch(self, service: TokenService) -> None:
+        payload = {"sub": "42", "ver": 0, "exp": int(time.time()) + 3600}
+        with pytest.raises(JwtTamperedError):
+            service.refresh_if_due(payload, current_token_version=1)
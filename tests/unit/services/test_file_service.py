@@ -1,11 +1,14 @@
 """Unit tests for FileService."""
 
+import asyncio
 import os
 from tempfile import NamedTemporaryFile
 
+import httpx
 import pytest
 from fastapi import HTTPException, UploadFile
 
+from app.infrastructure.storage.url_downloader import UrlDownloader
 from app.services.file_service import FileService
 
 
@@ -117,17 +120,56 @@ class TestFileService:
 
     def test_download_from_url_invalid_extension_raises_error(self) -> None:
         """Test download_from_url raises error for invalid extension."""
-        # Mock the requests.get to avoid network calls
-        import unittest.mock as mock
+        # Mock transport to avoid network calls
+        service = FileService(
+            UrlDownloader(
+                max_bytes=1024,
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(200, content=b"text")
+                ),
+            )
+        )
+
+        # Use a URL with invalid extension
+        url = "https://example.com/test.txt"
+        with pytest.raises(ValueError, match="Invalid file extension"):
+            asyncio.run(service.download_from_url(url))
+
+    def test_download_from_url_uses_content_disposition_name(self) -> None:
+        """The Content-Disposition filename wins over the URL path."""
+        service = FileService(
+            UrlDownloader(
+                max_bytes=1024,
+                transport=httpx.MockTransport(
+                    lambda request: httpx.Response(
+                        200,
+                        content=b"RIFF",
+                        headers={"Content-Disposition": 'attachment; filename="talk.WAV"'},
+                    )
+                ),
+            )
+        )
+
+        path, filename = asyncio.run(
+            service.download_from_url("https://example.com/download?id=1")
+        )
+        try:
+            assert filename == "talk.WAV"
+            assert path.endswith(".wav")
+            with open(path, "rb") as f:
+                assert f.read() == b"RIFF"
+        finally:
+            os.unlink(path)
 
-        # Create a mock response with invalid extension
-        mock_response = mock.MagicMock()
-        mock_response.headers.get.return_value = None
+    def test_download_from_url_failure_is_http_400(self) -> None:
+        """Transport errors keep surfacing as HTTP 400."""
 
-        with mock.patch("app.services.file_service.requests.get") as mock_get:
-            mock_get.return_value.__enter__.return_value = mock_response
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
 
-            # Use a URL with invalid extension
-            url = "https://example.com/test.txt"
-            with pytest.raises(ValueError, match="Invalid file extension"):
-                FileService.download_from_url(url)
+        service = FileService(
+            UrlDownloader(max_bytes=1024, transport=httpx.MockTransport(handler))
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(service.download_from_url("https://example.com/a.mp3"))
+        assert exc_info.value.status_code == 400
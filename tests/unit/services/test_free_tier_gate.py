@@ -12,10 +12,14 @@ Coverage (≥11):
   9.  test_daily_audio_cap_consumes
   10. test_concurrency_limit_enforced
   11. test_concurrency_slot_released_after_completion (W1)
+
+AsyncFreeTierGate: one batch for all three buckets, unchanged gate order,
+nothing consumed when any gate fails.
 """
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
@@ -31,6 +35,7 @@ from app.domain.entities.user import User
 from app.services.free_tier_gate import (
     FREE_POLICY,
     PRO_POLICY,
+    AsyncFreeTierGate,
     FreeTierGate,
     concurrency_bucket_key,
 )
@@ -251,3 +256,70 @@ class TestFreeTierGate:
 
     def test_concurrency_bucket_key_is_deterministic(self) -> None:
         assert concurrency_bucket_key(7) == "user:7:concurrent"
+
+
+class _StubAsyncRateLimitService:
+    """Batched RLS stub: canned outcomes per bucket key prefix, like the sync stub."""
+
+    def __init__(self, allow_map: dict[str, bool] | None = None) -> None:
+        self.allow_map = allow_map or {}
+        self.batches: list[list[str]] = []
+        self.consumed = False
+
+    async def check_and_consume_all(self, requests, *, settle=None) -> list[bool]:
+        self.batches.append([r.bucket_key for r in requests])
+        allowed = [
+            next((ok for prefix, ok in self.allow_map.items() if prefix in r.bucket_key), True)
+            for r in requests
+        ]
+        if settle is not None:
+            settle(allowed)
+        self.consumed = all(allowed)
+        return allowed
+
+
+def _run_async_gate(rls: _StubAsyncRateLimitService, **kwargs: object) -> None:
+    gate = AsyncFreeTierGate(rls)  # type: ignore[arg-type]
+    asyncio.run(gate.check(user=_make_user(plan_tier="free"), **kwargs))  # type: ignore[arg-type]
+
+
+@pytest.mark.unit
+class TestAsyncFreeTierGate:
+    def test_one_batch_for_all_three_buckets(self) -> None:
+        rls = _StubAsyncRateLimitService()
+        _run_async_gate(rls, file_seconds=120.0, model="tiny", diarize=False)
+        assert rls.batches == [
+            ["user:1:tx:hour", "user:1:audio_min:day", concurrency_bucket_key(1)]
+        ]
+        assert rls.consumed
+
+    def test_hourly_denial_wins_over_model_violation(self) -> None:
+        """Gate order is unchanged: the hourly cap is checked before the model."""
+        rls = _StubAsyncRateLimitService(allow_map={"tx:hour": False})
+        with pytest.raises(RateLimitExceededError):
+            _run_async_gate(rls, file_seconds=60.0, model="large-v3", diarize=False)
+
+    def test_model_violation_consumes_nothing(self) -> None:
+        rls = _StubAsyncRateLimitService()
+        with pytest.raises(FreeTierViolationError):
+            _run_async_gate(rls, file_seconds=60.0, model="large-v3", diarize=False)
+        assert not rls.consumed
+
+    def test_concurrency_denial_raises(self) -> None:
+        rls = _StubAsyncRateLimitService(allow_map={"concurrent": False})
+        with pytest.raises(ConcurrencyLimitError):
+            _run_async_gate(rls, file_seconds=60.0, model="tiny", diarize=False)
+        assert not rls.consumed
+
+    def test_trial_expired_skips_bucket_io(self) -> None:
+        rls = _StubAsyncRateLimitService()
+        gate = AsyncFreeTierGate(rls)  # type: ignore[arg-type]
+        user = _make_user(
+            plan_tier="trial",
+            trial_started_at=datetime.now(timezone.utc) - timedelta(days=8),
+        )
+        with pytest.raises(TrialExpiredError):
+            asyncio.run(
+                gate.check(user=user, file_seconds=60.0, model="tiny", diarize=False)
+            )
+        assert rls.batches == []
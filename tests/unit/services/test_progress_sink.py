@@ -0,0 +1,305 @@
+"""Unit tests for ProgressSink and the worker's short-lived sessions.
+
+Verifies:
+
+  * stage transitions always write; same-stage reports are coalesced
+    until ``min_interval_seconds`` have elapsed
+  * every report still reaches WebSocket clients
+  * flush() persists only unwritten progress
+  * finish() persists the final progress and status in one write
+  * process_audio_common holds no database session while a model runs
+  * a failed job persists its last coalesced progress before the status
+"""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.infrastructure.database.connection  # noqa: F401  (PRAGMA foreign_keys listener)
+from app.infrastructure.database.models import Base
+from app.infrastructure.database.models import Task as ORMTask
+from app.infrastructure.database.models import User as ORMUser
+from app.schemas import (
+    AlignmentParams,
+    ASROptions,
+    ComputeType,
+    Device,
+    DiarizationParams,
+    InterpolateMethod,
+    SpeechToTextProcessingParams,
+    TaskEnum,
+    TaskProgressStage,
+    VADOptions,
+    WhisperModel,
+    WhisperModelParams,
+)
+from app.services.progress_sink import ProgressSink
+from tests.mocks import (
+    MockAlignmentService,
+    MockDiarizationService,
+    MockSpeakerAssignmentService,
+    MockTranscriptionService,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def emitter() -> Generator[MagicMock, None, None]:
+    mock = MagicMock()
+    with patch("app.services.progress_sink.get_progress_emitter", return_value=mock):
+        yield mock
+
+
+def _sink(clock: _Clock, interval: float = 5.0) -> tuple[ProgressSink, list[dict[str, Any]]]:
+    writes: list[dict[str, Any]] = []
+    sink = ProgressSink(
+        "t-1",
+        lambda _identifier, data: writes.append(data),
+        min_interval_seconds=interval,
+        clock=clock,
+    )
+    return sink, writes
+
+
+@pytest.mark.unit
+class TestProgressSink:
+    """Test suite for ProgressSink."""
+
+    def test_stage_transitions_always_write(self, emitter: MagicMock) -> None:
+        sink, writes = _sink(_Clock())
+
+        sink.report(TaskProgressStage.queued, 0)
+        sink.report(TaskProgressStage.transcribing, 10)
+
+        assert writes == [
+            {"progress_stage": "queued", "progress_percentage": 0},
+            {"progress_stage": "transcribing", "progress_percentage": 10},
+        ]
+
+    def test_same_stage_reports_are_coalesced_until_interval(
+        self, emitter: MagicMock
+    ) -> None:
+        clock = _Clock()
+        sink, writes = _sink(clock)
+
+        sink.report(TaskProgressStage.diarizing, 60)
+        for percentage in range(61, 70):
+            clock.now += 0.5
+            sink.report(TaskProgressStage.diarizing, percentage)
+        clock.now += 0.5
+        sink.report(TaskProgressStage.diarizing, 70)
+
+        assert [w["progress_percentage"] for w in writes] == [60, 70]
+        assert emitter.emit_progress.call_count == 11
+
+    def test_flush_writes_only_pending_progress(self, emitter: MagicMock) -> None:
+        sink, writes = _sink(_Clock())
+
+        sink.flush()
+        sink.report(TaskProgressStage.aligning, 40)
+        sink.report(TaskProgressStage.aligning, 45)
+        sink.flush()
+        sink.flush()
+
+        assert [w["progress_percentage"] for w in writes] == [40, 45]
+
+    def test_zero_interval_writes_every_report(self, emitter: MagicMock) -> None:
+        sink, writes = _sink(_Clock(), interval=0.0)
+
+        sink.report(TaskProgressStage.diarizing, 60)
+        sink.report(TaskProgressStage.diarizing, 80)
+
+        assert len(writes) == 2
+
+    def test_finish_writes_progress_and_status_together(
+        self, emitter: MagicMock
+    ) -> None:
+        sink, writes = _sink(_Clock())
+
+        sink.report(TaskProgressStage.diarizing, 80)
+        sink.finish(TaskProgressStage.complete, 100, {"status": "completed"})
+        sink.flush()
+
+        assert writes[1:] == [
+            {
+                "status": "completed",
+                "progress_stage": "complete",
+                "progress_percentage": 100,
+            }
+        ]
+        emitter.emit_progress.assert_called_with("t-1", TaskProgressStage.complete, 100)
+
+
+class _TrackingSessions:
+    """sessionmaker wrapper counting sessions that are currently open."""
+
+    def __init__(self, factory: sessionmaker[Session]) -> None:
+        self.factory = factory
+        self.open = 0
+        self.opened = 0
+
+    def __call__(self) -> Session:
+        tracker = self
+        session = self.factory()
+        original_close = session.close
+
+        def close() -> None:
+            tracker.open -= 1
+            original_close()
+
+        session.close = close  # type: ignore[method-assign]
+        self.open += 1
+        self.opened += 1
+        return session
+
+
+def _params() -> SpeechToTextProcessingParams:
+    return SpeechToTextProcessingParams(
+        audio=np.zeros(16000, dtype=np.float32),
+        identifier="t-1",
+        whisper_model_params=WhisperModelParams(
+            language="en",
+            model=WhisperModel.tiny,
+            device=Device.cpu,
+            device_index=0,
+            compute_type=ComputeType.int8,
+            task=TaskEnum.TRANSCRIBE,
+            threads=0,
+            batch_size=8,
+            chunk_size=20,
+        ),
+        asr_options=ASROptions(
+            beam_size=5,
+            best_of=5,
+            patience=1,
+            length_penalty=1,
+            temperatures=0.0,
+            compression_ratio_threshold=2.4,
+            log_prob_threshold=-1.0,
+            no_speech_threshold=0.6,
+            initial_prompt=None,
+            suppress_tokens=[-1],
+            suppress_numerals=True,
+            hotwords=None,
+        ),
+        vad_options=VADOptions(vad_onset=0.5, vad_offset=0.363),
+        alignment_params=AlignmentParams(
+            align_model=None,
+            interpolate_method=InterpolateMethod.nearest,
+            return_char_alignments=False,
+        ),
+        diarization_params=DiarizationParams(min_speakers=1, max_speakers=2),
+    )
+
+
+@pytest.fixture
+def sessions() -> Generator[_TrackingSessions, None, None]:
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    tracking = _TrackingSessions(sessionmaker(bind=engine, autoflush=False))
+    with tracking.factory() as seed:
+        seed.add(ORMUser(id=1, email="u1@example.com", password_hash="x"))
+        seed.commit()
+        seed.add(ORMTask(uuid="t-1", status="processing", task_type="full_process", user_id=1))
+        seed.commit()
+    yield tracking
+    engine.dispose()
+
+
+def _task_row(sessions: _TrackingSessions) -> tuple[Any, ...]:
+    with sessions.factory() as check:
+        row = check.execute(
+            select(ORMTask.status, ORMTask.progress_stage, ORMTask.progress_percentage)
+        ).one()
+    return tuple(row)
+
+
+@pytest.mark.unit
+def test_process_audio_common_holds_no_session_during_inference(
+    emitter: MagicMock, sessions: _TrackingSessions
+) -> None:
+    from app.services import whisperx_wrapper_service
+
+    open_during_inference: list[int] = []
+
+    class _Transcriber(MockTranscriptionService):
+        def transcribe(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+            open_during_inference.append(sessions.open)
+            return super().transcribe(*args, **kwargs)
+
+    class _Diarizer(MockDiarizationService):
+        def diarize(self, *args: Any, **kwargs: Any) -> Any:
+            open_during_inference.append(sessions.open)
+            return super().diarize(*args, **kwargs)
+
+    with (
+        patch.object(whisperx_wrapper_service, "SessionLocal", sessions),
+        patch("app.services.whisperx_wrapper_service.get_progress_emitter", return_value=emitter),
+    ):
+        whisperx_wrapper_service.process_audio_common(
+            _params(),
+            transcription_service=_Transcriber(),
+            alignment_service=MockAlignmentService(),
+            diarization_service=_Diarizer(),
+            speaker_service=MockSpeakerAssignmentService(),
+        )
+
+    assert open_during_inference == [0, 0]
+    assert sessions.open == 0
+    assert _task_row(sessions) == ("completed", "complete", 100)
+
+
+@pytest.mark.unit
+def test_failure_persists_coalesced_progress_before_failed_status(
+    emitter: MagicMock, sessions: _TrackingSessions
+) -> None:
+    from app.services import whisperx_wrapper_service
+
+    class _FailingSpeakers(MockSpeakerAssignmentService):
+        def assign_speakers(self, *args: Any, **kwargs: Any) -> Any:
+            raise RuntimeError("speaker assignment failed")
+
+    writes: list[dict[str, Any]] = []
+    real_write = whisperx_wrapper_service._write_task
+
+    def recording_write(identifier: str, data: dict[str, Any]) -> None:
+        writes.append(data)
+        real_write(identifier, data)
+
+    settings = MagicMock()
+    settings.database.PROGRESS_WRITE_INTERVAL_SECONDS = 3600.0
+    with (
+        patch.object(whisperx_wrapper_service, "SessionLocal", sessions),
+        patch.object(whisperx_wrapper_service, "_write_task", recording_write),
+        patch.object(whisperx_wrapper_service, "get_settings", return_value=settings),
+        patch("app.services.whisperx_wrapper_service.get_progress_emitter", return_value=emitter),
+    ):
+        whisperx_wrapper_service.process_audio_common(
+            _params(),
+            transcription_service=MockTranscriptionService(),
+            alignment_service=MockAlignmentService(),
+            diarization_service=MockDiarizationService(),
+            speaker_service=_FailingSpeakers(),
+        )
+
+    # diarizing/80 was coalesced behind diarizing/60; it lands before "failed"
+    assert writes[-2] == {
+        "progress_stage": TaskProgressStage.diarizing.value,
+        "progress_percentage": 80,
+    }
+    assert writes[-1]["status"] == "failed"
+    assert _task_row(sessions) == ("failed", "diarizing", 80)
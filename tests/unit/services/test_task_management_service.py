@@ -1,11 +1,16 @@
 """Unit tests for TaskManagementService."""
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
+from app.core.exceptions import ValidationError
 from app.domain.entities.task import Task
-from app.services.task_management_service import TaskManagementService
+from app.services.task_management_service import (
+    TaskManagementService,
+    decode_task_cursor,
+)
 
 
 class TestTaskManagementService:
@@ -71,6 +76,21 @@ class TestTaskManagementService:
         assert result is None
         mock_repository.get_by_id.assert_called_once_with("non-existent-uuid")
 
+    def test_get_task_summary_uses_summary_projection(
+        self,
+        service: TaskManagementService,
+        mock_repository: MagicMock,
+        sample_task: Task,
+    ) -> None:
+        """Test task summary reads go through get_summary_by_id."""
+        mock_repository.get_summary_by_id.return_value = sample_task
+
+        result = service.get_task_summary("test-uuid-123")
+
+        assert result == sample_task
+        mock_repository.get_summary_by_id.assert_called_once_with("test-uuid-123")
+        mock_repository.get_by_id.assert_not_called()
+
     def test_get_all_tasks(
         self,
         service: TaskManagementService,
@@ -139,3 +159,54 @@ class TestTaskManagementService:
         service.update_task_status("test-uuid-123", update_data)
 
         mock_repository.update.assert_called_once_with("test-uuid-123", update_data)
+
+    def test_list_tasks_by_cursor_round_trips_next_cursor(
+        self,
+        service: TaskManagementService,
+        mock_repository: MagicMock,
+        sample_task: Task,
+    ) -> None:
+        """Test the issued next_cursor decodes back to the repository key."""
+        key = (datetime(2026, 10, 19, 7, 45, 32, 16000), 42)
+        mock_repository.list_keyset.return_value = ([sample_task], key)
+        mock_repository.count.return_value = 10
+
+        tasks, next_cursor, total = service.list_tasks_by_cursor(
+            q=None, status=None, cursor=None, page_size=1
+        )
+
+        assert tasks == [sample_task]
+        assert total == 10
+        assert next_cursor is not None
+        assert decode_task_cursor(next_cursor) == key
+        mock_repository.list_keyset.assert_called_once_with(
+            q=None, status=None, after=None, limit=1
+        )
+
+        service.list_tasks_by_cursor(
+            q=None, status=None, cursor=next_cursor, page_size=1
+        )
+        assert mock_repository.list_keyset.call_args.kwargs["after"] == key
+
+    def test_list_tasks_by_cursor_last_page_has_no_cursor(
+        self, service: TaskManagementService, mock_repository: MagicMock
+    ) -> None:
+        """Test next_cursor is None when the repository reports no more rows."""
+        mock_repository.list_keyset.return_value = ([], None)
+        mock_repository.count.return_value = 0
+
+        _tasks, next_cursor, _total = service.list_tasks_by_cursor(
+            q=None, status=None, cursor=None, page_size=50
+        )
+
+        assert next_cursor is None
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "bm90LWpzb24", "WzEsMl0"])
+    def test_list_tasks_by_cursor_rejects_malformed_cursor(
+        self, service: TaskManagementService, cursor: str
+    ) -> None:
+        """Test tampered cursors raise ValidationError (422), not a 500."""
+        with pytest.raises(ValidationError, match="Invalid pagination cursor"):
+            service.list_tasks_by_cursor(
+                q=None, status=None, cursor=cursor, page_size=50
+            )
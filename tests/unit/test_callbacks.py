@@ -1,7 +1,9 @@
 """Unit tests for callback functionality."""
 
+import asyncio
+import json
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, Mock
+from urllib.parse import parse_qs, urlsplit
 
 import httpx
 import pytest
@@ -10,10 +12,35 @@ from pydantic import HttpUrl
 from pytest import MonkeyPatch
 
 from app.callbacks import (
-    post_task_callback,
+    CallbackUrlValidator,
+    build_callback_payload,
+    parse_trusted_hosts,
     validate_callback_url,
     validate_callback_url_dependency,
 )
+from app.core import result_link
+from app.domain.entities.task import Task
+from app.schemas import CallbackMode, Result
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_transport(
+    status_code: int, probes: list[str], delay_seconds: float = 0.0
+) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        probes.append(str(request.url))
+        if delay_seconds:
+            await asyncio.sleep(delay_seconds)
+        return httpx.Response(status_code)
+
+    return httpx.MockTransport(handler)
 
 
 class TestCallbacks:
@@ -32,152 +59,299 @@ class TestCallbacks:
         ],
     )
     def test_validate_callback_url_status_codes(
-        self, status_code: int, expected_result: bool, monkeypatch: MonkeyPatch
+        self, status_code: int, expected_result: bool
     ) -> None:
         """Test callback URL validation with different HTTP status codes."""
-        mock_response = Mock()
-        mock_response.status_code = status_code
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value.head.return_value = mock_response
-        mock_client_instance.__exit__.return_value = None
-
-        mock_client = Mock(return_value=mock_client_instance)
-
-        monkeypatch.setattr("httpx.Client", mock_client)
+        probes: list[str] = []
+
+        result = asyncio.run(
+            validate_callback_url(
+                "http://example.com/callback",
+                5.0,
+                transport=_counting_transport(status_code, probes),
+            )
+        )
 
-        result = validate_callback_url("http://example.com/callback")
         assert result == expected_result
+        assert probes == ["http://example.com/callback"]
 
-    def test_post_task_callback_success(self, monkeypatch: MonkeyPatch) -> None:
-        """Test successful callback posting."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-
-        payload = {
-            "identifier": "test-123",
-            "status": "completed",
-            "result": {"transcript": "test"},
-        }
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value.post.return_value = mock_response
-        mock_client_instance.__exit__.return_value = None
-
-        mock_client = Mock(return_value=mock_client_instance)
-
-        monkeypatch.setattr("httpx.Client", mock_client)
-
-        # Should not raise any exceptions
-        post_task_callback("http://example.com/callback", payload)
+    def test_validate_callback_url_connection_error(self) -> None:
+        """Connection failures are reported as unreachable, not raised."""
 
-        # Verify the POST was called with correct parameters
-        mock_client_instance.__enter__.return_value.post.assert_called_once()
-        call_args = mock_client_instance.__enter__.return_value.post.call_args
-        assert call_args[0][0] == "http://example.com/callback"
-        assert call_args[1]["json"] == payload
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
 
-    def test_post_task_callback_retry_logic(self, monkeypatch: MonkeyPatch) -> None:
-        """Test callback retry logic on failure."""
-        payload = {"identifier": "test-123", "status": "completed"}
-
-        mock_sleep = Mock()
-        monkeypatch.setattr("time.sleep", mock_sleep)
-
-        mock_client_instance = MagicMock()
-        mock_client_instance.__exit__.return_value = None
-
-        # First two attempts fail, third succeeds
-        mock_client_instance.__enter__.return_value.post.side_effect = [
-            httpx.TimeoutException("Timeout"),
-            httpx.HTTPStatusError(
-                "Server error",
-                request=Mock(),
-                response=Mock(status_code=500, text="Error"),
-            ),
-            Mock(status_code=200),  # Success on third attempt
-        ]
-        mock_client = Mock(return_value=mock_client_instance)
-
-        monkeypatch.setattr("httpx.Client", mock_client)
-
-        post_task_callback("http://example.com/callback", payload)
-
-        # Should have made 3 attempts
-        assert mock_client_instance.__enter__.return_value.post.call_count == 3
-        # Should have slept twice (between retries)
-        assert mock_sleep.call_count == 2
+        result = asyncio.run(
+            validate_callback_url(
+                "http://example.com/callback",
+                5.0,
+                transport=httpx.MockTransport(handler),
+            )
+        )
+        assert result is False
 
     def test_callback_dependency_valid_url(self, monkeypatch: MonkeyPatch) -> None:
         """Test callback URL dependency with valid URL."""
-        # Override the global mock to return True for this test
-        monkeypatch.setattr("app.callbacks.validate_callback_url", lambda url: True)
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(200, [])
+        )
+        monkeypatch.setattr(
+            "app.core.services.get_callback_url_validator", lambda: validator
+        )
 
-        result = validate_callback_url_dependency(
-            HttpUrl("http://example.com/callback")
+        result = asyncio.run(
+            validate_callback_url_dependency(HttpUrl("http://example.com/callback"))
         )
         assert result == "http://example.com/callback"
 
     def test_callback_dependency_none_url(self) -> None:
         """Test callback URL dependency with None."""
-        result = validate_callback_url_dependency(None)
+        result = asyncio.run(validate_callback_url_dependency(None))
         assert result is None
 
     def test_callback_dependency_invalid_url_raises_exception(
         self, monkeypatch: MonkeyPatch
     ) -> None:
         """Test callback URL dependency with invalid URL (should raise HTTPException)."""
-        monkeypatch.setattr("app.callbacks.validate_callback_url", lambda url: False)
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(500, [])
+        )
+        monkeypatch.setattr(
+            "app.core.services.get_callback_url_validator", lambda: validator
+        )
 
         # Should raise HTTPException for invalid URLs
         with pytest.raises(HTTPException) as exc_info:
-            validate_callback_url_dependency(HttpUrl("http://invalid.com/callback"))
+            asyncio.run(
+                validate_callback_url_dependency(HttpUrl("http://invalid.com/callback"))
+            )
 
         assert exc_info.value.status_code == 400
         assert "Callback URL is not reachable" in str(exc_info.value.detail)
 
-    def test_callback_with_datetime_serialization_integration(
-        self, monkeypatch: MonkeyPatch
-    ) -> None:
-        """Integration test for callback with datetime serialization."""
-        # Create payload with datetime objects
-        payload = {
-            "identifier": "test-123",
-            "status": "completed",
-            "created_at": datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
-            "updated_at": datetime(2023, 1, 1, 12, 5, 0, tzinfo=timezone.utc),
-            "result": {
-                "processing_time": 5.2,
-                "metadata": {
-                    "processed_at": datetime(2023, 1, 1, 12, 5, 0, tzinfo=timezone.utc)
-                },
-            },
-        }
 
-        mock_response = Mock()
-        mock_response.status_code = 200
+class TestCallbackUrlValidator:
+    """Per-origin caching, probe coalescing and trusted hosts."""
 
-        mock_client_instance = MagicMock()
-        mock_client_instance.__enter__.return_value.post.return_value = mock_response
-        mock_client_instance.__exit__.return_value = None
+    def test_one_probe_per_origin_for_many_submissions(self) -> None:
+        """Sequential submissions to one origin reuse the cached verdict."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(200, probes)
+        )
+
+        async def submit_many() -> list[bool]:
+            return [
+                await validator.is_reachable(f"https://hooks.example.com/task/{i}")
+                for i in range(100)
+            ]
+
+        assert all(asyncio.run(submit_many()))
+        assert probes == ["https://hooks.example.com/task/0"]
+
+    def test_concurrent_probes_of_one_origin_are_coalesced(self) -> None:
+        """Concurrent submissions await the single in-flight probe."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(200, probes, delay_seconds=0.05)
+        )
+
+        async def submit_concurrently() -> list[bool]:
+            return await asyncio.gather(
+                *(
+                    validator.is_reachable(f"https://hooks.example.com/task/{i}")
+                    for i in range(50)
+                )
+            )
+
+        assert all(asyncio.run(submit_concurrently()))
+        assert len(probes) == 1
+
+    def test_origins_are_cached_separately(self) -> None:
+        """Scheme, host and port each distinguish an origin."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(200, probes)
+        )
+
+        async def submit() -> None:
+            for url in (
+                "https://a.example.com/x",
+                "https://a.example.com/y",
+                "http://a.example.com/x",
+                "https://a.example.com:8443/x",
+                "https://b.example.com/x",
+            ):
+                await validator.is_reachable(url)
+
+        asyncio.run(submit())
+        assert len(probes) == 4
+
+    def test_positive_verdict_expires_after_ttl(self) -> None:
+        """A reachable origin is probed again once its TTL has passed."""
+        probes: list[str] = []
+        clock = _FakeClock()
+        validator = CallbackUrlValidator(
+            5.0,
+            ttl_seconds=300.0,
+            transport=_counting_transport(200, probes),
+            clock=clock,
+        )
+
+        asyncio.run(validator.is_reachable("https://hooks.example.com/a"))
+        clock.now += 299.0
+        asyncio.run(validator.is_reachable("https://hooks.example.com/b"))
+        assert len(probes) == 1
+
+        clock.now += 2.0
+        asyncio.run(validator.is_reachable("https://hooks.example.com/c"))
+        assert len(probes) == 2
+
+    def test_negative_verdict_uses_shorter_ttl(self) -> None:
+        """An unreachable origin is rejected from cache, then re-probed sooner."""
+        probes: list[str] = []
+        clock = _FakeClock()
+        validator = CallbackUrlValidator(
+            5.0,
+            ttl_seconds=300.0,
+            negative_ttl_seconds=30.0,
+            transport=_counting_transport(503, probes),
+            clock=clock,
+        )
+
+        assert asyncio.run(validator.is_reachable("https://down.example.com/a")) is False
+        clock.now += 29.0
+        assert asyncio.run(validator.is_reachable("https://down.example.com/b")) is False
+        assert len(probes) == 1
+
+        clock.now += 2.0
+        asyncio.run(validator.is_reachable("https://down.example.com/c"))
+        assert len(probes) == 2
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        """With both TTLs at 0 every submission probes."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0,
+            ttl_seconds=0.0,
+            negative_ttl_seconds=0.0,
+            transport=_counting_transport(200, probes),
+        )
+
+        async def submit() -> None:
+            for _ in range(3):
+                await validator.is_reachable("https://hooks.example.com/x")
+
+        asyncio.run(submit())
+        assert len(probes) == 3
 
-        mock_client = Mock(return_value=mock_client_instance)
+    def test_trusted_hosts_skip_the_probe(self) -> None:
+        """Exact and ``*.`` wildcard trusted hosts are accepted without a probe."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0,
+            trusted_hosts=parse_trusted_hosts(
+                " Hooks.Example.com , *.internal.example.com,"
+            ),
+            transport=_counting_transport(500, probes),
+        )
+
+        async def submit() -> list[bool]:
+            return [
+                await validator.is_reachable("https://hooks.example.com/x"),
+                await validator.is_reachable("https://a.internal.example.com/x"),
+                await validator.is_reachable("https://a.b.internal.example.com/x"),
+                await validator.is_reachable("https://internal.example.com/x"),
+            ]
+
+        assert asyncio.run(submit()) == [True, True, True, False]
+        assert probes == ["https://internal.example.com/x"]
+
+    def test_clear_forgets_verdicts(self) -> None:
+        """``clear`` forces the next submission to probe again."""
+        probes: list[str] = []
+        validator = CallbackUrlValidator(
+            5.0, transport=_counting_transport(200, probes)
+        )
 
-        monkeypatch.setattr("httpx.Client", mock_client)
+        asyncio.run(validator.is_reachable("https://hooks.example.com/x"))
+        validator.clear()
+        asyncio.run(validator.is_reachable("https://hooks.example.com/x"))
+        assert len(probes) == 2
 
-        post_task_callback("http://example.com/callback", payload)
+    def test_rejects_invalid_max_origins(self) -> None:
+        """A zero-capacity cache is a configuration error."""
+        with pytest.raises(ValueError):
+            CallbackUrlValidator(5.0, max_origins=0)
 
-        # Verify the payload was serialized correctly
-        call_args = mock_client_instance.__enter__.return_value.post.call_args
-        sent_payload = call_args[1]["json"]
 
-        # Check that datetime objects were serialized to ISO strings
-        assert sent_payload["created_at"] == "2023-01-01T12:00:00+00:00"
-        assert sent_payload["updated_at"] == "2023-01-01T12:05:00+00:00"
-        assert (
-            sent_payload["result"]["metadata"]["processed_at"]
-            == "2023-01-01T12:05:00+00:00"
+class TestBuildCallbackPayload:
+    """Full and reference callback bodies."""
+
+    _NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    def _task(self) -> Task:
+        return Task(
+            uuid="task-1",
+            status="completed",
+            task_type="full_process",
+            file_name="a.mp3",
+            callback_url="https://hooks.example.com/cb",
+            start_time=datetime(2026, 1, 1, 11, tzinfo=timezone.utc),
+            end_time=self._NOW,
+        )
+
+    def _build(self, mode: CallbackMode, result_chunks=None) -> str:
+        return build_callback_payload(
+            self._task(),
+            result_chunks,
+            mode,
+            public_base_url="https://api.example.com/",
+            secret="s3cret",
+            link_ttl_seconds=3600,
+            now=self._NOW,
         )
 
-        assert sent_payload["identifier"] == "test-123"
-        assert sent_payload["result"]["processing_time"] == 5.2
+    def test_full_payload_splices_stored_result(self) -> None:
+        """The stored JSON is embedded as-is into a valid ``Result``."""
+        result = {"segments": [{"start": 0.0, "end": 1.0, "text": "Grüße"}]}
+        stored = json.dumps(result, ensure_ascii=False).encode()
+
+        body = self._build(CallbackMode.full, iter([stored[:7], stored[7:]]))
+
+        parsed = Result.model_validate_json(body)
+        assert parsed.status == "completed"
+        assert parsed.result == result
+        assert parsed.metadata.end_time == self._NOW
+        assert list(json.loads(body)) == ["status", "result", "metadata", "error"]
+
+    def test_full_payload_without_result(self) -> None:
+        assert json.loads(self._build(CallbackMode.full))["result"] is None
+
+    def test_reference_payload_carries_a_signed_link(self) -> None:
+        """Reference mode sends a small body whose link verifies."""
+        body = json.loads(self._build(CallbackMode.reference, iter([b"{}"])))
+
+        assert set(body) == {
+            "identifier",
+            "status",
+            "error",
+            "result_url",
+            "result_expires_at",
+        }
+        assert body["identifier"] == "task-1"
+        assert body["status"] == "completed"
+        link = urlsplit(body["result_url"])
+        assert (link.scheme, link.netloc) == ("https", "api.example.com")
+        assert link.path == "/task/task-1/callback-result"
+        query = parse_qs(link.query)
+        expires_at = int(query["expires"][0])
+        assert expires_at == int(self._NOW.timestamp()) + 3600
+        assert datetime.fromisoformat(body["result_expires_at"]).timestamp() == expires_at
+        assert result_link.verify(
+            "task-1",
+            expires_at,
+            query["signature"][0],
+            "s3cret",
+            now=self._NOW.timestamp(),
+        )
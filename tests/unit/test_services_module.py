@@ -24,6 +24,15 @@ def _clear_all_caches() -> None:
     services.get_csrf_service.cache_clear()
     services.get_token_service.cache_clear()
     services.get_ws_ticket_service.cache_clear()
+    services.get_task_count_cache.cache_clear()
+    services.get_bucket_store.cache_clear()
+    services.get_api_key_cache.cache_clear()
+    services.get_last_used_buffer.cache_clear()
+    services.get_user_snapshot_cache.cache_clear()
+    services.get_password_hash_pool.cache_clear()
+    services.get_webhook_dispatcher.cache_clear()
+    services.get_callback_url_validator.cache_clear()
+    services.get_url_downloader.cache_clear()
     services.get_file_service.cache_clear()
     services.get_transcription_service.cache_clear()
     services.get_alignment_service.cache_clear()
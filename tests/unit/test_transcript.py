@@ -0,0 +1,67 @@
+"""Unit tests for app.transcript — the dict fast path must match pydantic."""
+
+import pytest
+
+from app.schemas import AlignedTranscription
+from app.transcript import filter_aligned_result, filter_aligned_transcription
+
+ALIGNED = {
+    "segments": [
+        {
+            "start": 0,
+            "end": 2.5,
+            "text": " Hello there.",
+            "words": [
+                {"word": "Hello", "start": 0, "end": 0.4, "score": 0.91,
+                 "chars": [{"char": "H"}]},
+                {"word": "there.", "start": 0.5, "end": 2.5, "score": 0.8},
+                {"word": "%", "score": 0.5},
+            ],
+        },
+        {
+            "start": 3.0,
+            "end": 4.0,
+            "text": " 42",
+            "words": [{"word": "42"}, {"word": "7", "start": 3.1, "end": None}],
+        },
+        {"start": 5.0, "end": 6.0, "text": " ok", "words": [
+            {"word": "ok", "start": 5.0, "end": 6.0, "score": 0.0},
+        ]},
+    ],
+    "word_segments": [{"word": "Hello", "start": 0, "end": 0.4, "score": 0.91}],
+}
+
+
+def _pydantic_path(aligned: dict) -> dict:
+    return filter_aligned_transcription(AlignedTranscription(**aligned)).model_dump()
+
+
+@pytest.mark.unit
+class TestFilterAlignedResult:
+    """filter_aligned_result fast path vs the pydantic implementation."""
+
+    def test_matches_pydantic_output_exactly(self) -> None:
+        fast = filter_aligned_result(ALIGNED)
+
+        assert fast == _pydantic_path(ALIGNED)
+        assert [type(w["start"]) for w in fast["segments"][0]["words"]] == [float, float]
+
+    def test_drops_incomplete_words_and_empty_segments(self) -> None:
+        fast = filter_aligned_result(ALIGNED)
+
+        assert [s["text"] for s in fast["segments"]] == [" Hello there.", " ok"]
+        assert [w["word"] for w in fast["segments"][0]["words"]] == ["Hello", "there."]
+        assert "chars" not in fast["segments"][0]["words"][0]
+        assert fast["word_segments"] == []
+
+    def test_validate_uses_pydantic_and_fails_loud(self) -> None:
+        assert filter_aligned_result(ALIGNED, validate=True) == _pydantic_path(ALIGNED)
+
+        with pytest.raises(ValueError):
+            filter_aligned_result({"segments": [{"start": "x"}]}, validate=True)
+
+    def test_empty_input(self) -> None:
+        assert filter_aligned_result({"segments": []}) == {
+            "segments": [],
+            "word_segments": [],
+        }
@@ -0,0 +1,147 @@
+"""Unit tests for app.transcript_columnar.ColumnarTranscript."""
+
+import io
+import json
+
+import numpy as np
+import pytest
+
+from app.schemas import AlignedTranscription
+from app.transcript_columnar import COLUMNAR_FORMAT, NO_SPEAKER, ColumnarTranscript
+
+RESULT = {
+    "language": "en",
+    "segments": [
+        {
+            "start": 0.031,
+            "end": 1.5,
+            "text": " Hello there.",
+            "speaker": "SPEAKER_00",
+            "words": [
+                {"word": "Hello", "start": 0.031, "end": 0.4, "score": 0.912,
+                 "speaker": "SPEAKER_00"},
+                {"word": "there.", "start": 0.45, "end": 1.5, "score": 0.8,
+                 "speaker": "SPEAKER_00"},
+            ],
+        },
+        {
+            "start": 2.0,
+            "end": 3.25,
+            "text": " Hello 42",
+            "words": [
+                {"word": "Hello", "start": 2.0, "end": 2.5, "score": 0.7,
+                 "speaker": "SPEAKER_01"},
+                {"word": "42"},
+            ],
+        },
+    ],
+    "word_segments": [],
+}
+
+
+@pytest.mark.unit
+class TestColumnarTranscript:
+    """Round-trips between the verbose and columnar shapes."""
+
+    def test_from_result_builds_typed_parallel_columns(self) -> None:
+        columnar = ColumnarTranscript.from_result(RESULT)
+
+        assert columnar.word_count == 4
+        assert columnar.segment_count == 2
+        assert columnar.strings == ["Hello", "there.", "42"]
+        assert columnar.speakers == ["SPEAKER_00", "SPEAKER_01"]
+        assert columnar.word_text.tolist() == [0, 1, 0, 2]
+        assert columnar.word_speaker.tolist() == [0, 0, 1, NO_SPEAKER]
+        assert columnar.segment_speaker.tolist() == [0, NO_SPEAKER]
+        assert columnar.word_offsets.tolist() == [0, 2, 4]
+        assert columnar.word_start.dtype == np.float32
+        assert columnar.word_speaker.dtype == np.int16
+        assert np.isnan(columnar.word_score[3])
+        assert columnar.extra == {"language": "en"}
+
+    def test_iter_segments_reconstructs_verbose_shape(self) -> None:
+        columnar = ColumnarTranscript.from_result(RESULT)
+
+        assert list(columnar.iter_segments()) == RESULT["segments"]
+
+    def test_from_aligned_model_matches_dict(self) -> None:
+        aligned = AlignedTranscription(
+            segments=[
+                {"start": 0.0, "end": 1.0, "text": "hi",
+                 "words": [{"word": "hi", "start": 0.0, "end": 1.0, "score": 0.5}]}
+            ],
+            word_segments=[],
+        )
+
+        from_model = ColumnarTranscript.from_result(aligned)
+        from_dict = ColumnarTranscript.from_result(aligned.model_dump())
+
+        assert list(from_model.iter_segments()) == list(from_dict.iter_segments())
+
+    def test_to_json_uses_rounded_lists_and_nulls(self) -> None:
+        payload = ColumnarTranscript.from_result(RESULT).to_json()
+
+        assert payload["format"] == COLUMNAR_FORMAT
+        assert payload["language"] == "en"
+        assert payload["words"]["start"] == [0.031, 0.45, 2.0, None]
+        assert payload["words"]["score"][0] == 0.912
+        json.dumps(payload, allow_nan=False)
+
+    def test_json_is_smaller_than_verbose(self) -> None:
+        words = [
+            {"word": f"w{i % 50}", "start": i * 0.25, "end": i * 0.25 + 0.2,
+             "score": 0.9, "speaker": f"SPEAKER_0{i % 3}"}
+            for i in range(2_000)
+        ]
+        verbose = {"segments": [{"start": 0.0, "end": 500.0, "text": "x", "words": words}]}
+
+        columnar = ColumnarTranscript.from_result(verbose)
+
+        assert len(json.dumps(columnar.to_json())) < len(json.dumps(verbose)) / 2
+        assert len(columnar.to_npz()) < len(json.dumps(verbose)) / 4
+
+    def test_npz_round_trip(self) -> None:
+        columnar = ColumnarTranscript.from_result(RESULT)
+
+        restored = ColumnarTranscript.from_npz(columnar.to_npz())
+
+        assert list(restored.iter_segments()) == list(columnar.iter_segments())
+        assert restored.word_start.dtype == np.float32
+
+    def test_empty_result_round_trips(self) -> None:
+        columnar = ColumnarTranscript.from_result({"segments": []})
+
+        restored = ColumnarTranscript.from_npz(columnar.to_npz())
+
+        assert restored.word_count == 0
+        assert list(restored.iter_segments()) == []
+
+    def test_from_npz_rejects_foreign_archive(self) -> None:
+        buffer = io.BytesIO()
+        np.savez(buffer, something=np.zeros(3))
+
+        with pytest.raises(ValueError, match=COLUMNAR_FORMAT):
+            ColumnarTranscript.from_npz(buffer.getvalue())
+
+    def test_without_incomplete_words_matches_dict_filter(self) -> None:
+        columnar = ColumnarTranscript.from_result(RESULT).without_incomplete_words()
+
+        assert columnar.word_count == 3
+        assert columnar.word_offsets.tolist() == [0, 2, 3]
+        assert [w["word"] for w in columnar.iter_words()] == ["Hello", "there.", "Hello"]
+
+    def test_without_incomplete_words_drops_emptied_segments(self) -> None:
+        result = {
+            "segments": [
+                {"start": 0.0, "end": 1.0, "text": "a", "words": [{"word": "a"}]},
+                {"start": 1.0, "end": 2.0, "text": "b", "words": []},
+                {"start": 2.0, "end": 3.0, "text": "c",
+                 "words": [{"word": "c", "start": 2.0, "end": 3.0, "score": 0.5}]},
+            ]
+        }
+
+        filtered = ColumnarTranscript.from_result(result).without_incomplete_words()
+
+        assert filtered.segment_text == ["c"]
+        assert filtered.word_offsets.tolist() == [0, 1]
+        assert filtered.word_offsets.dtype == np.int32